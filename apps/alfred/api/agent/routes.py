@@ -16,11 +16,14 @@ from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from alfred.api.dependencies import get_db_session
+from alfred.api.dependencies import get_async_db_session, get_db_session
+from alfred.core.database import get_async_engine
 from alfred.core.dependencies import get_doc_storage_service
 from alfred.core.settings import settings
 from alfred.models.thinking import AgentMessageRow, ThinkingSessionRow
+from alfred.services.agent.context_window import load_thread_history
 from alfred.services.agent.service import AgentService
 from alfred.services.knowledge_notifications import (
     get_notification_count,
@@ -334,6 +337,7 @@ async def agent_stream(
     body: AgentStreamRequest,
     request: Request,
     db: Session = Depends(get_db_session),
+    async_db: AsyncSession = Depends(get_async_db_session),
 ):
     """SSE endpoint for agentic chat using the flat tool-calling loop.
 
@@ -371,17 +375,8 @@ async def agent_stream(
     )
     source_context_text = _document_context_for_source(body.source_context)
 
-    # Load history from DB (last 20 messages)
-    history = body.history
-    if not history:
-        stmt = (
-            select(AgentMessageRow)
-            .where(AgentMessageRow.thread_id == thread_id)
-            .order_by(AgentMessageRow.created_at.desc())
-            .limit(20)
-        )
-        db_messages = db.exec(stmt).all()
-        history = [{"role": m.role, "content": m.content} for m in reversed(db_messages)]
+    # Load the unsummarized tail of the thread; AgentService bounds it by tokens.
+    history = body.history or await load_thread_history(async_db, thread_id)
 
     # Persist user message immediately
     _persist_message(
@@ -483,6 +478,7 @@ async def agent_stream_v2(
     body: AgentStreamRequest,
     request: Request,
     db: Session = Depends(get_db_session),
+    async_db: AsyncSession = Depends(get_async_db_session),
 ):
     """AG-UI streaming endpoint — Phase 1 of streaming revamp.
 
@@ -519,16 +515,7 @@ async def agent_stream_v2(
     source_context_text = _document_context_for_source(body.source_context)
 
     # Load history from DB if the client didn't provide one — mirrors v1.
-    history = body.history
-    if not history:
-        stmt = (
-            select(AgentMessageRow)
-            .where(AgentMessageRow.thread_id == thread_id)
-            .order_by(AgentMessageRow.created_at.desc())
-            .limit(20)
-        )
-        db_messages = db.exec(stmt).all()
-        history = [{"role": m.role, "content": m.content} for m in reversed(db_messages)]
+    history = body.history or await load_thread_history(async_db, thread_id)
 
     # Persist user message immediately — same contract as v1.
     _persist_message(
@@ -562,6 +549,7 @@ async def agent_stream_v2(
         model_id=body.model,
         active_lens=body.lens,
         input_summary=message_text[:400] if message_text else None,
+        async_engine=get_async_engine(),
     )
     message_projector = MessageProjector(session=db)
     snapshot_projector = SnapshotProjector(session=db)
@@ -1,11 +1,12 @@
 """Shared API dependencies."""
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from alfred.core.auth import AuthUser, get_current_user, optional_auth
-from alfred.core.database import get_session
+from alfred.core.database import get_async_session, get_session
 
 
 def get_db_session() -> Generator[Session, None, None]:
@@ -13,4 +14,16 @@ def get_db_session() -> Generator[Session, None, None]:
     yield from get_session()
 
 
-__all__ = ["AuthUser", "get_current_user", "get_db_session", "optional_auth"]
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """Provide an ``AsyncSession`` for handlers and streams that run on the event loop."""
+    async for session in get_async_session():
+        yield session
+
+
+__all__ = [
+    "AuthUser",
+    "get_async_db_session",
+    "get_current_user",
+    "get_db_session",
+    "optional_auth",
+]
@@ -1,7 +1,7 @@
 """Nexus graph endpoints — GitNexus-style zettel graph view.
 
 Endpoints:
-    POST /api/nexus/sync     — full rebuild of the Neo4j zettel projection
+    POST /api/nexus/sync     — rebuild (or incrementally sync) the Neo4j zettel projection
     GET  /api/nexus/graph    — entire graph (nodes + edges) for rendering
     GET  /api/nexus/path     — shortest path between two cards
     GET  /api/nexus/bridges  — top-N bridge-like nodes by in*out degree
@@ -45,15 +45,20 @@ def _require_graph(gs: GraphService | None) -> GraphService:
 
 @router.post("/sync", response_model=NexusSyncResult)
 def sync_graph(
+    incremental: bool = Query(False),
     session: Session = Depends(get_db_session),
     gs: GraphService | None = Depends(get_graph_service),
 ) -> NexusSyncResult:
-    """Rebuild the Neo4j :Zettel subgraph from Postgres."""
+    """Rebuild the Neo4j :Zettel subgraph from Postgres.
+
+    ``incremental=true`` projects only cards/links changed since the last sync.
+    """
     graph = _require_graph(gs)
     sync = ZettelGraphSync(session=session, graph=graph)
-    result = sync.full_rebuild()
+    result = sync.sync_incremental() if incremental else sync.full_rebuild()
     logger.info(
-        "nexus sync complete: %d nodes, %d edges",
+        "nexus sync complete (%s): %d nodes, %d edges",
+        result["mode"],
         result["nodes_synced"],
         result["edges_synced"],
     )
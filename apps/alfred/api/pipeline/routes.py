@@ -80,13 +80,35 @@ def pipeline_status(doc_id: str):
 def replay_batch(
     force: bool = Query(False),
     limit: int = Query(50, ge=1, le=500),
+    batched: bool = Query(False),
 ):
-    """Replay pipeline for documents missing enrichment."""
+    """Replay pipeline for documents missing enrichment.
+
+    With ``batched=true`` the documents go to micro-batch tasks of
+    ``PIPELINE_BATCH_SIZE`` instead of one task per document.
+    """
     from alfred.core.dependencies import get_doc_storage_service
+    from alfred.core.settings import settings
 
     svc = get_doc_storage_service()
     docs = svc.list_documents_needing_concepts_extraction(limit=limit)
 
+    if batched:
+        doc_ids = [str(doc.id) if hasattr(doc, "id") else str(doc["id"]) for doc in docs]
+        size = settings.pipeline_batch_size
+        batches = []
+        for i in range(0, len(doc_ids), size):
+            chunk = doc_ids[i : i + size]
+            try:
+                async_result = dispatch_task(
+                    "alfred.tasks.document_pipeline.run_document_pipeline_batch",
+                    kwargs={"doc_ids": chunk, "force_replay": force},
+                )
+            except BrokerUnavailableError as exc:
+                raise ServiceUnavailableError("Background worker unavailable") from exc
+            batches.append({"doc_ids": chunk, "task_id": async_result.id})
+        return {"queued": len(doc_ids), "batches": batches}
+
     task_ids = []
     for doc in docs:
         doc_id = str(doc.id) if hasattr(doc, "id") else str(doc["id"])
@@ -791,22 +791,27 @@ def sync_wiki_links(
 @router.get("/graph")
 def graph(
     include: str | None = None,
+    since: str | None = None,
     session: Session = Depends(get_db_session),
+    response: Response = None,
 ):
+    """Graph payload; pass a previous ``version`` as ``since`` for a delta."""
     svc = ZettelkastenService(session)
     if include:
         includes = set(include.split(","))
         cache_key = f"{_GRAPH_EXT_CACHE_KEY}:{','.join(sorted(includes))}"
-        cached = _cache_get(cache_key)
-        if cached is not None:
-            return cached
-        result = svc.extended_graph_summary(
-            include_clusters="clusters" in includes,
-            include_gaps="gaps" in includes,
-        )
-        _cache_set(cache_key, result, ttl_seconds=_GRAPH_EXT_CACHE_TTL)
-        return result
-    return svc.graph_summary()
+        result = _cache_get(cache_key)
+        if result is None:
+            result = svc.extended_graph_summary(
+                include_clusters="clusters" in includes,
+                include_gaps="gaps" in includes,
+            )
+            _cache_set(cache_key, result, ttl_seconds=_GRAPH_EXT_CACHE_TTL)
+    else:
+        result = svc.graph_summary(since=since)
+    if response is not None and result.get("version"):
+        response.headers["ETag"] = f'"{result["version"]}"'
+    return result
 
 
 @router.get("/reviews/due", response_model=list[ZettelReviewOut])
@@ -70,6 +70,7 @@ def create_celery_app(*, include_tasks: bool = True) -> Celery:
             "alfred.tasks.document_pipeline.*": {"queue": "default"},
             "alfred.tasks.taxonomy_reclassify.*": {"queue": "default"},
             "alfred.tasks.planning.*": {"queue": "default"},
+            "alfred.tasks.semantic_map.*": {"queue": "default"},
         },
     )
 
@@ -136,6 +137,18 @@ def create_celery_app(*, include_tasks: bool = True) -> Celery:
             }
         }
 
+    if settings.enable_semantic_map_refit:
+        beat_schedule |= {
+            "semantic-map-basis-refit": {
+                "task": "alfred.tasks.semantic_map.refit_semantic_map_basis",
+                "schedule": crontab(
+                    minute=15,
+                    hour=f"*/{int(settings.semantic_map_refit_interval_hours)}",
+                ),
+                "options": {"queue": "default"},
+            }
+        }
+
     if beat_schedule:
         celery_app.conf.beat_schedule = beat_schedule
 
@@ -154,6 +167,7 @@ def create_celery_app(*, include_tasks: bool = True) -> Celery:
         import alfred.tasks.mind_palace_agent
         import alfred.tasks.notion_import
         import alfred.tasks.planning
+        import alfred.tasks.semantic_map
         import alfred.tasks.session_cleanup
         import alfred.tasks.taxonomy_reclassify
         import alfred.tasks.today_pipeline  # noqa: F401
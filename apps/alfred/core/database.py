@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from datetime import date, datetime
+from functools import lru_cache
 
 from sqlalchemy import create_engine
 
@@ -18,8 +19,10 @@ def _json_serializer(obj: object) -> str:
         raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
 
     return json.dumps(obj, default=_default)
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from alfred.core.exceptions import ConfigurationError
 from alfred.core.settings import settings
@@ -38,6 +41,21 @@ def normalize_db_url(url: str) -> str:
     return url
 
 
+def async_db_url(url: str) -> str:
+    """Map a (normalized) database URL onto its asyncio driver.
+
+    - Postgres → asyncpg
+    - SQLite → aiosqlite (dev and the test suite)
+    """
+    url = normalize_db_url(url)
+    scheme, sep, rest = url.partition("://")
+    if scheme.startswith("postgresql"):
+        return "postgresql+asyncpg" + sep + rest
+    if scheme == "sqlite":
+        return "sqlite+aiosqlite" + sep + rest
+    return url
+
+
 DB_URL = normalize_db_url(settings.database_url)
 
 try:
@@ -84,6 +102,52 @@ def get_session() -> Generator[Session, None, None]:
         session.close()
 
 
+@lru_cache(maxsize=1)
+def get_async_engine() -> AsyncEngine:
+    """Process-wide async engine for code that runs on the event loop.
+
+    Built on first use so processes that never touch it (Celery workers, CLI
+    scripts) don't need the asyncio drivers. Connections are bound to the
+    loop that opened them; worker threads running their own loop (agent tool
+    calls) keep using the sync ``SessionLocal``.
+
+    asyncpg rejects timezone-aware datetimes for naive ``TIMESTAMP`` columns,
+    which is what ``Model`` timestamps are. Insert ``Model`` rows through the
+    sync session; reads and updates of other columns are fine here.
+    """
+    url = async_db_url(settings.database_url)
+    kwargs: dict[str, object] = {"pool_pre_ping": True}
+    if url.startswith("postgresql"):
+        kwargs.update(
+            pool_size=int(settings.db_pool_size),
+            max_overflow=int(settings.db_max_overflow),
+            pool_timeout=int(settings.db_pool_timeout),
+            pool_recycle=int(settings.db_pool_recycle_seconds),
+        )
+    try:
+        return create_async_engine(url, json_serializer=_json_serializer, **kwargs)
+    except ModuleNotFoundError as exc:  # pragma: no cover - runtime dependency hint
+        driver = "asyncpg" if url.startswith("postgresql") else "aiosqlite"
+        raise ConfigurationError(f"Async database driver missing. Run: pip install {driver}") from exc
+
+
+@lru_cache(maxsize=1)
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """Async counterpart of ``SessionLocal``; call it for a caller-managed session."""
+    return async_sessionmaker(
+        bind=get_async_engine(),
+        autoflush=False,
+        expire_on_commit=False,
+        class_=AsyncSession,
+    )
+
+
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """Yield an ``AsyncSession`` scoped to the request lifecycle."""
+    async with get_async_sessionmaker()() as session:
+        yield session
+
+
 def get_db_session() -> Session:
     """Return a caller-managed database session.
 
@@ -94,4 +158,14 @@ def get_db_session() -> Session:
     return SessionLocal()
 
 
-__all__ = ["engine", "get_session", "get_db_session", "SessionLocal", "normalize_db_url"]
+__all__ = [
+    "SessionLocal",
+    "async_db_url",
+    "engine",
+    "get_async_engine",
+    "get_async_session",
+    "get_async_sessionmaker",
+    "get_db_session",
+    "get_session",
+    "normalize_db_url",
+]
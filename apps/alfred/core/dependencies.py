@@ -7,6 +7,7 @@ clearing/overrides.
 
 from __future__ import annotations
 
+import os
 from functools import lru_cache
 from typing import TYPE_CHECKING
 
@@ -20,6 +21,7 @@ if TYPE_CHECKING:
     from alfred.services.doc_storage_pg import DocStorageService
     from alfred.services.extraction_service import ExtractionService
     from alfred.services.graph_service import GraphService
+    from alfred.services.knowledge import KnowledgeService
     from alfred.services.llm_service import LLMService
     from alfred.services.reading_service import ReadingService
     from alfred.services.research_service import ResearchService
@@ -214,3 +216,39 @@ def get_qdrant_client():
         return QdrantClient(url=url, api_key=api_key)
     except Exception:
         return None
+
+
+@lru_cache(maxsize=1)
+def get_local_qdrant_client():
+    """Return an embedded on-disk Qdrant client, or an in-memory one if no path is set.
+
+    Embedded storage takes an exclusive lock on its folder, so only one client
+    per process (and one process per path) may open it. A store that cannot be
+    opened is an error rather than a silent switch to memory, which would leave
+    this process indexing into and searching a throwaway collection; run a
+    Qdrant server (``QDRANT_URL``) when several workers share the knowledge base.
+    """
+    from qdrant_client import QdrantClient
+
+    path = settings.qdrant_local_path
+    if not path:
+        return QdrantClient(":memory:")
+    try:
+        os.makedirs(path, exist_ok=True)
+        return QdrantClient(path=path)
+    except Exception as exc:
+        raise RuntimeError(
+            f"Embedded Qdrant storage at {path} could not be opened ({exc}). It is "
+            "locked by the first process that opens it; set QDRANT_URL to a Qdrant "
+            "server for multi-process deployments."
+        ) from exc
+
+
+@lru_cache(maxsize=1)
+def get_knowledge_service() -> KnowledgeService:
+    from alfred.services.knowledge import KnowledgeService
+
+    return KnowledgeService(
+        collection_name=settings.qdrant_knowledge_collection,
+        client=get_qdrant_client() or get_local_qdrant_client(),
+    )
@@ -1,16 +1,18 @@
 from __future__ import annotations
 
+import base64
 import hashlib
 import json
 import logging
-import math
+import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import Any, Protocol
 
-from cachetools import TTLCache
+import numpy as np
+from cachetools import LRUCache, TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -29,50 +31,54 @@ def _normalize_text(text: str) -> str:
     return " ".join((text or "").strip().split())
 
 
-def _unit_normalize(vec: list[float]) -> list[float]:
-    norm = math.sqrt(sum((float(x) * float(x)) for x in vec))
-    if norm <= 0:
-        return [0.0 for _ in vec]
-    return [float(x) / norm for x in vec]
+def _unit_normalize(vec: Sequence[float]) -> np.ndarray:
+    arr = np.asarray(vec, dtype=np.float32)
+    norm = float(np.linalg.norm(arr))
+    if norm <= 0 or not np.isfinite(norm):
+        return np.zeros_like(arr)
+    return arr / norm
 
 
-def _cosine_similarity(a: list[float], b: list[float]) -> float:
-    if not a or not b or len(a) != len(b):
-        return -1.0
-    return float(sum((x * y) for x, y in zip(a, b, strict=False)))
+def _pack_vector(vec: np.ndarray) -> str:
+    """Encode a vector as base64 float32 bytes (safe for `decode_responses=True` clients)."""
+    return base64.b64encode(np.asarray(vec, dtype="<f4").tobytes()).decode("ascii")
 
 
-def _signature(vec: list[float], *, bits: int, seed: str) -> str:
+def _unpack_vector(raw: str | bytes) -> np.ndarray | None:
+    try:
+        data = base64.b64decode(raw, validate=True)
+    except Exception:
+        return None
+    if not data or len(data) % 4:
+        return None
+    return np.frombuffer(data, dtype="<f4")
+
+
+@lru_cache(maxsize=64)
+def _projection_indices(seed: str, bits: int, dim: int) -> np.ndarray:
+    """Dimensions sampled by `_signature`, derived once per (seed, bits, dim)."""
+    indices = np.empty(bits, dtype=np.intp)
+    for i in range(bits):
+        digest = hashlib.sha256(f"{seed}:{i}:{dim}".encode()).digest()
+        indices[i] = int.from_bytes(digest[:4], "big") % dim
+    indices.setflags(write=False)
+    return indices
+
+
+def _signature(vec: Sequence[float] | np.ndarray, *, bits: int, seed: str) -> str:
     """Return a stable, coarse signature for vector bucketing.
 
     This is intentionally lightweight and avoids requiring Redis modules (e.g., RediSearch).
     It uses the sign of selected dimensions as a locality-sensitive hash.
     """
 
-    dim = len(vec)
+    arr = np.asarray(vec, dtype=np.float32)
+    dim = int(arr.shape[0]) if arr.ndim == 1 else 0
     if dim <= 0 or bits <= 0:
         return ""
 
-    BITS_PER_BYTE = 8
-    packed: list[int] = []
-    byte = 0
-    filled = 0
-    for i in range(bits):
-        digest = hashlib.sha256(f"{seed}:{i}:{dim}".encode()).digest()
-        idx = int.from_bytes(digest[:4], "big") % dim
-        bit = 1 if float(vec[idx]) >= 0.0 else 0
-        byte = (byte << 1) | bit
-        filled += 1
-        if filled == BITS_PER_BYTE:
-            packed.append(byte)
-            byte = 0
-            filled = 0
-
-    if filled:
-        byte = byte << (BITS_PER_BYTE - filled)
-        packed.append(byte)
-
-    return bytes(packed).hex()
+    signs = arr[_projection_indices(seed, bits, dim)] >= 0.0
+    return np.packbits(signs).tobytes().hex()
 
 
 @dataclass(frozen=True, slots=True)
@@ -85,6 +91,7 @@ class SemanticCacheConfig:
     bucket_bits: int = 64
     bucket_seeds: tuple[str, ...] = ("a", "b", "c")
     max_candidates_per_bucket: int = 25
+    local_vectors: int = 4096
 
 
 class RedisSemanticCache:
@@ -95,8 +102,14 @@ class RedisSemanticCache:
     - semantic lookups by comparing embeddings of recent candidates in the same bucket(s)
 
     It is designed to work on plain Redis (no modules required) by using:
-    - `SETEX` for value storage
+    - `SETEX` for value storage, with each entry's embedding kept under its own
+      key as packed float32 bytes
     - `ZADD`/`ZREVRANGE` for bucket indices (recency-biased candidate selection)
+
+    A semantic lookup reads every bucket in one pipeline, fetches the candidate
+    embeddings it hasn't seen yet with one `MGET`, and scores them all with a
+    single matrix-vector product. Embeddings are immutable per entry, so they
+    are also kept in a bounded local map and reused across lookups.
     """
 
     def __init__(
@@ -115,10 +128,17 @@ class RedisSemanticCache:
             if local_fallback is not None
             else TTLCache(maxsize=256, ttl=max(1, int(config.ttl_seconds)))
         )
+        self._vectors: LRUCache[str, np.ndarray] = LRUCache(
+            maxsize=max(1, int(config.local_vectors))
+        )
+        self._vectors_lock = threading.Lock()
 
     def _item_key(self, entry_id: str) -> str:
         return f"semantic-cache:item:{self._config.namespace}:{entry_id}"
 
+    def _vector_key(self, entry_id: str) -> str:
+        return f"semantic-cache:vec:{self._config.namespace}:{entry_id}"
+
     def _exact_key(self, normalized_text: str) -> str:
         entry_id = _stable_hash_hex(f"exact:{normalized_text}")
         return self._item_key(entry_id)
@@ -126,10 +146,9 @@ class RedisSemanticCache:
     def _bucket_key(self, signature: str) -> str:
         return f"semantic-cache:bucket:{self._config.namespace}:{signature}"
 
-    def _encode_payload(self, *, normalized_text: str, embedding: list[float], value: Any) -> str:
+    def _encode_payload(self, *, normalized_text: str, value: Any) -> str:
         payload = {
             "text": normalized_text,
-            "embedding": embedding,
             "value": value,
         }
         return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
@@ -141,11 +160,11 @@ class RedisSemanticCache:
             return None
         if not isinstance(payload, dict):
             return None
-        if "value" not in payload or "embedding" not in payload:
+        if "value" not in payload:
             return None
         return payload
 
-    def _embed(self, normalized_text: str) -> list[float] | None:
+    def _embed(self, normalized_text: str) -> np.ndarray | None:
         try:
             vec = self._embedder.embed_query(normalized_text)
         except Exception:
@@ -154,26 +173,18 @@ class RedisSemanticCache:
         if not isinstance(vec, list) or not vec:
             return None
         try:
-            floats = [float(x) for x in vec]
+            return _unit_normalize(vec)
         except Exception:
             return None
-        return _unit_normalize(floats)
-
-    def get(self, text: str) -> Any | None:
-        """Return a cached value for `text` if a match is found, else None."""
 
-        normalized = _normalize_text(text)
-        if not normalized:
-            return None
-
-        # 1) Fast exact match (no embedding call).
-        exact_key = self._exact_key(normalized)
+    def _lookup_exact(self, normalized_text: str) -> tuple[bool, Any]:
+        exact_key = self._exact_key(normalized_text)
         try:
             raw = self._redis.get(exact_key)
             if raw:
                 payload = self._decode_payload(raw)
                 if payload is not None:
-                    return payload.get("value")
+                    return True, payload.get("value")
         except Exception:
             logger.debug("Semantic cache: exact Redis read failed", exc_info=True)
 
@@ -181,85 +192,151 @@ class RedisSemanticCache:
         if local_raw:
             payload = self._decode_payload(local_raw)
             if payload is not None:
-                return payload.get("value")
-
-        # 2) Semantic match using a small candidate set from recency buckets.
-        emb = self._embed(normalized)
-        if emb is None:
-            return None
-
-        best_value: Any | None = None
-        best_sim = float("-inf")
+                return True, payload.get("value")
+        return False, None
 
+    def _candidate_ids(self, embedding: np.ndarray) -> dict[str, list[str]]:
+        """Map candidate entry ids to the bucket keys that listed them (recency order)."""
+        bucket_keys = []
         for seed in self._config.bucket_seeds:
-            sig = _signature(emb, bits=self._config.bucket_bits, seed=seed)
-            if not sig:
-                continue
-            bucket_key = self._bucket_key(sig)
+            sig = _signature(embedding, bits=self._config.bucket_bits, seed=seed)
+            if sig:
+                bucket_keys.append(self._bucket_key(sig))
+        if not bucket_keys:
+            return {}
+
+        stop = self._config.max_candidates_per_bucket - 1
+        results: list[Any] = []
+        pipeline_factory = getattr(self._redis, "pipeline", None)
+        if callable(pipeline_factory):
             try:
-                candidate_ids = self._redis.zrevrange(
-                    bucket_key, 0, self._config.max_candidates_per_bucket - 1
-                )
+                pipe = pipeline_factory(transaction=False)
+                for bucket_key in bucket_keys:
+                    pipe.zrevrange(bucket_key, 0, stop)
+                results = pipe.execute(raise_on_error=False)
             except Exception:
-                logger.debug("Semantic cache: bucket read failed", exc_info=True)
-                continue
-
-            for entry_id in candidate_ids or []:
-                item_key = self._item_key(str(entry_id))
+                logger.debug("Semantic cache: bucket pipeline failed", exc_info=True)
+                results = []
+        if len(results) != len(bucket_keys):
+            results = []
+            for bucket_key in bucket_keys:
                 try:
-                    raw = self._redis.get(item_key)
+                    results.append(self._redis.zrevrange(bucket_key, 0, stop))
                 except Exception:
-                    logger.debug("Semantic cache: candidate read failed", exc_info=True)
-                    raw = None
-                if not raw:
-                    try:
-                        self._redis.zrem(bucket_key, entry_id)
-                    except Exception:
-                        pass
-                    continue
+                    logger.debug("Semantic cache: bucket read failed", exc_info=True)
+                    results.append(None)
 
-                payload = self._decode_payload(raw)
-                if payload is None:
-                    continue
-                candidate_emb = payload.get("embedding")
-                if not isinstance(candidate_emb, list) or len(candidate_emb) != len(emb):
-                    continue
-                try:
-                    candidate_vec = [float(x) for x in candidate_emb]
-                except Exception:
-                    continue
+        candidates: dict[str, list[str]] = {}
+        for bucket_key, ids in zip(bucket_keys, results, strict=True):
+            if isinstance(ids, Exception):
+                continue
+            for entry_id in ids or []:
+                candidates.setdefault(str(entry_id), []).append(bucket_key)
+        return candidates
+
+    def _candidate_vectors(self, entry_ids: list[str], dim: int) -> dict[str, np.ndarray]:
+        with self._vectors_lock:
+            found = {eid: vec for eid in entry_ids if (vec := self._vectors.get(eid)) is not None}
+        missing = [eid for eid in entry_ids if eid not in found]
+        if missing:
+            try:
+                raws = self._redis.mget([self._vector_key(eid) for eid in missing])
+            except Exception:
+                logger.debug("Semantic cache: candidate read failed", exc_info=True)
+                raws = [None] * len(missing)
+            fetched: dict[str, np.ndarray] = {}
+            for eid, raw in zip(missing, raws, strict=False):
+                vec = _unpack_vector(raw) if raw else None
+                if vec is not None:
+                    fetched[eid] = vec
+            with self._vectors_lock:
+                for eid, vec in fetched.items():
+                    self._vectors[eid] = vec
+            found.update(fetched)
+        return {eid: vec for eid, vec in found.items() if vec.shape[0] == dim}
+
+    def _forget(self, entry_id: str, bucket_keys: list[str]) -> None:
+        with self._vectors_lock:
+            self._vectors.pop(entry_id, None)
+        for bucket_key in bucket_keys:
+            try:
+                self._redis.zrem(bucket_key, entry_id)
+            except Exception:
+                pass
+
+    def _lookup_semantic(self, embedding: np.ndarray) -> tuple[bool, Any]:
+        candidates = self._candidate_ids(embedding)
+        if not candidates:
+            return False, None
+
+        vectors = self._candidate_vectors(list(candidates), int(embedding.shape[0]))
+        for entry_id in candidates.keys() - vectors.keys():
+            self._forget(entry_id, candidates[entry_id])
+        if not vectors:
+            return False, None
+
+        entry_ids = list(vectors)
+        sims = np.stack([vectors[eid] for eid in entry_ids]) @ embedding
+        threshold = float(self._config.similarity_threshold)
+        for pos in np.argsort(-sims, kind="stable"):
+            if float(sims[pos]) < threshold:
+                break
+            entry_id = entry_ids[pos]
+            try:
+                raw = self._redis.get(self._item_key(entry_id))
+            except Exception:
+                logger.debug("Semantic cache: candidate read failed", exc_info=True)
+                raw = None
+            payload = self._decode_payload(raw) if raw else None
+            if payload is not None:
+                return True, payload.get("value")
+            # Expired behind a locally cached vector: drop it and try the next best.
+            self._forget(entry_id, candidates[entry_id])
+        return False, None
 
-                sim = _cosine_similarity(emb, candidate_vec)
-                if sim > best_sim:
-                    best_sim = sim
-                    best_value = payload.get("value")
+    def get(self, text: str) -> Any | None:
+        """Return a cached value for `text` if a match is found, else None."""
 
-        if best_sim >= float(self._config.similarity_threshold):
-            return best_value
-        return None
+        normalized = _normalize_text(text)
+        if not normalized:
+            return None
 
-    def _store(self, *, normalized_text: str, embedding: list[float], value: Any) -> None:
+        # 1) Fast exact match (no embedding call).
+        hit, value = self._lookup_exact(normalized)
+        if hit:
+            return value
+
+        # 2) Semantic match using a small candidate set from recency buckets.
+        emb = self._embed(normalized)
+        if emb is None:
+            return None
+        _hit, value = self._lookup_semantic(emb)
+        return value
+
+    def _store(self, *, normalized_text: str, embedding: np.ndarray, value: Any) -> None:
         now = time.time()
-        payload = self._encode_payload(
-            normalized_text=normalized_text, embedding=embedding, value=value
-        )
+        ttl = int(self._config.ttl_seconds)
+        payload = self._encode_payload(normalized_text=normalized_text, value=value)
 
         exact_key = self._exact_key(normalized_text)
         try:
-            self._redis.setex(exact_key, int(self._config.ttl_seconds), payload)
+            self._redis.setex(exact_key, ttl, payload)
         except Exception:
             logger.debug("Semantic cache: exact Redis write failed", exc_info=True)
 
         self._local[exact_key] = payload
 
         entry_id = _stable_hash_hex(f"semantic:{normalized_text}")
-        item_key = self._item_key(entry_id)
         try:
-            self._redis.setex(item_key, int(self._config.ttl_seconds), payload)
+            self._redis.setex(self._item_key(entry_id), ttl, payload)
+            self._redis.setex(self._vector_key(entry_id), ttl, _pack_vector(embedding))
         except Exception:
             logger.debug("Semantic cache: item Redis write failed", exc_info=True)
             return
 
+        with self._vectors_lock:
+            self._vectors[entry_id] = np.asarray(embedding, dtype=np.float32)
+
         for seed in self._config.bucket_seeds:
             sig = _signature(embedding, bits=self._config.bucket_bits, seed=seed)
             if not sig:
@@ -281,72 +358,15 @@ class RedisSemanticCache:
         if not normalized:
             return factory()
 
-        exact_key = self._exact_key(normalized)
-        try:
-            raw = self._redis.get(exact_key)
-            if raw:
-                payload = self._decode_payload(raw)
-                if payload is not None:
-                    return payload.get("value")
-        except Exception:
-            logger.debug("Semantic cache: exact Redis read failed", exc_info=True)
-
-        local_raw = self._local.get(exact_key)
-        if local_raw:
-            payload = self._decode_payload(local_raw)
-            if payload is not None:
-                return payload.get("value")
+        hit, value = self._lookup_exact(normalized)
+        if hit:
+            return value
 
         emb = self._embed(normalized)
         if emb is not None:
-            best_value: Any | None = None
-            best_sim = float("-inf")
-
-            for seed in self._config.bucket_seeds:
-                sig = _signature(emb, bits=self._config.bucket_bits, seed=seed)
-                if not sig:
-                    continue
-                bucket_key = self._bucket_key(sig)
-                try:
-                    candidate_ids = self._redis.zrevrange(
-                        bucket_key, 0, self._config.max_candidates_per_bucket - 1
-                    )
-                except Exception:
-                    logger.debug("Semantic cache: bucket read failed", exc_info=True)
-                    continue
-
-                for entry_id in candidate_ids or []:
-                    item_key = self._item_key(str(entry_id))
-                    try:
-                        raw = self._redis.get(item_key)
-                    except Exception:
-                        logger.debug("Semantic cache: candidate read failed", exc_info=True)
-                        raw = None
-                    if not raw:
-                        try:
-                            self._redis.zrem(bucket_key, entry_id)
-                        except Exception:
-                            pass
-                        continue
-
-                    payload = self._decode_payload(raw)
-                    if payload is None:
-                        continue
-                    candidate_emb = payload.get("embedding")
-                    if not isinstance(candidate_emb, list) or len(candidate_emb) != len(emb):
-                        continue
-                    try:
-                        candidate_vec = [float(x) for x in candidate_emb]
-                    except Exception:
-                        continue
-
-                    sim = _cosine_similarity(emb, candidate_vec)
-                    if sim > best_sim:
-                        best_sim = sim
-                        best_value = payload.get("value")
-
-            if best_sim >= float(self._config.similarity_threshold):
-                return best_value
+            hit, value = self._lookup_semantic(emb)
+            if hit:
+                return value
 
         value = factory()
         if emb is not None:
@@ -106,6 +106,15 @@ class Settings(BaseSettings):
             return None
         return v
 
+    @field_validator("qdrant_local_path", mode="before")
+    @classmethod
+    def _resolve_qdrant_local_path(cls, v: object) -> object:
+        if v is None or (isinstance(v, str) and not v.strip()):
+            return None
+        if isinstance(v, str | os.PathLike):
+            return str(_PROJECT_ROOT / Path(v).expanduser())
+        return v
+
     @field_validator("notes_filesystem_roots", mode="before")
     @classmethod
     def _parse_notes_filesystem_roots(cls, v: object) -> object:
@@ -142,6 +151,19 @@ class Settings(BaseSettings):
         default="alfred_zettels",
         alias="QDRANT_ZETTELS_COLLECTION",
     )
+    qdrant_knowledge_collection: str = Field(
+        default="alfred_knowledge",
+        alias="QDRANT_KNOWLEDGE_COLLECTION",
+    )
+    # Embedded on-disk store used when no Qdrant server URL is configured. It is
+    # locked by the first process that opens it, so deployments running several
+    # workers must set QDRANT_URL. Relative paths resolve against the repo root;
+    # an empty value selects a throwaway in-memory store.
+    qdrant_local_path: str | None = Field(
+        default=".alfred_data/qdrant",
+        alias="QDRANT_LOCAL_PATH",
+        validate_default=True,
+    )
 
     # OpenAI (also used by downstream libs)
     openai_api_key: SecretStr | None = Field(default=None, alias="OPENAI_API_KEY")
@@ -356,6 +378,86 @@ class Settings(BaseSettings):
         description="Cosine similarity threshold for semantic cache hits.",
     )
 
+    # Agent conversation context (token-bounded history + running thread summary)
+    agent_context_max_tokens: int = Field(
+        default=12000,
+        alias="AGENT_CONTEXT_MAX_TOKENS",
+        ge=500,
+        description="History token budget per turn; older turns fold into the thread summary.",
+    )
+    agent_context_max_messages: int = Field(
+        default=20,
+        alias="AGENT_CONTEXT_MAX_MESSAGES",
+        ge=2,
+        description="Most history messages sent verbatim per turn.",
+    )
+    agent_context_tool_output_tokens: int = Field(
+        default=1500,
+        alias="AGENT_CONTEXT_TOOL_OUTPUT_TOKENS",
+        ge=100,
+        description="Tool results above this size are replaced by references after their round.",
+    )
+    agent_context_summary_model: str = Field(
+        default="",
+        alias="AGENT_CONTEXT_SUMMARY_MODEL",
+        description="Model for running thread summaries; empty uses the chat model.",
+    )
+
+    # Agent tool result cache (read-only tools; in-process)
+    agent_tool_cache_enabled: bool = Field(
+        default=True,
+        alias="AGENT_TOOL_CACHE_ENABLED",
+        description="Reuse results of read-only agent tools within their TTL.",
+    )
+    agent_tool_cache_max_entries: int = Field(
+        default=512,
+        alias="AGENT_TOOL_CACHE_MAX_ENTRIES",
+        ge=0,
+        description="Tool results kept per process; 0 disables storing.",
+    )
+
+    # Dictionary lookups: in-process LRU -> Redis -> Postgres, plus an optional
+    # offline snapshot (SQLite, built by `python -m alfred.services.dictionary_snapshot`).
+    dictionary_cache_enabled: bool = Field(
+        default=True,
+        alias="DICTIONARY_CACHE_ENABLED",
+        description="Cache Wiktionary, Wikipedia and AI explanation results per word.",
+    )
+    dictionary_cache_lru_size: int = Field(
+        default=2048,
+        alias="DICTIONARY_CACHE_LRU_SIZE",
+        ge=0,
+        description="In-process entries kept per worker; 0 disables the LRU tier.",
+    )
+    dictionary_snapshot_path: str = Field(
+        default="",
+        alias="DICTIONARY_SNAPSHOT_PATH",
+        description="Offline dictionary snapshot answering lexical lookups without network.",
+    )
+
+    # Memory recall: cosine similarity over write-time embeddings, weighted by a
+    # recency prior that halves every half-life (0 disables the prior).
+    memory_recall_half_life_days: float = Field(
+        default=90.0,
+        alias="MEMORY_RECALL_HALF_LIFE_DAYS",
+        ge=0.0,
+        description="Age at which a memory's recency boost has halved.",
+    )
+    memory_recall_recency_weight: float = Field(
+        default=0.2,
+        alias="MEMORY_RECALL_RECENCY_WEIGHT",
+        ge=0.0,
+        le=1.0,
+        description="Share of the score that depends on recency.",
+    )
+    memory_recall_min_similarity: float = Field(
+        default=0.2,
+        alias="MEMORY_RECALL_MIN_SIMILARITY",
+        ge=-1.0,
+        le=1.0,
+        description="Cosine similarity below which a memory is not recalled.",
+    )
+
     # Text cleaning
     text_cleaning_strategy: str = Field(default="basic", alias="TEXT_CLEANING_STRATEGY")
     text_cleaning_langextract_model: str = Field(
@@ -439,6 +541,22 @@ class Settings(BaseSettings):
         default=6, alias="DOCUMENT_CONCEPT_EXTRACTION_MIN_AGE_HOURS", ge=0, le=168
     )
 
+    # Document pipeline (LangGraph)
+    pipeline_parallel_stages: bool = Field(
+        default=False,
+        alias="PIPELINE_PARALLEL_STAGES",
+        description="Run extract, classify and embed concurrently after chunk instead of in series",
+    )
+    pipeline_batch_size: int = Field(
+        default=50, alias="PIPELINE_BATCH_SIZE", ge=1, le=1000
+    )
+    pipeline_batch_llm_concurrency: int = Field(
+        default=4, alias="PIPELINE_BATCH_LLM_CONCURRENCY", ge=1, le=64
+    )
+    pipeline_batch_embed_size: int = Field(
+        default=256, alias="PIPELINE_BATCH_EMBED_SIZE", ge=1, le=2048
+    )
+
     # Today Page nightly pipeline (digest + carry-over)
     enable_today_pipeline_nightly: bool = Field(
         default=False,
@@ -489,6 +607,24 @@ class Settings(BaseSettings):
         description="UTC minute the abandon-stale-sessions beat runs",
     )
 
+    # Semantic map (Galaxy) basis refit
+    enable_semantic_map_refit: bool = Field(
+        default=False,
+        alias="ENABLE_SEMANTIC_MAP_REFIT",
+        description=(
+            "Periodically refit the stored PCA basis used to project documents. "
+            "Default OFF: the basis is fitted on first use, and each refit moves "
+            "every point on the map."
+        ),
+    )
+    semantic_map_refit_interval_hours: int = Field(
+        default=6,
+        alias="SEMANTIC_MAP_REFIT_INTERVAL_HOURS",
+        ge=1,
+        le=24,
+        description="Hours between semantic-map basis refits (UTC, on the hour mark + 15 min)",
+    )
+
     # Admin API (visibility)
     enable_admin_api_schema: bool = Field(default=False, alias="ENABLE_ADMIN_API_SCHEMA")
 
@@ -3,8 +3,10 @@
 Run via:  python -m alfred.mcp.server
 Config:   Add to ~/.claude/claude_code_config.json as an mcpServers entry.
 
-On startup, checks if the Alfred FastAPI backend is running at localhost:8000.
-If not, spawns it automatically so the generic API proxy tool works.
+The generic API proxy calls the Alfred FastAPI app in-process through an
+ASGI transport, so no backend server or loopback HTTP is needed. If the app
+cannot be imported, it falls back to HTTP against localhost:8000 and spawns
+the backend there when it isn't running.
 """
 
 import logging
@@ -12,9 +14,10 @@ import subprocess
 import sys
 import time
 from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 from uuid import uuid4
 
 import httpx
@@ -23,6 +26,9 @@ from mcp.server.fastmcp import FastMCP
 logger = logging.getLogger(__name__)
 
 ALFRED_API_URL = "http://localhost:8000"
+# Host name is only used to build request URLs; nothing leaves the process.
+ALFRED_INPROCESS_URL = "http://alfred.internal"
+ALFRED_API_TIMEOUT = 30
 ALFRED_HEALTH_ENDPOINT = "/healthz"
 PROJECT_ROOT = Path(__file__).resolve().parents[3]  # apps/alfred/mcp -> project root
 ENV_FILE = PROJECT_ROOT / "apps" / "alfred" / ".env"
@@ -86,30 +92,45 @@ def _start_backend() -> subprocess.Popen:
     raise RuntimeError("Alfred backend did not become healthy within 10 seconds")
 
 
+def _load_api_app() -> Any | None:
+    """Import the Alfred FastAPI app for in-process calls, or None if it fails to load."""
+    try:
+        from alfred.main import app
+    except Exception:
+        logger.exception("Failed to import alfred.main — falling back to HTTP at %s", ALFRED_API_URL)
+        return None
+    return app
+
+
+def _ensure_backend() -> subprocess.Popen | None:
+    """Start the HTTP backend if it isn't running; return the spawned process."""
+    if _is_backend_running():
+        logger.info("Alfred backend already running at %s", ALFRED_API_URL)
+        return None
+    logger.info("Alfred backend not detected — starting automatically...")
+    try:
+        return _start_backend()
+    except RuntimeError:
+        logger.exception("Failed to auto-start Alfred backend")
+        # Continue anyway — hand-crafted tools using direct DB still work
+        return None
+
+
 @dataclass
 class AlfredContext:
     """Shared resources initialized once at server startup."""
 
     session_factory: object  # sessionmaker callable
     session_id: str  # UUID for auto-logging this session
+    api: httpx.AsyncClient | None = field(default=None, repr=False)  # generic proxy client
+    api_app: Any = field(default=None, repr=False)  # FastAPI app when called in-process
+    api_base: str = ALFRED_API_URL
     backend_process: subprocess.Popen | None = field(default=None, repr=False)
 
 
 @asynccontextmanager
 async def alfred_lifespan(server: FastMCP) -> AsyncIterator[AlfredContext]:
     """Initialize Alfred backend resources at startup."""
-    # Auto-start backend if not running
-    backend_proc = None
-    if _is_backend_running():
-        logger.info("Alfred backend already running at %s", ALFRED_API_URL)
-    else:
-        logger.info("Alfred backend not detected — starting automatically...")
-        try:
-            backend_proc = _start_backend()
-        except RuntimeError:
-            logger.exception("Failed to auto-start Alfred backend")
-            # Continue anyway — hand-crafted tools using direct DB still work
-
     # Initialize direct DB access for hand-crafted tools
     try:
         from alfred.core.database import SessionLocal
@@ -117,14 +138,40 @@ async def alfred_lifespan(server: FastMCP) -> AsyncIterator[AlfredContext]:
         logger.exception("Failed to initialize database — is DATABASE_URL set?")
         raise
 
+    stack = AsyncExitStack()
+    backend_proc = None
+    api_app = _load_api_app()
+    if api_app is not None:
+        # Run the app's own lifespan so its shutdown hooks still close clients.
+        await stack.enter_async_context(api_app.router.lifespan_context(api_app))
+        api = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=api_app, raise_app_exceptions=False),
+            base_url=ALFRED_INPROCESS_URL,
+        )
+        api_base = "in-process Alfred API"
+    else:
+        backend_proc = _ensure_backend()
+        api = httpx.AsyncClient(base_url=ALFRED_API_URL, timeout=ALFRED_API_TIMEOUT)
+        api_base = ALFRED_API_URL
+    await stack.enter_async_context(api)
+
     session_id = str(uuid4())
     logger.info("Alfred MCP server started (session=%s)", session_id)
 
-    yield AlfredContext(
-        session_factory=SessionLocal,
-        session_id=session_id,
-        backend_process=backend_proc,
-    )
+    try:
+        yield AlfredContext(
+            session_factory=SessionLocal,
+            session_id=session_id,
+            api=api,
+            api_app=api_app,
+            api_base=api_base,
+            backend_process=backend_proc,
+        )
+    finally:
+        from alfred.mcp.tools import flush_call_log
+
+        await flush_call_log()
+        await stack.aclose()
 
     # Shutdown: clean up auto-started backend
     if backend_proc and backend_proc.poll() is None:
@@ -1,12 +1,16 @@
 """MCP tool implementations wrapping existing Alfred services.
 
 Includes hand-crafted tools for common operations (fast, direct DB)
-and a generic HTTP proxy for the full Alfred API surface.
+and a generic API proxy for the full Alfred API surface. The proxy uses the
+client set up by the server lifespan, which calls the FastAPI app in-process
+when it can.
 """
 
 import asyncio
+import atexit
 import json
 import logging
+import threading
 from contextlib import contextmanager
 from datetime import UTC, datetime
 from pathlib import Path
@@ -15,13 +19,7 @@ from typing import Any
 import httpx
 from mcp.server.fastmcp import Context
 
-from alfred.mcp.server import AlfredContext, mcp
-
-# ---------------------------------------------------------------------------
-# Configuration
-# ---------------------------------------------------------------------------
-
-ALFRED_API_BASE = "http://localhost:8000"
+from alfred.mcp.server import ALFRED_API_TIMEOUT, AlfredContext, mcp
 
 logger = logging.getLogger(__name__)
 
@@ -31,24 +29,133 @@ logger = logging.getLogger(__name__)
 
 _LOG_DIR = Path.home() / ".alfred"
 _LOG_FILE = _LOG_DIR / "mcp-sessions.jsonl"
+_LOG_FLUSH_LINES = 64
+_LOG_FLUSH_SECONDS = 1.0
+_log_file_lock = threading.Lock()
+
+
+def _append_lines(path: Path, lines: list[str]) -> None:
+    """Append lines to a session log. Best-effort, never raises."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with _log_file_lock, path.open("a") as f:
+            f.write("".join(lines))
+    except Exception:
+        pass
+
+
+def _write_entries(entries: list[tuple[Path, str]]) -> None:
+    by_path: dict[Path, list[str]] = {}
+    for path, line in entries:
+        by_path.setdefault(path, []).append(line)
+    for path, lines in by_path.items():
+        _append_lines(path, lines)
+
+
+class _CallLogWriter:
+    """Buffers session-log lines and appends them in a worker thread.
+
+    ``log`` never touches the file on the event loop: lines are flushed
+    together ``_LOG_FLUSH_SECONDS`` after the first pending one, or at once
+    when ``_LOG_FLUSH_LINES`` are pending. Each line keeps the log file it was
+    logged for. Lines are written synchronously when no loop is running
+    (scripts), when the loop cancels the flush timer on shutdown, and when
+    the loop that buffered them is gone by the next ``log`` call.
+    """
+
+    def __init__(self) -> None:
+        self._pending: list[tuple[Path, str]] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._timer: asyncio.Task[None] | None = None
+        self._flushes: set[asyncio.Task[None]] = set()
+        self._lock = threading.Lock()
+
+    def log(self, line: str) -> None:
+        entry = (_LOG_FILE, line)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        with self._lock:
+            orphaned: list[tuple[Path, str]] = []
+            if self._loop is not loop:
+                orphaned, self._pending = self._pending, []
+            if loop is not None:
+                self._pending.append(entry)
+                self._loop = loop
+            pending = len(self._pending)
+        if orphaned:
+            # Buffered under a loop that is no longer running this code; its
+            # timer may never fire.
+            _write_entries(orphaned)
+        if loop is None:
+            _write_entries([entry])
+            return
+        if pending >= _LOG_FLUSH_LINES:
+            task = loop.create_task(self.flush())
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+        elif self._timer is None or self._timer.done() or self._timer.get_loop() is not loop:
+            self._timer = loop.create_task(self._flush_later())
+
+    async def flush(self) -> None:
+        entries = self._take()
+        if entries:
+            await asyncio.to_thread(_write_entries, entries)
+
+    async def aclose(self) -> None:
+        loop = asyncio.get_running_loop()
+        timer = self._timer
+        if timer is not None and not timer.done() and timer.get_loop() is loop:
+            timer.cancel()
+        flushes = [task for task in self._flushes if task.get_loop() is loop]
+        if flushes:
+            await asyncio.gather(*flushes, return_exceptions=True)
+        await self.flush()
+
+    def close(self) -> None:
+        """Write pending lines synchronously (interpreter exit)."""
+        _write_entries(self._take())
+
+    async def _flush_later(self) -> None:
+        try:
+            await asyncio.sleep(_LOG_FLUSH_SECONDS)
+        except asyncio.CancelledError:
+            # The loop is shutting down; no worker thread will pick these up.
+            self.close()
+            raise
+        await self.flush()
+
+    def _take(self) -> list[tuple[Path, str]]:
+        with self._lock:
+            entries, self._pending = self._pending, []
+            self._loop = None
+        return entries
+
+
+_call_log = _CallLogWriter()
+atexit.register(_call_log.close)
 
 
 def _log_call(session_id: str, tool: str, **extra: Any) -> None:
-    """Append a JSONL line to the session log. Best-effort, never raises."""
+    """Queue a JSONL line for the session log. Best-effort, never raises."""
     try:
-        _LOG_DIR.mkdir(parents=True, exist_ok=True)
         entry = {
             "ts": datetime.now(UTC).isoformat(),
             "tool": tool,
             "session_id": session_id,
             **extra,
         }
-        with _LOG_FILE.open("a") as f:
-            f.write(json.dumps(entry, default=str) + "\n")
+        _call_log.log(json.dumps(entry, default=str) + "\n")
     except Exception:
         pass
 
 
+async def flush_call_log() -> None:
+    """Write every queued session-log line; called on server shutdown."""
+    await _call_log.aclose()
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -293,16 +400,35 @@ async def save_insight(
 # ---------------------------------------------------------------------------
 
 
+# Serialized spec per app version; FastAPI builds the schema once per app.
+_OPENAPI_CACHE: dict[str, str] = {}
+
+
+async def _openapi_json(app: AlfredContext) -> str:
+    if app.api_app is not None:
+        key = f"{app.api_app.title}:{app.api_app.version}"
+    else:
+        key = app.api_base
+    spec = _OPENAPI_CACHE.get(key)
+    if spec is None:
+        if app.api_app is not None:
+            doc = app.api_app.openapi()
+        else:
+            resp = await app.api.get("/openapi.json", timeout=10)
+            resp.raise_for_status()
+            doc = resp.json()
+        spec = json.dumps(doc, indent=2)
+        _OPENAPI_CACHE[key] = spec
+    return spec
+
+
 @mcp.resource("alfred://openapi-spec")
 async def openapi_spec() -> str:
     """Alfred's full OpenAPI specification. Read this to discover all available
     API endpoints, their parameters, request bodies, and response schemas.
 
     Use with the alfred_api tool to call any endpoint."""
-    async with httpx.AsyncClient(base_url=ALFRED_API_BASE, timeout=10) as client:
-        resp = await client.get("/openapi.json")
-        resp.raise_for_status()
-        return json.dumps(resp.json(), indent=2)
+    return await _openapi_json(_get_app(mcp.get_context()))
 
 
 @mcp.tool()
@@ -335,13 +461,16 @@ async def alfred_api(
         return {"error": f"Unsupported HTTP method: {method}"}
 
     try:
-        async with httpx.AsyncClient(base_url=ALFRED_API_BASE, timeout=30) as client:
-            resp = await client.request(
+        # The in-process transport ignores httpx timeouts, so bound the call here.
+        resp = await asyncio.wait_for(
+            app.api.request(
                 method=method,
                 url=path,
                 json=body if body and method in {"POST", "PATCH", "PUT"} else None,
                 params=query_params,
-            )
+            ),
+            timeout=ALFRED_API_TIMEOUT,
+        )
 
         _log_call(app.session_id, "alfred_api", method=method, path=path, status=resp.status_code)
 
@@ -360,8 +489,8 @@ async def alfred_api(
         return result if isinstance(result, dict) else {"data": result}
 
     except httpx.ConnectError:
-        return {"error": "Cannot connect to Alfred API at " + ALFRED_API_BASE + ". Is the backend running?"}
-    except httpx.TimeoutException:
+        return {"error": "Cannot connect to Alfred API at " + app.api_base + ". Is the backend running?"}
+    except (httpx.TimeoutException, TimeoutError):
         return {"error": f"Request timed out: {method} {path}"}
     except Exception as e:
         logger.exception("alfred_api failed")
@@ -0,0 +1,57 @@
+"""Add weighted full-text search vector and trigram index on zettel_cards.
+
+`search_vector` is a stored generated column so it never drifts from the row:
+- A: title
+- B: tags, topic
+- C: summary
+- D: content
+
+A GIN index serves `@@` matches; a trigram GIN index on `lower(title)` serves
+fuzzy/substring title matches for identifiers the tokenizer splits poorly.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import context, op
+
+revision: str = "u2v3w4x5y6z7"
+down_revision: str | Sequence[str] | None = "t1a2s3k4o5s6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Postgres-only (tsvector, generated columns, pg_trgm).
+    if context.get_context().dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "ALTER TABLE zettel_cards ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        "GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('simple'::regconfig, coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('simple'::regconfig, coalesce(tags::text, '')), 'B') || "
+        "setweight(to_tsvector('simple'::regconfig, coalesce(topic, '')), 'B') || "
+        "setweight(to_tsvector('simple'::regconfig, coalesce(summary, '')), 'C') || "
+        "setweight(to_tsvector('simple'::regconfig, coalesce(content, '')), 'D')"
+        ") STORED"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_zettel_cards_search_vector "
+        "ON zettel_cards USING gin (search_vector)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_zettel_cards_title_trgm "
+        "ON zettel_cards USING gin (lower(title) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    if context.get_context().dialect.name != "postgresql":
+        return
+
+    op.execute("DROP INDEX IF EXISTS ix_zettel_cards_title_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_zettel_cards_search_vector")
+    op.execute("ALTER TABLE zettel_cards DROP COLUMN IF EXISTS search_vector")
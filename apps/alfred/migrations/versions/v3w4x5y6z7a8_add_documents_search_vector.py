@@ -0,0 +1,52 @@
+"""Add weighted full-text search vector and trigram title index on documents.
+
+`search_vector` is a stored generated column (english config):
+- A: title
+- B: cleaned_text (first 200k characters, keeping it under the tsvector size cap)
+
+A GIN index serves `@@` matches from the explorer search box; a trigram GIN
+index on `title` keeps the `title ILIKE '%q%'` branch index-backed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import context, op
+
+revision: str = "v3w4x5y6z7a8"
+down_revision: str | Sequence[str] | None = "u2v3w4x5y6z7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Postgres-only (tsvector, generated columns, pg_trgm).
+    if context.get_context().dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "ALTER TABLE documents ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        "GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english'::regconfig, left(coalesce(cleaned_text, ''), 200000)), 'B')"
+        ") STORED"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_documents_search_vector "
+        "ON documents USING gin (search_vector)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_documents_title_trgm "
+        "ON documents USING gin (title gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    if context.get_context().dialect.name != "postgresql":
+        return
+
+    op.execute("DROP INDEX IF EXISTS ix_documents_title_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_documents_search_vector")
+    op.execute("ALTER TABLE documents DROP COLUMN IF EXISTS search_vector")
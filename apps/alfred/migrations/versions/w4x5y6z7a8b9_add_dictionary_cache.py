@@ -0,0 +1,38 @@
+"""add dictionary_cache table
+
+Revision ID: w4x5y6z7a8b9
+Revises: v3w4x5y6z7a8
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "w4x5y6z7a8b9"
+down_revision: str | Sequence[str] | None = "v3w4x5y6z7a8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "dictionary_cache",
+        sa.Column("id", sa.Integer, primary_key=True, autoincrement=True, nullable=False),
+        sa.Column("source", sa.String(length=32), nullable=False),
+        sa.Column("cache_key", sa.String(length=512), nullable=False),
+        sa.Column("value", sa.JSON, nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.UniqueConstraint("source", "cache_key", name="uq_dictionary_cache_source_key"),
+    )
+    op.create_index("ix_dictionary_cache_expires_at", "dictionary_cache", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_dictionary_cache_expires_at", table_name="dictionary_cache")
+    op.drop_table("dictionary_cache")
@@ -0,0 +1,28 @@
+"""add running context summary to agent threads
+
+Revision ID: x5y6z7a8b9c0
+Revises: w4x5y6z7a8b9
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "x5y6z7a8b9c0"
+down_revision = "w4x5y6z7a8b9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("thinking_sessions", sa.Column("context_summary", sa.Text(), nullable=True))
+    op.add_column(
+        "thinking_sessions", sa.Column("context_summary_through", sa.Integer(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("thinking_sessions", "context_summary_through")
+    op.drop_column("thinking_sessions", "context_summary")
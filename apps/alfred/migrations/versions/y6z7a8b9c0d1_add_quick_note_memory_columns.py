@@ -0,0 +1,66 @@
+"""promote memory kind/user_id to indexed quick_notes columns, add embedding
+
+Revision ID: y6z7a8b9c0d1
+Revises: x5y6z7a8b9c0
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import context, op
+
+revision = "y6z7a8b9c0d1"
+down_revision = "x5y6z7a8b9c0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("quick_notes", sa.Column("kind", sa.String(length=32), nullable=True))
+    op.add_column("quick_notes", sa.Column("user_id", sa.Integer(), nullable=True))
+    op.add_column("quick_notes", sa.Column("embedding", sa.JSON(), nullable=True))
+
+    # Backfill from the JSON payload written by MemoryService before this revision.
+    if context.get_context().dialect.name == "postgresql":
+        op.execute(
+            """
+            UPDATE quick_notes
+            SET kind = left(metadata->>'kind', 32),
+                user_id = CASE
+                    WHEN metadata->>'user_id' ~ '^-?[0-9]{1,9}$'
+                    THEN (metadata->>'user_id')::integer
+                END
+            WHERE metadata->>'kind' IS NOT NULL OR metadata->>'user_id' IS NOT NULL
+            """
+        )
+    else:
+        op.execute(
+            """
+            UPDATE quick_notes
+            SET kind = substr(json_extract(metadata, '$.kind'), 1, 32),
+                user_id = CASE
+                    WHEN json_type(metadata, '$.user_id') = 'integer'
+                    THEN json_extract(metadata, '$.user_id')
+                    WHEN json_type(metadata, '$.user_id') = 'text'
+                        AND json_extract(metadata, '$.user_id') GLOB '[0-9]*'
+                        AND json_extract(metadata, '$.user_id') NOT GLOB '*[^0-9]*'
+                    THEN CAST(json_extract(metadata, '$.user_id') AS INTEGER)
+                END
+            WHERE json_extract(metadata, '$.kind') IS NOT NULL
+                OR json_extract(metadata, '$.user_id') IS NOT NULL
+            """
+        )
+
+    op.create_index(
+        "ix_quick_notes_kind_user_created",
+        "quick_notes",
+        ["kind", "user_id", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_quick_notes_kind_user_created", table_name="quick_notes")
+    op.drop_column("quick_notes", "embedding")
+    op.drop_column("quick_notes", "user_id")
+    op.drop_column("quick_notes", "kind")
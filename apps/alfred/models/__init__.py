@@ -47,6 +47,7 @@ from alfred.models.taxonomy import TaxonomyNodeRow
 from alfred.models.thinking import AgentMessageRow, ThinkingSessionRow
 from alfred.models.today import DailyEntryRow, DailyReflectionRow
 from alfred.models.user import User
+from alfred.models.vocabulary import DictionaryCacheEntry
 from alfred.models.whiteboard import Whiteboard, WhiteboardComment, WhiteboardRevision
 from alfred.models.zettel import ZettelCard, ZettelLink, ZettelReview, ZettelSession
 
@@ -104,4 +105,5 @@ __all__ = [
     "UserTaskGamificationProfileRow",
     "UserTaskRewardProgressRow",
     "UserTaskRewardRow",
+    "DictionaryCacheEntry",
 ]
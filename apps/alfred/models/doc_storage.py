@@ -107,9 +107,16 @@ class _JsonObjectType(TypeDecorator[dict[str, Any] | None]):
 
 
 class QuickNoteRow(SQLModel, table=True):
-    """Lightweight note record for quick capture (legacy Atheneum notes)."""
+    """Lightweight note record for quick capture (legacy Atheneum notes).
+
+    ``kind`` and ``user_id`` mirror the same keys in ``metadata`` so memory
+    lookups can filter on an index instead of the JSON payload.
+    """
 
     __tablename__ = "quick_notes"
+    __table_args__ = (
+        sa.Index("ix_quick_notes_kind_user_created", "kind", "user_id", "created_at"),
+    )
 
     id: uuid.UUID = Field(
         default_factory=uuid.uuid4,
@@ -126,6 +133,11 @@ class QuickNoteRow(SQLModel, table=True):
             server_default=sa.text("'{}'"),
         ),
     )
+    kind: str | None = Field(default=None, sa_column=sa.Column(sa.String(32), nullable=True))
+    user_id: int | None = Field(default=None, sa_column=sa.Column(sa.Integer, nullable=True))
+    embedding: list[float] | None = Field(
+        default=None, sa_column=sa.Column(sa.JSON(none_as_null=True), nullable=True)
+    )
     created_at: datetime = Field(
         default_factory=_utcnow,
         sa_column=sa.Column(
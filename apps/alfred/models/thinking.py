@@ -55,6 +55,12 @@ class ThinkingSessionRow(Model, table=True):
     source_kind: str | None = Field(default=None, sa_column=Column(String(32), nullable=True))
     source_id: str | None = Field(default=None, sa_column=Column(String(96), nullable=True))
     model_id: str | None = Field(default=None, sa_column=Column(String(128), nullable=True))
+    # Running summary of agent messages folded out of the prompt window, and the
+    # id of the last AgentMessageRow it covers.
+    context_summary: str | None = Field(default=None, sa_column=Column(Text, nullable=True))
+    context_summary_through: int | None = Field(
+        default=None, sa_column=Column(Integer, nullable=True)
+    )
 
 
 class AgentMessageRow(Model, table=True):
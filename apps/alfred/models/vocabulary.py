@@ -3,8 +3,20 @@
 from __future__ import annotations
 
 import enum
-
-from sqlalchemy import JSON, Column, ForeignKey, Index, Integer, SmallInteger, String, Text
+from datetime import datetime
+
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlmodel import Field
 
 from alfred.models.base import Model
@@ -64,3 +76,18 @@ class VocabularyEntry(Model, table=True):
         default=None,
         sa_column=Column(Integer, ForeignKey("zettel_cards.id"), nullable=True),
     )
+
+
+class DictionaryCacheEntry(Model, table=True):
+    """Shared cache tier for dictionary lookups, one row per (source, cache_key)."""
+
+    __tablename__ = "dictionary_cache"
+    __table_args__ = (
+        UniqueConstraint("source", "cache_key", name="uq_dictionary_cache_source_key"),
+        Index("ix_dictionary_cache_expires_at", "expires_at"),
+    )
+
+    source: str = Field(sa_column=Column(String(32), nullable=False))
+    cache_key: str = Field(sa_column=Column(String(512), nullable=False))
+    value: dict = Field(sa_column=Column(JSON, nullable=False))
+    expires_at: datetime = Field(sa_column=Column(DateTime(timezone=True), nullable=False))
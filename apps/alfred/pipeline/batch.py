@@ -0,0 +1,188 @@
+"""Micro-batched pipeline runner for backfills.
+
+Runs the same stage functions as the graph, but over many documents at once:
+load and chunk serially, look up the extract/classify cache for the whole
+batch with one ``get_many`` per stage, then run extract + classify on a
+bounded thread pool only for documents that still need an LLM call, then
+embed every chunk of the batch through large ``index_documents`` batches
+(upserts of ``embed_batch_size`` points, then one stale-chunk delete for the
+whole batch), then persist. The batch shares one
+``stage_cache_scope()``.
+
+Batch runs are not checkpointed. A failed document is reported in
+``failed`` and the rest of the batch continues.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any
+
+from alfred.pipeline.cache import current_stage_cache, stage_cache_scope
+from alfred.pipeline.nodes import chunk, classify, extract, load_document, persist
+from alfred.pipeline.nodes.embed import _get_knowledge_service, chunk_index_docs
+from alfred.pipeline.nodes.extract import extract_cache_key
+from alfred.pipeline.state import DocumentPipelineState
+
+logger = logging.getLogger(__name__)
+
+
+def _get_cache():
+    return current_stage_cache()
+
+
+def _llm_stages(state: DocumentPipelineState) -> DocumentPipelineState:
+    # Stages already served from the batch cache lookup are skipped.
+    if "extract" not in state["cache_hits"]:
+        state.update(extract(state))
+    if "classify" not in state["cache_hits"]:
+        state.update(classify(state))
+    return state
+
+
+def _apply_cached_stages(states: list[DocumentPipelineState]) -> list[DocumentPipelineState]:
+    """Fill extract/classify from the cache in one query per stage.
+
+    Returns the states that still need at least one LLM stage. Their nodes
+    skip the per-document cache read, since the batch lookup already missed.
+    """
+    cache = _get_cache()
+    extract_keys = {
+        s["doc_id"]: extract_cache_key(s.get("content_hash", ""), s.get("metadata") or {})
+        for s in states
+    }
+    enrichments = cache.get_many("extract", extract_keys.values())
+    classifications = cache.get_many("classify", (s.get("content_hash", "") for s in states))
+
+    pending: list[DocumentPipelineState] = []
+    for state in states:
+        state["cache_checked"] = ["extract", "classify"]
+        enrichment = enrichments.get(extract_keys[state["doc_id"]])
+        if enrichment is not None:
+            state["enrichment"] = enrichment
+            state["cache_hits"].append("extract")
+        classification = classifications.get(state.get("content_hash", ""))
+        if classification is not None:
+            state["classification"] = classification
+            state["cache_hits"].append("classify")
+        if enrichment is None or classification is None:
+            pending.append(state)
+    return pending
+
+
+def run_pipeline_batch(
+    doc_ids: list[str],
+    *,
+    user_id: str = "",
+    force_replay: bool = False,
+    llm_concurrency: int = 4,
+    embed_batch_size: int = 256,
+) -> dict[str, Any]:
+    """Run the pipeline over ``doc_ids`` as one batch.
+
+    Returns ``{"completed": [...], "failed": {doc_id: error}, "errored": [...],
+    "chunks_indexed": int, "stage_timings": {...}}``. ``errored`` lists
+    documents whose content was rejected at load (persisted as errors).
+    """
+    timings: dict[str, float] = {}
+    failed: dict[str, str] = {}
+    states: list[DocumentPipelineState] = []
+
+    def _timed(stage: str, started: float) -> None:
+        timings[stage] = time.perf_counter() - started
+
+    with stage_cache_scope():
+        started = time.perf_counter()
+        for doc_id in doc_ids:
+            state: DocumentPipelineState = {
+                "doc_id": doc_id,
+                "user_id": user_id,
+                "errors": [],
+                "cache_hits": [],
+                "force_replay": force_replay,
+            }
+            try:
+                state.update(load_document(state))
+                if not state.get("errors"):
+                    state.update(chunk(state))
+            except Exception as exc:
+                logger.warning("Batch load/chunk failed for %s", doc_id, exc_info=True)
+                failed[doc_id] = str(exc)
+                continue
+            states.append(state)
+        _timed("load_chunk", started)
+
+        runnable = [s for s in states if not s.get("errors")]
+
+        started = time.perf_counter()
+        needs_llm = runnable if force_replay else _apply_cached_stages(runnable)
+        logger.info(
+            "Pipeline batch: %d of %d documents need LLM stages",
+            len(needs_llm),
+            len(runnable),
+        )
+        with ThreadPoolExecutor(max_workers=max(1, llm_concurrency)) as pool:
+            # Workers need the caller's context for current_stage_cache().
+            futures = {
+                pool.submit(contextvars.copy_context().run, _llm_stages, s): s["doc_id"]
+                for s in needs_llm
+            }
+            for future in as_completed(futures):
+                doc_id = futures[future]
+                try:
+                    future.result()
+                except Exception as exc:
+                    logger.warning("Batch LLM stages failed for %s", doc_id, exc_info=True)
+                    failed[doc_id] = str(exc)
+        _timed("extract_classify", started)
+
+        runnable = [s for s in runnable if s["doc_id"] not in failed]
+
+        started = time.perf_counter()
+        index_docs: list[dict[str, Any]] = []
+        for state in runnable:
+            index_docs.extend(chunk_index_docs(state["doc_id"], state.get("chunks", [])))
+        chunks_indexed = 0
+        if index_docs:
+            svc = _get_knowledge_service()
+            indexed = svc.index_documents(index_docs, batch_size=embed_batch_size)
+            svc.delete_stale_chunks([s["doc_id"] for s in runnable], indexed)
+            chunks_indexed = len(indexed)
+        for state in runnable:
+            state["embedding_indexed"] = bool(state.get("chunks"))
+        _timed("embed", started)
+
+        started = time.perf_counter()
+        for state in states:
+            doc_id = state["doc_id"]
+            if doc_id in failed:
+                continue
+            try:
+                persist(state)
+            except Exception as exc:
+                logger.warning("Batch persist failed for %s", doc_id, exc_info=True)
+                failed[doc_id] = str(exc)
+        _timed("persist", started)
+
+    errored = [s["doc_id"] for s in states if s.get("errors") and s["doc_id"] not in failed]
+    completed = [
+        s["doc_id"] for s in states if not s.get("errors") and s["doc_id"] not in failed
+    ]
+    logger.info(
+        "Pipeline batch: %d completed, %d errored, %d failed, %d chunks indexed, timings=%s",
+        len(completed),
+        len(errored),
+        len(failed),
+        chunks_indexed,
+        {k: round(v, 3) for k, v in timings.items()},
+    )
+    return {
+        "completed": completed,
+        "errored": errored,
+        "failed": failed,
+        "chunks_indexed": chunks_indexed,
+        "stage_timings": timings,
+    }
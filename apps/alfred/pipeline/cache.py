@@ -1,17 +1,34 @@
-"""PostgreSQL-backed stage result cache for LLM-calling pipeline nodes."""
+"""PostgreSQL-backed stage result cache for LLM-calling pipeline nodes.
+
+Nodes reach the cache through ``current_stage_cache()``. It returns the cache
+bound to the active ``stage_cache_scope()``, which owns one session for the
+whole scope and closes it on exit. The graph opens a scope around each node,
+and a caller can open an outer scope around a run or a whole batch to share
+one session across them.
+"""
 
 from __future__ import annotations
 
 import json
 import logging
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import UTC, datetime
 from typing import Any
 
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlmodel import Field, Session, SQLModel, select
 
 logger = logging.getLogger(__name__)
 
+_GET_MANY_CHUNK = 500
+_scoped_cache: ContextVar[PipelineStageCache | None] = ContextVar(
+    "pipeline_stage_cache", default=None
+)
+
 
 class PipelineStageCacheRow(SQLModel, table=True):
     __tablename__ = "pipeline_stage_cache"
@@ -30,36 +47,98 @@ class PipelineStageCacheRow(SQLModel, table=True):
 
 
 class PipelineStageCache:
-    """Simple cache: (stage, content_hash) -> result dict."""
+    """Simple cache: (stage, content_hash) -> result dict.
+
+    Safe to share between the threads of one graph run; session access is
+    serialized with a lock.
+    """
 
     def __init__(self, *, session: Session) -> None:
         self._session = session
+        self._lock = threading.Lock()
 
     def get(self, stage: str, content_hash: str) -> dict[str, Any] | None:
-        stmt = select(PipelineStageCacheRow).where(
+        stmt = select(PipelineStageCacheRow.result_json).where(
             PipelineStageCacheRow.stage == stage,
             PipelineStageCacheRow.content_hash == content_hash,
         )
-        row = self._session.exec(stmt).first()
-        if row is None:
+        with self._lock:
+            result_json = self._session.exec(stmt).first()
+        if result_json is None:
             return None
-        return json.loads(row.result_json)
+        return json.loads(result_json)
+
+    def get_many(self, stage: str, content_hashes: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Return cached results for ``content_hashes``; misses are absent from the dict."""
+        hashes = list(dict.fromkeys(content_hashes))
+        found: dict[str, dict[str, Any]] = {}
+        for start in range(0, len(hashes), _GET_MANY_CHUNK):
+            stmt = select(
+                PipelineStageCacheRow.content_hash, PipelineStageCacheRow.result_json
+            ).where(
+                PipelineStageCacheRow.stage == stage,
+                PipelineStageCacheRow.content_hash.in_(hashes[start : start + _GET_MANY_CHUNK]),
+            )
+            with self._lock:
+                rows = self._session.exec(stmt).all()
+            for content_hash, result_json in rows:
+                found[content_hash] = json.loads(result_json)
+        return found
 
     def set(self, stage: str, content_hash: str, result: dict[str, Any]) -> None:
-        stmt = select(PipelineStageCacheRow).where(
-            PipelineStageCacheRow.stage == stage,
-            PipelineStageCacheRow.content_hash == content_hash,
+        insert = (
+            sqlite.insert
+            if self._session.get_bind().dialect.name == "sqlite"
+            else postgresql.insert
         )
-        row = self._session.exec(stmt).first()
-        serialized = json.dumps(result, default=str)
-        if row is not None:
-            row.result_json = serialized
-            row.created_at = datetime.now(UTC)
-        else:
-            row = PipelineStageCacheRow(
-                stage=stage,
-                content_hash=content_hash,
-                result_json=serialized,
-            )
-            self._session.add(row)
-        self._session.commit()
+        stmt = insert(PipelineStageCacheRow).values(
+            stage=stage,
+            content_hash=content_hash,
+            result_json=json.dumps(result, default=str),
+            created_at=datetime.now(UTC),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["stage", "content_hash"],
+            set_={
+                "result_json": stmt.excluded.result_json,
+                "created_at": stmt.excluded.created_at,
+            },
+        )
+        with self._lock:
+            try:
+                self._session.execute(stmt)
+                self._session.commit()
+            except Exception:
+                self._session.rollback()
+                raise
+
+
+@contextmanager
+def stage_cache_scope() -> Iterator[PipelineStageCache]:
+    """Bind a stage cache with its own session for the duration of the block.
+
+    Nested scopes reuse the outer cache, so one session serves a whole run
+    (or batch) when the caller opens the outermost scope.
+    """
+    existing = _scoped_cache.get()
+    if existing is not None:
+        yield existing
+        return
+
+    from alfred.core.database import SessionLocal
+
+    session = SessionLocal()
+    cache = PipelineStageCache(session=session)
+    token = _scoped_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _scoped_cache.reset(token)
+        session.close()
+
+
+def current_stage_cache() -> PipelineStageCache:
+    cache = _scoped_cache.get()
+    if cache is None:
+        raise RuntimeError("No pipeline stage cache in scope; wrap the call in stage_cache_scope().")
+    return cache
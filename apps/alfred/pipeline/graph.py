@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any
 
 from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import END, StateGraph
 
+from alfred.pipeline.cache import stage_cache_scope
 from alfred.pipeline.nodes import (
     chunk,
     classify,
@@ -16,21 +18,25 @@ from alfred.pipeline.nodes import (
     load_document,
     persist,
 )
-from alfred.pipeline.router import resolve_next_stage
-from alfred.pipeline.state import DocumentPipelineState
+from alfred.pipeline.router import resolve_next_stage, resolve_parallel_stages
+from alfred.pipeline.state import PARALLEL_STAGES, DocumentPipelineState
 
 logger = logging.getLogger(__name__)
 
 
 def _wrap_node(fn, name: str):
-    """Wrap a node function with error logging."""
+    """Wrap a node function with error logging, timing and a stage-cache scope."""
 
     def wrapper(state: DocumentPipelineState) -> dict[str, Any]:
+        started = time.perf_counter()
         try:
-            return fn(state)
+            with stage_cache_scope():
+                result = fn(state)
         except Exception:
             logger.exception("Pipeline node '%s' failed", name)
             raise
+        elapsed = time.perf_counter() - started
+        return {**(result or {}), "stage_timings": {name: elapsed}}
 
     wrapper.__name__ = name
     return wrapper
@@ -39,8 +45,14 @@ def _wrap_node(fn, name: str):
 def build_pipeline_graph(
     *,
     checkpointer: BaseCheckpointSaver | None = None,
+    parallel: bool = False,
 ) -> Any:
-    """Build and compile the document pipeline StateGraph."""
+    """Build and compile the document pipeline StateGraph.
+
+    With ``parallel=True`` extract, classify and embed fan out after chunk
+    (or after load_document on replay) and join at persist, which runs once
+    all branches of that superstep have finished.
+    """
 
     graph = StateGraph(DocumentPipelineState)
 
@@ -55,7 +67,7 @@ def build_pipeline_graph(
 
     graph.add_conditional_edges(
         "load_document",
-        resolve_next_stage,
+        resolve_parallel_stages if parallel else resolve_next_stage,
         {
             "chunk": "chunk",
             "extract": "extract",
@@ -65,10 +77,15 @@ def build_pipeline_graph(
         },
     )
 
-    graph.add_edge("chunk", "extract")
-    graph.add_edge("extract", "classify")
-    graph.add_edge("classify", "embed")
-    graph.add_edge("embed", "persist")
+    if parallel:
+        for stage in PARALLEL_STAGES:
+            graph.add_edge("chunk", stage)
+            graph.add_edge(stage, "persist")
+    else:
+        graph.add_edge("chunk", "extract")
+        graph.add_edge("extract", "classify")
+        graph.add_edge("classify", "embed")
+        graph.add_edge("embed", "persist")
     graph.add_edge("persist", END)
 
     return graph.compile(checkpointer=checkpointer)
@@ -22,11 +22,9 @@ def _get_extraction_service():
 
 
 def _get_cache():
-    from alfred.core.database import SessionLocal
-    from alfred.pipeline.cache import PipelineStageCache
+    from alfred.pipeline.cache import current_stage_cache
 
-    session = SessionLocal()
-    return PipelineStageCache(session=session)
+    return current_stage_cache()
 
 
 def classify(state: DocumentPipelineState) -> dict[str, Any]:
@@ -37,7 +35,8 @@ def classify(state: DocumentPipelineState) -> dict[str, Any]:
 
     if not force:
         cache = _get_cache()
-        cached = cache.get("classify", content_hash)
+        checked = "classify" in state.get("cache_checked", [])
+        cached = None if checked else cache.get("classify", content_hash)
         if cached is not None:
             logger.info("Cache hit for classify:%s", content_hash)
             cache_hits.append("classify")
@@ -51,7 +50,6 @@ def classify(state: DocumentPipelineState) -> dict[str, Any]:
     classification = svc.classify_taxonomy(text=state["cleaned_text"])
 
     if not force:
-        cache = _get_cache()
         cache.set("classify", content_hash, classification)
 
     logger.info("Classified: domain=%s", classification.get("domain"))
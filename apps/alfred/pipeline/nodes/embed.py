@@ -11,22 +11,14 @@ logger = logging.getLogger(__name__)
 
 
 def _get_knowledge_service():
-    from alfred.services.knowledge import KnowledgeService
-    return KnowledgeService()
+    from alfred.core.dependencies import get_knowledge_service
 
+    return get_knowledge_service()
 
-def embed(state: DocumentPipelineState) -> dict[str, Any]:
-    """Transform chunks to Qdrant format and index."""
-    doc_id = state["doc_id"]
-    chunks = state.get("chunks", [])
-
-    if not chunks:
-        logger.warning("No chunks to embed for %s", doc_id)
-        return {"embedding_indexed": False, "stage": "embed"}
-
-    svc = _get_knowledge_service()
 
-    index_docs = [
+def chunk_index_docs(doc_id: str, chunks: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Map pipeline chunks to ``KnowledgeService.index_documents`` input."""
+    return [
         {
             "id": f"{doc_id}:{chunk['idx']}",
             "text": chunk["text"],
@@ -40,7 +32,24 @@ def embed(state: DocumentPipelineState) -> dict[str, Any]:
         for chunk in chunks
     ]
 
+
+def embed(state: DocumentPipelineState) -> dict[str, Any]:
+    """Transform chunks to Qdrant format and index."""
+    doc_id = state["doc_id"]
+    chunks = state.get("chunks", [])
+
+    if not chunks:
+        logger.warning("No chunks to embed for %s", doc_id)
+        return {"embedding_indexed": False, "stage": "embed"}
+
+    svc = _get_knowledge_service()
+
+    index_docs = chunk_index_docs(doc_id, chunks)
+
+    # Upsert first, then drop chunks a shorter re-chunk left behind, so the
+    # document never drops out of search while it is re-indexed.
     ids = svc.index_documents(index_docs)
+    svc.delete_stale_chunks([doc_id], ids)
     logger.info("Indexed %d chunks for %s", len(ids), doc_id)
 
     return {"embedding_indexed": True, "stage": "embed"}
@@ -24,29 +24,33 @@ def _get_extraction_service():
 
 
 def _get_cache():
-    from alfred.core.database import SessionLocal
-    from alfred.pipeline.cache import PipelineStageCache
+    from alfred.pipeline.cache import current_stage_cache
 
-    session = SessionLocal()
-    return PipelineStageCache(session=session)
+    return current_stage_cache()
+
+
+def extract_cache_key(content_hash: str, metadata: dict[str, Any] | None) -> str:
+    """Stage-cache key for extract: the content hash plus a metadata fingerprint."""
+    if not metadata:
+        return content_hash
+    metadata_fingerprint = hashlib.sha256(
+        json.dumps(metadata, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()[:16]
+    return f"{content_hash}:{metadata_fingerprint}"
 
 
 def extract(state: DocumentPipelineState) -> dict[str, Any]:
     """Run extract_all + extract_graph and merge into enrichment dict."""
     content_hash = state.get("content_hash", "")
     metadata = state.get("metadata") or {}
-    cache_key = content_hash
-    if metadata:
-        metadata_fingerprint = hashlib.sha256(
-            json.dumps(metadata, sort_keys=True, default=str).encode("utf-8")
-        ).hexdigest()[:16]
-        cache_key = f"{content_hash}:{metadata_fingerprint}"
+    cache_key = extract_cache_key(content_hash, metadata)
     force = state.get("force_replay", False)
     cache_hits = list(state.get("cache_hits", []))
 
     if not force:
         cache = _get_cache()
-        cached = cache.get("extract", cache_key)
+        checked = "extract" in state.get("cache_checked", [])
+        cached = None if checked else cache.get("extract", cache_key)
         if cached is not None:
             logger.info("Cache hit for extract:%s", content_hash)
             cache_hits.append("extract")
@@ -70,7 +74,6 @@ def extract(state: DocumentPipelineState) -> dict[str, Any]:
         enrichment["entities"] = graph_data["entities"]
 
     if not force:
-        cache = _get_cache()
         cache.set("extract", cache_key, enrichment)
 
     logger.info(
@@ -5,7 +5,12 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from alfred.pipeline.state import STAGE_ORDER, STAGE_PREREQUISITES, DocumentPipelineState
+from alfred.pipeline.state import (
+    PARALLEL_STAGES,
+    STAGE_ORDER,
+    STAGE_PREREQUISITES,
+    DocumentPipelineState,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -62,3 +67,15 @@ def resolve_next_stage(state: DocumentPipelineState) -> str:
         )
 
     return _earliest_incomplete_stage(state)
+
+
+def resolve_parallel_stages(state: DocumentPipelineState) -> list[str]:
+    """Routing for the parallel graph: fan out to every remaining parallel stage.
+
+    Replaying from ``classify`` still runs ``embed`` alongside it, matching
+    what the serial graph would execute after that point.
+    """
+    target = resolve_next_stage(state)
+    if target in PARALLEL_STAGES:
+        return PARALLEL_STAGES[PARALLEL_STAGES.index(target):]
+    return [target]
@@ -2,7 +2,27 @@
 
 from __future__ import annotations
 
-from typing import Any, TypedDict
+from typing import Annotated, Any, TypedDict
+
+
+def _last_value(left: str | None, right: str | None) -> str | None:
+    """Reducer for fields that several parallel branches may write in one step."""
+    return right if right is not None else left
+
+
+def _merge_unique(left: list[str] | None, right: list[str] | None) -> list[str]:
+    """Order-preserving union, so branches echoing the full list don't duplicate."""
+    merged = list(left or [])
+    for item in right or []:
+        if item not in merged:
+            merged.append(item)
+    return merged
+
+
+def _merge_timings(
+    left: dict[str, float] | None, right: dict[str, float] | None,
+) -> dict[str, float]:
+    return {**(left or {}), **(right or {})}
 
 
 class DocumentPipelineState(TypedDict, total=False):
@@ -24,10 +44,12 @@ class DocumentPipelineState(TypedDict, total=False):
     embedding_indexed: bool            # from embed node
 
     # Pipeline metadata
-    stage: str                         # current stage name
-    errors: list[dict[str, Any]]       # [{stage, error, timestamp}]
-    cache_hits: list[str]              # stages that returned cached results
+    stage: Annotated[str, _last_value]             # current stage name
+    errors: list[dict[str, Any]]                   # [{stage, error, timestamp}]
+    cache_hits: Annotated[list[str], _merge_unique]  # stages that returned cached results
+    stage_timings: Annotated[dict[str, float], _merge_timings]  # stage -> wall seconds
     force_replay: bool                 # bypass cache for all stages
+    cache_checked: list[str]           # stages whose cache lookup already ran (batch get_many)
     replay_from: str | None            # skip stages before this one
 
 
@@ -41,6 +63,10 @@ STAGE_ORDER: list[str] = [
     "persist",
 ]
 
+# Stages that only depend on chunk/cleaned_text and can run side by side
+# in the parallel graph variant.
+PARALLEL_STAGES: list[str] = ["extract", "classify", "embed"]
+
 # For each stage, the state fields that must be non-empty for it to run.
 # Used by the replay router to validate replay_from targets.
 STAGE_PREREQUISITES: dict[str, list[str]] = {
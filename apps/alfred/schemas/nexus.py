@@ -38,3 +38,5 @@ class NexusBridge(BaseModel):
 class NexusSyncResult(BaseModel):
     nodes_synced: int
     edges_synced: int
+    nodes_deleted: int = 0
+    mode: str = "full"
@@ -2,21 +2,55 @@
 
 This app exposes the `localhost:8010` contract used by local agent tooling while
 reusing Alfred's Docker services instead of requiring a second conflicting stack.
+
+Each upstream gets one pooled keep-alive ``httpx.AsyncClient`` (HTTP/2 when
+``h2`` is installed), closed by the app lifespan. Raw proxies stream request
+and response bodies instead of buffering them.
 """
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+import asyncio
+import importlib.util
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
 from typing import Any
 
 import httpx
 from fastapi import FastAPI, File, Form, HTTPException, Request, UploadFile
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 
 from alfred.core.settings import settings
 
-app = FastAPI(title="Alfred Search Gateway", version="1.0.0")
+_HTTP2 = importlib.util.find_spec("h2") is not None
+_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=16, keepalive_expiry=60)
+_UPLOAD_CHUNK_SIZE = 64 * 1024
+_clients: dict[str, httpx.AsyncClient] = {}
+
+
+def _client(base_url: str) -> httpx.AsyncClient:
+    """Pooled client for one upstream, created on first use."""
+    client = _clients.get(base_url)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(http2=_HTTP2, limits=_LIMITS, timeout=30)
+        _clients[base_url] = client
+    return client
+
+
+async def _close_clients() -> None:
+    clients = list(_clients.values())
+    _clients.clear()
+    await asyncio.gather(*(client.aclose() for client in clients), return_exceptions=True)
+
+
+@asynccontextmanager
+async def _lifespan(_: FastAPI) -> AsyncIterator[None]:
+    yield
+    await _close_clients()
+
+
+app = FastAPI(title="Alfred Search Gateway", version="1.0.0", lifespan=_lifespan)
 
 
 class MeiliAddDocumentsRequest(BaseModel):
@@ -96,19 +130,21 @@ async def health() -> dict[str, Any]:
         "gotenberg_url": urls["gotenberg"],
         "n8n_url": urls["n8n"],
     }
-    async with httpx.AsyncClient() as client:
-        checks = {
-            "firecrawl": urls["firecrawl"],
-            "searxng": urls["searxng"],
-            "qdrant": f"{urls['qdrant']}/healthz",
-            "meilisearch": f"{urls['meilisearch']}/health",
-            "tika": urls["tika"],
-            "litellm": f"{urls['litellm']}/health",
-            "gotenberg": f"{urls['gotenberg']}/health",
-            "n8n": f"{urls['n8n']}/healthz",
-        }
-        for name, url in checks.items():
-            statuses[f"{name}_status"] = await _check(client, url)
+    checks = {
+        "firecrawl": urls["firecrawl"],
+        "searxng": urls["searxng"],
+        "qdrant": f"{urls['qdrant']}/healthz",
+        "meilisearch": f"{urls['meilisearch']}/health",
+        "tika": urls["tika"],
+        "litellm": f"{urls['litellm']}/health",
+        "gotenberg": f"{urls['gotenberg']}/health",
+        "n8n": f"{urls['n8n']}/healthz",
+    }
+    results = await asyncio.gather(
+        *(_check(_client(urls[name]), url) for name, url in checks.items())
+    )
+    for name, result in zip(checks, results, strict=True):
+        statuses[f"{name}_status"] = result
     return statuses
 
 
@@ -117,6 +153,33 @@ def _clean_headers(headers: Mapping[str, str]) -> dict[str, str]:
     return {key: value for key, value in headers.items() if key.lower() not in excluded}
 
 
+def _has_body(request: Request) -> bool:
+    return "content-length" in request.headers or "transfer-encoding" in request.headers
+
+
+def _stream_headers(request: Request) -> dict[str, str]:
+    # The body is relayed byte-for-byte, so a known length still holds and
+    # keeps httpx from switching the upstream request to chunked encoding.
+    headers = _clean_headers(request.headers)
+    headers.pop("transfer-encoding", None)
+    if length := request.headers.get("content-length"):
+        headers["content-length"] = length
+    return headers
+
+
+async def _relay(upstream: httpx.Response) -> AsyncIterator[bytes]:
+    try:
+        async for chunk in upstream.aiter_raw():
+            yield chunk
+    finally:
+        await upstream.aclose()
+
+
+async def _iter_upload(file: UploadFile) -> AsyncIterator[bytes]:
+    while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+        yield chunk
+
+
 def _meili_headers() -> dict[str, str]:
     return {
         "Authorization": f"Bearer {settings.search_gateway_meilisearch_key}",
@@ -139,20 +202,26 @@ def _json_or_text(response: httpx.Response) -> Any:
 
 
 async def _proxy(request: Request, base_url: str, path: str) -> Response:
-    body = await request.body()
     url = f"{base_url.rstrip('/')}/{path.lstrip('/')}"
-    async with httpx.AsyncClient(timeout=300) as client:
-        upstream = await client.request(
-            request.method,
-            url,
-            content=body if body else None,
-            headers=_clean_headers(request.headers),
-            params=request.query_params,
-        )
-    return Response(
-        content=upstream.content,
+    client = _client(base_url)
+    upstream_request = client.build_request(
+        request.method,
+        url,
+        content=request.stream() if _has_body(request) else None,
+        headers=_stream_headers(request),
+        params=request.query_params,
+        timeout=300,
+    )
+    upstream = await client.send(upstream_request, stream=True)
+    # Raw bytes pass through untouched, so the upstream encoding goes with them.
+    headers = {}
+    if encoding := upstream.headers.get("content-encoding"):
+        headers["content-encoding"] = encoding
+    return StreamingResponse(
+        _relay(upstream),
         status_code=upstream.status_code,
         media_type=upstream.headers.get("content-type"),
+        headers=headers,
     )
 
 
@@ -171,36 +240,38 @@ async def meili_create_index(req: MeiliCreateIndexRequest) -> dict[str, Any]:
     body: dict[str, Any] = {"uid": req.uid}
     if req.primary_key:
         body["primaryKey"] = req.primary_key
-    async with httpx.AsyncClient(timeout=30) as client:
-        response = await client.post(
-            f"{_service_urls()['meilisearch']}/indexes",
-            headers=_meili_headers(),
-            json=body,
-        )
+    base_url = _service_urls()["meilisearch"]
+    response = await _client(base_url).post(
+        f"{base_url}/indexes",
+        headers=_meili_headers(),
+        json=body,
+        timeout=30,
+    )
     return {"success": response.status_code < 300, "data": _json_or_text(response)}
 
 
 @app.get("/meili/indexes")
 async def meili_list_indexes() -> dict[str, Any]:
-    async with httpx.AsyncClient(timeout=30) as client:
-        response = await client.get(
-            f"{_service_urls()['meilisearch']}/indexes",
-            headers=_meili_headers(),
-        )
+    base_url = _service_urls()["meilisearch"]
+    response = await _client(base_url).get(
+        f"{base_url}/indexes",
+        headers=_meili_headers(),
+        timeout=30,
+    )
     return {"success": response.status_code < 300, "data": _json_or_text(response)}
 
 
 @app.post("/meili/documents")
 async def meili_add_documents(req: MeiliAddDocumentsRequest) -> dict[str, Any]:
-    url = f"{_service_urls()['meilisearch']}/indexes/{req.index}/documents"
+    base_url = _service_urls()["meilisearch"]
     params = {"primaryKey": req.primary_key} if req.primary_key else None
-    async with httpx.AsyncClient(timeout=30) as client:
-        response = await client.post(
-            url,
-            headers=_meili_headers(),
-            params=params,
-            json=req.documents,
-        )
+    response = await _client(base_url).post(
+        f"{base_url}/indexes/{req.index}/documents",
+        headers=_meili_headers(),
+        params=params,
+        json=req.documents,
+        timeout=30,
+    )
     return {"success": response.status_code < 300, "data": _json_or_text(response)}
 
 
@@ -217,12 +288,13 @@ async def meili_search(req: MeiliSearchRequest) -> dict[str, Any]:
         body["sort"] = req.sort
     if req.attributes_to_retrieve:
         body["attributesToRetrieve"] = req.attributes_to_retrieve
-    async with httpx.AsyncClient(timeout=30) as client:
-        response = await client.post(
-            f"{_service_urls()['meilisearch']}/indexes/{req.index}/search",
-            headers=_meili_headers(),
-            json=body,
-        )
+    base_url = _service_urls()["meilisearch"]
+    response = await _client(base_url).post(
+        f"{base_url}/indexes/{req.index}/search",
+        headers=_meili_headers(),
+        json=body,
+        timeout=30,
+    )
     return {"success": response.status_code < 300, "data": _json_or_text(response)}
 
 
@@ -231,18 +303,18 @@ async def tika_parse(
     file: UploadFile = File(...),
     output_format: str = Form("text"),
 ) -> dict[str, Any]:
-    content = await file.read()
     content_type = file.content_type or "application/octet-stream"
     endpoint = "/meta" if output_format == "metadata" else "/tika"
     accept = "application/json" if output_format == "metadata" else "text/plain"
     if output_format == "html":
         accept = "text/html"
-    async with httpx.AsyncClient(timeout=120) as client:
-        response = await client.put(
-            f"{_service_urls()['tika']}{endpoint}",
-            content=content,
-            headers={"Content-Type": content_type, "Accept": accept},
-        )
+    base_url = _service_urls()["tika"]
+    response = await _client(base_url).put(
+        f"{base_url}{endpoint}",
+        content=_iter_upload(file),
+        headers={"Content-Type": content_type, "Accept": accept},
+        timeout=120,
+    )
     if response.status_code >= 400:
         raise HTTPException(status_code=response.status_code, detail=response.text)
     data = response.json() if output_format == "metadata" else {
@@ -254,11 +326,12 @@ async def tika_parse(
 
 @app.get("/llm/models")
 async def llm_models() -> dict[str, Any]:
-    async with httpx.AsyncClient(timeout=30) as client:
-        response = await client.get(
-            f"{_service_urls()['litellm']}/models",
-            headers=_litellm_headers(),
-        )
+    base_url = _service_urls()["litellm"]
+    response = await _client(base_url).get(
+        f"{base_url}/models",
+        headers=_litellm_headers(),
+        timeout=30,
+    )
     return {"success": response.status_code < 300, "data": _json_or_text(response)}
 
 
@@ -269,12 +342,13 @@ async def llm_chat(req: LiteLLMChatRequest) -> dict[str, Any]:
         body["temperature"] = req.temperature
     if req.max_tokens is not None:
         body["max_tokens"] = req.max_tokens
-    async with httpx.AsyncClient(timeout=120) as client:
-        response = await client.post(
-            f"{_service_urls()['litellm']}/chat/completions",
-            headers=_litellm_headers(),
-            json=body,
-        )
+    base_url = _service_urls()["litellm"]
+    response = await _client(base_url).post(
+        f"{base_url}/chat/completions",
+        headers=_litellm_headers(),
+        json=body,
+        timeout=120,
+    )
     if response.status_code >= 400:
         raise HTTPException(status_code=response.status_code, detail=response.text)
     return {"success": True, "data": response.json()}
@@ -282,12 +356,13 @@ async def llm_chat(req: LiteLLMChatRequest) -> dict[str, Any]:
 
 @app.post("/llm/embeddings")
 async def llm_embeddings(req: LiteLLMEmbeddingRequest) -> dict[str, Any]:
-    async with httpx.AsyncClient(timeout=60) as client:
-        response = await client.post(
-            f"{_service_urls()['litellm']}/embeddings",
-            headers=_litellm_headers(),
-            json={"model": req.model, "input": req.input},
-        )
+    base_url = _service_urls()["litellm"]
+    response = await _client(base_url).post(
+        f"{base_url}/embeddings",
+        headers=_litellm_headers(),
+        json={"model": req.model, "input": req.input},
+        timeout=60,
+    )
     if response.status_code >= 400:
         raise HTTPException(status_code=response.status_code, detail=response.text)
     return {"success": True, "data": response.json()}
@@ -298,11 +373,12 @@ async def gotenberg_html_to_pdf(file: UploadFile = File(...)) -> dict[str, Any]:
     import base64
 
     content = await file.read()
-    async with httpx.AsyncClient(timeout=60) as client:
-        response = await client.post(
-            f"{_service_urls()['gotenberg']}/forms/chromium/convert/html",
-            files={"files": ("index.html", content, "text/html")},
-        )
+    base_url = _service_urls()["gotenberg"]
+    response = await _client(base_url).post(
+        f"{base_url}/forms/chromium/convert/html",
+        files={"files": ("index.html", content, "text/html")},
+        timeout=60,
+    )
     if response.status_code >= 400:
         raise HTTPException(status_code=response.status_code, detail=response.text)
     return {
@@ -318,11 +394,12 @@ async def gotenberg_html_to_pdf(file: UploadFile = File(...)) -> dict[str, Any]:
 async def gotenberg_url_to_pdf(url: str = Form(...)) -> dict[str, Any]:
     import base64
 
-    async with httpx.AsyncClient(timeout=60) as client:
-        response = await client.post(
-            f"{_service_urls()['gotenberg']}/forms/chromium/convert/url",
-            files={"url": (None, url)},
-        )
+    base_url = _service_urls()["gotenberg"]
+    response = await _client(base_url).post(
+        f"{base_url}/forms/chromium/convert/url",
+        files={"url": (None, url)},
+        timeout=60,
+    )
     if response.status_code >= 400:
         raise HTTPException(status_code=response.status_code, detail=response.text)
     return {
@@ -0,0 +1,318 @@
+"""Token-bounded conversation context for agent turns.
+
+┌───────────────────────────────────────────────────────────┐
+│  ConversationContext.build()                              │
+│                                                           │
+│  1. Load the thread's running summary + unsummarized tail │
+│  2. Count tokens per message (cached tiktoken encoder)    │
+│  3. Over budget → keep the newest messages down to the    │
+│     low-water mark, fold the rest into the summary        │
+│  4. Persist summary + watermark (last folded message id)  │
+└───────────────────────────────────────────────────────────┘
+
+Folding is incremental: the summarizer sees only the previous summary and the
+messages aging out this turn. The low-water mark lets several turns
+accumulate before the next fold. History supplied by the client has no
+message ids, so its aged-out messages are dropped, not summarized.
+
+All reads and writes go through short-lived ``AsyncSession``s; no connection
+is held while the summarizer runs. The tokenizer is loaded off the event loop
+(tiktoken may download its BPE file on first use) and falls back to a
+chars/4 estimate when it cannot be loaded.
+
+Inside a turn, ``compact_tool_outputs`` replaces large tool results from
+earlier rounds with compact references.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from alfred.core.database import get_async_sessionmaker
+from alfred.models.thinking import AgentMessageRow, ThinkingSessionRow
+from alfred.services.agent.harness import normalize_tool_result
+
+logger = logging.getLogger(__name__)
+
+# Hard cap on unsummarized rows loaded per turn; folding keeps the tail far below it.
+_MAX_HISTORY_ROWS = 200
+# Per-message framing tokens in the chat format.
+_MESSAGE_OVERHEAD_TOKENS = 4
+_LOW_WATER_RATIO = 0.6
+_SUMMARY_PREFIX = "Summary of the earlier conversation in this thread:\n"
+
+Summarizer = Callable[[str | None, list[dict[str, Any]]], Awaitable[str | None]]
+AsyncSessionFactory = Callable[[], AsyncSession]
+
+
+_encodings: dict[str, Any | None] = {}
+_encodings_lock = threading.Lock()
+
+
+def _load_encoding(model: str) -> Any | None:
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        # Offline or blocked BPE download: estimate instead of failing the turn.
+        logger.warning("tiktoken encoding unavailable for %s; estimating tokens", model)
+        return None
+
+
+def _encoding(model: str) -> Any | None:
+    with _encodings_lock:
+        if model in _encodings:
+            return _encodings[model]
+    enc = _load_encoding(model)
+    with _encodings_lock:
+        return _encodings.setdefault(model, enc)
+
+
+async def ensure_encoding(model: str) -> None:
+    """Load ``model``'s tokenizer in a worker thread so token counts never block the loop."""
+    if model not in _encodings:
+        await asyncio.to_thread(_encoding, model)
+
+
+@lru_cache(maxsize=1024)
+def count_tokens(text: str, model: str) -> int:
+    """Token count for ``text`` under ``model``'s encoding (≈ chars/4 without tiktoken)."""
+    if not text:
+        return 0
+    enc = _encoding(model)
+    if enc is None:
+        return max(1, len(text) // 4)
+    return len(enc.encode(text, disallowed_special=()))
+
+
+def message_tokens(message: dict[str, Any], model: str) -> int:
+    content = message.get("content")
+    if isinstance(content, list):
+        text = "".join(
+            part.get("text", "") for part in content if isinstance(part, dict)
+        )
+    else:
+        text = content or ""
+    tokens = _MESSAGE_OVERHEAD_TOKENS + count_tokens(text, model)
+    for call in message.get("tool_calls") or []:
+        function = call.get("function") or {}
+        tokens += count_tokens(function.get("name", ""), model)
+        tokens += count_tokens(function.get("arguments", ""), model)
+    return tokens
+
+
+def prompt_tokens(messages: list[dict[str, Any]], model: str) -> int:
+    return sum(message_tokens(m, model) for m in messages)
+
+
+async def load_thread_history(db: AsyncSession, thread_id: int) -> list[dict[str, Any]]:
+    """Messages not yet folded into the thread summary, oldest first, with ids."""
+    through = (
+        await db.exec(
+            select(ThinkingSessionRow.context_summary_through).where(
+                ThinkingSessionRow.id == thread_id
+            )
+        )
+    ).first()
+    stmt = select(AgentMessageRow.id, AgentMessageRow.role, AgentMessageRow.content).where(
+        AgentMessageRow.thread_id == thread_id
+    )
+    if through is not None:
+        stmt = stmt.where(AgentMessageRow.id > through)
+    rows = (
+        await db.exec(stmt.order_by(AgentMessageRow.id.desc()).limit(_MAX_HISTORY_ROWS))
+    ).all()
+    return [{"id": row.id, "role": row.role, "content": row.content} for row in reversed(rows)]
+
+
+@dataclass
+class ContextWindow:
+    messages: list[dict[str, Any]]
+    summary: str | None
+    history_tokens: int
+    folded: int = 0
+    dropped: int = 0
+
+
+class ConversationContext:
+    """Builds the bounded history part of an agent prompt for one thread."""
+
+    def __init__(
+        self,
+        *,
+        model: str,
+        max_history_tokens: int,
+        max_messages: int,
+        summarize: Summarizer | None = None,
+        session_factory: AsyncSessionFactory | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self.model = model
+        self.max_history_tokens = max_history_tokens
+        self.max_messages = max_messages
+        self.summarize = summarize
+
+    async def build(
+        self,
+        *,
+        thread_id: int | None,
+        history: list[dict[str, Any]] | None,
+    ) -> ContextWindow:
+        await ensure_encoding(self.model)
+        summary: str | None = None
+        has_thread = False
+        if thread_id is not None:
+            async with self._session() as db:
+                row = (
+                    await db.exec(
+                        select(ThinkingSessionRow.id, ThinkingSessionRow.context_summary).where(
+                            ThinkingSessionRow.id == thread_id
+                        )
+                    )
+                ).first()
+            has_thread = row is not None
+            summary = row.context_summary if row else None
+
+        messages = [
+            {"id": m.get("id"), "role": m.get("role", "user"), "content": m.get("content", "")}
+            for m in history or []
+            if m.get("role", "user") in ("user", "assistant", "system")
+        ]
+        costs = [message_tokens(m, self.model) for m in messages]
+
+        keep_from = 0
+        if sum(costs) > self.max_history_tokens or len(messages) > self.max_messages:
+            keep_from = self._low_water_start(costs)
+        aged, kept = messages[:keep_from], messages[keep_from:]
+
+        folded = [m for m in aged if m["id"] is not None]
+        if folded and has_thread and self.summarize is not None:
+            new_summary = await self._fold(summary, folded)
+            if new_summary:
+                summary = new_summary
+                await self._save_summary(thread_id, new_summary, max(m["id"] for m in folded))
+            else:
+                folded = []
+
+        window = [{"role": m["role"], "content": m["content"]} for m in kept]
+        if summary:
+            window.insert(0, {"role": "system", "content": _SUMMARY_PREFIX + summary})
+        return ContextWindow(
+            messages=window,
+            summary=summary,
+            history_tokens=prompt_tokens(window, self.model),
+            folded=len(folded),
+            dropped=len(aged) - len(folded),
+        )
+
+    def _low_water_start(self, costs: list[int]) -> int:
+        """Index of the oldest message kept when trimming to the low-water mark."""
+        token_target = int(self.max_history_tokens * _LOW_WATER_RATIO)
+        count_target = max(1, int(self.max_messages * _LOW_WATER_RATIO))
+        total = 0
+        start = len(costs)
+        for idx in range(len(costs) - 1, -1, -1):
+            if start < len(costs) and (
+                total + costs[idx] > token_target or len(costs) - idx > count_target
+            ):
+                break
+            total += costs[idx]
+            start = idx
+        return start
+
+    def _session(self) -> AsyncSession:
+        factory = self._session_factory or get_async_sessionmaker()
+        return factory()
+
+    async def _save_summary(self, thread_id: int, summary: str, through: int) -> None:
+        # Core UPDATE: only the summary columns change, thread timestamps are untouched.
+        async with self._session() as db:
+            await db.execute(
+                update(ThinkingSessionRow)
+                .where(ThinkingSessionRow.id == thread_id)
+                .values(context_summary=summary, context_summary_through=through)
+            )
+            await db.commit()
+
+    async def _fold(self, summary: str | None, messages: list[dict[str, Any]]) -> str | None:
+        try:
+            return await self.summarize(summary, messages)
+        except Exception:
+            logger.warning("Context summary failed; older turns dropped this turn", exc_info=True)
+            return None
+
+
+def compact_tool_outputs(
+    messages: list[dict[str, Any]],
+    *,
+    model: str,
+    max_tokens: int,
+) -> int:
+    """Replace large tool results from earlier rounds with compact references.
+
+    Results answering the latest assistant tool call stay intact. Returns the
+    number of messages compacted.
+    """
+    last_call = max(
+        (i for i, m in enumerate(messages) if m.get("role") == "assistant" and m.get("tool_calls")),
+        default=-1,
+    )
+    names = {
+        call["id"]: (call.get("function") or {}).get("name", "")
+        for m in messages[:last_call]
+        for call in m.get("tool_calls") or []
+    }
+    compacted = 0
+    for msg in messages[:last_call]:
+        if msg.get("role") != "tool":
+            continue
+        content = msg.get("content") or ""
+        # Already-compacted references are far below the threshold.
+        if count_tokens(content, model) <= max_tokens:
+            continue
+        try:
+            raw: Any = json.loads(content)
+        except (TypeError, ValueError):
+            raw = content
+        envelope = normalize_tool_result(raw, max_preview_chars=300)
+        msg["content"] = json.dumps(
+            {
+                "elided": True,
+                "tool": names.get(msg.get("tool_call_id"), ""),
+                "ref": envelope.raw_hash,
+                "summary": envelope.summary,
+                "preview": list(envelope.preview),
+                "note": "Full output was shown earlier in this turn; call the tool again if needed.",
+            }
+        )
+        compacted += 1
+    return compacted
+
+
+__all__ = [
+    "ContextWindow",
+    "ConversationContext",
+    "compact_tool_outputs",
+    "count_tokens",
+    "ensure_encoding",
+    "load_thread_history",
+    "message_tokens",
+    "prompt_tokens",
+]
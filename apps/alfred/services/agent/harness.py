@@ -88,6 +88,7 @@ class AgentRunTrace:
 
     context: AgentRunContext
     events: list[AgentEvent] = field(default_factory=list)
+    counters: dict[str, int] = field(default_factory=dict)
 
     def emit(self, event_type: AgentEventType, **data: Any) -> AgentEvent:
         event = AgentEvent(
@@ -99,6 +100,11 @@ class AgentRunTrace:
         self.events.append(event)
         return event
 
+    def incr(self, name: str, amount: int = 1) -> int:
+        """Bump a run-level counter and return its new value."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+        return self.counters[name]
+
 
 @dataclass(frozen=True)
 class ToolPolicyDecision:
@@ -34,11 +34,17 @@ from typing import Any
 
 from openai import APIError, APITimeoutError, AsyncOpenAI, BadRequestError, RateLimitError
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from alfred.core.database import SessionLocal
 from alfred.core.llm_factory import get_async_openai_client
 from alfred.core.openai_compat import add_temperature_if_supported, uses_max_completion_tokens
 from alfred.core.settings import DEFAULT_OPENAI_MODEL, settings
+from alfred.services.agent.context_window import (
+    ConversationContext,
+    compact_tool_outputs,
+    prompt_tokens,
+)
 from alfred.services.agent.harness import AgentEventType, AgentRunContext, AgentRunTrace
 from alfred.services.agent.prompts import SystemPromptBuilder
 from alfred.services.agent.tool_runtime import execute_tool_with_harness
@@ -62,6 +68,16 @@ _TOOL_TIMEOUTS: dict[str, int] = {
     "firecrawl_scrape": 30,
 }
 
+# Per-message character cap when feeding aged-out turns to the summarizer.
+_SUMMARY_INPUT_CHARS = 4000
+
+_SUMMARY_SYSTEM_PROMPT = (
+    "You maintain a running summary of a conversation between a user and Alfred, "
+    "a knowledge assistant. Merge the new messages into the existing summary. Keep "
+    "facts, decisions, open questions, user preferences, and ids of notes or cards "
+    "mentioned. Drop pleasantries. Write compact prose, at most 250 words."
+)
+
 # Regex for stripping HTML tags from tool results (prompt injection mitigation).
 _HTML_TAG_RE = re.compile(r"<[^>]+>")
 
@@ -104,9 +120,13 @@ class AgentService:
         db: Session,
         *,
         tool_session_factory: Callable[[], Session] | None = None,
+        async_session_factory: Callable[[], AsyncSession] | None = None,
     ) -> None:
         self.db = db
+        # Tool calls run on worker threads with their own event loop, so they
+        # keep sync sessions; reads on the streaming loop use async sessions.
         self._tool_session_factory = tool_session_factory or SessionLocal
+        self._async_session_factory = async_session_factory
         self._client: AsyncOpenAI | None = None
 
     @property
@@ -120,7 +140,7 @@ class AgentService:
         *,
         message: str,
         thread_id: int | None = None,
-        history: list[dict[str, str]] | None = None,
+        history: list[dict[str, Any]] | None = None,
         lens: str | None = None,
         model: str | None = None,
         image_attachments: list[dict[str, Any]] | None = None,
@@ -136,6 +156,10 @@ class AgentService:
         Yields (event_name, data_dict, sse_string) so the caller can:
         - Forward sse_string to the client
         - Inspect data_dict to collect content for DB persistence
+
+        ``history`` is bounded by ``ConversationContext``: turns beyond the
+        token/message budget are folded into the thread's running summary.
+        Per-round prompt size is reported as ``prompt_tokens`` on trace events.
         """
         model_name = model or settings.llm_model or DEFAULT_OPENAI_MODEL
         effective_max = max_iterations if max_iterations else MAX_TOOL_ROUNDS
@@ -170,12 +194,17 @@ class AgentService:
                     }
                 )
 
-            if history:
-                for msg in history:
-                    role = msg.get("role", "user")
-                    content = msg.get("content", "")
-                    if role in ("user", "assistant", "system"):
-                        messages.append({"role": role, "content": content})
+            context = ConversationContext(
+                model=model_name,
+                max_history_tokens=settings.agent_context_max_tokens,
+                max_messages=settings.agent_context_max_messages,
+                summarize=lambda summary, msgs: self._summarize_history(
+                    summary, msgs, model_name
+                ),
+                session_factory=self._async_session_factory,
+            )
+            window = await context.build(thread_id=thread_id, history=history)
+            messages.extend(window.messages)
 
             messages.append(
                 {
@@ -197,11 +226,22 @@ class AgentService:
                 content_parts: list[str] = []
                 tool_calls: list[dict[str, Any]] = []
 
+                compact_tool_outputs(
+                    messages,
+                    model=model_name,
+                    max_tokens=settings.agent_context_tool_output_tokens,
+                )
+                round_tokens = prompt_tokens(messages, model_name)
+                trace.incr("prompt_tokens", round_tokens)
                 kwargs = self._build_api_kwargs(model_name, messages)
                 trace.emit(
                     AgentEventType.MODEL_STARTED,
                     round=_round + 1,
                     message_count=len(messages),
+                    prompt_tokens=round_tokens,
+                    history_tokens=window.history_tokens,
+                    folded_messages=window.folded,
+                    dropped_messages=window.dropped,
                 )
 
                 for attempt in range(3):  # 2 retries with backoff
@@ -345,9 +385,18 @@ class AgentService:
             AgentEventType.AGENT_COMPLETED,
             tool_call_count=len(all_tool_calls),
             artifact_count=len(all_artifacts),
+            cache_hits=trace.counters.get("cache_hits", 0),
+            cache_misses=trace.counters.get("cache_misses", 0),
+            prompt_tokens=trace.counters.get("prompt_tokens", 0),
+        )
+        logger.info(
+            "Agent turn %s: %d prompt tokens",
+            trace.context.run_id,
+            trace.counters.get("prompt_tokens", 0),
         )
         done_data = {
             "run_id": trace.context.run_id,
+            "prompt_tokens": trace.counters.get("prompt_tokens", 0),
             "thread_id": str(thread_id or ""),
             "reasoning": "".join(all_reasoning) if all_reasoning else None,
             "tool_calls": all_tool_calls or None,
@@ -477,6 +526,39 @@ class AgentService:
                 )
             yield {"type": "tool_calls", "tool_calls": tool_calls}
 
+    async def _summarize_history(
+        self,
+        summary: str | None,
+        messages: list[dict[str, Any]],
+        model: str,
+    ) -> str | None:
+        """Fold ``messages`` into the running thread ``summary`` (one non-streaming call)."""
+        transcript = "\n\n".join(
+            f"{m['role']}: {str(m.get('content') or '')[:_SUMMARY_INPUT_CHARS]}" for m in messages
+        )
+        summary_model = settings.agent_context_summary_model or model
+        kwargs: dict[str, Any] = {
+            "model": summary_model,
+            "messages": [
+                {"role": "system", "content": _SUMMARY_SYSTEM_PROMPT},
+                {
+                    "role": "user",
+                    "content": (
+                        f"Existing summary:\n{summary or '(none)'}\n\n"
+                        f"New messages:\n{transcript}"
+                    ),
+                },
+            ],
+            "timeout": 30,
+        }
+        if uses_max_completion_tokens(summary_model):
+            kwargs["max_completion_tokens"] = 600
+        else:
+            kwargs["max_tokens"] = 600
+        add_temperature_if_supported(kwargs, model=summary_model, temperature=0.2)
+        response = await self.client.chat.completions.create(**kwargs)
+        return (response.choices[0].message.content or "").strip() or None
+
     def _build_api_kwargs(self, model: str, messages: list[dict[str, Any]]) -> dict[str, Any]:
         """Build the kwargs dict for the OpenAI chat completion call."""
         kwargs: dict[str, Any] = {
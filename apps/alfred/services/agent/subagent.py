@@ -295,6 +295,8 @@ class SubAgentRunner:
             AgentEventType.AGENT_COMPLETED,
             rounds_used=rounds_used,
             response_chars=len(final_content),
+            cache_hits=trace.counters.get("cache_hits", 0),
+            cache_misses=trace.counters.get("cache_misses", 0),
         )
         logger.info(
             "Sub-agent [%s] completed in %d rounds, response: %d chars, run_id=%s",
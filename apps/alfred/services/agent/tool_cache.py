@@ -0,0 +1,188 @@
+"""Result cache for read-only agent tools.
+
+Only tools listed in ``TOOL_CACHE_POLICIES`` are cached, and only while the
+policy still classifies them as ``read`` or ``network``. Entries are keyed by
+``(tool name, args hash, data version)`` and expire after the tool's TTL.
+
+The data version is built from the row count and latest ``updated_at`` of the
+tables a tool reads (zettels, documents), so a write from any process makes
+older entries unreachable. Each domain's version is memoized for a couple of
+seconds, which lets a burst of concurrent tool calls share one lookup.
+Write tools run through the harness also call ``invalidate()``. That takes
+effect at once, even when a write does not change ``updated_at``.
+
+Error results are never cached.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Literal
+
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from alfred.core.settings import settings
+from alfred.services.agent.harness import classify_tool_risk
+
+logger = logging.getLogger(__name__)
+
+DataDomain = Literal["zettels", "documents"]
+
+
+@dataclass(frozen=True)
+class ToolCachePolicy:
+    ttl_seconds: float
+    domains: tuple[DataDomain, ...] = ()
+
+
+_KB: tuple[DataDomain, ...] = ("zettels", "documents")
+
+TOOL_CACHE_POLICIES: dict[str, ToolCachePolicy] = {
+    # Knowledge base reads: short TTL, invalidated by data version.
+    "search_kb": ToolCachePolicy(300, _KB),
+    "search_kb_for_research": ToolCachePolicy(300, _KB),
+    "get_zettel": ToolCachePolicy(300, ("zettels",)),
+    "list_recent_cards": ToolCachePolicy(120, ("zettels",)),
+    "find_similar": ToolCachePolicy(300, ("zettels",)),
+    "get_card_links": ToolCachePolicy(300, ("zettels",)),
+    "search_documents": ToolCachePolicy(300, ("documents",)),
+    "get_document": ToolCachePolicy(600, ("documents",)),
+    # External lookups: TTL only.
+    "web_search_searxng": ToolCachePolicy(900),
+    "search_web": ToolCachePolicy(900),
+    "firecrawl_search": ToolCachePolicy(900),
+    "firecrawl_scrape": ToolCachePolicy(3600),
+    "scrape_url": ToolCachePolicy(3600),
+    "search_papers": ToolCachePolicy(3600),
+    "query_wikipedia": ToolCachePolicy(3600),
+    "query_arxiv": ToolCachePolicy(3600),
+    "query_semantic_scholar": ToolCachePolicy(3600),
+}
+
+_CACHEABLE_TIERS = frozenset({"read", "network"})
+
+
+def _domain_models(domain: DataDomain) -> tuple[Any, ...]:
+    if domain == "zettels":
+        from alfred.models.zettel import ZettelCard, ZettelLink
+
+        return (ZettelCard, ZettelLink)
+    from alfred.models.doc_storage import DocumentRow
+
+    return (DocumentRow,)
+
+
+class ToolResultCache:
+    """In-process TTL + LRU cache shared by every agent run in the process.
+
+    Thread-safe: tool calls run on worker threads, each in its own event loop.
+    """
+
+    def __init__(self, *, max_entries: int = 512, version_ttl_seconds: float = 2.0) -> None:
+        self._max_entries = max_entries
+        self._version_ttl = version_ttl_seconds
+        self._entries: OrderedDict[tuple[str, str, str], tuple[float, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._versions: dict[DataDomain, tuple[float, str]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def policy_for(self, tool_name: str) -> ToolCachePolicy | None:
+        policy = TOOL_CACHE_POLICIES.get(tool_name)
+        if policy is None or classify_tool_risk(tool_name) not in _CACHEABLE_TIERS:
+            return None
+        return policy
+
+    def data_version(self, domains: Iterable[DataDomain], db: Session) -> str:
+        """Version token for ``domains``; ``g<generation>`` alone when there are none."""
+        with self._lock:
+            generation = self._generation
+        parts = [f"g{generation}"]
+        for domain in domains:
+            parts.append(f"{domain}:{self._domain_version(domain, db)}")
+        return "|".join(parts)
+
+    def get(self, tool_name: str, args_hash: str, version: str) -> dict[str, Any] | None:
+        key = (tool_name, args_hash, version)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[1]
+        return copy.deepcopy(value)
+
+    def set(
+        self,
+        tool_name: str,
+        args_hash: str,
+        version: str,
+        result: dict[str, Any],
+        ttl_seconds: float,
+    ) -> None:
+        if self._max_entries <= 0 or ttl_seconds <= 0:
+            return
+        value = copy.deepcopy(result)
+        with self._lock:
+            key = (tool_name, args_hash, version)
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Make every cached entry unreachable and force fresh data versions."""
+        with self._lock:
+            self._generation += 1
+            self._versions.clear()
+            self._entries.clear()
+
+    def _domain_version(self, domain: DataDomain, db: Session) -> str:
+        now = time.monotonic()
+        with self._lock:
+            memo = self._versions.get(domain)
+            if memo is not None and memo[0] > now:
+                return memo[1]
+
+        parts: list[str] = []
+        for model in _domain_models(domain):
+            count, latest = db.exec(select(func.count(), func.max(model.updated_at))).one()
+            micros = int(latest.timestamp() * 1_000_000) if latest else 0
+            parts.append(f"{int(count or 0)}-{micros}")
+        version = ".".join(parts)
+
+        with self._lock:
+            self._versions[domain] = (now + self._version_ttl, version)
+        return version
+
+
+@lru_cache(maxsize=1)
+def get_tool_result_cache() -> ToolResultCache | None:
+    """Process-wide cache, or None when ``AGENT_TOOL_CACHE_ENABLED`` is off."""
+    if not settings.agent_tool_cache_enabled:
+        return None
+    return ToolResultCache(max_entries=settings.agent_tool_cache_max_entries)
+
+
+__all__ = [
+    "TOOL_CACHE_POLICIES",
+    "ToolCachePolicy",
+    "ToolResultCache",
+    "get_tool_result_cache",
+]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 from collections.abc import Awaitable, Callable
 from typing import Any
 
@@ -16,6 +17,11 @@ from alfred.services.agent.harness import (
     normalize_tool_result,
     stable_hash,
 )
+from alfred.services.agent.tool_cache import ToolResultCache, get_tool_result_cache
+
+logger = logging.getLogger(__name__)
+
+_WRITE_TIERS = frozenset({"soft_write", "hard_write", "destructive"})
 
 
 async def execute_tool_with_harness(
@@ -27,12 +33,18 @@ async def execute_tool_with_harness(
     trace: AgentRunTrace | None = None,
     envelope: bool = False,
     executor: Callable[[str, dict[str, Any], Session], Awaitable[dict[str, Any]]] | None = None,
+    cache: ToolResultCache | None = None,
 ) -> dict[str, Any]:
     """Execute one tool behind policy, tracing, and result normalization.
 
     `envelope=False` preserves legacy return shape for existing callers while
     still enforcing policy and emitting trace events. New LangChain agents can
     opt into compact envelopes for context efficiency.
+
+    Read-only tools with a cache policy are served from `cache` (the
+    process-wide result cache by default). `tool.completed` then carries
+    `cache="hit"|"miss"` and the run's running `cache_hits`/`cache_misses`.
+    Write tools invalidate the cache.
     """
 
     active_policy = policy or DEFAULT_AGENT_POLICY
@@ -65,7 +77,21 @@ async def execute_tool_with_harness(
             )
         return _maybe_envelope(result, envelope=envelope)
 
-    if executor is None:
+    cache = cache or get_tool_result_cache()
+    cache_policy = cache.policy_for(tool_name) if cache is not None else None
+    cache_version: str | None = None
+    cached: dict[str, Any] | None = None
+    if cache is not None and cache_policy is not None:
+        try:
+            cache_version = cache.data_version(cache_policy.domains, db)
+        except Exception:
+            logger.debug("Tool cache version lookup failed for %s", tool_name, exc_info=True)
+        else:
+            cached = cache.get(tool_name, args_hash, cache_version)
+
+    if cached is not None:
+        result = cached
+    elif executor is None:
         from alfred.services.agent.tools import execute_tool
 
         result = await execute_tool(tool_name, args, db)
@@ -73,6 +99,22 @@ async def execute_tool_with_harness(
         result = await executor(tool_name, args, db)
     normalized = normalize_tool_result(result)
 
+    if cache is not None:
+        if decision.tier in _WRITE_TIERS:
+            cache.invalidate()
+        elif cached is None and cache_version is not None and normalized.status == "ok":
+            cache.set(tool_name, args_hash, cache_version, result, cache_policy.ttl_seconds)
+
+    cache_data: dict[str, Any] = {}
+    if cache_version is not None and trace:
+        hit = cached is not None
+        trace.incr("cache_hits" if hit else "cache_misses")
+        cache_data = {
+            "cache": "hit" if hit else "miss",
+            "cache_hits": trace.counters.get("cache_hits", 0),
+            "cache_misses": trace.counters.get("cache_misses", 0),
+        }
+
     if trace:
         trace.emit(
             AgentEventType.TOOL_COMPLETED,
@@ -80,6 +122,7 @@ async def execute_tool_with_harness(
             result_hash=normalized.raw_hash,
             status=normalized.status,
             summary=normalized.summary,
+            **cache_data,
         )
 
     return _maybe_envelope(result, envelope=envelope, normalized=normalized)
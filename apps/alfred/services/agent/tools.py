@@ -20,11 +20,10 @@ from typing import Any
 from uuid import UUID
 
 from langchain_core.tools import BaseTool
-from sqlmodel import Session
+from sqlmodel import Session, select
 
 from alfred.core.settings import settings
 from alfred.models.doc_storage import DocumentRow
-from alfred.services.knowledge import KnowledgeService
 from alfred.services.notes_filesystem_service import (
     FilesystemPathNotAllowedError,
     FilesystemPathNotFoundError,
@@ -569,25 +568,40 @@ async def _search_kb(args: dict[str, Any], db: Session) -> dict[str, Any]:
     if query and len(results) < limit and search_mode != "metadata":
         seen_docs: set[str] = set()
         try:
-            doc_hits = KnowledgeService().search(query, limit=limit)
+            from alfred.core.dependencies import get_knowledge_service
+
+            doc_hits = get_knowledge_service().search(query, limit=limit)
         except Exception as exc:  # pragma: no cover - external vector service availability
             logger.info("Document KB search unavailable: %s", exc)
             doc_hits = []
 
+        hit_doc_ids: list[tuple[dict[str, Any], dict[str, Any], str]] = []
         for hit in doc_hits:
             payload = hit.get("payload") or hit
             meta = payload.get("meta") if isinstance(payload.get("meta"), dict) else {}
             doc_id = payload.get("doc_id") or meta.get("doc_id") or hit.get("doc_id")
-            if not doc_id:
+            if doc_id:
+                hit_doc_ids.append((hit, payload, str(doc_id)))
+
+        # One query for every hit's document instead of a lookup per hit.
+        doc_uuids: set[UUID] = set()
+        for _, _, doc_id_str in hit_doc_ids:
+            try:
+                doc_uuids.add(UUID(doc_id_str))
+            except (TypeError, ValueError):
                 continue
+        docs_by_id: dict[str, DocumentRow] = {}
+        if doc_uuids:
+            docs = db.exec(select(DocumentRow).where(DocumentRow.id.in_(doc_uuids))).all()
+            docs_by_id = {str(doc.id): doc for doc in docs}
 
-            doc_id_str = str(doc_id)
+        for hit, payload, doc_id_str in hit_doc_ids:
             if doc_id_str in seen_docs:
                 continue
             seen_docs.add(doc_id_str)
 
             try:
-                doc = db.get(DocumentRow, UUID(doc_id_str))
+                doc = docs_by_id.get(str(UUID(doc_id_str)))
             except (TypeError, ValueError):
                 doc = None
 
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-from collections.abc import Iterator, Sequence
+from collections.abc import AsyncIterator, Iterator, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 import psycopg
@@ -20,9 +23,29 @@ from langgraph.checkpoint.base import (
     get_checkpoint_metadata,
 )
 
+try:
+    from psycopg_pool import ConnectionPool
+except ImportError:  # pragma: no cover - optional dependency
+    ConnectionPool = None  # type: ignore[assignment,misc]
+
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _get_pool(dsn: str, min_size: int, max_size: int) -> ConnectionPool | None:
+    """Process-wide connection pool per DSN; None when psycopg_pool is missing."""
+    if ConnectionPool is None:
+        return None
+    return ConnectionPool(
+        dsn,
+        min_size=min_size,
+        max_size=max_size,
+        kwargs={"autocommit": True},
+        name="alfred-lg-checkpoints",
+        open=True,
+    )
+
+
 def _version_key(v: str | int | float) -> str:
     # Preserve numeric vs string identity.
     return json.dumps(v, separators=(",", ":"), ensure_ascii=False)
@@ -34,6 +57,8 @@ class PostgresCheckpointConfig:
     checkpoints_table: str = "alfred_lg_checkpoints"
     blobs_table: str = "alfred_lg_checkpoint_blobs"
     writes_table: str = "alfred_lg_checkpoint_writes"
+    pool_min_size: int = 1
+    pool_max_size: int = 8
 
 
 class PostgresCheckpointSaver(BaseCheckpointSaver[str]):
@@ -42,6 +67,10 @@ class PostgresCheckpointSaver(BaseCheckpointSaver[str]):
 
     This mirrors the core behavior of LangGraph's InMemorySaver, but persists
     checkpoints/blobs/writes in Postgres via psycopg.
+
+    Connections come from a process-wide ``psycopg_pool`` pool shared by every
+    saver with the same DSN. The async methods run the sync implementation in
+    a worker thread so graph runs inside FastAPI don't block the event loop.
     """
 
     def __init__(self, *, cfg: PostgresCheckpointConfig) -> None:
@@ -49,10 +78,16 @@ class PostgresCheckpointSaver(BaseCheckpointSaver[str]):
         self.cfg = cfg
         self._schema_ready = False
 
-    def _connect(self) -> psycopg.Connection:
+    @contextmanager
+    def _connect(self) -> Iterator[psycopg.Connection]:
         # autocommit keeps code simple; each call is a small transaction.
-        conn = psycopg.connect(self.cfg.dsn, autocommit=True)
-        return conn
+        pool = _get_pool(self.cfg.dsn, self.cfg.pool_min_size, self.cfg.pool_max_size)
+        if pool is None:
+            with psycopg.connect(self.cfg.dsn, autocommit=True) as conn:
+                yield conn
+            return
+        with pool.connection() as conn:
+            yield conn
 
     def _ensure_schema(self) -> None:
         if self._schema_ready:
@@ -111,30 +146,27 @@ class PostgresCheckpointSaver(BaseCheckpointSaver[str]):
         self._schema_ready = True
 
     def _load_blobs(
-        self, thread_id: str, checkpoint_ns: str, versions: ChannelVersions
+        self, cur: psycopg.Cursor, thread_id: str, checkpoint_ns: str, versions: ChannelVersions
     ) -> dict[str, Any]:
         if not versions:
             return {}
-        self._ensure_schema()
+        channels = list(versions)
+        version_keys = [_version_key(versions[channel]) for channel in channels]
+        cur.execute(
+            f"""
+            SELECT b.channel, b.value_type, b.value_bytes
+            FROM {self.cfg.blobs_table} AS b
+            JOIN unnest(%s::text[], %s::text[]) AS v(channel, version_key)
+              ON b.channel = v.channel AND b.version_key = v.version_key
+            WHERE b.thread_id = %s AND b.checkpoint_ns = %s
+            """,
+            (channels, version_keys, thread_id, checkpoint_ns),
+        )
         out: dict[str, Any] = {}
-        with self._connect() as conn:
-            with conn.cursor() as cur:
-                for channel, version in versions.items():
-                    cur.execute(
-                        f"""
-                        SELECT value_type, value_bytes
-                        FROM {self.cfg.blobs_table}
-                        WHERE thread_id = %s AND checkpoint_ns = %s AND channel = %s AND version_key = %s
-                        """,
-                        (thread_id, checkpoint_ns, channel, _version_key(version)),
-                    )
-                    row = cur.fetchone()
-                    if not row:
-                        continue
-                    value_type, value_bytes = row
-                    if value_type == "empty":
-                        continue
-                    out[channel] = self.serde.loads_typed((value_type, value_bytes))
+        for channel, value_type, value_bytes in cur.fetchall():
+            if value_type == "empty":
+                continue
+            out[channel] = self.serde.loads_typed((value_type, value_bytes))
         return out
 
     def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
@@ -181,7 +213,7 @@ class PostgresCheckpointSaver(BaseCheckpointSaver[str]):
                 checkpoint_full: Checkpoint = {
                     **checkpoint_,
                     "channel_values": self._load_blobs(
-                        thread_id, checkpoint_ns, checkpoint_["channel_versions"]
+                        cur, thread_id, checkpoint_ns, checkpoint_["channel_versions"]
                     ),
                 }
 
@@ -294,14 +326,19 @@ class PostgresCheckpointSaver(BaseCheckpointSaver[str]):
 
         values: dict[str, Any] = c.pop("channel_values")  # type: ignore[misc]
 
-        with self._connect() as conn:
+        blob_rows = []
+        for channel, version in new_versions.items():
+            value_type, value_bytes = (
+                self.serde.dumps_typed(values[channel]) if channel in values else ("empty", b"")
+            )
+            blob_rows.append(
+                (thread_id, checkpoint_ns, channel, _version_key(version), value_type, value_bytes)
+            )
+
+        with self._connect() as conn, conn.transaction():
             with conn.cursor() as cur:
-                for channel, version in new_versions.items():
-                    v = values.get(channel)
-                    value_type, value_bytes = (
-                        self.serde.dumps_typed(v) if channel in values else ("empty", b"")
-                    )
-                    cur.execute(
+                if blob_rows:
+                    cur.executemany(
                         f"""
                         INSERT INTO {self.cfg.blobs_table}
                           (thread_id, checkpoint_ns, channel, version_key, value_type, value_bytes)
@@ -309,14 +346,7 @@ class PostgresCheckpointSaver(BaseCheckpointSaver[str]):
                         ON CONFLICT (thread_id, checkpoint_ns, channel, version_key)
                         DO UPDATE SET value_type = EXCLUDED.value_type, value_bytes = EXCLUDED.value_bytes
                         """,
-                        (
-                            thread_id,
-                            checkpoint_ns,
-                            channel,
-                            _version_key(version),
-                            value_type,
-                            value_bytes,
-                        ),
+                        blob_rows,
                     )
 
                 checkpoint_type, checkpoint_bytes = self.serde.dumps_typed(c)
@@ -369,44 +399,36 @@ class PostgresCheckpointSaver(BaseCheckpointSaver[str]):
         checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
         checkpoint_id = config["configurable"]["checkpoint_id"]
 
+        # ON CONFLICT DO NOTHING keeps the first write for an (task_id, idx),
+        # matching InMemorySaver, so no per-write existence check is needed.
+        rows = [
+            (
+                thread_id,
+                checkpoint_ns,
+                checkpoint_id,
+                task_id,
+                WRITES_IDX_MAP.get(channel, idx),
+                channel,
+                *self.serde.dumps_typed(value),
+                task_path or "",
+            )
+            for idx, (channel, value) in enumerate(writes)
+        ]
+        if not rows:
+            return
+
         with self._connect() as conn:
             with conn.cursor() as cur:
-                for idx, (channel, value) in enumerate(writes):
-                    write_idx = WRITES_IDX_MAP.get(channel, idx)
-                    if write_idx >= 0:
-                        cur.execute(
-                            f"""
-                            SELECT 1
-                            FROM {self.cfg.writes_table}
-                            WHERE thread_id = %s AND checkpoint_ns = %s AND checkpoint_id = %s
-                              AND task_id = %s AND idx = %s
-                            """,
-                            (thread_id, checkpoint_ns, checkpoint_id, task_id, write_idx),
-                        )
-                        if cur.fetchone():
-                            continue
-
-                    value_type, value_bytes = self.serde.dumps_typed(value)
-                    cur.execute(
-                        f"""
-                        INSERT INTO {self.cfg.writes_table}
-                          (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, value_type, value_bytes, task_path)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        ON CONFLICT (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
-                        DO NOTHING
-                        """,
-                        (
-                            thread_id,
-                            checkpoint_ns,
-                            checkpoint_id,
-                            task_id,
-                            write_idx,
-                            channel,
-                            value_type,
-                            value_bytes,
-                            task_path or "",
-                        ),
-                    )
+                cur.executemany(
+                    f"""
+                    INSERT INTO {self.cfg.writes_table}
+                      (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, value_type, value_bytes, task_path)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    ON CONFLICT (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+                    DO NOTHING
+                    """,
+                    rows,
+                )
 
     def delete_thread(self, thread_id: str) -> None:
         self._ensure_schema()
@@ -422,5 +444,43 @@ class PostgresCheckpointSaver(BaseCheckpointSaver[str]):
                     f"DELETE FROM {self.cfg.blobs_table} WHERE thread_id = %s", (thread_id,)
                 )
 
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        tuples = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for tup in tuples:
+            yield tup
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
 
 __all__ = ["PostgresCheckpointConfig", "PostgresCheckpointSaver"]
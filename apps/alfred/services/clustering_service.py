@@ -3,10 +3,20 @@
 Groups zettel cards into semantic clusters using KMeans on card embeddings,
 generates human-readable cluster names via LLM, and detects knowledge gaps
 (stub cards with inbound links).
+
+The cluster model (centroids plus their stable ids) is persisted in Redis.
+Each refresh assigns every card to its nearest stored centroid and moves the
+centroids one mini-batch step toward their members. A full MiniBatchKMeans
+refit happens only when the mean point-to-centroid distance drifts past
+``_REFIT_DRIFT_RATIO`` of the value at the last fit, or the target cluster
+count moves too far from the stored one. Refit centroids are matched to the
+previous ones so cluster ids and colors stay stable across refreshes.
 """
 
 from __future__ import annotations
 
+import base64
+import json
 import logging
 import re
 from collections import Counter
@@ -14,7 +24,8 @@ from dataclasses import dataclass
 from typing import Any, ClassVar
 
 import numpy as np
-from sklearn.cluster import KMeans
+from scipy.optimize import linear_sum_assignment
+from sklearn.cluster import MiniBatchKMeans
 
 from alfred.core.llm_factory import get_chat_model
 from alfred.core.redis_client import get_redis_client
@@ -22,7 +33,14 @@ from alfred.core.redis_client import get_redis_client
 logger = logging.getLogger(__name__)
 
 _CACHE_KEY = "zettel:graph:clusters"
+_MODEL_KEY = "zettel:graph:cluster_model"
 _MIN_CARDS_FOR_CLUSTERING = 10
+# Refit when mean distance to the assigned centroid grows past this ratio of
+# the value at the last fit, or when the target k leaves [1/ratio, ratio] of
+# the stored k.
+_REFIT_DRIFT_RATIO = 1.25
+_REFIT_K_RATIO = 1.5
+_MINIBATCH_SIZE = 1024
 _TOKEN_RE = re.compile(r"[A-Za-z][A-Za-z0-9+#/-]*")
 _TITLE_STOP_WORDS = {
     "about",
@@ -109,22 +127,47 @@ class ClusteringService:
                 "Excluded %d card(s) without embeddings from clustering", excluded
             )
 
-        n = len(embeddable)
+        return self.cluster_matrix(
+            [card.id for card, _ in embeddable],
+            np.array([emb for _, emb in embeddable], dtype=np.float32),
+        )
+
+    def cluster_matrix(self, card_ids: list[int], X: np.ndarray) -> list[dict[str, Any]]:
+        """Run KMeans over a prebuilt ``(len(card_ids), dim)`` embedding matrix.
+
+        Same output as ``detect_clusters``; lets callers that already hold a
+        float32 matrix skip materializing card objects. Cluster ids come from
+        the persisted model and are stable across calls.
+        """
+        n = len(card_ids)
         if n < _MIN_CARDS_FOR_CLUSTERING:
             return []
 
-        # Build matrix and run KMeans
-        X = np.array([emb for _, emb in embeddable])
+        X = np.asarray(X, dtype=np.float32)
         k = max(2, n // 10)
-        kmeans = KMeans(n_clusters=k, random_state=42, n_init="auto")
-        labels = kmeans.fit_predict(X)
+        model = _ClusterModel.load()
+        if model is None or not model.usable_for(X.shape[1], k):
+            model = _ClusterModel.fit(X, k, previous=model)
+            labels = model.assign(X)[0]
+        else:
+            labels, distances = model.assign(X)
+            drift = float(distances.mean())
+            if drift > model.baseline * _REFIT_DRIFT_RATIO:
+                logger.info(
+                    "Cluster drift %.4f exceeds baseline %.4f; refitting",
+                    drift,
+                    model.baseline,
+                )
+                model = _ClusterModel.fit(X, k, previous=model)
+                labels = model.assign(X)[0]
+            else:
+                model.step(X, labels)
+        model.save()
 
-        # Group card IDs by cluster label
+        # Group card IDs by stable cluster id
         cluster_map: dict[int, list[int]] = {}
         for idx, label in enumerate(labels):
-            label_int = int(label)
-            card = embeddable[idx][0]
-            cluster_map.setdefault(label_int, []).append(card.id)
+            cluster_map.setdefault(int(model.ids[label]), []).append(card_ids[idx])
 
         total = len(cluster_map)
         clusters: list[dict[str, Any]] = []
@@ -282,7 +325,11 @@ class ClusteringService:
 
     @staticmethod
     def invalidate_cache() -> None:
-        """Delete the Redis cache key for graph clusters."""
+        """Delete the Redis cache key for graph clusters.
+
+        The persisted cluster model is kept; it adapts to card changes on the
+        next ``cluster_matrix`` call.
+        """
         redis = get_redis_client()
         if redis is None:
             return
@@ -383,3 +430,130 @@ class ClusteringService:
                 if part
             )
         return token[:1].upper() + token[1:]
+
+
+class _ClusterModel:
+    """Centroids with stable ids, persisted as JSON in Redis."""
+
+    def __init__(
+        self,
+        centroids: np.ndarray,
+        ids: np.ndarray,
+        *,
+        counts: np.ndarray,
+        baseline: float,
+        next_id: int,
+    ) -> None:
+        self.centroids = centroids
+        self.ids = ids
+        self.counts = counts
+        self.baseline = baseline
+        self.next_id = next_id
+
+    def usable_for(self, dim: int, k: int) -> bool:
+        stored_k = len(self.ids)
+        return (
+            self.centroids.shape[1] == dim
+            and stored_k * _REFIT_K_RATIO >= k
+            and k * _REFIT_K_RATIO >= stored_k
+        )
+
+    def assign(self, X: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Nearest-centroid labels (row indexes into ``ids``) and distances."""
+        # ||x - c||^2 = ||x||^2 - 2 x.c + ||c||^2, without an (n, k, dim) temporary.
+        sq = (
+            np.einsum("ij,ij->i", X, X)[:, None]
+            - 2.0 * (X @ self.centroids.T)
+            + np.einsum("ij,ij->i", self.centroids, self.centroids)[None, :]
+        )
+        labels = sq.argmin(axis=1)
+        distances = np.sqrt(np.maximum(sq[np.arange(len(X)), labels], 0.0))
+        return labels, distances
+
+    def step(self, X: np.ndarray, labels: np.ndarray) -> None:
+        """Move each centroid toward its current members.
+
+        ``X`` is the full card set, not a batch of new cards, so ``counts`` is
+        each centroid's membership at the last refresh rather than a running
+        total; accumulating would re-add the same cards every refresh until the
+        centroids stopped moving. The old centroid is weighted by that previous
+        membership, which damps the update without freezing it.
+        """
+        current = np.bincount(labels, minlength=len(self.ids)).astype(np.float64)
+        for row in np.flatnonzero(current):
+            members = X[labels == row]
+            rate = current[row] / (self.counts[row] + current[row])
+            self.centroids[row] += rate * (members.mean(axis=0) - self.centroids[row])
+        self.counts = current
+
+    @classmethod
+    def fit(cls, X: np.ndarray, k: int, previous: _ClusterModel | None) -> _ClusterModel:
+        kmeans = MiniBatchKMeans(
+            n_clusters=k,
+            random_state=42,
+            n_init="auto",
+            batch_size=_MINIBATCH_SIZE,
+        )
+        labels = kmeans.fit_predict(X)
+        centroids = kmeans.cluster_centers_.astype(np.float32)
+        counts = np.bincount(labels, minlength=k).astype(np.float64)
+        distances = np.linalg.norm(X - centroids[labels], axis=1)
+        baseline = float(distances.mean()) or 1e-9
+
+        next_id = previous.next_id if previous is not None else 0
+        ids = np.full(k, -1, dtype=np.int64)
+        if previous is not None and previous.centroids.shape[1] == X.shape[1]:
+            # Hand old ids to the closest new centroids.
+            cost = np.linalg.norm(
+                centroids[:, None, :] - previous.centroids[None, :, :], axis=2
+            )
+            rows, cols = linear_sum_assignment(cost)
+            ids[rows] = previous.ids[cols]
+        for row in np.flatnonzero(ids < 0):
+            ids[row] = next_id
+            next_id += 1
+        next_id = max(next_id, int(ids.max()) + 1)
+        return cls(centroids, ids, counts=counts, baseline=baseline, next_id=next_id)
+
+    @classmethod
+    def load(cls) -> _ClusterModel | None:
+        redis = get_redis_client()
+        if redis is None:
+            return None
+        try:
+            raw = redis.get(_MODEL_KEY)
+            if not raw:
+                return None
+            data = json.loads(raw)
+            centroids = np.frombuffer(
+                base64.b64decode(data["centroids"]), dtype=np.float32
+            ).reshape(data["k"], data["dim"]).copy()
+            return cls(
+                centroids,
+                np.asarray(data["ids"], dtype=np.int64),
+                counts=np.asarray(data["counts"], dtype=np.float64),
+                baseline=float(data["baseline"]),
+                next_id=int(data["next_id"]),
+            )
+        except Exception:
+            logger.warning("Failed to load cluster model from %s", _MODEL_KEY, exc_info=True)
+            return None
+
+    def save(self) -> None:
+        redis = get_redis_client()
+        if redis is None:
+            return
+        k, dim = self.centroids.shape
+        payload = {
+            "k": k,
+            "dim": dim,
+            "centroids": base64.b64encode(self.centroids.astype(np.float32).tobytes()).decode(),
+            "ids": self.ids.tolist(),
+            "counts": self.counts.tolist(),
+            "baseline": self.baseline,
+            "next_id": self.next_id,
+        }
+        try:
+            redis.set(_MODEL_KEY, json.dumps(payload))
+        except Exception:
+            logger.warning("Failed to save cluster model to %s", _MODEL_KEY, exc_info=True)
@@ -0,0 +1,250 @@
+"""Tiered cache for dictionary lookups.
+
+Reads go in-process LRU -> Redis -> Postgres (``dictionary_cache``). A hit in
+a slower tier is copied into the faster ones. Writes go to every tier. Each
+source has its own TTL, and that TTL applies in every tier.
+
+Keys are normalized words. The AI explanation also depends on the user's
+domains, so its key includes the normalized, sorted domain set.
+
+Like ``alfred.core.cache``, the shared tiers are best-effort. A Redis or
+database failure is logged at debug level and counts as a miss.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session, select
+
+from alfred.core.settings import settings
+from alfred.models.vocabulary import DictionaryCacheEntry
+
+logger = logging.getLogger(__name__)
+
+SOURCE_TTL_SECONDS: dict[str, int] = {
+    "wiktionary": 30 * 24 * 60 * 60,
+    "wikipedia": 7 * 24 * 60 * 60,
+    "ai": 30 * 24 * 60 * 60,
+}
+_REDIS_PREFIX = "dictionary"
+
+
+def normalize_word(word: str) -> str:
+    return " ".join(word.strip().lower().split())
+
+
+def cache_key(word: str, domains: Iterable[str] | None = None) -> str:
+    """Normalized ``word``, plus ``|domain,...`` when ``domains`` is given."""
+    key = normalize_word(word)
+    if domains is None:
+        return key
+    normalized = sorted({normalize_word(d) for d in domains if d and d.strip()})
+    return f"{key}|{','.join(normalized)}"
+
+
+class DictionaryCache:
+    """LRU -> Redis -> Postgres cache of JSON dicts keyed by ``(source, key)``."""
+
+    def __init__(
+        self,
+        *,
+        lru_size: int = 2048,
+        redis: Any | None = None,
+        session_factory: Callable[[], Session] | None = None,
+    ) -> None:
+        self._lru_size = lru_size
+        self._lru: OrderedDict[tuple[str, str], tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis = redis
+        self._session_factory = session_factory
+
+    async def aget(self, source: str, key: str) -> dict[str, Any] | None:
+        found = self._lru_get(source, key)
+        if found is not None:
+            return found
+        if self._redis is None and self._session_factory is None:
+            return None
+        return await asyncio.to_thread(self._get_shared, source, key)
+
+    async def aset(self, source: str, key: str, value: dict[str, Any]) -> None:
+        self._lru_set(source, key, value, _ttl(source))
+        if self._redis is None and self._session_factory is None:
+            return
+        await asyncio.to_thread(self._set_shared, source, key, value)
+
+    def get(self, source: str, key: str) -> dict[str, Any] | None:
+        found = self._lru_get(source, key)
+        if found is not None:
+            return found
+        return self._get_shared(source, key)
+
+    def set(self, source: str, key: str, value: dict[str, Any]) -> None:
+        self._lru_set(source, key, value, _ttl(source))
+        self._set_shared(source, key, value)
+
+    # -- tiers ---------------------------------------------------------
+
+    def _lru_get(self, source: str, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._lru.get((source, key))
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._lru[(source, key)]
+                return None
+            self._lru.move_to_end((source, key))
+            return value
+
+    def _lru_set(self, source: str, key: str, value: dict[str, Any], ttl: float) -> None:
+        if self._lru_size <= 0 or ttl <= 0:
+            return
+        with self._lock:
+            self._lru[(source, key)] = (time.monotonic() + ttl, value)
+            self._lru.move_to_end((source, key))
+            while len(self._lru) > self._lru_size:
+                self._lru.popitem(last=False)
+
+    def _get_shared(self, source: str, key: str) -> dict[str, Any] | None:
+        value = self._redis_get(source, key)
+        if value is not None:
+            ttl = self._redis_ttl(source, key)
+            self._lru_set(source, key, value, ttl if ttl is not None else _ttl(source))
+            return value
+
+        found = self._db_get(source, key)
+        if found is None:
+            return None
+        value, expires_at = found
+        remaining = (expires_at - datetime.now(UTC)).total_seconds()
+        self._lru_set(source, key, value, remaining)
+        self._redis_set(source, key, value, int(remaining))
+        return value
+
+    def _set_shared(self, source: str, key: str, value: dict[str, Any]) -> None:
+        ttl = _ttl(source)
+        self._redis_set(source, key, value, ttl)
+        self._db_set(source, key, value, ttl)
+
+    def _redis_get(self, source: str, key: str) -> dict[str, Any] | None:
+        if self._redis is None:
+            return None
+        try:
+            raw = self._redis.get(_redis_key(source, key))
+            return json.loads(raw) if raw else None
+        except Exception:
+            logger.debug("Dictionary cache Redis read failed", exc_info=True)
+            return None
+
+    def _redis_ttl(self, source: str, key: str) -> int | None:
+        try:
+            ttl = int(self._redis.ttl(_redis_key(source, key)))
+        except Exception:
+            return None
+        return ttl if ttl > 0 else None
+
+    def _redis_set(self, source: str, key: str, value: dict[str, Any], ttl: int) -> None:
+        if self._redis is None or ttl <= 0:
+            return
+        try:
+            self._redis.set(_redis_key(source, key), json.dumps(value), ex=ttl)
+        except Exception:
+            logger.debug("Dictionary cache Redis write failed", exc_info=True)
+
+    def _db_get(self, source: str, key: str) -> tuple[dict[str, Any], datetime] | None:
+        if self._session_factory is None:
+            return None
+        stmt = select(DictionaryCacheEntry.value, DictionaryCacheEntry.expires_at).where(
+            DictionaryCacheEntry.source == source,
+            DictionaryCacheEntry.cache_key == key,
+        )
+        try:
+            with self._session_factory() as session:
+                row = session.exec(stmt).first()
+        except Exception:
+            logger.debug("Dictionary cache database read failed", exc_info=True)
+            return None
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=UTC)
+        if expires_at <= datetime.now(UTC):
+            return None
+        return value, expires_at
+
+    def _db_set(self, source: str, key: str, value: dict[str, Any], ttl: int) -> None:
+        if self._session_factory is None:
+            return
+        now = datetime.now(UTC)
+        try:
+            with self._session_factory() as session:
+                insert = (
+                    sqlite.insert
+                    if session.get_bind().dialect.name == "sqlite"
+                    else postgresql.insert
+                )
+                stmt = insert(DictionaryCacheEntry).values(
+                    source=source,
+                    cache_key=key,
+                    value=value,
+                    expires_at=now + timedelta(seconds=ttl),
+                    created_at=now,
+                    updated_at=now,
+                )
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["source", "cache_key"],
+                    set_={
+                        "value": stmt.excluded.value,
+                        "expires_at": stmt.excluded.expires_at,
+                        "updated_at": stmt.excluded.updated_at,
+                    },
+                )
+                session.execute(stmt)
+                session.commit()
+        except Exception:
+            logger.debug("Dictionary cache database write failed", exc_info=True)
+
+
+def _ttl(source: str) -> int:
+    return SOURCE_TTL_SECONDS.get(source, 24 * 60 * 60)
+
+
+def _redis_key(source: str, key: str) -> str:
+    return f"{_REDIS_PREFIX}:{source}:{key}"
+
+
+@lru_cache(maxsize=1)
+def get_dictionary_cache() -> DictionaryCache | None:
+    """Process-wide cache, or None when ``DICTIONARY_CACHE_ENABLED`` is off."""
+    if not settings.dictionary_cache_enabled:
+        return None
+
+    from alfred.core.database import SessionLocal
+    from alfred.core.redis_client import get_redis_client
+
+    return DictionaryCache(
+        lru_size=settings.dictionary_cache_lru_size,
+        redis=get_redis_client(),
+        session_factory=SessionLocal,
+    )
+
+
+__all__ = [
+    "SOURCE_TTL_SECONDS",
+    "DictionaryCache",
+    "cache_key",
+    "get_dictionary_cache",
+    "normalize_word",
+]
@@ -1,4 +1,9 @@
-"""Dictionary service -- aggregates Wiktionary, Wikipedia, and LLM sources."""
+"""Dictionary service -- aggregates Wiktionary, Wikipedia, and LLM sources.
+
+Every source goes through the tiered ``DictionaryCache`` when it is enabled.
+Wiktionary results come from the offline snapshot when one is configured.
+Failed fetches are never cached.
+"""
 
 from __future__ import annotations
 
@@ -11,6 +16,8 @@ from typing import Any
 
 import httpx
 
+from alfred.services.dictionary_cache import DictionaryCache, cache_key, get_dictionary_cache
+from alfred.services.dictionary_snapshot import get_dictionary_snapshot
 from alfred.services.llm_service import LLMService
 from alfred.services.wikipedia import retrieve_wikipedia
 
@@ -19,6 +26,8 @@ logger = logging.getLogger(__name__)
 WIKTIONARY_API = "https://en.wiktionary.org/api/rest_v1/page/definition"
 WIKTIONARY_TIMEOUT_SECONDS = 4.0
 _STREAM_END = object()
+_HTTP_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=8, keepalive_expiry=60)
+_http: tuple[asyncio.AbstractEventLoop, httpx.AsyncClient] | None = None
 
 
 @dataclass
@@ -144,26 +153,61 @@ def _merge_results(
     )
 
 
-async def _fetch_wiktionary(word: str) -> dict[str, Any]:
-    """Fetch and parse Wiktionary definition."""
+def _http_client() -> httpx.AsyncClient:
+    """Pooled client for the running event loop, created on first use."""
+    global _http
+    loop = asyncio.get_running_loop()
+    if _http is None or _http[0] is not loop or _http[1].is_closed:
+        _http = (loop, httpx.AsyncClient(timeout=WIKTIONARY_TIMEOUT_SECONDS, limits=_HTTP_LIMITS))
+    return _http[1]
+
+
+def _empty_wiktionary() -> dict[str, Any]:
+    return {"definitions": [], "pronunciation_ipa": None, "etymology": None}
+
+
+async def _fetch_wiktionary(word: str, cache: DictionaryCache | None = None) -> dict[str, Any]:
+    """Fetch and parse Wiktionary definition (snapshot, then cache, then network)."""
+    snapshot = get_dictionary_snapshot()
+    if snapshot is not None:
+        try:
+            found = await asyncio.to_thread(snapshot.get, word)
+        except Exception:
+            logger.exception("Dictionary snapshot lookup failed for '%s'", word)
+            found = None
+        if found is not None:
+            return found
+
+    key = cache_key(word)
+    if cache is not None:
+        cached = await cache.aget("wiktionary", key)
+        if cached is not None:
+            return cached
+
     try:
-        async with httpx.AsyncClient(timeout=WIKTIONARY_TIMEOUT_SECONDS) as client:
-            resp = await client.get(f"{WIKTIONARY_API}/{word}")
-            if resp.status_code == 404:
-                return {
-                    "definitions": [],
-                    "pronunciation_ipa": None,
-                    "etymology": None,
-                }
+        resp = await _http_client().get(f"{WIKTIONARY_API}/{word}")
+        if resp.status_code == 404:
+            data = _empty_wiktionary()
+        else:
             resp.raise_for_status()
-            return _parse_wiktionary_response(resp.json())
+            data = _parse_wiktionary_response(resp.json())
     except Exception:
         logger.exception("Wiktionary lookup failed for '%s'", word)
-        return {"definitions": [], "pronunciation_ipa": None, "etymology": None}
+        return _empty_wiktionary()
 
+    if cache is not None:
+        await cache.aset("wiktionary", key, data)
+    return data
 
-async def _fetch_wikipedia(word: str) -> str | None:
+
+async def _fetch_wikipedia(word: str, cache: DictionaryCache | None = None) -> str | None:
     """Fetch Wikipedia summary using existing service."""
+    key = cache_key(word)
+    if cache is not None:
+        cached = await cache.aget("wikipedia", key)
+        if cached is not None:
+            return cached.get("summary")
+
     try:
         result = await asyncio.to_thread(
             retrieve_wikipedia,
@@ -171,12 +215,15 @@ async def _fetch_wikipedia(word: str) -> str | None:
             top_k_results=1,
             doc_content_chars_max=1500,
         )
-        items = result.get("items", [])
-        if items:
-            return items[0].get("content")
     except Exception:
         logger.exception("Wikipedia lookup failed for '%s'", word)
-    return None
+        return None
+
+    items = result.get("items", [])
+    summary = items[0].get("content") if items else None
+    if cache is not None:
+        await cache.aset("wikipedia", key, {"summary": summary})
+    return summary
 
 
 def _definitions_text(wiktionary_data: dict[str, Any]) -> str:
@@ -243,6 +290,22 @@ async def _stream_ai_explanation(
             yield chunk
 
 
+async def _cached_ai_explanation(
+    word: str, domains: list[str], cache: DictionaryCache | None
+) -> str | None:
+    if cache is None:
+        return None
+    cached = await cache.aget("ai", cache_key(word, domains))
+    return cached.get("text") if cached else None
+
+
+async def _store_ai_explanation(
+    word: str, domains: list[str], text: str | None, cache: DictionaryCache | None
+) -> None:
+    if cache is not None and text:
+        await cache.aset("ai", cache_key(word, domains), {"text": text})
+
+
 async def _generate_ai_explanation(
     word: str,
     definitions_text: str,
@@ -263,12 +326,17 @@ async def lookup(
     *,
     user_domains: list[str] | None = None,
     llm: LLMService | None = None,
+    cache: DictionaryCache | None = None,
 ) -> DictionaryResult:
-    """Look up a word from all sources in parallel, merge into DictionaryResult."""
+    """Look up a word from all sources in parallel, merge into DictionaryResult.
+
+    ``cache`` defaults to the process-wide cache (None when disabled).
+    """
     domains = user_domains or []
+    cache = cache or get_dictionary_cache()
 
-    wiktionary_task = asyncio.create_task(_fetch_wiktionary(word))
-    wikipedia_task = asyncio.create_task(_fetch_wikipedia(word))
+    wiktionary_task = asyncio.create_task(_fetch_wiktionary(word, cache))
+    wikipedia_task = asyncio.create_task(_fetch_wikipedia(word, cache))
 
     wiktionary_data = await wiktionary_task
     wikipedia_summary = await wikipedia_task
@@ -277,7 +345,10 @@ async def lookup(
 
     ai_explanation = None
     if llm:
-        ai_explanation = await _generate_ai_explanation(word, definitions_text, domains, llm)
+        ai_explanation = await _cached_ai_explanation(word, domains, cache)
+        if ai_explanation is None:
+            ai_explanation = await _generate_ai_explanation(word, definitions_text, domains, llm)
+            await _store_ai_explanation(word, domains, ai_explanation, cache)
 
     return _merge_results(
         word=word,
@@ -292,17 +363,22 @@ async def lookup_stream_events(
     *,
     user_domains: list[str] | None = None,
     llm: LLMService | None = None,
+    cache: DictionaryCache | None = None,
 ) -> AsyncGenerator[tuple[str, dict[str, Any]], None]:
-    """Stream dictionary lookup phases as event/data pairs."""
+    """Stream dictionary lookup phases as event/data pairs.
+
+    A cached AI explanation is sent as a single ``ai_delta``.
+    """
     domains = user_domains or []
+    cache = cache or get_dictionary_cache()
 
     yield (
         "status",
         {"phase": "lexicon", "message": "Checking dictionary sources"},
     )
 
-    wikipedia_task = asyncio.create_task(_fetch_wikipedia(word))
-    wiktionary_data = await _fetch_wiktionary(word)
+    wikipedia_task = asyncio.create_task(_fetch_wikipedia(word, cache))
+    wiktionary_data = await _fetch_wiktionary(word, cache)
     definitions_text = _definitions_text(wiktionary_data)
 
     lexical_result = _merge_results(
@@ -320,22 +396,30 @@ async def lookup_stream_events(
             {"phase": "ai", "message": "Streaming contextual explanation"},
         )
         yield ("ai_start", {"word": word})
-        chunks: list[str] = []
-        try:
-            async for chunk in _stream_ai_explanation(word, definitions_text, domains, llm):
-                chunks.append(chunk)
-                yield ("ai_delta", {"content": chunk})
-        except Exception:
-            logger.exception("AI explanation stream failed for '%s'", word)
-            yield (
-                "error",
-                {
-                    "step": "ai",
-                    "message": "AI explanation could not be generated.",
-                },
-            )
-
-        ai_explanation = "".join(chunks).strip() or None
+        ai_explanation = await _cached_ai_explanation(word, domains, cache)
+        if ai_explanation is not None:
+            yield ("ai_delta", {"content": ai_explanation})
+        else:
+            chunks: list[str] = []
+            stream_failed = False
+            try:
+                async for chunk in _stream_ai_explanation(word, definitions_text, domains, llm):
+                    chunks.append(chunk)
+                    yield ("ai_delta", {"content": chunk})
+            except Exception:
+                logger.exception("AI explanation stream failed for '%s'", word)
+                stream_failed = True
+                yield (
+                    "error",
+                    {
+                        "step": "ai",
+                        "message": "AI explanation could not be generated.",
+                    },
+                )
+
+            ai_explanation = "".join(chunks).strip() or None
+            if not stream_failed:
+                await _store_ai_explanation(word, domains, ai_explanation, cache)
         if ai_explanation:
             yield ("ai_done", {"content": ai_explanation})
 
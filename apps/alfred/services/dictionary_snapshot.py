@@ -0,0 +1,188 @@
+"""Offline dictionary snapshot: a read-only SQLite index of Wiktionary entries.
+
+The snapshot is built from a wiktextract JSONL dump (the per-language files
+published on kaikki.org, optionally gzipped). Each line holds one part of
+speech of one word. Lines are grouped by normalized word and stored as the
+same dict ``_parse_wiktionary_response`` returns, so a snapshot hit can stand
+in for the Wiktionary request without further changes.
+
+Build once, then point ``DICTIONARY_SNAPSHOT_PATH`` at the file::
+
+    python -m alfred.services.dictionary_snapshot kaikki-english.jsonl.gz dictionary.sqlite
+
+Lookups open the file read-only with memory-mapped I/O.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from alfred.core.settings import settings
+from alfred.services.dictionary_cache import normalize_word
+
+logger = logging.getLogger(__name__)
+
+_FLUSH_WORDS = 10_000
+_SELECT_CHUNK = 500
+_MMAP_BYTES = 1 << 30
+
+
+def _open_dump(path: Path) -> Iterator[str]:
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as fh:
+        yield from fh
+
+
+def _entry_from_line(record: dict[str, Any]) -> dict[str, Any] | None:
+    senses: list[dict[str, Any]] = []
+    for sense in record.get("senses") or []:
+        glosses = [g.strip() for g in sense.get("glosses") or [] if isinstance(g, str)]
+        definition = "; ".join(g for g in glosses if g)
+        if not definition:
+            continue
+        examples = [
+            ex["text"].strip()
+            for ex in sense.get("examples") or []
+            if isinstance(ex, dict) and isinstance(ex.get("text"), str)
+        ]
+        senses.append({"definition": definition, "examples": examples})
+    if not senses:
+        return None
+
+    ipa = next(
+        (s["ipa"] for s in record.get("sounds") or [] if isinstance(s, dict) and s.get("ipa")),
+        None,
+    )
+    pos = str(record.get("pos") or "unknown")
+    return {
+        "definitions": [{"part_of_speech": pos.title(), "senses": senses}],
+        "pronunciation_ipa": ipa,
+        "etymology": record.get("etymology_text") or None,
+    }
+
+
+def _merge(base: dict[str, Any] | None, extra: dict[str, Any]) -> dict[str, Any]:
+    if base is None:
+        return extra
+    base["definitions"].extend(extra["definitions"])
+    base["pronunciation_ipa"] = base.get("pronunciation_ipa") or extra.get("pronunciation_ipa")
+    base["etymology"] = base.get("etymology") or extra.get("etymology")
+    return base
+
+
+def _flush(conn: sqlite3.Connection, pending: dict[str, dict[str, Any]]) -> None:
+    """Write ``pending``, merging with rows already stored for the same word."""
+    words = list(pending)
+    for start in range(0, len(words), _SELECT_CHUNK):
+        chunk = words[start : start + _SELECT_CHUNK]
+        placeholders = ",".join("?" * len(chunk))
+        for word, data in conn.execute(
+            f"SELECT word, data FROM entries WHERE word IN ({placeholders})", chunk
+        ):
+            stored = json.loads(data)
+            pending[word] = _merge(stored, pending[word])
+    conn.executemany(
+        "INSERT OR REPLACE INTO entries (word, data) VALUES (?, ?)",
+        ((word, json.dumps(data, ensure_ascii=False)) for word, data in pending.items()),
+    )
+    pending.clear()
+
+
+def build_snapshot(source: Path, target: Path, *, lang_code: str = "en") -> int:
+    """Build a snapshot at ``target`` from the dump at ``source``; return the word count.
+
+    The file is written next to ``target`` and renamed into place, so a
+    running reader never sees a partial snapshot.
+    """
+    tmp = target.with_name(target.name + ".tmp")
+    tmp.unlink(missing_ok=True)
+    conn = sqlite3.connect(tmp)
+    try:
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute(
+            "CREATE TABLE entries (word TEXT PRIMARY KEY, data TEXT NOT NULL) WITHOUT ROWID"
+        )
+        pending: dict[str, dict[str, Any]] = {}
+        for line in _open_dump(source):
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get("lang_code", lang_code) != lang_code:
+                continue
+            word = normalize_word(str(record.get("word") or ""))
+            entry = _entry_from_line(record) if word else None
+            if entry is None:
+                continue
+            pending[word] = _merge(pending.get(word), entry)
+            if len(pending) >= _FLUSH_WORDS:
+                _flush(conn, pending)
+        if pending:
+            _flush(conn, pending)
+        conn.commit()
+        (count,) = conn.execute("SELECT count(*) FROM entries").fetchone()
+    finally:
+        conn.close()
+    os.replace(tmp, target)
+    logger.info("Built dictionary snapshot %s with %d words", target, count)
+    return int(count)
+
+
+class DictionarySnapshot:
+    """Read-only lookups against a built snapshot. Safe to share across threads."""
+
+    def __init__(self, path: Path) -> None:
+        self._conn = sqlite3.connect(
+            f"{path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+        )
+        self._conn.execute(f"PRAGMA mmap_size={_MMAP_BYTES}")
+        self._lock = threading.Lock()
+
+    def get(self, word: str) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM entries WHERE word = ?", (normalize_word(word),)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+@lru_cache(maxsize=1)
+def get_dictionary_snapshot() -> DictionarySnapshot | None:
+    """Snapshot from ``DICTIONARY_SNAPSHOT_PATH``, or None when unset or missing."""
+    raw = settings.dictionary_snapshot_path.strip()
+    if not raw:
+        return None
+    path = Path(raw).expanduser()
+    if not path.is_file():
+        logger.warning("Dictionary snapshot %s not found; using online sources", path)
+        return None
+    return DictionarySnapshot(path)
+
+
+def main(argv: Iterable[str] | None = None) -> None:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", type=Path, help="wiktextract JSONL dump (.jsonl or .jsonl.gz)")
+    parser.add_argument("target", type=Path, help="snapshot file to write")
+    parser.add_argument("--lang-code", default="en")
+    args = parser.parse_args(list(argv) if argv is not None else None)
+    logging.basicConfig(level=logging.INFO)
+    build_snapshot(args.source, args.target, lang_code=args.lang_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 logger = logging.getLogger(__name__)
 
@@ -53,7 +53,11 @@ class EnrichmentMixin:
     def _ensure_extraction_service(self) -> Any: ...
     def _ensure_graph_service(self) -> Any: ...
     def _ensure_llm_service(self) -> Any: ...
-    def _bump_semantic_map_version(self) -> None: ...
+
+    if TYPE_CHECKING:
+        # Declared only for type-checking: a real stub here would shadow
+        # SemanticMapMixin's implementation in the MRO.
+        def _bump_semantic_map_version(self) -> None: ...
 
     def enrich_document(self, doc_id: str, *, force: bool = False) -> dict[str, Any]:
         uid = _parse_uuid(doc_id)
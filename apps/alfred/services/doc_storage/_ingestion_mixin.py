@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import func
 from sqlalchemy.orm import load_only
@@ -53,7 +53,11 @@ class IngestionMixin:
     def _ensure_extraction_service(self) -> Any: ...
     def _ensure_graph_service(self) -> Any: ...
     def _ensure_llm_service(self) -> Any: ...
-    def _bump_semantic_map_version(self) -> None: ...
+
+    if TYPE_CHECKING:
+        # Declared only for type-checking: a real stub here would shadow
+        # SemanticMapMixin's implementation in the MRO.
+        def _bump_semantic_map_version(self) -> None: ...
 
     def ingest_document(self, payload: DocumentIngest) -> dict[str, Any]:
         do_enrichment = bool(settings.enable_ingest_enrichment)
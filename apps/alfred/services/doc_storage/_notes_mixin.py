@@ -18,17 +18,42 @@ from alfred.services.doc_storage.utils import (
 
 from ._session import _session_scope
 
+_MAX_KIND_LENGTH = 32
+_MAX_USER_ID = 2**31 - 1
+
+
+def _meta_kind(value: Any) -> str | None:
+    """``metadata.kind`` for the indexed ``kind`` column."""
+    if not isinstance(value, str) or not value:
+        return None
+    return value[:_MAX_KIND_LENGTH]
+
+
+def _meta_user_id(value: Any) -> int | None:
+    """``metadata.user_id`` for the indexed ``user_id`` column (ints and digit strings)."""
+    if isinstance(value, bool):
+        return None
+    try:
+        user_id = int(value) if isinstance(value, int) else int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+    return user_id if abs(user_id) <= _MAX_USER_ID else None
+
 
 class NotesMixin:
     """Notes CRUD — mixed into DocStorageService."""
 
     session: Any  # provided by the dataclass host
 
-    def create_note(self, note: NoteCreate) -> str:
+    def create_note(self, note: NoteCreate, *, embedding: list[float] | None = None) -> str:
+        meta = note.metadata or {}
         record = QuickNoteRow(
             text=note.text,
             source_url=note.source_url,
-            meta=note.metadata or {},
+            meta=meta,
+            kind=_meta_kind(meta.get("kind")),
+            user_id=_meta_user_id(meta.get("user_id")),
+            embedding=embedding or None,
         )
         with _session_scope(self.session) as s:
             s.add(record)
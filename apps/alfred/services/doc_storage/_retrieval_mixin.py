@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
+import threading
 import uuid
+import weakref
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import and_, func, or_
+from sqlalchemy import and_, func, inspect, literal_column, or_
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import load_only
-from sqlmodel import select
+from sqlmodel import Session, select
 
 from alfred.core.exceptions import BadRequestError
 from alfred.models.doc_storage import DocChunkRow, DocumentRow
@@ -48,15 +54,124 @@ from alfred.services.doc_storage.utils import (
 
 from ._session import _session_scope
 
+logger = logging.getLogger(__name__)
+
+# Generated column added by migration v3w4x5y6z7a8 (Postgres only).
+_DOCUMENT_SEARCH_VECTOR = literal_column("documents.search_vector", type_=TSVECTOR)
+_DOCUMENT_COUNT_VERSION_KEY = "documents:count:version"
+
+_fulltext_support: weakref.WeakKeyDictionary[Any, bool] = weakref.WeakKeyDictionary()
+_fulltext_support_lock = threading.Lock()
+
+
+def _supports_document_fulltext(session: Session) -> bool:
+    """True when the bound database is Postgres and has ``documents.search_vector``."""
+    bind = session.get_bind()
+    with _fulltext_support_lock:
+        cached = _fulltext_support.get(bind)
+    if cached is not None:
+        return cached
+    supported = False
+    if bind.dialect.name == "postgresql":
+        try:
+            columns = inspect(bind).get_columns(DocumentRow.__tablename__)
+            supported = any(col["name"] == "search_vector" for col in columns)
+        except Exception as exc:
+            logger.debug("Could not inspect documents for search_vector: %s", exc)
+    with _fulltext_support_lock:
+        _fulltext_support[bind] = supported
+    return supported
+
+
+def _document_search_filter(session: Session, q: str) -> Any:
+    """Predicate for the free-text search box.
+
+    With the full-text column available this is ``search_vector @@
+    websearch_to_tsquery(q)`` plus a trigram-indexed ``title ILIKE`` so partial
+    title words still match; otherwise it falls back to ILIKE over the body.
+    """
+    title_match = DocumentRow.title.ilike(f"%{q}%")
+    if _supports_document_fulltext(session):
+        return or_(
+            title_match,
+            _DOCUMENT_SEARCH_VECTOR.op("@@")(func.websearch_to_tsquery("english", q)),
+        )
+    return title_match | DocumentRow.cleaned_text.ilike(f"%{q}%")
+
 
 class RetrievalMixin:
     """Document retrieval and listing — mixed into DocStorageService."""
 
     session: Any
     redis_client: Any
+    document_count_cache: Any
+    document_count_cache_lock: Any
+    document_count_cache_ttl_seconds: int
+
+    if TYPE_CHECKING:
+        # Declared only for type-checking: a real stub here would shadow
+        # SemanticMapMixin's implementation in the MRO.
+        def _bump_semantic_map_version(self) -> None: ...
+
+    # --------------- Count cache ---------------
+    def _document_count_version(self) -> str:
+        if self.redis_client is not None:
+            try:
+                value = self.redis_client.get(_DOCUMENT_COUNT_VERSION_KEY)
+                if value:
+                    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+            except Exception:
+                pass
+        return "0"
+
+    def _invalidate_document_counts(self) -> None:
+        """Drop cached totals after documents are added or changed."""
+        with self.document_count_cache_lock:
+            self.document_count_cache.clear()
+        if self.redis_client is not None:
+            try:
+                self.redis_client.incr(_DOCUMENT_COUNT_VERSION_KEY)
+            except Exception:
+                pass
+
+    def _cached_document_count(self, s: Session, count_stmt: Any, **filters: Any) -> int:
+        """Return ``count_stmt``'s result, cached per filter set.
+
+        Totals are shared through Redis (when configured) and a local TTL cache,
+        so paging through results or retyping a query doesn't rerun the same
+        count. Entries are keyed by a version that ``_invalidate_document_counts``
+        bumps on writes; the TTL bounds staleness for writes from other workers.
+        """
+        digest = hashlib.sha1(
+            json.dumps(filters, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        key = f"documents:count:{self._document_count_version()}:{digest}"
+
+        with self.document_count_cache_lock:
+            cached = self.document_count_cache.get(key)
+        if cached is not None:
+            return cached
+
+        total: int | None = None
+        if self.redis_client is not None:
+            try:
+                raw = self.redis_client.get(key)
+                if raw is not None:
+                    total = int(raw)
+            except Exception:
+                total = None
+
+        if total is None:
+            total = int(s.scalar(count_stmt) or 0)
+            if self.redis_client is not None:
+                try:
+                    self.redis_client.setex(key, int(self.document_count_cache_ttl_seconds), total)
+                except Exception:
+                    pass
 
-    # Implemented on the host dataclass
-    def _bump_semantic_map_version(self) -> None: ...
+        with self.document_count_cache_lock:
+            self.document_count_cache[key] = total
+        return total
 
     def get_document_text(self, doc_id: str) -> str | None:
         uid = _parse_uuid(doc_id)
@@ -308,9 +423,7 @@ class RetrievalMixin:
             )
 
             if q:
-                q_filter = DocumentRow.title.ilike(f"%{q}%") | DocumentRow.cleaned_text.ilike(
-                    f"%{q}%"
-                )
+                q_filter = _document_search_filter(s, q)
                 stmt = stmt.where(q_filter)
                 count_stmt = count_stmt.where(q_filter)
 
@@ -319,7 +432,9 @@ class RetrievalMixin:
                 stmt = stmt.where(topic_filter)
                 count_stmt = count_stmt.where(topic_filter)
 
-            total_count = int(s.scalar(count_stmt) or 0)
+            total_count = self._cached_document_count(
+                s, count_stmt, view="explorer", q=q, topic=topic
+            )
 
             if cursor_created_at is not None and cursor_uuid is not None:
                 stmt = stmt.where(
@@ -416,9 +531,7 @@ class RetrievalMixin:
 
             conditions = []
             if q:
-                conditions.append(
-                    DocumentRow.title.ilike(f"%{q}%") | DocumentRow.cleaned_text.ilike(f"%{q}%")
-                )
+                conditions.append(_document_search_filter(s, q))
             if topic:
                 conditions.append(DocumentRow.topics["primary"].astext == topic)  # type: ignore[index]
             if (d := _parse_iso_date(date)) is not None:
@@ -434,7 +547,16 @@ class RetrievalMixin:
 
             stmt = _apply_offset_limit(stmt, skip=skip, limit=limit, max_limit=200)
             rows = s.exec(stmt).all()
-            total = int(s.scalar(count_stmt) or 0)
+            total = self._cached_document_count(
+                s,
+                count_stmt,
+                view="documents",
+                q=q,
+                topic=topic,
+                date=date,
+                start=start,
+                end=end,
+            )
 
             items = []
             for drow in rows:
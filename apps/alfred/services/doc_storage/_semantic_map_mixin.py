@@ -1,24 +1,41 @@
-"""Mixin: Semantic map (Galaxy view) support."""
+"""Mixin: Semantic map (Galaxy view) support.
+
+Vector points are projected with a stored PCA basis (``semantic_map:basis``
+in Redis), so a new or changed document costs one matrix multiply instead of
+a refit. The basis is fitted on first use and refreshed by the periodic
+``refit_semantic_map_basis`` task when ``ENABLE_SEMANTIC_MAP_REFIT`` is set.
+
+When the map version moves, only documents that are new to the top-``limit``
+window or have changed since the cached watermark are fetched and projected.
+Cached points are stored as compact base64 ``npz`` (float32 positions,
+deduplicated topics) rather than a JSON list of dicts.
+"""
 
 from __future__ import annotations
 
 import json
 import logging
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import func
 from sqlmodel import select
 
 from alfred.models.doc_storage import DocumentRow
 from alfred.services.doc_storage.semantic_map import (
-    extract_embedding as _extract_embedding,
+    ProjectionBasis,
+    decode_basis,
+    decode_points,
+    encode_basis,
+    encode_points,
+    fit_projection_basis,
+    project_with_basis,
 )
 from alfred.services.doc_storage.semantic_map import (
-    project_texts_to_3d as _project_texts_to_3d,
+    extract_embedding as _extract_embedding,
 )
 from alfred.services.doc_storage.semantic_map import (
-    project_vectors_to_3d as _project_vectors_to_3d,
+    project_texts_to_3d as _project_texts_to_3d,
 )
 from alfred.services.doc_storage.semantic_map import (
     topic_to_color as _topic_to_color,
@@ -35,6 +52,14 @@ from ._session import _session_scope
 logger = logging.getLogger(__name__)
 
 MIN_PROJECTABLE_ITEMS = 3
+SEMANTIC_MAP_BASIS_KEY = "semantic_map:basis"
+_FETCH_CHUNK = 1000
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    if value is None:
+        return None
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
 
 
 class SemanticMapMixin:
@@ -46,71 +71,188 @@ class SemanticMapMixin:
     semantic_map_cache_lock: Any
     semantic_map_cache_ttl_seconds: int
 
+    if TYPE_CHECKING:
+        # Implemented by RetrievalMixin
+        def _invalidate_document_counts(self) -> None: ...
+
     def get_semantic_map_points(
         self,
         *,
         limit: int = 5000,
         force_refresh: bool = False,
     ) -> list[dict[str, Any]]:
-        """Return 3D-projected document points for the semantic map (Galaxy)."""
+        """Return 3D-projected document points for the semantic map (Galaxy).
+
+        ``force_refresh`` bypasses the point cache and refits the basis.
+        """
 
         limit = max(1, min(int(limit), 20_000))
-        cache_key = f"documents:semantic-map:v1:limit:{limit}"
+        cache_key = f"documents:semantic-map:v2:limit:{limit}"
 
         version = self._current_semantic_map_version()
-        if not force_refresh:
-            cached = self._get_cached_semantic_map(cache_key, version=version)
-            if cached is not None:
-                return cached
+        cached = None if force_refresh else self._get_cached_semantic_map(cache_key, version=version)
+        if cached is not None and cached.get("version") == version:
+            return cached["items"]
+
+        basis = None if force_refresh else self._load_semantic_map_basis()
+        if (
+            basis is not None
+            and cached is not None
+            and cached.get("basis_id") == basis.basis_id
+            and cached.get("watermark")
+        ):
+            items, watermark = self._refresh_semantic_map_points(
+                cached, basis=basis, limit=limit
+            )
+            basis_id: str | None = basis.basis_id
+        else:
+            items, watermark, basis_id = self._build_semantic_map_points(
+                limit=limit, basis=basis
+            )
+
+        self._set_cached_semantic_map(
+            cache_key,
+            version=version,
+            basis_id=basis_id,
+            watermark=watermark,
+            items=items,
+        )
+        return items
+
+    def refit_semantic_map_basis(self, *, limit: int = 20_000) -> dict[str, Any]:
+        """Refit the stored PCA basis on the latest ``limit`` embedded documents."""
+
+        docs = self._fetch_docs_for_semantic_map(limit=max(1, min(int(limit), 20_000)))
+        _, mat = self._embedding_matrix(docs)
+        basis = fit_projection_basis(mat) if mat is not None else None
+        if basis is None:
+            return {"refit": False, "documents": 0}
+        self._save_semantic_map_basis(basis)
+        self._bump_semantic_map_version()
+        return {"refit": True, "documents": int(mat.shape[0]), "basis_id": basis.basis_id}
+
+    def _build_semantic_map_points(
+        self, *, limit: int, basis: ProjectionBasis | None
+    ) -> tuple[list[dict[str, Any]], str | None, str | None]:
+        """Project the whole window; fits and stores a basis when needed."""
 
         docs = self._fetch_docs_for_semantic_map(limit=limit)
+        watermark = self._max_updated_at(docs)
+        embedded_docs, mat = self._embedding_matrix(docs)
+
+        if mat is not None and mat.shape[0] >= MIN_PROJECTABLE_ITEMS:
+            if basis is None or basis.dim != mat.shape[1]:
+                basis = fit_projection_basis(mat)
+                if basis is not None:
+                    self._save_semantic_map_basis(basis)
+            if basis is not None:
+                coords = project_with_basis(mat, basis)
+                items = [self._point(d, pos) for d, pos in zip(embedded_docs, coords, strict=False)]
+                return items, watermark, basis.basis_id
+
+        texts = [f"{d.get('label') or ''} {d.get('primary_topic') or ''}".strip() for d in docs]
+        coords = _project_texts_to_3d(texts)
+        items = [self._point(d, pos) for d, pos in zip(docs, coords, strict=False)]
+        return items, watermark, None
+
+    def _refresh_semantic_map_points(
+        self,
+        cached: dict[str, Any],
+        *,
+        basis: ProjectionBasis,
+        limit: int,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Reproject only documents that entered the window or changed since the watermark."""
+
+        since = _as_utc(datetime.fromisoformat(cached["watermark"]))
+        with _session_scope(self.session) as s:
+            window = s.exec(
+                select(DocumentRow.id, DocumentRow.updated_at)
+                .order_by(DocumentRow.updated_at.desc())
+                .limit(limit)
+            ).all()
+
+        by_id = {item["id"]: item for item in cached["items"]}
+        stale = [
+            str(doc_id)
+            for doc_id, updated_at in window
+            if str(doc_id) not in by_id or (_as_utc(updated_at) or since) > since
+        ]
+        if stale:
+            docs = self._fetch_docs_for_semantic_map(limit=len(stale), doc_ids=stale)
+            embedded_docs, mat = self._embedding_matrix(docs, dim=basis.dim)
+            for doc_id in stale:
+                by_id.pop(doc_id, None)
+            if mat is not None:
+                coords = project_with_basis(mat, basis)
+                for d, pos in zip(embedded_docs, coords, strict=False):
+                    by_id[d["id"]] = self._point(d, pos)
+            logger.debug("Semantic map: reprojected %d of %d documents", len(stale), len(window))
+
+        items = [by_id[str(doc_id)] for doc_id, _ in window if str(doc_id) in by_id]
+        watermark = max((_as_utc(u) for _, u in window if u is not None), default=since)
+        return items, watermark.isoformat() if watermark else cached["watermark"]
 
-        vectors: list[list[float]] = []
+    @staticmethod
+    def _point(doc: dict[str, Any], pos: list[float]) -> dict[str, Any]:
+        topic = doc.get("primary_topic")
+        return {
+            "id": doc["id"],
+            "pos": pos,
+            "color": _topic_to_color(topic),
+            "label": doc.get("label") or doc["id"],
+            "primary_topic": topic,
+        }
+
+    @staticmethod
+    def _embedding_matrix(
+        docs: list[dict[str, Any]], *, dim: int | None = None
+    ) -> tuple[list[dict[str, Any]], Any]:
+        """Stack usable embeddings into a float32 matrix (first dim wins unless given)."""
+
+        import numpy as np
+
+        rows: list[Any] = []
         embedded_docs: list[dict[str, Any]] = []
-        expected_dim: int | None = None
         for d in docs:
-            emb = _extract_embedding(d.get("embedding"), d.get("enrichment"))
-            if not emb:
+            emb = d.get("embedding")
+            if emb is None or not len(emb):
+                continue
+            vec = np.asarray(emb, dtype=np.float32)
+            if vec.ndim != 1:
                 continue
-            if expected_dim is None:
-                expected_dim = len(emb)
-            if len(emb) != expected_dim:
+            if dim is None:
+                dim = int(vec.shape[0])
+            if vec.shape[0] != dim:
                 continue
-            vectors.append(emb)
+            rows.append(vec)
             embedded_docs.append(d)
+        if not rows:
+            return [], None
+        return embedded_docs, np.vstack(rows)
 
-        items: list[dict[str, Any]] = []
-
-        if len(vectors) >= MIN_PROJECTABLE_ITEMS:
-            coords = _project_vectors_to_3d(vectors)
-            for d, pos in zip(embedded_docs, coords, strict=False):
-                topic = d.get("primary_topic")
-                items.append(
-                    {
-                        "id": d["id"],
-                        "pos": pos,
-                        "color": _topic_to_color(topic),
-                        "label": d.get("label") or d["id"],
-                        "primary_topic": topic,
-                    }
-                )
-        else:
-            texts = [f"{d.get('label') or ''} {d.get('primary_topic') or ''}".strip() for d in docs]
-            coords = _project_texts_to_3d(texts)
-            for d, pos in zip(docs, coords, strict=False):
-                topic = d.get("primary_topic")
-                items.append(
-                    {
-                        "id": d["id"],
-                        "pos": pos,
-                        "color": _topic_to_color(topic),
-                        "label": d.get("label") or d["id"],
-                        "primary_topic": topic,
-                    }
-                )
+    @staticmethod
+    def _max_updated_at(docs: list[dict[str, Any]]) -> str | None:
+        stamps = [_as_utc(d.get("updated_at")) for d in docs if d.get("updated_at")]
+        return max(stamps).isoformat() if stamps else None
 
-        self._set_cached_semantic_map(cache_key, version=version, items=items)
-        return items
+    def _load_semantic_map_basis(self) -> ProjectionBasis | None:
+        if self.redis_client is None:
+            return None
+        try:
+            raw = self.redis_client.get(SEMANTIC_MAP_BASIS_KEY)
+            return decode_basis(raw) if raw else None
+        except Exception:
+            logger.warning("Failed reading semantic map basis from Redis", exc_info=True)
+            return None
+
+    def _save_semantic_map_basis(self, basis: ProjectionBasis) -> None:
+        if self.redis_client is None:
+            return
+        try:
+            self.redis_client.set(SEMANTIC_MAP_BASIS_KEY, encode_basis(basis))
+        except Exception:
+            logger.warning("Failed writing semantic map basis to Redis", exc_info=True)
 
     def _current_semantic_map_version(self) -> str:
         """Return a version string for cache invalidation.
@@ -150,75 +292,121 @@ class SemanticMapMixin:
                 self.redis_client.delete("semantic_map:version")
             except Exception:
                 pass
+        self._invalidate_document_counts()
+
+    def _fetch_docs_for_semantic_map(
+        self, *, limit: int, doc_ids: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Fetch only what a point needs: id, title, primary topic, embedding."""
 
-    def _fetch_docs_for_semantic_map(self, *, limit: int) -> list[dict[str, Any]]:
+        columns = (
+            DocumentRow.id,
+            DocumentRow.title,
+            DocumentRow.meta["title"].as_string().label("meta_title"),
+            DocumentRow.meta["page_title"].as_string().label("meta_page_title"),
+            DocumentRow.meta["name"].as_string().label("meta_name"),
+            DocumentRow.topics["primary"].as_string().label("topic_primary"),
+            DocumentRow.topics["classification"].label("topic_classification"),
+            DocumentRow.meta[("enrichment", "topics", "primary")]
+            .as_string()
+            .label("enrichment_topic"),
+            DocumentRow.embedding,
+            DocumentRow.updated_at,
+        )
         with _session_scope(self.session) as s:
-            stmt = (
-                select(
-                    DocumentRow.id,
-                    DocumentRow.title,
-                    DocumentRow.meta,
-                    DocumentRow.topics,
-                    DocumentRow.enrichment,
-                    DocumentRow.embedding,
+            if doc_ids is None:
+                rows = s.exec(
+                    select(*columns).order_by(DocumentRow.updated_at.desc()).limit(limit)
+                ).all()
+            else:
+                rows = []
+                for i in range(0, len(doc_ids), _FETCH_CHUNK):
+                    chunk = doc_ids[i : i + _FETCH_CHUNK]
+                    rows.extend(s.exec(select(*columns).where(DocumentRow.id.in_(chunk))).all())
+
+            # Older rows keep their vector under enrichment.embedding only.
+            missing = [row.id for row in rows if not row.embedding]
+            fallback: dict[Any, Any] = {}
+            for i in range(0, len(missing), _FETCH_CHUNK):
+                chunk = missing[i : i + _FETCH_CHUNK]
+                fallback.update(
+                    s.exec(
+                        select(DocumentRow.id, DocumentRow.enrichment["embedding"])
+                        .where(DocumentRow.id.in_(chunk))
+                        .where(DocumentRow.enrichment.is_not(None))
+                    ).all()
                 )
-                .order_by(DocumentRow.updated_at.desc())
-                .limit(limit)
-            )
-            rows = s.exec(stmt).all()
 
         docs: list[dict[str, Any]] = []
         for row in rows:
-            meta = row.meta or {}
-            label = _best_effort_title(row_title=row.title, meta=meta)
-            primary_topic = _best_effort_primary_topic(row.topics, meta)
+            meta = {
+                "title": row.meta_title,
+                "page_title": row.meta_page_title,
+                "name": row.meta_name,
+                "enrichment": {"topics": {"primary": row.enrichment_topic}},
+            }
+            topics = {"primary": row.topic_primary, "classification": row.topic_classification}
+            embedding = row.embedding
+            if not embedding:
+                embedding = _extract_embedding(None, {"embedding": fallback.get(row.id)})
             docs.append(
                 {
                     "id": str(row.id),
-                    "label": label,
-                    "primary_topic": primary_topic,
-                    "meta": meta,
-                    "topics": row.topics or {},
-                    "enrichment": row.enrichment or {},
-                    "embedding": row.embedding,
+                    "label": _best_effort_title(row_title=row.title, meta=meta),
+                    "primary_topic": _best_effort_primary_topic(topics, meta),
+                    "embedding": embedding,
+                    "updated_at": row.updated_at,
                 }
             )
         return docs
 
     def _get_cached_semantic_map(
-        self,
-        cache_key: str,
-        *,
-        version: str,
-    ) -> list[dict[str, Any]] | None:
+        self, cache_key: str, *, version: str
+    ) -> dict[str, Any] | None:
+        """Return the cached ``{version, basis_id, watermark, items}`` payload.
+
+        The payload may be stale (different version); callers use it as the
+        base for an incremental refresh.
+        """
+
+        with self.semantic_map_cache_lock:
+            local = self.semantic_map_cache.get(cache_key)
+        if local and local.get("version") == version:
+            return local
+
         if self.redis_client is not None:
             try:
                 raw = self.redis_client.get(cache_key)
                 if raw:
                     payload = json.loads(raw)
-                    if payload.get("version") == version and isinstance(payload.get("items"), list):
-                        return payload["items"]
+                    payload["items"] = decode_points(payload.pop("points"))
+                    with self.semantic_map_cache_lock:
+                        self.semantic_map_cache[cache_key] = payload
+                    return payload
             except Exception:
                 logger.exception("Failed reading semantic map cache from Redis")
-
-        with self.semantic_map_cache_lock:
-            cached = self.semantic_map_cache.get(cache_key)
-        if cached and cached.get("version") == version and isinstance(cached.get("items"), list):
-            return cached["items"]
-        return None
+        return local
 
     def _set_cached_semantic_map(
-        self, cache_key: str, *, version: str, items: list[dict[str, Any]]
+        self,
+        cache_key: str,
+        *,
+        version: str,
+        basis_id: str | None,
+        watermark: str | None,
+        items: list[dict[str, Any]],
     ) -> None:
-        payload = {"version": version, "items": items}
+        header = {"version": version, "basis_id": basis_id, "watermark": watermark}
 
         if self.redis_client is not None:
             try:
                 self.redis_client.setex(
-                    cache_key, self.semantic_map_cache_ttl_seconds, json.dumps(payload)
+                    cache_key,
+                    self.semantic_map_cache_ttl_seconds,
+                    json.dumps({**header, "points": encode_points(items)}),
                 )
             except Exception:
                 logger.exception("Failed writing semantic map cache to Redis")
 
         with self.semantic_map_cache_lock:
-            self.semantic_map_cache[cache_key] = payload
+            self.semantic_map_cache[cache_key] = {**header, "items": items}
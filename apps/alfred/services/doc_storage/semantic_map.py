@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import base64
 import hashlib
+import io
+import uuid
+from dataclasses import dataclass
 from typing import Any
 
 HSL_LIGHTNESS_MIDPOINT = 0.5
@@ -156,9 +160,155 @@ def project_texts_to_3d(texts: list[str]) -> list[list[float]]:
     return [[float(row[0]), float(row[1]), float(row[2])] for row in coords]
 
 
+@dataclass(frozen=True)
+class ProjectionBasis:
+    """A fitted PCA basis: ``coords = ((x - mean) @ components.T) / scale``."""
+
+    basis_id: str
+    mean: Any  # np.ndarray (dim,)
+    components: Any  # np.ndarray (3, dim)
+    scale: float
+
+    @property
+    def dim(self) -> int:
+        return int(self.components.shape[1])
+
+
+def fit_projection_basis(mat: Any) -> ProjectionBasis | None:
+    """Fit a 3D PCA basis on an ``(n, dim)`` float32 matrix (n >= 3)."""
+
+    import numpy as np
+    from sklearn.decomposition import PCA
+
+    if mat.ndim != MATRIX_EXPECTED_NDIM or mat.shape[0] < MIN_PROJECTABLE_ITEMS:
+        return None
+    mat = np.where(np.isfinite(mat), mat, 0.0).astype(np.float32, copy=False)
+    n_components = min(SEMANTIC_MAP_DIMENSIONS, mat.shape[0], mat.shape[1])
+    pca = PCA(n_components=n_components)
+    coords = pca.fit_transform(mat)
+    components = pca.components_.astype(np.float32)
+    if n_components < SEMANTIC_MAP_DIMENSIONS:
+        pad = np.zeros((SEMANTIC_MAP_DIMENSIONS - n_components, mat.shape[1]), dtype=np.float32)
+        components = np.concatenate([components, pad], axis=0)
+    max_norm = float(np.max(np.linalg.norm(coords, axis=1))) if coords.shape[0] else 0.0
+    return ProjectionBasis(
+        basis_id=uuid.uuid4().hex,
+        mean=pca.mean_.astype(np.float32),
+        components=components,
+        scale=max_norm if max_norm > 0 else 1.0,
+    )
+
+
+def project_with_basis(mat: Any, basis: ProjectionBasis) -> list[list[float]]:
+    """Project an ``(n, dim)`` matrix into 3D with one matrix multiply."""
+
+    import numpy as np
+
+    if not len(mat):
+        return []
+    mat = np.where(np.isfinite(mat), mat, 0.0).astype(np.float32, copy=False)
+    coords = ((mat - basis.mean) @ basis.components.T) / basis.scale
+    return coords.astype(float).tolist()
+
+
+def _npz_to_text(**arrays: Any) -> str:
+    import numpy as np
+
+    buf = io.BytesIO()
+    np.savez_compressed(buf, **arrays)
+    return base64.b64encode(buf.getvalue()).decode("ascii")
+
+
+def _text_to_npz(raw: str | bytes) -> Any:
+    import numpy as np
+
+    return np.load(io.BytesIO(base64.b64decode(raw)), allow_pickle=False)
+
+
+def encode_basis(basis: ProjectionBasis) -> str:
+    """Serialize a basis as base64 ``npz`` text (safe for decode_responses Redis)."""
+
+    import numpy as np
+
+    return _npz_to_text(
+        basis_id=np.array(basis.basis_id),
+        mean=basis.mean,
+        components=basis.components,
+        scale=np.array(basis.scale, dtype=np.float64),
+    )
+
+
+def decode_basis(raw: str | bytes) -> ProjectionBasis:
+    data = _text_to_npz(raw)
+    return ProjectionBasis(
+        basis_id=str(data["basis_id"]),
+        mean=data["mean"],
+        components=data["components"],
+        scale=float(data["scale"]),
+    )
+
+
+def encode_points(items: list[dict[str, Any]]) -> str:
+    """Pack semantic-map points into base64 ``npz`` text.
+
+    Positions are float32, topics are stored once and referenced by index, and
+    colors are dropped (they are derived from the topic on decode).
+    """
+
+    import numpy as np
+
+    topics: list[str | None] = []
+    topic_index: dict[str | None, int] = {}
+    topic_idx = []
+    for item in items:
+        topic = item.get("primary_topic")
+        if topic not in topic_index:
+            topic_index[topic] = len(topics)
+            topics.append(topic)
+        topic_idx.append(topic_index[topic])
+    return _npz_to_text(
+        ids=np.array([item["id"] for item in items], dtype=str),
+        labels=np.array([item.get("label") or "" for item in items], dtype=str),
+        pos=np.array([item["pos"] for item in items], dtype=np.float32).reshape(-1, 3),
+        topics=np.array(["" if t is None else t for t in topics], dtype=str),
+        topic_is_null=np.array([t is None for t in topics], dtype=bool),
+        topic_idx=np.array(topic_idx, dtype=np.int32),
+    )
+
+
+def decode_points(raw: str | bytes) -> list[dict[str, Any]]:
+    data = _text_to_npz(raw)
+    topics = [
+        None if is_null else str(topic)
+        for topic, is_null in zip(data["topics"], data["topic_is_null"], strict=True)
+    ]
+    items: list[dict[str, Any]] = []
+    for doc_id, label, pos, idx in zip(
+        data["ids"], data["labels"], data["pos"], data["topic_idx"], strict=True
+    ):
+        topic = topics[int(idx)]
+        items.append(
+            {
+                "id": str(doc_id),
+                "pos": [float(v) for v in pos],
+                "color": topic_to_color(topic),
+                "label": str(label) or str(doc_id),
+                "primary_topic": topic,
+            }
+        )
+    return items
+
+
 __all__ = [
+    "ProjectionBasis",
+    "decode_basis",
+    "decode_points",
+    "encode_basis",
+    "encode_points",
     "extract_embedding",
+    "fit_projection_basis",
     "project_texts_to_3d",
     "project_vectors_to_3d",
+    "project_with_basis",
     "topic_to_color",
 ]
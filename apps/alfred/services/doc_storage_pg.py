@@ -74,6 +74,12 @@ class DocStorageService(
         default_factory=lambda: TTLCache(maxsize=8, ttl=600),
         repr=False,
     )
+    document_count_cache_ttl_seconds: int = 60
+    document_count_cache_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    document_count_cache: TTLCache[str, int] = field(
+        default_factory=lambda: TTLCache(maxsize=256, ttl=60),
+        repr=False,
+    )
 
     def __post_init__(self) -> None:
         # Keep initialization side-effect free (no DB/network clients).
@@ -83,6 +89,10 @@ class DocStorageService(
             maxsize=8,
             ttl=int(self.semantic_map_cache_ttl_seconds),
         )
+        self.document_count_cache = TTLCache(
+            maxsize=256,
+            ttl=int(self.document_count_cache_ttl_seconds),
+        )
         return
 
     # --------------- Lazy service creation ---------------
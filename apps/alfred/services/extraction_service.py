@@ -21,6 +21,105 @@ else:  # pragma: no cover - environment dependent
     lx = None  # type: ignore
 
 
+# ---------- Output schemas ----------
+# Defined once at module level so LLMService can cache the response_format
+# payload per class instead of rebuilding it on every call.
+
+
+# LangExtract target schemas (dataclasses)
+@dataclass
+class Entity:
+    name: str | None = None
+    type: str | None = None
+
+
+@dataclass
+class Relation:
+    source: str | None = field(default=None, metadata={"alias": "from"})
+    target: str | None = field(default=None, metadata={"alias": "to"})
+    type: str | None = None
+
+
+@dataclass
+class GraphExtraction:
+    entities: list[Entity] = field(default_factory=list)
+    relations: list[Relation] = field(default_factory=list)
+    topics: list[str] = field(default_factory=list)
+
+
+@dataclass
+class DocEnrichment:
+    lang: str | None = None
+    summary_short: str | None = None
+    summary_long: str | None = None
+    bullets: list[str] = field(default_factory=list)
+    key_points: list[str] = field(default_factory=list)
+    topics_primary: str | None = None
+    topics_secondary: list[str] = field(default_factory=list)
+    tags: list[str] = field(default_factory=list)
+    source_thesis: str | None = None
+    source_argument_flow: list[str] = field(default_factory=list)
+    source_audience: str | None = None
+
+
+@dataclass
+class Topic:
+    title: str | None = None
+    confidence: float | None = None
+
+
+@dataclass
+class Classification:
+    domain: str | None = None
+    subdomain: str | None = None
+    microtopics: list[str] = field(default_factory=list)
+    topic: Topic = field(default_factory=Topic)
+
+
+# LLMService.structured fallback schemas (Pydantic)
+class EntityModel(BaseModel):
+    name: str
+    type: str | None = None
+
+
+class RelationModel(BaseModel):
+    from_name: str = Field(alias="from")
+    to_name: str = Field(alias="to")
+    type: str | None = None
+
+
+class GraphOut(BaseModel):
+    entities: list[EntityModel] = Field(default_factory=list)
+    relations: list[RelationModel] = Field(default_factory=list)
+    topics: list[str] = Field(default_factory=list)
+
+
+class EnrichOut(BaseModel):
+    lang: str | None = None
+    summary_short: str | None = None
+    summary_long: str | None = None
+    bullets: list[str] = Field(default_factory=list)
+    key_points: list[str] = Field(default_factory=list)
+    topics_primary: str | None = None
+    topics_secondary: list[str] = Field(default_factory=list)
+    tags: list[str] = Field(default_factory=list)
+    source_thesis: str | None = None
+    source_argument_flow: list[str] = Field(default_factory=list)
+    source_audience: str | None = None
+
+
+class TopicTitle(BaseModel):
+    title: str
+    confidence: float = Field(ge=0.0, le=1.0)
+
+
+class ClassificationResult(BaseModel):
+    domain: str | None = None
+    subdomain: str | None = None
+    microtopics: list[str] | None = None
+    topic: TopicTitle
+
+
 def _source_capture(metadata: dict[str, Any] | None) -> dict[str, Any]:
     source = (metadata or {}).get("source_capture") if isinstance(metadata, dict) else None
     return source if isinstance(source, dict) else {}
@@ -117,25 +216,6 @@ class ExtractionService:
         # LangExtract graph extraction (OpenAI provider), if available
         try:
             if _LANGEXTRACT_AVAILABLE and lx is not None:
-                from dataclasses import dataclass as _dc_dataclass
-
-                @_dc_dataclass
-                class Entity:
-                    name: str | None = None
-                    type: str | None = None
-
-                @_dc_dataclass
-                class Relation:
-                    source: str | None = field(default=None, metadata={"alias": "from"})
-                    target: str | None = field(default=None, metadata={"alias": "to"})
-                    type: str | None = None
-
-                @_dc_dataclass
-                class GraphExtraction:
-                    entities: list[Entity] = field(default_factory=list)
-                    relations: list[Relation] = field(default_factory=list)
-                    topics: list[str] = field(default_factory=list)
-
                 instr = (
                     "Extract entities (name,type) and relations (from,to,type). "
                     "Return JSON that matches the schema exactly. Use snake_case for types and topics."
@@ -177,20 +257,6 @@ class ExtractionService:
             logger.debug("LangExtract graph failed: %s", exc)
 
         # Fallback: OpenAI structured outputs
-        class EntityModel(BaseModel):
-            name: str
-            type: str | None = None
-
-        class RelationModel(BaseModel):
-            from_name: str = Field(alias="from")
-            to_name: str = Field(alias="to")
-            type: str | None = None
-
-        class GraphOut(BaseModel):
-            entities: list[EntityModel] = Field(default_factory=list)
-            relations: list[RelationModel] = Field(default_factory=list)
-            topics: list[str] = Field(default_factory=list)
-
         ls = self._llm()
         prompt = (
             "TASK: Extract entities and relations from the provided text.\n"
@@ -266,37 +332,9 @@ class ExtractionService:
             return hashlib.sha256((s or "").encode("utf-8")).hexdigest()
 
         # ---------- 1) Combined structured extraction (LangExtract preferred) ----------
-        class EnrichOut(BaseModel):
-            lang: str | None = None
-            summary_short: str | None = None
-            summary_long: str | None = None
-            bullets: list[str] = Field(default_factory=list)
-            key_points: list[str] = Field(default_factory=list)
-            topics_primary: str | None = None
-            topics_secondary: list[str] = Field(default_factory=list)
-            tags: list[str] = Field(default_factory=list)
-            source_thesis: str | None = None
-            source_argument_flow: list[str] = Field(default_factory=list)
-            source_audience: str | None = None
-
         out: EnrichOut
         try:
             if _LANGEXTRACT_AVAILABLE and lx is not None:
-
-                @dataclass
-                class DocEnrichment:
-                    lang: str | None = None
-                    summary_short: str | None = None
-                    summary_long: str | None = None
-                    bullets: list[str] = field(default_factory=list)
-                    key_points: list[str] = field(default_factory=list)
-                    topics_primary: str | None = None
-                    topics_secondary: list[str] = field(default_factory=list)
-                    tags: list[str] = field(default_factory=list)
-                    source_thesis: str | None = None
-                    source_argument_flow: list[str] = field(default_factory=list)
-                    source_audience: str | None = None
-
                 instr = (
                     "Detect `lang` (ISO 639-1). "
                     "Write a richer summary_short (3-6 sentences in a single cohesive paragraph) and "
@@ -429,21 +467,6 @@ class ExtractionService:
         taxonomy = taxonomy_context or load_prompt("classification", "taxonomy_min.txt")
         prompt_description = instructions.replace("{TAXONOMY}", taxonomy).replace("{TEXT}", txt)
 
-        # LangExtract schema (dataclasses)
-        from dataclasses import dataclass as _dc_dataclass
-
-        @_dc_dataclass
-        class Topic:
-            title: str | None = None
-            confidence: float | None = None
-
-        @_dc_dataclass
-        class Classification:
-            domain: str | None = None
-            subdomain: str | None = None
-            microtopics: list[str] = field(default_factory=list)
-            topic: Topic = field(default_factory=Topic)
-
         try:
             if _LANGEXTRACT_AVAILABLE and lx is not None:
                 result = lx.extract(  # type: ignore[attr-defined]
@@ -470,16 +493,6 @@ class ExtractionService:
             logger.debug("LangExtract classify failed: %s", exc)
 
         # Fallback to LLMService.structured
-        class TopicTitle(BaseModel):
-            title: str
-            confidence: float = Field(ge=0.0, le=1.0)
-
-        class ClassificationResult(BaseModel):
-            domain: str | None = None
-            subdomain: str | None = None
-            microtopics: list[str] | None = None
-            topic: TopicTitle
-
         ls = self._llm()
         res = ls.structured(
             [
@@ -7,6 +7,9 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Rows per ``UNWIND`` statement for bulk zettel projection.
+_UNWIND_BATCH = 1000
+
 _NEO4J_AVAILABLE = importlib.util.find_spec("neo4j") is not None
 
 if _NEO4J_AVAILABLE:
@@ -50,6 +53,17 @@ if _NEO4J_AVAILABLE:
                 except Exception:
                     return []
 
+        def _run_batched(
+            self, query: str, rows: list[dict[str, Any]], *,
+            batch_size: int = _UNWIND_BATCH, params: dict[str, Any] | None = None,
+        ) -> None:
+            """Run an ``UNWIND $rows`` query over ``rows`` in chunks on one session."""
+            if not rows:
+                return
+            with self._driver.session() as session:
+                for i in range(0, len(rows), batch_size):
+                    session.run(query, {**(params or {}), "rows": rows[i : i + batch_size]}).consume()
+
         def close(self) -> None:
             try:
                 self._driver.close()
@@ -194,6 +208,90 @@ if _NEO4J_AVAILABLE:
             """
             self._run("MATCH (z:Zettel) DETACH DELETE z")
 
+        # --- Bulk zettel projection -------------------------------------------
+        def upsert_zettels(
+            self, rows: list[dict[str, Any]], *, sync_id: str | None = None,
+            batch_size: int = _UNWIND_BATCH,
+        ) -> None:
+            """Bulk form of ``upsert_zettel``; rows carry the same keyword fields.
+
+            ``sync_id`` tags every touched node so ``prune_zettel_subgraph`` can
+            drop the ones a full rebuild did not see.
+            """
+            query = """
+            UNWIND $rows AS row
+            MERGE (z:Zettel {card_id: row.card_id})
+            SET z.title = row.title,
+                z.topic = row.topic,
+                z.tags = row.tags,
+                z.bloom_level = row.bloom_level,
+                z.cluster_id = row.cluster_id,
+                z.sync_id = $sync_id,
+                z.updated_at = timestamp()
+            """
+            self._run_batched(query, rows, batch_size=batch_size, params={"sync_id": sync_id})
+
+        def link_zettels_bulk(
+            self, rows: list[dict[str, Any]], *, sync_id: str | None = None,
+            batch_size: int = _UNWIND_BATCH,
+        ) -> None:
+            """Bulk form of ``link_zettels``; rows carry from_id/to_id/type_/bidirectional."""
+            query = """
+            UNWIND $rows AS row
+            MATCH (a:Zettel {card_id: row.from_id})
+            MATCH (b:Zettel {card_id: row.to_id})
+            MERGE (a)-[r:LINK {type: row.type_}]->(b)
+            ON CREATE SET r.created_at = timestamp()
+            SET r.bidirectional = row.bidirectional,
+                r.sync_id = $sync_id
+            """
+            self._run_batched(query, rows, batch_size=batch_size, params={"sync_id": sync_id})
+
+        def delete_zettels(self, card_ids: list[int], *, batch_size: int = _UNWIND_BATCH) -> None:
+            rows = [{"card_id": int(card_id)} for card_id in card_ids]
+            self._run_batched(
+                "UNWIND $rows AS row MATCH (z:Zettel {card_id: row.card_id}) DETACH DELETE z",
+                rows,
+                batch_size=batch_size,
+            )
+
+        def prune_zettel_subgraph(self, *, sync_id: str) -> dict[str, int]:
+            """Delete :LINK edges and :Zettel nodes not tagged with ``sync_id``."""
+            edges = self._run(
+                """
+                MATCH (:Zettel)-[r:LINK]->(:Zettel)
+                WHERE r.sync_id IS NULL OR r.sync_id <> $sync_id
+                DELETE r
+                RETURN count(r) AS n
+                """,
+                {"sync_id": sync_id},
+            )
+            nodes = self._run(
+                """
+                MATCH (z:Zettel)
+                WHERE z.sync_id IS NULL OR z.sync_id <> $sync_id
+                DETACH DELETE z
+                RETURN count(z) AS n
+                """,
+                {"sync_id": sync_id},
+            )
+            return {
+                "nodes": int(nodes[0]["n"]) if nodes else 0,
+                "edges": int(edges[0]["n"]) if edges else 0,
+            }
+
+        def get_zettel_watermark(self) -> str | None:
+            rows = self._run(
+                "MATCH (s:ZettelSyncState {key: 'zettel'}) RETURN s.watermark AS watermark"
+            )
+            return rows[0]["watermark"] if rows else None
+
+        def set_zettel_watermark(self, watermark: str) -> None:
+            self._run(
+                "MERGE (s:ZettelSyncState {key: 'zettel'}) SET s.watermark = $watermark",
+                {"watermark": watermark},
+            )
+
         def fetch_topic_subgraph(self, *, topic_id: str, limit: int = 200) -> dict[str, Any]:
             query = """
             MATCH (t:Topic {topic_id: $topic_id})
@@ -319,5 +417,29 @@ else:
         def wipe_zettel_subgraph(self) -> None:
             return None
 
+        def upsert_zettels(
+            self, rows: list[dict[str, Any]], *, sync_id: str | None = None,
+            batch_size: int = _UNWIND_BATCH,
+        ) -> None:
+            return None
+
+        def link_zettels_bulk(
+            self, rows: list[dict[str, Any]], *, sync_id: str | None = None,
+            batch_size: int = _UNWIND_BATCH,
+        ) -> None:
+            return None
+
+        def delete_zettels(self, card_ids: list[int], *, batch_size: int = _UNWIND_BATCH) -> None:
+            return None
+
+        def prune_zettel_subgraph(self, *, sync_id: str) -> dict[str, int]:
+            return {"nodes": 0, "edges": 0}
+
+        def get_zettel_watermark(self) -> str | None:
+            return None
+
+        def set_zettel_watermark(self, watermark: str) -> None:
+            return None
+
         def fetch_topic_subgraph(self, *, topic_id: str, limit: int = 200) -> dict[str, Any]:
             return {"nodes": [], "edges": []}
@@ -1,21 +1,38 @@
 """Knowledge service using Qdrant for vector storage and retrieval.
 
-Provides vector indexing and search capabilities over documents.
+Provides vector indexing and search capabilities over documents. Callers
+should use the process-wide instance from
+``alfred.core.dependencies.get_knowledge_service`` so indexing and search
+share one client and collection.
 """
 
 from __future__ import annotations
 
 import hashlib
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from typing import Any
 from uuid import uuid4
 
 from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, PointStruct, VectorParams
+from qdrant_client.models import (
+    Distance,
+    FieldCondition,
+    Filter,
+    FilterSelector,
+    MatchAny,
+    MatchValue,
+    PayloadSchemaType,
+    PointStruct,
+    VectorParams,
+)
 
 from alfred.core.llm_factory import get_embedding_model
 from alfred.core.settings import LLMProvider
 
+# Payload fields filtered on: the point's own id and its parent document.
+_PAYLOAD_INDEX_FIELDS = ("doc_id", "meta.doc_id")
+
 
 @dataclass
 class KnowledgeService:
@@ -27,7 +44,10 @@ class KnowledgeService:
     collection_name: str = "alfred_knowledge"
     client: QdrantClient | None = None
     embedder: Any | None = None
-    vector_size: int = 1536  # OpenAI default, adjust for other models
+    # Inferred from the first embedding batch when not set explicitly.
+    vector_size: int | None = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _collection_ready: bool = field(default=False, init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Defer heavy initialization until first use."""
@@ -36,29 +56,45 @@ class KnowledgeService:
 
     # Lazy initialization helpers
     def _ensure_initialized(self) -> None:
-        if self.client is None:
-            # Use in-memory Qdrant for prototyping by default
-            self.client = QdrantClient(":memory:")
-        if self.embedder is None:
-            # Use existing embedding factory, fallback to Ollama if no OpenAI key
-            try:
-                self.embedder = get_embedding_model()
-            except Exception:
-                self.embedder = get_embedding_model(provider=LLMProvider.ollama)
-        # Ensure collection availability
-        self._ensure_collection()
-
-    def _ensure_collection(self) -> None:
-        """Create collection if it doesn't exist."""
-        collections = self.client.get_collections().collections
-        if not any(c.name == self.collection_name for c in collections):
-            self.client.create_collection(
-                collection_name=self.collection_name,
-                vectors_config=VectorParams(
-                    size=self.vector_size,
-                    distance=Distance.COSINE,
-                ),
-            )
+        with self._lock:
+            if self.client is None:
+                from alfred.core.dependencies import get_local_qdrant_client
+
+                self.client = get_local_qdrant_client()
+            if self.embedder is None:
+                # Use existing embedding factory, fallback to Ollama if no OpenAI key
+                try:
+                    self.embedder = get_embedding_model()
+                except Exception:
+                    self.embedder = get_embedding_model(provider=LLMProvider.ollama)
+
+    def _ensure_collection(self, vector_size: int | None = None) -> bool:
+        """Create the collection and its payload indexes on first use.
+
+        Returns False when the collection does not exist yet and there is no
+        vector size to create it with (nothing has been indexed).
+        """
+        if self._collection_ready:
+            return True
+        with self._lock:
+            if self._collection_ready:
+                return True
+            if not self.client.collection_exists(self.collection_name):
+                size = self.vector_size or vector_size
+                if not size:
+                    return False
+                self.client.create_collection(
+                    collection_name=self.collection_name,
+                    vectors_config=VectorParams(size=size, distance=Distance.COSINE),
+                )
+                for field_name in _PAYLOAD_INDEX_FIELDS:
+                    self.client.create_payload_index(
+                        collection_name=self.collection_name,
+                        field_name=field_name,
+                        field_schema=PayloadSchemaType.KEYWORD,
+                    )
+            self._collection_ready = True
+            return True
 
     def index_documents(
         self,
@@ -84,6 +120,9 @@ class KnowledgeService:
 
             # Generate embeddings
             embeddings = self.embedder.embed_documents(texts)
+            if not embeddings:
+                continue
+            self._ensure_collection(len(embeddings[0]))
 
             # Prepare points for Qdrant
             points = []
@@ -101,10 +140,12 @@ class KnowledgeService:
                 points.append(point)
                 indexed_ids.append(doc_id)
 
-            # Upload to Qdrant
+            # Upload to Qdrant; only the final batch waits so the caller can
+            # read its own writes without serializing every batch.
             self.client.upsert(
                 collection_name=self.collection_name,
                 points=points,
+                wait=i + batch_size >= len(docs),
             )
 
         return indexed_ids
@@ -127,6 +168,8 @@ class KnowledgeService:
         """
         # Ensure dependencies exist
         self._ensure_initialized()
+        if not self._ensure_collection():
+            return []
         # Generate query embedding
         query_embedding = self.embedder.embed_query(query)
 
@@ -157,15 +200,70 @@ class KnowledgeService:
     def delete_documents(self, doc_ids: list[str]) -> None:
         """Delete documents by ID."""
         self._ensure_initialized()
+        if not self._ensure_collection():
+            return
         point_ids = [self._hash_id(doc_id) for doc_id in doc_ids]
         self.client.delete(
             collection_name=self.collection_name,
             points_selector=point_ids,
         )
 
+    def delete_by_parent(self, parent_doc_id: str) -> None:
+        """Delete every point whose ``meta.doc_id`` is ``parent_doc_id`` (e.g. a document's chunks)."""
+        self._ensure_initialized()
+        if not self._ensure_collection():
+            return
+        self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=FilterSelector(
+                filter=Filter(
+                    must=[FieldCondition(key="meta.doc_id", match=MatchValue(value=parent_doc_id))]
+                )
+            ),
+        )
+
+    def delete_by_parents(self, parent_doc_ids: list[str]) -> None:
+        """Delete the points of many parent documents in one request."""
+        if not parent_doc_ids:
+            return
+        self._ensure_initialized()
+        if not self._ensure_collection():
+            return
+        self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=FilterSelector(
+                filter=Filter(
+                    must=[FieldCondition(key="meta.doc_id", match=MatchAny(any=list(parent_doc_ids)))]
+                )
+            ),
+        )
+
+    def delete_stale_chunks(self, parent_doc_ids: list[str], keep_ids: list[str]) -> None:
+        """Delete points of ``parent_doc_ids`` whose id is not in ``keep_ids``.
+
+        Run after re-indexing so a document's chunks are replaced in place: its
+        current chunks stay searchable throughout, and only leftovers from a
+        longer previous run are removed.
+        """
+        if not parent_doc_ids:
+            return
+        self._ensure_initialized()
+        if not self._ensure_collection():
+            return
+        parents = FieldCondition(key="meta.doc_id", match=MatchAny(any=list(parent_doc_ids)))
+        current = FieldCondition(key="doc_id", match=MatchAny(any=list(keep_ids)))
+        self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=FilterSelector(
+                filter=Filter(must=[parents], must_not=[current] if keep_ids else None)
+            ),
+        )
+
     def count(self) -> int:
         """Get total number of indexed documents."""
         self._ensure_initialized()
+        if not self._ensure_collection():
+            return 0
         info = self.client.get_collection(self.collection_name)
         return info.points_count
 
@@ -4,7 +4,9 @@ from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
-from sqlalchemy import func
+from sqlalchemy import case, func
+from sqlalchemy import insert as sa_insert
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlmodel import Session, select
 
 from alfred.core.settings import settings
@@ -29,6 +31,8 @@ from alfred.services.spaced_repetition import compute_next_review_schedule
 PROGRESS_COMPLETE = 100
 QUIZ_SOURCE_TEXT_CHAR_BUDGET = 8000
 RETENTION_METRIC_30D_STAGE = 3
+# Rows per multi-VALUES statement; keeps bind parameters under SQLite's limit.
+_UPSERT_CHUNK = 500
 
 
 @dataclass
@@ -493,14 +497,21 @@ class LearningService:
         entities = graph.get("entities") or []
         relations = graph.get("relations") or []
 
-        entity_ids = self._upsert_entities(entities)
-        self._link_resource_entities(resource_id=resource.id or 0, entity_ids=entity_ids)
-        self._upsert_relations(resource_id=resource.id or 0, relations=relations)
+        # Entities, links, relations and the resource stamp commit together.
+        try:
+            entity_ids = self._upsert_entities(entities)
+            self._link_resource_entities(resource_id=resource.id or 0, entity_ids=entity_ids)
+            self._upsert_relations(
+                resource_id=resource.id or 0, relations=relations, entity_ids=entity_ids
+            )
 
-        resource.extracted_at = _utcnow()
-        resource.updated_at = _utcnow()
-        self.session.add(resource)
-        self.session.commit()
+            resource.extracted_at = _utcnow()
+            resource.updated_at = _utcnow()
+            self.session.add(resource)
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
         self.session.refresh(resource)
 
         gs = self._maybe_graph()
@@ -541,68 +552,127 @@ class LearningService:
                 gs.close()
         return graph
 
+    def _insert(self):
+        """Dialect ``insert`` supporting ``ON CONFLICT`` for the session's bind."""
+        if self.session.get_bind().dialect.name == "sqlite":
+            return sqlite.insert
+        return postgresql.insert
+
     def _upsert_entities(self, entities: Iterable[dict]) -> dict[str, int]:
-        name_to_id: dict[str, int] = {}
+        """Insert-or-fill entities by name in one statement per chunk; return name -> id.
+
+        An existing entity keeps its type; a missing type is filled from the
+        extraction. Does not commit.
+        """
+        types: dict[str, str | None] = {}
         for ent in entities:
             name = (ent.get("name") or "").strip()
             if not name:
                 continue
             type_ = ent.get("type") or None
-            existing = self.session.exec(
-                select(LearningEntity).where(LearningEntity.name == name)
-            ).first()
-            if existing:
-                if type_ and not existing.type:
-                    existing.type = str(type_)
-                    existing.updated_at = _utcnow()
-                    self.session.add(existing)
-                    self.session.commit()
-                    self.session.refresh(existing)
-                name_to_id[name] = existing.id or 0
-                continue
-            created = LearningEntity(name=name, type=(str(type_) if type_ else None))
-            self.session.add(created)
-            self.session.commit()
-            self.session.refresh(created)
-            name_to_id[name] = created.id or 0
+            if types.get(name) is None:
+                types[name] = str(type_) if type_ else None
+        if not types:
+            return {}
+
+        table = LearningEntity.__table__
+        insert = self._insert()
+        now = _utcnow()
+        name_to_id: dict[str, int] = {}
+        names = list(types)
+        for i in range(0, len(names), _UPSERT_CHUNK):
+            rows = [
+                {"name": name, "type": types[name], "created_at": now, "updated_at": now}
+                for name in names[i : i + _UPSERT_CHUNK]
+            ]
+            stmt = insert(LearningEntity).values(rows)
+            fills_type = table.c.type.is_(None) & stmt.excluded.type.is_not(None)
+            # DO UPDATE (not DO NOTHING) so RETURNING also yields existing rows.
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["name"],
+                set_={
+                    "type": func.coalesce(table.c.type, stmt.excluded.type),
+                    "updated_at": case(
+                        (fills_type, stmt.excluded.updated_at), else_=table.c.updated_at
+                    ),
+                },
+            ).returning(table.c.id, table.c.name)
+            name_to_id.update({name: entity_id for entity_id, name in self.session.execute(stmt)})
         return name_to_id
 
     def _link_resource_entities(self, *, resource_id: int, entity_ids: dict[str, int]) -> None:
-        for entity_id in entity_ids.values():
-            stmt = select(LearningResourceEntity).where(
-                (LearningResourceEntity.resource_id == resource_id)
-                & (LearningResourceEntity.entity_id == entity_id)
+        """Bulk-insert resource/entity links, skipping existing pairs. Does not commit."""
+        ids = sorted(set(entity_ids.values()))
+        if not ids:
+            return
+        insert = self._insert()
+        now = _utcnow()
+        for i in range(0, len(ids), _UPSERT_CHUNK):
+            rows = [
+                {
+                    "resource_id": resource_id,
+                    "entity_id": entity_id,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for entity_id in ids[i : i + _UPSERT_CHUNK]
+            ]
+            self.session.execute(
+                insert(LearningResourceEntity)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=["resource_id", "entity_id"])
             )
-            existing = self.session.exec(stmt).first()
-            if existing:
-                continue
-            self.session.add(LearningResourceEntity(resource_id=resource_id, entity_id=entity_id))
-        self.session.commit()
 
-    def _upsert_relations(self, *, resource_id: int, relations: Iterable[dict]) -> None:
-        # Relations are best-effort; skip if entities aren't present
+    def _upsert_relations(
+        self,
+        *,
+        resource_id: int,
+        relations: Iterable[dict],
+        entity_ids: dict[str, int] | None = None,
+    ) -> None:
+        """Bulk-insert relations, resolving names through ``entity_ids``.
+
+        Names missing from the map are looked up in one query. Relations are
+        best-effort: any endpoint that does not resolve is skipped. Does not commit.
+        """
+        pairs: list[tuple[str, str, str]] = []
         for rel in relations:
             from_name = (rel.get("from") or "").strip()
             to_name = (rel.get("to") or "").strip()
-            if not from_name or not to_name:
-                continue
-            from_ent = self.session.exec(
-                select(LearningEntity).where(LearningEntity.name == from_name)
-            ).first()
-            to_ent = self.session.exec(
-                select(LearningEntity).where(LearningEntity.name == to_name)
-            ).first()
-            if not from_ent or not to_ent:
-                continue
-            self.session.add(
-                LearningEntityRelation(
-                    resource_id=resource_id,
-                    from_entity_id=from_ent.id or 0,
-                    to_entity_id=to_ent.id or 0,
-                    type=str(rel.get("type") or "RELATED_TO"),
-                )
+            if from_name and to_name:
+                pairs.append((from_name, to_name, str(rel.get("type") or "RELATED_TO")))
+        if not pairs:
+            return
+
+        name_to_id = dict(entity_ids or {})
+        missing = {name for pair in pairs for name in pair[:2]} - name_to_id.keys()
+        if missing:
+            name_to_id.update(
+                {
+                    name: entity_id
+                    for entity_id, name in self.session.exec(
+                        select(LearningEntity.id, LearningEntity.name).where(
+                            LearningEntity.name.in_(missing)  # type: ignore[attr-defined]
+                        )
+                    )
+                }
             )
-        self.session.commit()
+
+        now = _utcnow()
+        rows = [
+            {
+                "resource_id": resource_id,
+                "from_entity_id": name_to_id[from_name],
+                "to_entity_id": name_to_id[to_name],
+                "type": rel_type,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for from_name, to_name, rel_type in pairs
+            if from_name in name_to_id and to_name in name_to_id
+        ]
+        if rows:
+            self.session.execute(sa_insert(LearningEntityRelation), rows)
 
     def build_graph(self, *, topic_id: int | None = None, max_entities: int = 200) -> dict:
         nodes: list[dict] = []
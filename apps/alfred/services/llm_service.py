@@ -3,6 +3,7 @@ from __future__ import annotations
 import base64
 import importlib.util
 from collections.abc import Iterable
+from functools import lru_cache
 from typing import Any, TypeVar
 
 from openai import AsyncOpenAI, OpenAI
@@ -23,6 +24,108 @@ def _get_ollama_chat():
 T = TypeVar("T", bound=BaseModel)
 
 
+def _deref(obj: object, defs: dict[str, object]) -> object:
+    """Inline local ``#/$defs/...`` references (OpenAI rejects ``$ref``)."""
+    if isinstance(obj, dict):
+        # Replace local refs like #/$defs/Name
+        if "$ref" in obj:
+            ref = obj["$ref"]
+            if isinstance(ref, str) and ref.startswith("#/$defs/"):
+                name = ref.split("/")[-1]
+                target = defs.get(name, {})
+                # Deep copy via recursion
+                return _deref(target, defs)
+        # Recurse
+        out: dict[str, object] = {}
+        for k, v in obj.items():
+            out[k] = _deref(v, defs)
+        return out
+    if isinstance(obj, list):
+        return [_deref(x, defs) for x in obj]
+    return obj
+
+
+def _strictify(obj: object) -> None:
+    """Recursively normalize all object schemas to be strict for OpenAI."""
+    if isinstance(obj, dict):
+        t = obj.get("type")
+        if t == "object":
+            obj.setdefault("type", "object")
+            # Disallow unknown keys
+            obj["additionalProperties"] = False
+            props = obj.get("properties")
+            if isinstance(props, dict):
+                # OpenAI expects 'required' listing all keys in properties
+                obj["required"] = list(props.keys())
+                # Recurse into nested properties
+                for v in props.values():
+                    _strictify(v)
+        # Recurse into common schema containers
+        for key in ("items", "allOf", "anyOf", "oneOf", "$defs", "definitions"):
+            if key in obj:
+                val = obj[key]
+                if isinstance(val, list):
+                    for it in val:
+                        _strictify(it)
+                elif isinstance(val, dict):
+                    _strictify(val)
+
+
+@lru_cache(maxsize=256)
+def _response_format(schema: type[BaseModel]) -> dict[str, Any]:
+    """Strict OpenAI ``response_format`` payload for ``schema``.
+
+    Cached per class for the life of the process and shared by the sync and
+    async paths; callers must treat the returned dict as read-only.
+    """
+    json_schema = schema.model_json_schema()
+
+    if isinstance(json_schema, dict):
+        defs = {}
+        for key in ("$defs", "definitions"):
+            if isinstance(json_schema.get(key), dict):
+                defs = json_schema[key]  # type: ignore[assignment]
+                break
+        if defs:
+            json_schema = _deref(json_schema, defs)  # type: ignore[assignment]
+            # Drop defs after inlining
+            json_schema.pop("$defs", None)
+            json_schema.pop("definitions", None)
+
+    try:
+        _strictify(json_schema)
+    except Exception:
+        # Fall through to harden root below
+        pass
+
+    # Ensure root object is strict per OpenAI requirements
+    if isinstance(json_schema, dict):
+        # Some pydantic schemas use $ref at root; still enforce a strict object wrapper
+        if json_schema.get("type") != "object":
+            # Wrap in an object if needed
+            props = (
+                json_schema.get("properties")
+                if isinstance(json_schema.get("properties"), dict)
+                else {}
+            )
+            json_schema["type"] = "object"
+            if not props:
+                json_schema.setdefault("properties", {})
+        json_schema["additionalProperties"] = False
+        # If pydantic already provided 'required', keep it; otherwise default to listed properties
+        if not json_schema.get("required") and isinstance(json_schema.get("properties"), dict):
+            json_schema["required"] = list(json_schema["properties"].keys())
+
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": schema.__name__,
+            "schema": json_schema,
+            "strict": True,
+        },
+    }
+
+
 class LLMService:
     """
     Unified LLM access for Alfred.
@@ -290,101 +393,10 @@ class LLMService:
         client = self.openai_client
         model_name = model or self.cfg.llm_model
 
-        json_schema = schema.model_json_schema()
-
-        # Inline local $ref references because OpenAI structured outputs do not
-        # accept $ref in the response_format schema.
-        def _deref(obj: object, defs: dict[str, object]) -> object:
-            if isinstance(obj, dict):
-                # Replace local refs like #/$defs/Name
-                if "$ref" in obj:
-                    ref = obj["$ref"]
-                    if isinstance(ref, str) and ref.startswith("#/$defs/"):
-                        name = ref.split("/")[-1]
-                        target = defs.get(name, {})
-                        # Deep copy via recursion
-                        return _deref(target, defs)
-                # Recurse
-                out: dict[str, object] = {}
-                for k, v in obj.items():
-                    out[k] = _deref(v, defs)
-                return out
-            if isinstance(obj, list):
-                return [_deref(x, defs) for x in obj]
-            return obj
-
-        if isinstance(json_schema, dict):
-            defs = {}
-            for key in ("$defs", "definitions"):
-                if isinstance(json_schema.get(key), dict):
-                    defs = json_schema[key]  # type: ignore[assignment]
-                    break
-            if defs:
-                json_schema = _deref(json_schema, defs)  # type: ignore[assignment]
-                # Drop defs after inlining
-                json_schema.pop("$defs", None)
-                json_schema.pop("definitions", None)
-
-        # Recursively normalize all object schemas to be strict for OpenAI
-        def _strictify(obj: object) -> None:
-            if isinstance(obj, dict):
-                t = obj.get("type")
-                if t == "object":
-                    obj.setdefault("type", "object")
-                    # Disallow unknown keys
-                    obj["additionalProperties"] = False
-                    props = obj.get("properties")
-                    if isinstance(props, dict):
-                        # OpenAI expects 'required' listing all keys in properties
-                        obj["required"] = list(props.keys())
-                        # Recurse into nested properties
-                        for v in props.values():
-                            _strictify(v)
-                # Recurse into common schema containers
-                for key in ("items", "allOf", "anyOf", "oneOf", "$defs", "definitions"):
-                    if key in obj:
-                        val = obj[key]
-                        if isinstance(val, list):
-                            for it in val:
-                                _strictify(it)
-                        elif isinstance(val, dict):
-                            _strictify(val)
-
-        try:
-            _strictify(json_schema)
-        except Exception:
-            # Fall through to harden root below
-            pass
-
-        # Ensure root object is strict per OpenAI requirements
-        if isinstance(json_schema, dict):
-            # Some pydantic schemas use $ref at root; still enforce a strict object wrapper
-            if json_schema.get("type") != "object":
-                # Wrap in an object if needed
-                props = (
-                    json_schema.get("properties")
-                    if isinstance(json_schema.get("properties"), dict)
-                    else {}
-                )
-                json_schema["type"] = "object"
-                if not props:
-                    json_schema.setdefault("properties", {})
-            json_schema["additionalProperties"] = False
-            # If pydantic already provided 'required', keep it; otherwise default to listed properties
-            if not json_schema.get("required") and isinstance(json_schema.get("properties"), dict):
-                json_schema["required"] = list(json_schema["properties"].keys())
-
         resp = client.chat.completions.create(
             model=model_name,
             messages=messages,
-            response_format={
-                "type": "json_schema",
-                "json_schema": {
-                    "name": schema.__name__,
-                    "schema": json_schema,
-                    "strict": True,
-                },
-            },
+            response_format=_response_format(schema),
             timeout=30,
         )
         raw = resp.choices[0].message.content
@@ -407,85 +419,10 @@ class LLMService:
         client = self.openai_async_client
         model_name = model or self.cfg.llm_model
 
-        json_schema = schema.model_json_schema()
-
-        def _deref(obj: object, defs: dict[str, object]) -> object:
-            if isinstance(obj, dict):
-                if "$ref" in obj:
-                    ref = obj["$ref"]
-                    if isinstance(ref, str) and ref.startswith("#/$defs/"):
-                        name = ref.split("/")[-1]
-                        target = defs.get(name, {})
-                        return _deref(target, defs)
-                out: dict[str, object] = {}
-                for k, v in obj.items():
-                    out[k] = _deref(v, defs)
-                return out
-            if isinstance(obj, list):
-                return [_deref(x, defs) for x in obj]
-            return obj
-
-        if isinstance(json_schema, dict):
-            defs = {}
-            for key in ("$defs", "definitions"):
-                if isinstance(json_schema.get(key), dict):
-                    defs = json_schema[key]  # type: ignore[assignment]
-                    break
-            if defs:
-                json_schema = _deref(json_schema, defs)  # type: ignore[assignment]
-                json_schema.pop("$defs", None)
-                json_schema.pop("definitions", None)
-
-        def _strictify(obj: object) -> None:
-            if isinstance(obj, dict):
-                t = obj.get("type")
-                if t == "object":
-                    obj.setdefault("type", "object")
-                    obj["additionalProperties"] = False
-                    props = obj.get("properties")
-                    if isinstance(props, dict):
-                        obj["required"] = list(props.keys())
-                        for v in props.values():
-                            _strictify(v)
-                for key in ("items", "allOf", "anyOf", "oneOf", "$defs", "definitions"):
-                    if key in obj:
-                        val = obj[key]
-                        if isinstance(val, list):
-                            for it in val:
-                                _strictify(it)
-                        elif isinstance(val, dict):
-                            _strictify(val)
-
-        try:
-            _strictify(json_schema)
-        except Exception:
-            pass
-
-        if isinstance(json_schema, dict):
-            if json_schema.get("type") != "object":
-                props = (
-                    json_schema.get("properties")
-                    if isinstance(json_schema.get("properties"), dict)
-                    else {}
-                )
-                json_schema["type"] = "object"
-                if not props:
-                    json_schema.setdefault("properties", {})
-            json_schema["additionalProperties"] = False
-            if not json_schema.get("required") and isinstance(json_schema.get("properties"), dict):
-                json_schema["required"] = list(json_schema["properties"].keys())
-
         resp = await client.chat.completions.create(
             model=model_name,
             messages=messages,
-            response_format={
-                "type": "json_schema",
-                "json_schema": {
-                    "name": schema.__name__,
-                    "schema": json_schema,
-                    "strict": True,
-                },
-            },
+            response_format=_response_format(schema),
             timeout=30,
         )
         raw = resp.choices[0].message.content
@@ -5,9 +5,10 @@ import re
 from collections.abc import Iterable
 from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field
+from sqlalchemy import func
 from sqlmodel import Session, select
 
 from alfred.core.database import SessionLocal
@@ -18,6 +19,10 @@ from alfred.schemas.documents import NoteCreate
 from alfred.schemas.intelligence import MemoryCreateRequest, MemoryItem, MemoryListResponse
 from alfred.services.doc_storage_pg import DocStorageService
 from alfred.services.llm_service import LLMService
+from alfred.services.memory_vector_index import get_memory_vector_index
+
+if TYPE_CHECKING:
+    from langchain_core.embeddings import Embeddings
 
 logger = logging.getLogger(__name__)
 
@@ -35,19 +40,6 @@ class _ThreadMemoryDraft(BaseModel):
     memories: list[_MemoryDraft] = Field(default_factory=list)
 
 
-def _first_int(value: Any) -> int | None:
-    if value is None:
-        return None
-    if isinstance(value, bool):
-        return None
-    if isinstance(value, int):
-        return value
-    try:
-        return int(str(value))
-    except Exception:
-        return None
-
-
 def _normalize_tags(tags: Iterable[str] | None, *, max_tags: int = 12) -> list[str]:
     cleaned: list[str] = []
     seen: set[str] = set()
@@ -78,16 +70,53 @@ def _session_scope(session: Session | None):
             yield s
 
 
+def _memory_item(row: QuickNoteRow, *, score: float | None = None) -> MemoryItem:
+    meta = dict(row.meta or {})
+    if score is not None:
+        meta.setdefault("score", round(float(score), 4))
+    return MemoryItem(
+        id=str(row.id),
+        text=row.text,
+        source_url=row.source_url,
+        metadata=meta,
+        created_at=row.created_at,
+    )
+
+
 @dataclass(slots=True)
 class MemoryService:
-    """Context-aware personal memory stored as notes with structured metadata."""
+    """Context-aware personal memory stored as notes with structured metadata.
+
+    Memories are embedded once when written; context recall ranks a user's
+    memories by cosine similarity weighted by recency. Memories without an
+    embedding (older rows, or the embedding model was unreachable) are still
+    found by lexical overlap.
+    """
 
     doc_storage: DocStorageService
     llm_service: LLMService | None = None
+    embedding_model: Embeddings | None = None
 
     def _llm(self) -> LLMService:
         return self.llm_service or LLMService()
 
+    def _embedder(self) -> Embeddings:
+        if self.embedding_model is not None:
+            return self.embedding_model
+        from alfred.core.llm_factory import get_embedding_model
+
+        return get_embedding_model()
+
+    def _embed(self, text: str, *, query: bool) -> list[float] | None:
+        """Best-effort embedding; memory writes and recall never fail on it."""
+        try:
+            model = self._embedder()
+            vector = model.embed_query(text) if query else model.embed_documents([text])[0]
+        except Exception as exc:
+            logger.warning("Memory embedding failed; using lexical recall: %s", exc)
+            return None
+        return [float(v) for v in vector] or None
+
     def create_memory(self, payload: MemoryCreateRequest) -> MemoryItem:
         meta: dict[str, Any] = dict(payload.metadata or {})
         meta.setdefault("kind", MEMORY_NOTE_KIND)
@@ -104,7 +133,8 @@ class MemoryService:
             meta["links"] = list(payload.links)
 
         note_id = self.doc_storage.create_note(
-            NoteCreate(text=payload.text, source_url=None, metadata=meta)
+            NoteCreate(text=payload.text, source_url=None, metadata=meta),
+            embedding=self._embed(payload.text, query=False),
         )
         note = self.doc_storage.get_note(note_id)
         if not note:
@@ -134,39 +164,29 @@ class MemoryService:
         source_norm = (source or "").strip() or None
         task_norm = (task_id or "").strip() or None
 
-        stmt = select(QuickNoteRow).order_by(QuickNoteRow.created_at.desc())
+        filters = [QuickNoteRow.kind == MEMORY_NOTE_KIND]
+        if user_id is not None:
+            filters.append(QuickNoteRow.user_id == int(user_id))
         if q_norm:
-            stmt = stmt.where(QuickNoteRow.text.ilike(f"%{q_norm}%"))
-
+            filters.append(QuickNoteRow.text.ilike(f"%{q_norm}%"))
+        if source_norm:
+            filters.append(QuickNoteRow.meta["source"].as_string() == source_norm)
+        if task_norm:
+            filters.append(QuickNoteRow.meta["task_id"].as_string() == task_norm)
+
+        stmt = (
+            select(QuickNoteRow)
+            .where(*filters)
+            .order_by(QuickNoteRow.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        count_stmt = select(func.count()).select_from(QuickNoteRow).where(*filters)
         with _session_scope(self.doc_storage.session) as s:
             rows = list(s.exec(stmt).all())
+            total = int(s.scalar(count_stmt) or 0)
 
-        filtered: list[QuickNoteRow] = []
-        for row in rows:
-            meta = row.meta or {}
-            if meta.get("kind") != MEMORY_NOTE_KIND:
-                continue
-            if user_id is not None and _first_int(meta.get("user_id")) != int(user_id):
-                continue
-            if source_norm and (meta.get("source") != source_norm):
-                continue
-            if task_norm and (str(meta.get("task_id") or "") != task_norm):
-                continue
-            filtered.append(row)
-
-        total = len(filtered)
-        page = filtered[skip : skip + limit]
-
-        items = [
-            MemoryItem(
-                id=str(row.id),
-                text=row.text,
-                source_url=row.source_url,
-                metadata=row.meta or {},
-                created_at=row.created_at,
-            )
-            for row in page
-        ]
+        items = [_memory_item(row) for row in rows]
         return MemoryListResponse(items=items, total=total, skip=skip, limit=limit)
 
     def get_context_memories(
@@ -177,7 +197,11 @@ class MemoryService:
         limit: int = 6,
         max_scan: int = 500,
     ) -> list[MemoryItem]:
-        """Return the most relevant memories for a query (simple lexical scoring)."""
+        """Return the most relevant memories for a query.
+
+        Embedded memories are ranked by vector similarity with a recency prior;
+        ``max_scan`` bounds the lexical pass over memories without an embedding.
+        """
 
         q = (query or "").strip()
         if not q:
@@ -190,22 +214,63 @@ class MemoryService:
         if not q_tokens:
             return []
 
-        stmt = select(QuickNoteRow).order_by(QuickNoteRow.created_at.desc()).limit(max_scan)
         with _session_scope(self.doc_storage.session) as s:
-            rows = list(s.exec(stmt).all())
+            index = get_memory_vector_index(s, kind=MEMORY_NOTE_KIND)
+            vector = self._embed(q, query=True) if index.sync(s, user_id=user_id) else None
+            hits = (
+                index.search(
+                    vector,
+                    user_id=user_id,
+                    limit=limit,
+                    min_similarity=settings.memory_recall_min_similarity,
+                    half_life_days=settings.memory_recall_half_life_days,
+                    recency_weight=settings.memory_recall_recency_weight,
+                )
+                if vector is not None
+                else []
+            )
+            scored: list[tuple[float, QuickNoteRow]] = []
+            if hits:
+                hit_ids = [note_id for note_id, _ in hits]
+                rows = s.exec(select(QuickNoteRow).where(QuickNoteRow.id.in_(hit_ids))).all()
+                by_id = {row.id: row for row in rows}
+                scored = [(score, by_id[note_id]) for note_id, score in hits if note_id in by_id]
+            if len(scored) < limit:
+                # Embedded memories were already ranked above; the lexical pass
+                # only covers the rest unless the query itself could not be embedded.
+                lexical = self._lexical_matches(
+                    s,
+                    q_tokens,
+                    user_id=user_id,
+                    max_scan=max_scan,
+                    unembedded_only=vector is not None,
+                )
+                scored.extend(lexical[: limit - len(scored)])
+
+        return [_memory_item(row, score=score) for score, row in scored]
+
+    def _lexical_matches(
+        self,
+        s: Session,
+        q_tokens: set[str],
+        *,
+        user_id: int | None,
+        max_scan: int,
+        unembedded_only: bool,
+    ) -> list[tuple[float, QuickNoteRow]]:
+        stmt = select(QuickNoteRow).where(QuickNoteRow.kind == MEMORY_NOTE_KIND)
+        if user_id is not None:
+            stmt = stmt.where(QuickNoteRow.user_id == int(user_id))
+        if unembedded_only:
+            stmt = stmt.where(QuickNoteRow.embedding.is_(None))
+        rows = s.exec(stmt.order_by(QuickNoteRow.created_at.desc()).limit(max_scan)).all()
 
         scored: list[tuple[float, QuickNoteRow]] = []
         for row in rows:
-            meta = row.meta or {}
-            if meta.get("kind") != MEMORY_NOTE_KIND:
-                continue
-            if user_id is not None and _first_int(meta.get("user_id")) != int(user_id):
-                continue
             overlap = len(q_tokens.intersection(_tokenize(row.text)))
             if overlap <= 0:
                 continue
-            score = overlap / max(1, len(q_tokens))
-            scored.append((score, row))
+            scored.append((overlap / max(1, len(q_tokens)), row))
 
         scored.sort(
             key=lambda pair: (
@@ -214,21 +279,7 @@ class MemoryService:
             ),
             reverse=True,
         )
-
-        out: list[MemoryItem] = []
-        for score, row in scored[:limit]:
-            meta = dict(row.meta or {})
-            meta.setdefault("score", round(float(score), 4))
-            out.append(
-                MemoryItem(
-                    id=str(row.id),
-                    text=row.text,
-                    source_url=row.source_url,
-                    metadata=meta,
-                    created_at=row.created_at,
-                )
-            )
-        return out
+        return scored
 
     def _try_llm_extract(self, *, transcript: str, max_memories: int) -> list[_MemoryDraft] | None:
         if settings.llm_provider != LLMProvider.openai:
@@ -0,0 +1,234 @@
+"""In-process similarity index over memory embeddings, one slice per user.
+
+Memories are embedded once when they are written (``MemoryService``) and
+stored on ``quick_notes.embedding``. Context recall then needs the top-k
+memories of a single user, so each user's vectors are held as a float32
+matrix of unit-normalized rows and scored with one matrix-vector product.
+
+Each slice is kept fresh with a ``count``/``max(created_at)`` fingerprint over
+that user's embedded memories. Memories are append-only, so a grown count is
+served by loading the rows newer than the slice's watermark. Any other change
+(deletes, backfilled embeddings) reloads the slice.
+
+Scores combine cosine similarity with a recency prior:
+
+    score = cosine * ((1 - w) + w * 0.5 ** (age_days / half_life_days))
+
+so an old but closely matching memory still beats a fresh, loosely related one.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+import numpy as np
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from alfred.models.doc_storage import QuickNoteRow
+from alfred.services.zettel_vector_index import _unit_vector
+
+logger = logging.getLogger(__name__)
+
+_LOAD_BATCH_SIZE = 2000
+_SECONDS_PER_DAY = 86_400.0
+
+Fingerprint = tuple[int, datetime | None]
+
+
+def _epoch(value: datetime | None) -> float:
+    if value is None:
+        return 0.0
+    if value.tzinfo is None:
+        # SQLite hands timestamps back naive; they were written as UTC.
+        value = value.replace(tzinfo=UTC)
+    return value.timestamp()
+
+
+@dataclass
+class _UserSlice:
+    ids: list[uuid.UUID] = field(default_factory=list)
+    matrix: np.ndarray = field(default_factory=lambda: np.empty((0, 0), dtype=np.float32))
+    created: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    fingerprint: Fingerprint | None = None
+    # Rows read from the database, including ones whose vector was unusable.
+    rows: int = 0
+
+    def extend(self, rows: Sequence[tuple[Any, Any, datetime | None]]) -> None:
+        dim = self.matrix.shape[1] if self.matrix.size else None
+        ids: list[uuid.UUID] = []
+        vectors: list[np.ndarray] = []
+        created: list[float] = []
+        self.rows += len(rows)
+        for note_id, embedding, created_at in rows:
+            vec = _unit_vector(embedding, dim)
+            if vec is None:
+                continue
+            dim = vec.shape[0]
+            ids.append(note_id)
+            vectors.append(vec)
+            created.append(_epoch(created_at))
+        if not vectors:
+            return
+        block = np.stack(vectors)
+        self.matrix = np.vstack([self.matrix, block]) if self.matrix.size else block
+        self.created = np.concatenate([self.created, np.asarray(created, dtype=np.float64)])
+        self.ids.extend(ids)
+
+
+class MemoryVectorIndex:
+    """Per-user cosine index over memory embeddings, LRU-bounded by user.
+
+    ``user_id=None`` addresses every memory regardless of owner, matching the
+    unscoped ``/memory/context`` lookup. All public methods are thread-safe.
+    """
+
+    def __init__(self, *, kind: str, max_users: int = 16) -> None:
+        self._kind = kind
+        self._max_users = max(1, max_users)
+        self._slices: OrderedDict[int | None, _UserSlice] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(s.ids) for s in self._slices.values())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._slices.clear()
+
+    def sync(self, session: Session, *, user_id: int | None) -> int:
+        """Bring ``user_id``'s slice up to date; returns its vector count."""
+        with self._lock:
+            return len(self._sync_locked(session, user_id).ids)
+
+    def search(
+        self,
+        query: Sequence[float],
+        *,
+        user_id: int | None,
+        limit: int,
+        min_similarity: float = 0.0,
+        half_life_days: float = 0.0,
+        recency_weight: float = 0.0,
+        now: float | None = None,
+    ) -> list[tuple[uuid.UUID, float]]:
+        """Return up to ``limit`` ``(note_id, score)`` pairs, best first.
+
+        Scores the slice as of the last ``sync`` for ``user_id``.
+        """
+        with self._lock:
+            user_slice = self._slices.get(user_id)
+            if user_slice is None or not user_slice.ids or limit <= 0:
+                return []
+            vec = _unit_vector(query, user_slice.matrix.shape[1])
+            if vec is None:
+                return []
+            similarity = user_slice.matrix @ vec
+            created = user_slice.created
+            ids = list(user_slice.ids)
+
+        keep = np.flatnonzero(similarity >= min_similarity)
+        if keep.size == 0:
+            return []
+        scores = similarity[keep].astype(np.float64)
+        if half_life_days > 0 and recency_weight > 0:
+            age_days = np.maximum(0.0, ((now or time.time()) - created[keep]) / _SECONDS_PER_DAY)
+            prior = (1.0 - recency_weight) + recency_weight * np.power(
+                0.5, age_days / half_life_days
+            )
+            scores = scores * prior
+
+        k = min(limit, scores.size)
+        top = np.argpartition(-scores, k - 1)[:k] if k < scores.size else np.arange(scores.size)
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(ids[int(keep[i])], float(scores[i])) for i in top]
+
+    # ---------------
+    # Sync
+    # ---------------
+    def _sync_locked(self, session: Session, user_id: int | None) -> _UserSlice:
+        fingerprint = self._db_fingerprint(session, user_id)
+        user_slice = self._slices.get(user_id)
+        if user_slice is None:
+            user_slice = _UserSlice()
+            self._slices[user_id] = user_slice
+            while len(self._slices) > self._max_users:
+                self._slices.popitem(last=False)
+        self._slices.move_to_end(user_id)
+
+        cached = user_slice.fingerprint
+        if cached == fingerprint:
+            return user_slice
+        if (
+            cached is not None
+            and fingerprint is not None
+            and cached[1] is not None
+            and fingerprint[0] > cached[0]
+        ):
+            user_slice.extend(self._load(session, user_id, after=cached[1]))
+            if user_slice.rows == fingerprint[0]:
+                user_slice.fingerprint = fingerprint
+                return user_slice
+
+        fresh = _UserSlice(fingerprint=fingerprint)
+        fresh.extend(self._load(session, user_id))
+        self._slices[user_id] = fresh
+        logger.debug("Loaded %d memory embeddings for user %s", len(fresh.ids), user_id)
+        return fresh
+
+    def _scope(self, stmt: Any, user_id: int | None) -> Any:
+        stmt = stmt.where(QuickNoteRow.kind == self._kind, QuickNoteRow.embedding.is_not(None))
+        if user_id is not None:
+            stmt = stmt.where(QuickNoteRow.user_id == int(user_id))
+        return stmt
+
+    def _db_fingerprint(self, session: Session, user_id: int | None) -> Fingerprint | None:
+        stmt = self._scope(select(func.count(), func.max(QuickNoteRow.created_at)), user_id)
+        row = session.execute(stmt).first()
+        if row is None or not isinstance(row[0], int):
+            return None
+        return row[0], row[1]
+
+    def _load(
+        self, session: Session, user_id: int | None, *, after: datetime | None = None
+    ) -> list[tuple[Any, Any, datetime | None]]:
+        stmt = self._scope(
+            select(QuickNoteRow.id, QuickNoteRow.embedding, QuickNoteRow.created_at), user_id
+        )
+        if after is not None:
+            stmt = stmt.where(QuickNoteRow.created_at > after)
+        stmt = stmt.order_by(QuickNoteRow.created_at).execution_options(
+            yield_per=_LOAD_BATCH_SIZE
+        )
+        return [tuple(row) for row in session.execute(stmt)]
+
+
+_indexes: weakref.WeakKeyDictionary[Any, dict[str, MemoryVectorIndex]] = (
+    weakref.WeakKeyDictionary()
+)
+_indexes_lock = threading.Lock()
+
+
+def get_memory_vector_index(session: Session, *, kind: str) -> MemoryVectorIndex:
+    """Return the process-wide ``kind`` index for the engine behind ``session``."""
+    bind = session.get_bind()
+    with _indexes_lock:
+        by_kind = _indexes.setdefault(bind, {})
+        index = by_kind.get(kind)
+        if index is None:
+            index = MemoryVectorIndex(kind=kind)
+            by_kind[kind] = index
+        return index
+
+
+__all__ = ["MemoryVectorIndex", "get_memory_vector_index"]
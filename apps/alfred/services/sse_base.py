@@ -8,24 +8,30 @@ orchestrators can focus on their domain logic:
 - Stale-request idempotency check (D5) — subclasses supply the key
 - OpenAI streaming with reasoning-token pass-through
 - Structured JSON response parser with markdown-fence stripping
+- Async DB reads on the event loop, with a worker-thread fallback
 
 Subclasses implement ``async def run()`` returning an ``AsyncGenerator[str, None]``.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-from collections.abc import AsyncGenerator, Callable
-from typing import Any
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import Any, TypeVar
 
 from fastapi import Request
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from alfred.api.dependencies import get_db_session
+from alfred.core.database import get_async_sessionmaker
 
 log = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class SSEStreamOrchestrator:
     """Base class for Server-Sent Events orchestrators with shared plumbing.
@@ -48,12 +54,16 @@ class SSEStreamOrchestrator:
     The base class's __init__ captures:
         request: fastapi.Request (for disconnect detection)
         db_session_factory: optional factory; defaults to alfred's get_db_session
+        async_db_session_factory: optional AsyncSession factory for reads on
+            the event loop; defaults to alfred's async engine, but only when
+            db_session_factory is also defaulted
     """
 
     def __init__(
         self,
         request: Request | None = None,
         db_session_factory: Callable[[], Session] | None = None,
+        async_db_session_factory: Callable[[], AsyncSession] | None = None,
     ) -> None:
         self._request = request
         self._uses_default_factory = db_session_factory is None
@@ -61,12 +71,37 @@ class SSEStreamOrchestrator:
             self._db_factory: Callable[[], Session] = self._default_session_factory
         else:
             self._db_factory = db_session_factory
+        # An injected sync factory without an async one (tests, scripts) keeps
+        # every read on that factory so both sides see the same database.
+        self._async_db_factory: Callable[[], AsyncSession] | None = async_db_session_factory
+        if self._async_db_factory is None and self._uses_default_factory:
+            self._async_db_factory = self._default_async_session_factory
 
     @staticmethod
     def _default_session_factory() -> Session:
         """Create and return a fresh DB session. Caller closes it."""
         return next(get_db_session())
 
+    @staticmethod
+    def _default_async_session_factory() -> AsyncSession:
+        """Create and return a fresh AsyncSession. Caller closes it."""
+        return get_async_sessionmaker()()
+
+    async def _read_db(
+        self,
+        async_read: Callable[[AsyncSession], Awaitable[T]],
+        sync_read: Callable[[], T],
+    ) -> T:
+        """Run a read-only query without blocking the event loop.
+
+        Uses ``async_read`` on a fresh AsyncSession when an async factory is
+        available, otherwise ``sync_read`` in a worker thread.
+        """
+        if self._async_db_factory is None:
+            return await asyncio.to_thread(sync_read)
+        async with self._async_db_factory() as session:
+            return await async_read(session)
+
     @staticmethod
     def _sse(event: str, data: dict[str, Any]) -> str:
         """Format a single SSE event."""
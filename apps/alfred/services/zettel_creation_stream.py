@@ -17,6 +17,7 @@ from typing import Any
 
 from fastapi import Request
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from alfred.schemas.zettel import ZettelCardCreate
 from alfred.services.sse_base import SSEStreamOrchestrator
@@ -45,8 +46,13 @@ class ZettelCreationStream(SSEStreamOrchestrator):
         payload: ZettelCardCreate,
         request: Request | None = None,
         db_session_factory: Callable[[], Session] | None = None,
+        async_db_session_factory: Callable[[], AsyncSession] | None = None,
     ) -> None:
-        super().__init__(request=request, db_session_factory=db_session_factory)
+        super().__init__(
+            request=request,
+            db_session_factory=db_session_factory,
+            async_db_session_factory=async_db_session_factory,
+        )
         self.payload = payload
         self.card_id: int | None = None
         self._card_title: str = ""
@@ -239,10 +245,10 @@ class ZettelCreationStream(SSEStreamOrchestrator):
 
         try:
             # Fetch lightweight KB context (prefer Redis cache)
-            context = await asyncio.to_thread(self._fetch_kb_context)
+            context = await self._load_kb_context()
 
             # Fetch sibling card titles if this card belongs to a session
-            sibling_titles = await asyncio.to_thread(self._fetch_session_sibling_titles)
+            sibling_titles = await self._load_session_sibling_titles()
 
             # Build prompt (with session context if sibling_titles is non-empty)
             messages = self._build_analysis_prompt(context, sibling_titles)
@@ -381,38 +387,47 @@ class ZettelCreationStream(SSEStreamOrchestrator):
             if self._uses_default_factory:
                 session.close()
 
+    def _sibling_titles_stmt(self) -> Any:
+        from alfred.models.zettel import ZettelCard
+
+        return (
+            select(ZettelCard.title)
+            .where(ZettelCard.session_id == self.payload.session_id)
+            .where(ZettelCard.id != (self.card_id or -1))
+            .where(ZettelCard.status != "archived")
+            .limit(20)
+        )
+
+    @staticmethod
+    def _titles_from_rows(rows: list[Any]) -> list[str]:
+        # sqlmodel's .exec on a single-column select may yield plain
+        # strings OR 1-tuples depending on the engine/driver. Normalise.
+        return [row[0] if isinstance(row, tuple) else row for row in rows]
+
     def _fetch_session_sibling_titles(self) -> list[str]:
         """Return titles of other cards in the same session (excludes this card's row)."""
         if self.payload.session_id is None:
             return []
         session = self._db_factory()
         try:
-            from alfred.models.zettel import ZettelCard
-
-            stmt = (
-                select(ZettelCard.title)
-                .where(ZettelCard.session_id == self.payload.session_id)
-                .where(ZettelCard.id != (self.card_id or -1))
-                .where(ZettelCard.status != "archived")
-                .limit(20)
-            )
-            rows = session.exec(stmt).all()
-            # sqlmodel's .exec on a single-column select may yield plain
-            # strings OR 1-tuples depending on the engine/driver. Normalise.
-            titles: list[str] = []
-            for row in rows:
-                if isinstance(row, tuple):
-                    titles.append(row[0])
-                else:
-                    titles.append(row)
-            return titles
+            return self._titles_from_rows(session.exec(self._sibling_titles_stmt()).all())
         finally:
             if self._uses_default_factory:
                 session.close()
 
-    def _fetch_kb_context(self) -> dict[str, Any]:
-        """Fetch lightweight KB context for the AI prompt. Prefers Redis cache."""
-        # Try Redis cache first
+    async def _load_session_sibling_titles(self) -> list[str]:
+        """Async variant of ``_fetch_session_sibling_titles`` for the event loop."""
+        if self.payload.session_id is None:
+            return []
+        stmt = self._sibling_titles_stmt()
+
+        async def _read(session: AsyncSession) -> list[str]:
+            return self._titles_from_rows((await session.exec(stmt)).all())
+
+        return await self._read_db(_read, self._fetch_session_sibling_titles)
+
+    @staticmethod
+    def _cached_kb_context() -> dict[str, Any] | None:
         try:
             from alfred.core.redis_client import get_redis_client
 
@@ -423,36 +438,67 @@ class ZettelCreationStream(SSEStreamOrchestrator):
                     return json.loads(cached_topics)
         except Exception:
             pass
+        return None
 
-        # Fall back to DB
-        session = self._db_factory()
-        try:
-            from sqlalchemy import func as sa_func
+    @staticmethod
+    def _kb_context_stmts() -> tuple[Any, Any]:
+        from sqlalchemy import func as sa_func
 
-            from alfred.models.zettel import ZettelCard
+        from alfred.models.zettel import ZettelCard
 
-            total = session.exec(
-                select(sa_func.count())
-                .select_from(ZettelCard)
-                .where(ZettelCard.status != "archived")
-            ).one()
+        total_stmt = (
+            select(sa_func.count())
+            .select_from(ZettelCard)
+            .where(ZettelCard.status != "archived")
+        )
+        topics_stmt = (
+            select(ZettelCard.topic, sa_func.count())
+            .where(ZettelCard.topic.isnot(None), ZettelCard.status != "archived")
+            .group_by(ZettelCard.topic)
+            .order_by(sa_func.count().desc())
+            .limit(30)
+        )
+        return total_stmt, topics_stmt
 
-            topics_rows = session.exec(
-                select(ZettelCard.topic, sa_func.count())
-                .where(ZettelCard.topic.isnot(None), ZettelCard.status != "archived")
-                .group_by(ZettelCard.topic)
-                .order_by(sa_func.count().desc())
-                .limit(30)
-            ).all()
+    @staticmethod
+    def _kb_context(total: int, topics_rows: list[Any]) -> dict[str, Any]:
+        return {
+            "total_cards": total,
+            "topics": [{"topic": t, "count": c} for t, c in topics_rows],
+        }
 
-            return {
-                "total_cards": total,
-                "topics": [{"topic": t, "count": c} for t, c in topics_rows],
-            }
+    def _fetch_kb_context(self) -> dict[str, Any]:
+        """Fetch lightweight KB context for the AI prompt. Prefers Redis cache."""
+        cached = self._cached_kb_context()
+        if cached is not None:
+            return cached
+        return self._fetch_kb_context_from_db()
+
+    def _fetch_kb_context_from_db(self) -> dict[str, Any]:
+        total_stmt, topics_stmt = self._kb_context_stmts()
+        session = self._db_factory()
+        try:
+            return self._kb_context(
+                session.exec(total_stmt).one(), session.exec(topics_stmt).all()
+            )
         finally:
             if self._uses_default_factory:
                 session.close()
 
+    async def _load_kb_context(self) -> dict[str, Any]:
+        """Async variant of ``_fetch_kb_context``: Redis in a thread, DB on the loop."""
+        cached = await asyncio.to_thread(self._cached_kb_context)
+        if cached is not None:
+            return cached
+        total_stmt, topics_stmt = self._kb_context_stmts()
+
+        async def _read(session: AsyncSession) -> dict[str, Any]:
+            total = (await session.exec(total_stmt)).one()
+            topics_rows = (await session.exec(topics_stmt)).all()
+            return self._kb_context(total, topics_rows)
+
+        return await self._read_db(_read, self._fetch_kb_context_from_db)
+
     def _build_analysis_prompt(
         self,
         context: dict[str, Any],
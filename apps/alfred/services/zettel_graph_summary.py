@@ -1,15 +1,53 @@
-"""Graph summaries for zettel cards and links."""
+"""Graph summaries for zettel cards and links.
+
+Queries are column-projected: node payloads never load card ``content``,
+``summary``, ``bloom_history`` or ``embedding``, and degree is computed in
+SQL. Embeddings are read only when clusters are requested, straight into a
+float32 matrix.
+
+Every payload carries a ``version`` token derived from row counts and the
+latest ``updated_at``. Passing it back as ``since`` to ``graph_summary``
+returns a delta: the nodes and edges touched since that token, plus the full
+id lists and degrees so clients can drop deleted rows and refresh counts.
+"""
 
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
+from datetime import UTC, datetime
 from typing import Any
 
+import numpy as np
+import sqlalchemy as sa
+from sqlalchemy import func
 from sqlmodel import Session, select
 
 from alfred.models.zettel import ZettelCard, ZettelLink, ZettelReview
 from alfred.services.clustering_service import ClusteringService
 
+logger = logging.getLogger(__name__)
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    if value is None:
+        return None
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+
+def _encode_version(watermark: datetime | None, *counts: int) -> str:
+    micros = int(_as_utc(watermark).timestamp() * 1_000_000) if watermark else 0
+    return "-".join(str(part) for part in (micros, *counts))
+
+
+def _decode_watermark(version: str) -> datetime | None:
+    """Return the watermark encoded in ``version``, or None if it is malformed."""
+    try:
+        micros = int(version.split("-", 1)[0])
+    except (ValueError, AttributeError):
+        return None
+    return datetime.fromtimestamp(micros / 1_000_000, tz=UTC)
+
 
 @dataclass
 class ZettelGraphSummaryService:
@@ -17,34 +55,69 @@ class ZettelGraphSummaryService:
 
     session: Session
 
-    def graph_summary(self) -> dict[str, list[dict[str, Any]]]:
-        cards: list[ZettelCard] = list(self.session.exec(select(ZettelCard)))
-        links: list[ZettelLink] = list(self.session.exec(select(ZettelLink)))
-        degree = self._degree_by_card(links)
+    def graph_summary(self, since: str | None = None) -> dict[str, Any]:
+        version = self.version()
+        if since is not None and since == version:
+            return {"version": version, "delta": True, "unchanged": True}
+
+        degree = self._degree_by_card()
+        watermark = _decode_watermark(since) if since else None
+
+        card_stmt = select(
+            ZettelCard.id,
+            ZettelCard.title,
+            ZettelCard.topic,
+            ZettelCard.tags,
+            ZettelCard.importance,
+            ZettelCard.status,
+        )
+        link_stmt = select(
+            ZettelLink.id,
+            ZettelLink.from_card_id,
+            ZettelLink.to_card_id,
+            ZettelLink.type,
+            ZettelLink.bidirectional,
+        )
+        if watermark is not None:
+            card_stmt = card_stmt.where(ZettelCard.updated_at >= watermark)
+            link_stmt = link_stmt.where(ZettelLink.updated_at >= watermark)
 
         nodes = [
             {
-                "id": card.id,
-                "title": card.title,
-                "topic": card.topic,
-                "tags": card.tags or [],
-                "importance": card.importance,
-                "status": card.status,
-                "degree": degree.get(card.id or 0, 0),
+                "id": row.id,
+                "title": row.title,
+                "topic": row.topic,
+                "tags": row.tags or [],
+                "importance": row.importance,
+                "status": row.status,
+                "degree": degree.get(row.id or 0, 0),
             }
-            for card in cards
+            for row in self.session.exec(card_stmt)
         ]
         edges = [
             {
-                "id": link.id,
-                "from": link.from_card_id,
-                "to": link.to_card_id,
-                "type": link.type,
-                "bidirectional": link.bidirectional,
+                "id": row.id,
+                "from": row.from_card_id,
+                "to": row.to_card_id,
+                "type": row.type,
+                "bidirectional": row.bidirectional,
             }
-            for link in links
+            for row in self.session.exec(link_stmt)
         ]
-        return {"nodes": nodes, "edges": edges}
+        if watermark is None:
+            return {"version": version, "nodes": nodes, "edges": edges}
+
+        node_ids = list(self.session.exec(select(ZettelCard.id).order_by(ZettelCard.id)))
+        edge_ids = list(self.session.exec(select(ZettelLink.id).order_by(ZettelLink.id)))
+        return {
+            "version": version,
+            "delta": True,
+            "nodes": nodes,
+            "edges": edges,
+            "node_ids": node_ids,
+            "degrees": [degree.get(card_id, 0) for card_id in node_ids],
+            "edge_ids": edge_ids,
+        }
 
     def extended_graph_summary(
         self,
@@ -52,22 +125,45 @@ class ZettelGraphSummaryService:
         include_gaps: bool = False,
     ) -> dict[str, Any]:
         """Extended graph summary with clusters, gaps, review due dates, and metadata."""
-        cards: list[ZettelCard] = list(self.session.exec(select(ZettelCard)))
-        links: list[ZettelLink] = list(self.session.exec(select(ZettelLink)))
-        degree = self._degree_by_card(links)
+        version = self.version(include_reviews=True)
+        cards = list(
+            self.session.exec(
+                select(
+                    ZettelCard.id,
+                    ZettelCard.title,
+                    ZettelCard.topic,
+                    ZettelCard.tags,
+                    ZettelCard.status,
+                    ZettelCard.importance,
+                    ZettelCard.created_at,
+                    ZettelCard.updated_at,
+                )
+            )
+        )
+        degree = self._degree_by_card()
         due_by_card = self._due_by_card()
+        total_cards = len(cards)
 
         cluster_id_by_card: dict[int, int] = {}
         clusters_out: list[dict[str, Any]] = []
         if include_clusters:
+            card_ids, matrix = self._embedding_matrix()
+            embedded_count = len(card_ids)
+            if embedded_count < total_cards:
+                logger.warning(
+                    "Excluded %d card(s) without embeddings from clustering",
+                    total_cards - embedded_count,
+                )
             clustering_svc = ClusteringService()
-            raw_clusters = clustering_svc.detect_clusters(cards)
+            raw_clusters = clustering_svc.cluster_matrix(card_ids, matrix)
             if raw_clusters:
                 cards_by_id = {c.id: c for c in cards if c.id is not None}
                 clusters_out = clustering_svc.name_clusters_from_cards(raw_clusters, cards_by_id)
                 for cluster in clusters_out:
                     for cid in cluster["card_ids"]:
                         cluster_id_by_card[cid] = cluster["id"]
+        else:
+            embedded_count = self._embedded_count()
 
         nodes = [
             {
@@ -86,6 +182,11 @@ class ZettelGraphSummaryService:
             for card in cards
         ]
 
+        links = list(
+            self.session.exec(
+                select(ZettelLink.from_card_id, ZettelLink.to_card_id, ZettelLink.type)
+            )
+        )
         edges = [
             {
                 "source": link.from_card_id,
@@ -99,11 +200,10 @@ class ZettelGraphSummaryService:
         if include_gaps:
             gaps_out = ClusteringService().detect_knowledge_gaps(cards, links)
 
-        embedded_count = sum(1 for card in cards if getattr(card, "embedding", None))
-        total_cards = len(cards)
         coverage_pct = round((embedded_count / total_cards * 100) if total_cards else 0.0, 1)
 
         return {
+            "version": version,
             "nodes": nodes,
             "edges": edges,
             "clusters": clusters_out,
@@ -116,21 +216,73 @@ class ZettelGraphSummaryService:
             },
         }
 
-    @staticmethod
-    def _degree_by_card(links: list[ZettelLink]) -> dict[int, int]:
-        degree: dict[int, int] = {}
-        for link in links:
-            degree[link.from_card_id] = degree.get(link.from_card_id, 0) + 1
-            degree[link.to_card_id] = degree.get(link.to_card_id, 0) + 1
-        return degree
+    def version(self, *, include_reviews: bool = False) -> str:
+        """Cheap change token: row counts plus the latest ``updated_at``."""
+        models = [ZettelCard, ZettelLink]
+        if include_reviews:
+            models.append(ZettelReview)
+        watermark: datetime | None = None
+        counts: list[int] = []
+        for model in models:
+            count, latest = self.session.exec(
+                select(func.count(model.id), func.max(model.updated_at))
+            ).one()
+            counts.append(int(count or 0))
+            latest = _as_utc(latest)
+            if latest is not None and (watermark is None or latest > watermark):
+                watermark = latest
+        return _encode_version(watermark, *counts)
+
+    def _degree_by_card(self) -> dict[int, int]:
+        endpoints = sa.union_all(
+            select(ZettelLink.from_card_id.label("card_id")),
+            select(ZettelLink.to_card_id.label("card_id")),
+        ).subquery()
+        rows = self.session.exec(
+            select(endpoints.c.card_id, func.count()).group_by(endpoints.c.card_id)
+        )
+        return {int(card_id): int(n) for card_id, n in rows}
+
+    def _embedding_matrix(self) -> tuple[list[int], np.ndarray]:
+        """Load card embeddings as an ``(n, dim)`` float32 matrix."""
+        card_ids: list[int] = []
+        vectors: list[np.ndarray] = []
+        dim: int | None = None
+        for card_id, embedding in self.session.exec(
+            select(ZettelCard.id, ZettelCard.embedding)
+        ):
+            if card_id is None or not embedding:
+                continue
+            vec = np.asarray(embedding, dtype=np.float32)
+            if vec.ndim != 1 or (dim is not None and vec.shape[0] != dim):
+                continue
+            dim = int(vec.shape[0])
+            card_ids.append(card_id)
+            vectors.append(vec)
+        if not vectors:
+            return [], np.empty((0, 0), dtype=np.float32)
+        return card_ids, np.vstack(vectors)
+
+    def _embedded_count(self) -> int:
+        # JSON None is stored as the literal 'null'; an empty list as '[]'.
+        embedding_text = sa.cast(ZettelCard.embedding, sa.Text)
+        return int(
+            self.session.exec(
+                select(func.count(ZettelCard.id)).where(
+                    embedding_text.is_not(None),
+                    embedding_text.not_in(["null", "[]"]),
+                )
+            ).one()
+        )
 
     def _due_by_card(self) -> dict[int, str]:
         open_reviews = self.session.exec(
-            select(ZettelReview).where(ZettelReview.completed_at.is_(None))  # type: ignore[union-attr]
+            select(ZettelReview.card_id, func.min(ZettelReview.due_at))
+            .where(ZettelReview.completed_at.is_(None))  # type: ignore[union-attr]
+            .group_by(ZettelReview.card_id)
         )
-        due_by_card: dict[int, str] = {}
-        for review in open_reviews:
-            iso = review.due_at.isoformat() if review.due_at else None
-            if iso and (review.card_id not in due_by_card or iso < due_by_card[review.card_id]):
-                due_by_card[review.card_id] = iso
-        return due_by_card
+        return {
+            card_id: due_at.isoformat()
+            for card_id, due_at in open_reviews
+            if due_at is not None
+        }
@@ -3,18 +3,29 @@
 Postgres is the source of truth. Neo4j holds a redundant copy used only for
 multi-hop graph queries (paths, bridges, community traversal). Drift is
 acceptable as long as writes are eventually propagated.
+
+Bulk projection goes through ``UNWIND`` batches. ``full_rebuild`` upserts
+every active card and link tagged with a fresh sync id, then prunes whatever
+was not tagged, so reads never see an empty graph. ``sync_incremental``
+projects only rows whose ``updated_at`` is at or past the watermark stored
+in Neo4j by the previous sync, less ``_COMMIT_LAG`` so rows stamped before
+the watermark but committed after it are still picked up. Both modes and the
+per-row hooks project ``active`` cards only.
 """
 
 from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Any
+from uuid import uuid4
 
 from sqlmodel import Session, select
 
 from alfred.models.zettel import ZettelCard, ZettelLink
 from alfred.services.graph_service import GraphService
+from alfred.services.zettel_vector_index import _COMMIT_LAG
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +36,7 @@ class ZettelGraphSync:
     graph: GraphService
 
     def _project_card(self, card: ZettelCard) -> None:
-        """Project one active card to Neo4j. Caller must filter archived/None-id cards."""
+        """Project one active card to Neo4j. Caller must filter non-active/None-id cards."""
         self.graph.upsert_zettel(
             card_id=card.id,  # caller guarantees not None
             title=card.title,
@@ -36,9 +47,9 @@ class ZettelGraphSync:
         )
 
     def upsert_card(self, card_id: int) -> None:
-        """Project a single card. Archived or missing cards get deleted from Neo4j."""
+        """Project a single card. Missing or non-active cards get deleted from Neo4j."""
         card = self.session.get(ZettelCard, card_id)
-        if card is None or card.status == "archived":
+        if card is None or card.status != "active":
             self.graph.delete_zettel(card_id=card_id)
             return
         if card.id is None:
@@ -64,40 +75,157 @@ class ZettelGraphSync:
         self.graph.delete_zettel_link(from_id=from_id, to_id=to_id, type_=type_)
 
     def full_rebuild(self) -> dict[str, Any]:
-        """Wipe and repopulate the Zettel subgraph.
-
-        Not transactional: there is a brief window between the wipe and the
-        first card upsert where reads return an empty graph. Callers should
-        schedule this as a background task and treat reads as eventually
-        consistent. A future upgrade may switch to upsert-then-prune to close
-        this window.
-        """
-        self.graph.wipe_zettel_subgraph()
+        """Upsert every active card and link, then prune stale projections."""
+        sync_id = uuid4().hex
+        watermark: datetime | None = None
+
+        card_rows: list[dict[str, Any]] = []
+        for row in self.session.exec(
+            select(
+                ZettelCard.id,
+                ZettelCard.title,
+                ZettelCard.topic,
+                ZettelCard.tags,
+                ZettelCard.bloom_level,
+                ZettelCard.updated_at,
+            ).where(ZettelCard.status == "active")
+        ):
+            card_id, title, topic, tags, bloom_level, updated_at = row
+            if card_id is None:
+                logger.warning("Skipping rebuild for card with no id (title=%r)", title)
+                continue
+            card_rows.append(_card_row(card_id, title, topic, tags, bloom_level))
+            watermark = _later(watermark, updated_at)
+        projected_ids = {row["card_id"] for row in card_rows}
+
+        link_rows: list[dict[str, Any]] = []
+        for row in self.session.exec(_link_columns()):
+            from_id, to_id, type_, bidirectional, updated_at = row
+            watermark = _later(watermark, updated_at)
+            if from_id in projected_ids and to_id in projected_ids:
+                link_rows.append(_link_row(from_id, to_id, type_, bidirectional))
+
+        self.graph.upsert_zettels(card_rows, sync_id=sync_id)
+        self.graph.link_zettels_bulk(link_rows, sync_id=sync_id)
+        pruned = self.graph.prune_zettel_subgraph(sync_id=sync_id)
+        if watermark is not None:
+            self.graph.set_zettel_watermark(watermark.isoformat())
 
-        cards = list(
-            self.session.exec(select(ZettelCard).where(ZettelCard.status == "active"))
+        logger.info(
+            "Zettel graph rebuild: %d nodes, %d edges (pruned %d nodes, %d edges)",
+            len(card_rows),
+            len(link_rows),
+            pruned["nodes"],
+            pruned["edges"],
         )
-        projected_ids: set[int] = set()
-        for card in cards:
-            if card.id is None:
-                logger.warning("Skipping rebuild for card with no id (title=%r)", card.title)
+        return {
+            "nodes_synced": len(card_rows),
+            "edges_synced": len(link_rows),
+            "nodes_deleted": pruned["nodes"],
+            "mode": "full",
+        }
+
+    def sync_incremental(self) -> dict[str, Any]:
+        """Project cards and links touched since the stored watermark.
+
+        Falls back to ``full_rebuild`` when no watermark exists yet. Hard
+        deletes are invisible to the delta query; they are handled by the
+        per-row hooks and the prune step of the next full rebuild.
+        """
+        stored = self.graph.get_zettel_watermark()
+        if not stored:
+            return self.full_rebuild()
+        watermark: datetime | None = datetime.fromisoformat(stored)
+        since = watermark - _COMMIT_LAG
+
+        card_rows: list[dict[str, Any]] = []
+        removed: list[int] = []
+        for row in self.session.exec(
+            select(
+                ZettelCard.id,
+                ZettelCard.title,
+                ZettelCard.topic,
+                ZettelCard.tags,
+                ZettelCard.bloom_level,
+                ZettelCard.status,
+                ZettelCard.updated_at,
+            ).where(ZettelCard.updated_at >= since)
+        ):
+            card_id, title, topic, tags, bloom_level, status, updated_at = row
+            watermark = _later(watermark, updated_at)
+            if card_id is None:
                 continue
-            self._project_card(card)
-            projected_ids.add(card.id)
-
-        links = list(self.session.exec(select(ZettelLink)))
-        edge_count = 0
-        for link in links:
-            if link.from_card_id in projected_ids and link.to_card_id in projected_ids:
-                self.graph.link_zettels(
-                    from_id=link.from_card_id,
-                    to_id=link.to_card_id,
-                    type_=link.type,
-                    bidirectional=bool(link.bidirectional),
-                )
-                edge_count += 1
+            if status == "active":
+                card_rows.append(_card_row(card_id, title, topic, tags, bloom_level))
+            else:
+                removed.append(card_id)
+
+        link_rows: list[dict[str, Any]] = []
+        for row in self.session.exec(_link_columns().where(ZettelLink.updated_at >= since)):
+            from_id, to_id, type_, bidirectional, updated_at = row
+            watermark = _later(watermark, updated_at)
+            link_rows.append(_link_row(from_id, to_id, type_, bidirectional))
+
+        # Cards first so the link MATCHes find both endpoints.
+        self.graph.delete_zettels(removed)
+        self.graph.upsert_zettels(card_rows)
+        self.graph.link_zettels_bulk(link_rows)
+        if watermark is not None:
+            self.graph.set_zettel_watermark(watermark.isoformat())
 
         logger.info(
-            "Zettel graph rebuild: %d nodes, %d edges", len(projected_ids), edge_count
+            "Zettel graph incremental sync since %s: %d nodes, %d edges, %d deleted",
+            stored,
+            len(card_rows),
+            len(link_rows),
+            len(removed),
         )
-        return {"nodes_synced": len(projected_ids), "edges_synced": edge_count}
+        return {
+            "nodes_synced": len(card_rows),
+            "edges_synced": len(link_rows),
+            "nodes_deleted": len(removed),
+            "mode": "incremental",
+        }
+
+
+def _link_columns():
+    return select(
+        ZettelLink.from_card_id,
+        ZettelLink.to_card_id,
+        ZettelLink.type,
+        ZettelLink.bidirectional,
+        ZettelLink.updated_at,
+    )
+
+
+def _card_row(
+    card_id: int, title: str, topic: str | None, tags: list[str] | None, bloom_level: int,
+) -> dict[str, Any]:
+    return {
+        "card_id": int(card_id),
+        "title": title,
+        "topic": topic,
+        "tags": list(tags or []),
+        "bloom_level": int(bloom_level),
+        "cluster_id": None,
+    }
+
+
+def _link_row(from_id: int, to_id: int, type_: str, bidirectional: bool | None) -> dict[str, Any]:
+    return {
+        "from_id": int(from_id),
+        "to_id": int(to_id),
+        "type_": type_,
+        "bidirectional": bool(bidirectional),
+    }
+
+
+def _later(current: datetime | None, candidate: datetime | None) -> datetime | None:
+    if candidate is None:
+        return current
+    if current is None:
+        return candidate
+    try:
+        return candidate if candidate > current else current
+    except TypeError:  # naive vs aware (SQLite drops tzinfo)
+        return candidate if candidate.replace(tzinfo=None) > current.replace(tzinfo=None) else current
@@ -0,0 +1,460 @@
+"""Ranked, explainable search over zettel cards.
+
+Two candidate backends feed the same Python re-ranker:
+
+* Postgres: the generated, weighted ``search_vector`` column (title > tags/
+  topic > summary > content) matched with ``@@`` and ordered by ``ts_rank``,
+  plus a trigram match on ``lower(title)``. Both are index-backed, and only
+  the top page is re-ranked in Python.
+* Anything else (SQLite in tests, or Postgres before the migration has run):
+  an OR of substring ``LIKE`` filters over a bounded, recency-ordered window.
+
+The re-ranker keeps the ``reasons`` output (``title:...``, ``tag:...``) that
+agent tools surface to explain why a card matched.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import weakref
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import String, cast, func, inspect, literal_column, or_
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlmodel import Session, select
+
+from alfred.core.utils import clamp_int
+from alfred.models.zettel import ZettelCard
+
+log = logging.getLogger(__name__)
+
+_SEARCH_STOP_TERMS = {
+    "about",
+    "and",
+    "card",
+    "cards",
+    "find",
+    "for",
+    "from",
+    "in",
+    "kb",
+    "knowledge",
+    "label",
+    "labels",
+    "note",
+    "notes",
+    "of",
+    "on",
+    "or",
+    "related",
+    "search",
+    "tag",
+    "tagged",
+    "tags",
+    "the",
+    "topic",
+    "topics",
+    "with",
+    "zettel",
+    "zettels",
+}
+
+
+@dataclass(frozen=True)
+class ZettelSearchMatch:
+    """Ranked zettel search result with lightweight explainability."""
+
+    card: ZettelCard
+    score: float
+    reasons: list[str]
+
+
+def _dedupe_preserve_order(values: Iterable[str]) -> list[str]:
+    seen: set[str] = set()
+    result: list[str] = []
+    for value in values:
+        cleaned = " ".join(str(value or "").strip().split())
+        if not cleaned:
+            continue
+        key = cleaned.lower()
+        if key in seen:
+            continue
+        seen.add(key)
+        result.append(cleaned)
+    return result
+
+
+def _compact_search_text(value: object) -> str:
+    return re.sub(r"[^a-z0-9]+", "", str(value or "").lower())
+
+
+def _split_camel_case(value: str) -> str:
+    return re.sub(r"(?<=[a-z])(?=[A-Z])", " ", value)
+
+
+def _search_variants(value: str | None) -> list[str]:
+    cleaned = " ".join(str(value or "").strip().split())
+    if not cleaned:
+        return []
+
+    camel_split = _split_camel_case(cleaned)
+    spaced = re.sub(r"[-_]+", " ", camel_split)
+    dashed = re.sub(r"[\s_]+", "-", camel_split)
+    compact = _compact_search_text(cleaned)
+
+    variants = [cleaned, camel_split, spaced, dashed, compact]
+    if compact.endswith("os") and len(compact) > 3:
+        root = compact[:-2]
+        variants.extend([f"{root} os", f"{root}-os"])
+    return _dedupe_preserve_order(variants)
+
+
+def _split_search_terms(value: str | None) -> list[str]:
+    cleaned = " ".join(str(value or "").strip().split())
+    if not cleaned:
+        return []
+
+    terms: list[str] = []
+    terms.extend(_search_variants(cleaned))
+    for raw in re.split(r"[\s,;:/()\[\]{}]+", cleaned):
+        token = raw.strip(".,!?\"'")
+        if not token:
+            continue
+        if token.lower() in _SEARCH_STOP_TERMS:
+            continue
+        if len(_compact_search_text(token)) < 2:
+            continue
+        terms.extend(_search_variants(token))
+    return _dedupe_preserve_order(terms)
+
+
+def _split_tag_values(value: object) -> list[str]:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [
+            item.strip().strip(".,!?\"'")
+            for item in re.split(r"[\s,;]+", value)
+            if item.strip().strip(".,!?\"'")
+        ]
+    if isinstance(value, Iterable):
+        return [
+            str(item).strip().strip(".,!?\"'")
+            for item in value
+            if str(item).strip().strip(".,!?\"'")
+        ]
+    return [str(value).strip()]
+
+
+def _extract_query_tag_terms(query: str | None) -> list[str]:
+    text_value = str(query or "").strip()
+    if not text_value:
+        return []
+
+    lowered = text_value.lower()
+    if lowered.startswith(("tags ", "tag ", "tagged ")):
+        return _split_tag_values(text_value.split(maxsplit=1)[1] if " " in text_value else "")
+
+    tagged_chunks: list[str] = []
+    for match in re.finditer(r"\btag(?:s|ged)?\s*:\s*([^\n]+)", text_value, flags=re.IGNORECASE):
+        tagged_chunks.extend(_split_tag_values(match.group(1)))
+    return tagged_chunks
+
+
+@dataclass(frozen=True)
+class _NormalizedText:
+    """A value lowered and compacted once, so it can be matched against many terms."""
+
+    lower: str
+    compact: str
+
+    @classmethod
+    def of(cls, value: object) -> _NormalizedText:
+        text_value = " ".join(str(value or "").strip().split())
+        return cls(lower=text_value.lower(), compact=_compact_search_text(text_value))
+
+
+def _match_normalized(text: _NormalizedText, term: _NormalizedText) -> str | None:
+    if not text.lower or not term.compact:
+        return None
+    if text.lower == term.lower or text.compact == term.compact:
+        return "exact"
+    if len(term.compact) >= 3 and (term.lower in text.lower or term.compact in text.compact):
+        return "contains"
+    return None
+
+
+def _match_kind(value: object, term: str) -> str | None:
+    if not term:
+        return None
+    return _match_normalized(_NormalizedText.of(value), _NormalizedText.of(term))
+
+
+def _reason(label: str, value: object, term: str) -> str:
+    shown = str(value or "").strip()
+    if not shown:
+        shown = term
+    return f"{label}:{shown}"
+
+
+_fulltext_support: weakref.WeakKeyDictionary[Any, bool] = weakref.WeakKeyDictionary()
+_fulltext_support_lock = threading.Lock()
+
+
+def _supports_fulltext(session: Session) -> bool:
+    """True when the bound database is Postgres and has ``zettel_cards.search_vector``."""
+    bind = session.get_bind()
+    with _fulltext_support_lock:
+        cached = _fulltext_support.get(bind)
+    if cached is not None:
+        return cached
+    supported = False
+    if bind.dialect.name == "postgresql":
+        try:
+            columns = inspect(bind).get_columns(ZettelCard.__tablename__)
+            supported = any(col["name"] == "search_vector" for col in columns)
+        except Exception as exc:
+            log.debug("Could not inspect zettel_cards for search_vector: %s", exc)
+    with _fulltext_support_lock:
+        _fulltext_support[bind] = supported
+    return supported
+
+
+def _tsquery_text(terms: Iterable[str]) -> str:
+    """Build a prefix-matching ``to_tsquery`` expression OR-ing every term.
+
+    Multi-word terms become an AND group so ``"event sourcing"`` needs both
+    words. Only ``[a-z0-9]`` runs survive, which keeps tsquery syntax
+    characters out of user input.
+    """
+    clauses: list[str] = []
+    for term in terms:
+        words = re.findall(r"[a-z0-9]+", term.lower())
+        if not words:
+            continue
+        clause = " & ".join(f"{word}:*" for word in words)
+        clauses.append(f"({clause})" if len(words) > 1 else clause)
+    return " | ".join(_dedupe_preserve_order(clauses))
+
+
+_SEARCH_VECTOR = literal_column("zettel_cards.search_vector", type_=TSVECTOR)
+# Weights A/B are title and tags/topic, i.e. the metadata fields.
+_METADATA_SEARCH_VECTOR = literal_column(
+    "ts_filter(zettel_cards.search_vector, '{a,b}')", type_=TSVECTOR
+)
+
+
+@dataclass
+class ZettelSearchService:
+    """Candidate retrieval plus explainable re-ranking for ``search_cards``."""
+
+    session: Session
+
+    def search(
+        self,
+        *,
+        query: str | None = None,
+        topic: str | None = None,
+        tags: list[str] | str | None = None,
+        limit: int = 10,
+        search_mode: str = "broad",
+    ) -> list[ZettelSearchMatch]:
+        """Search active cards across text and metadata with forgiving variants."""
+        capped_limit = clamp_int(int(limit or 10), lo=1, hi=50)
+        mode = (search_mode or "broad").strip().lower()
+        metadata_only = mode == "metadata"
+
+        query_terms = _split_search_terms(query)
+        topic_terms = _split_search_terms(topic)
+        explicit_tag_terms: list[str] = []
+        for tag in [*_split_tag_values(tags), *_extract_query_tag_terms(query)]:
+            explicit_tag_terms.extend(_split_search_terms(tag))
+        tag_terms = _dedupe_preserve_order(explicit_tag_terms)
+
+        if not query_terms and not topic_terms and not tag_terms:
+            return []
+
+        filter_terms = _dedupe_preserve_order([*query_terms, *topic_terms, *tag_terms])[:40]
+        if _supports_fulltext(self.session):
+            candidates = self._fulltext_candidates(
+                filter_terms,
+                raw_query=query or topic,
+                metadata_only=metadata_only,
+                page_size=min(max(capped_limit * 3, 30), 150),
+            )
+        else:
+            candidates = self._like_candidates(
+                filter_terms,
+                candidate_limit=min(max(capped_limit * 80, 250), 2000),
+            )
+
+        prepared_query = [_NormalizedText.of(term) for term in query_terms]
+        prepared_topic = [_NormalizedText.of(term) for term in topic_terms]
+        prepared_tags = [_NormalizedText.of(term) for term in tag_terms]
+        matches: list[ZettelSearchMatch] = []
+        for card in candidates:
+            score, reasons = self._score_search_card(
+                card,
+                query_terms=list(zip(query_terms, prepared_query, strict=True)),
+                topic_terms=list(zip(topic_terms, prepared_topic, strict=True)),
+                tag_terms=list(zip(tag_terms, prepared_tags, strict=True)),
+                metadata_only=metadata_only,
+            )
+            if score <= 0:
+                continue
+            matches.append(ZettelSearchMatch(card=card, score=score, reasons=reasons[:6]))
+
+        return sorted(
+            matches,
+            key=lambda item: (
+                item.score,
+                item.card.updated_at or datetime.min,
+                item.card.id or 0,
+            ),
+            reverse=True,
+        )[:capped_limit]
+
+    def fulltext_statement(
+        self,
+        terms: list[str],
+        *,
+        raw_query: str | None,
+        metadata_only: bool,
+        page_size: int,
+    ):
+        """Index-backed candidate query ordered by ``ts_rank`` (+ title trigram similarity)."""
+        vector = _METADATA_SEARCH_VECTOR if metadata_only else _SEARCH_VECTOR
+        tsquery_text = _tsquery_text(terms)
+        title_lower = func.lower(ZettelCard.title)
+        raw = " ".join(str(raw_query or "").lower().split())
+
+        conditions = []
+        rank = None
+        if tsquery_text:
+            tsquery = func.to_tsquery("simple", tsquery_text)
+            conditions.append(vector.op("@@")(tsquery))
+            rank = func.ts_rank(vector, tsquery)
+        if raw:
+            conditions.append(title_lower.op("%")(raw))
+            similarity = func.similarity(title_lower, raw)
+            rank = similarity if rank is None else rank + similarity
+
+        statement = select(ZettelCard).where(ZettelCard.status == "active")
+        if conditions:
+            statement = statement.where(or_(*conditions))
+        order_by = [ZettelCard.updated_at.desc(), ZettelCard.id.desc()]
+        if rank is not None:
+            order_by.insert(0, rank.desc())
+        return statement.order_by(*order_by).limit(page_size)
+
+    def _fulltext_candidates(
+        self,
+        terms: list[str],
+        *,
+        raw_query: str | None,
+        metadata_only: bool,
+        page_size: int,
+    ) -> list[ZettelCard]:
+        statement = self.fulltext_statement(
+            terms, raw_query=raw_query, metadata_only=metadata_only, page_size=page_size
+        )
+        return list(self.session.exec(statement))
+
+    def _like_candidates(self, terms: list[str], *, candidate_limit: int) -> list[ZettelCard]:
+        """Portable fallback: substring filters over a recency-ordered window."""
+        statement = (
+            select(ZettelCard)
+            .where(ZettelCard.status == "active")
+            .order_by(ZettelCard.updated_at.desc(), ZettelCard.id.desc())
+            .limit(candidate_limit)
+        )
+        filters = []
+        for term in terms:
+            term_lower = term.lower()
+            filters.extend(
+                [
+                    func.lower(cast(ZettelCard.title, String)).contains(term_lower),
+                    func.lower(cast(ZettelCard.topic, String)).contains(term_lower),
+                    func.lower(cast(ZettelCard.summary, String)).contains(term_lower),
+                    func.lower(cast(ZettelCard.content, String)).contains(term_lower),
+                    func.lower(cast(ZettelCard.tags, String)).contains(term_lower),
+                ]
+            )
+        if filters:
+            statement = statement.where(or_(*filters))
+        return list(self.session.exec(statement))
+
+    @staticmethod
+    def _score_search_card(
+        card: ZettelCard,
+        *,
+        query_terms: list[tuple[str, _NormalizedText]],
+        topic_terms: list[tuple[str, _NormalizedText]],
+        tag_terms: list[tuple[str, _NormalizedText]],
+        metadata_only: bool,
+    ) -> tuple[float, list[str]]:
+        score = 0.0
+        reasons: list[str] = []
+        seen_reasons: set[str] = set()
+
+        def add_reason(label: str, value: object, term: str) -> None:
+            reason = _reason(label, value, term)
+            if reason in seen_reasons:
+                return
+            seen_reasons.add(reason)
+            reasons.append(reason)
+
+        def score_field(
+            label: str,
+            value: object,
+            terms: list[tuple[str, _NormalizedText]],
+            *,
+            exact: float,
+            contains: float,
+        ) -> None:
+            nonlocal score
+            if not terms:
+                return
+            normalized = _NormalizedText.of(value)
+            for term, prepared in terms:
+                kind = _match_normalized(normalized, prepared)
+                if not kind:
+                    continue
+                score += exact if kind == "exact" else contains
+                add_reason(label, value, term)
+
+        seen_terms: set[str] = set()
+        all_text_terms = []
+        for term, prepared in [*query_terms, *topic_terms, *tag_terms]:
+            if term.lower() in seen_terms:
+                continue
+            seen_terms.add(term.lower())
+            all_text_terms.append((term, prepared))
+        score_field("title", card.title, all_text_terms, exact=110.0, contains=75.0)
+        score_field("topic", card.topic, [*query_terms, *topic_terms], exact=85.0, contains=60.0)
+
+        for tag in card.tags or []:
+            score_field("tag", tag, [*query_terms, *tag_terms], exact=95.0, contains=70.0)
+
+        if not metadata_only:
+            score_field("summary", card.summary, query_terms, exact=45.0, contains=30.0)
+            score_field("content", card.content, query_terms, exact=25.0, contains=15.0)
+
+        if tag_terms:
+            card_tag_compacts = {_compact_search_text(tag) for tag in card.tags or []}
+            requested_tag_compacts = {prepared.compact for _, prepared in tag_terms}
+            requested_tag_compacts.discard("")
+            if requested_tag_compacts and requested_tag_compacts <= card_tag_compacts:
+                score += 50.0
+                add_reason(
+                    "tags_all",
+                    ", ".join(card.tags or []),
+                    ",".join(term for term, _ in tag_terms),
+                )
+
+        return score, reasons
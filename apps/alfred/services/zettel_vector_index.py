@@ -0,0 +1,343 @@
+"""In-process similarity index over zettel card embeddings.
+
+Used when Qdrant is not configured. Cards are held as a float32 matrix of
+unit-normalized embeddings so a top-k lookup is one matrix-vector product
+instead of a Python loop over every row.
+
+The index is process-scoped (one per database engine) and kept fresh two ways:
+
+* ``ZettelkastenService`` pushes card writes into it directly
+  (``upsert_card``/``remove``) as they happen in this process.
+* ``sync`` compares a cheap ``count``/``max(updated_at)``/``max(id)``
+  fingerprint against the database and pulls only rows touched since the last
+  watermark, so writes from other workers are picked up without a full reload.
+
+``updated_at`` is stamped before a transaction commits, so a slow writer can
+commit a row older than the watermark after it has moved on. The delta query
+therefore reaches ``_COMMIT_LAG`` behind the watermark, and until that window
+has passed ``sync`` runs it even when the fingerprint is unchanged (a late
+update need not move ``count`` or ``max(updated_at)``).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import weakref
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import numpy as np
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from alfred.models.zettel import ZettelCard
+
+logger = logging.getLogger(__name__)
+
+_INITIAL_CAPACITY = 1024
+_LOAD_BATCH_SIZE = 2000
+# Longest expected gap between stamping ``updated_at`` and committing the row.
+_COMMIT_LAG = timedelta(minutes=2)
+
+Fingerprint = tuple[int, datetime | None, int | None]
+
+
+def _unit_vector(values: Sequence[float] | None, dim: int | None) -> np.ndarray | None:
+    if not values:
+        return None
+    vec = np.asarray(values, dtype=np.float32)
+    if vec.ndim != 1 or (dim is not None and vec.shape[0] != dim):
+        return None
+    norm = float(np.linalg.norm(vec))
+    if norm == 0.0 or not np.isfinite(norm):
+        return None
+    return vec / norm
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands timestamps back naive; they were written as UTC.
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
+class ZettelVectorIndex:
+    """Brute-force cosine index over active card embeddings.
+
+    Rows live in a preallocated matrix that doubles when full; removals swap
+    the last row into the freed slot so the live region stays contiguous.
+    All public methods are thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._dim: int | None = None
+        self._matrix = np.empty((0, 0), dtype=np.float32)
+        self._ids = np.empty(0, dtype=np.int64)
+        self._rows: dict[int, int] = {}
+        self._size = 0
+        self._known_ids: set[int] = set()
+        self._loaded = False
+        self._watermark: datetime | None = None
+        self._fingerprint: Fingerprint | None = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def dim(self) -> int | None:
+        return self._dim
+
+    # ---------------
+    # Mutation
+    # ---------------
+    def clear(self) -> None:
+        with self._lock:
+            self._dim = None
+            self._matrix = np.empty((0, 0), dtype=np.float32)
+            self._ids = np.empty(0, dtype=np.int64)
+            self._rows = {}
+            self._size = 0
+            self._known_ids = set()
+            self._loaded = False
+            self._watermark = None
+            self._fingerprint = None
+
+    def upsert(self, card_id: int, embedding: Sequence[float] | None) -> bool:
+        """Insert or replace one card vector. Returns False when the vector is unusable."""
+        with self._lock:
+            vec = _unit_vector(embedding, self._dim)
+            if vec is None:
+                self._remove_locked(card_id)
+                return False
+            if self._dim is None:
+                self._dim = int(vec.shape[0])
+                self._matrix = np.empty((_INITIAL_CAPACITY, self._dim), dtype=np.float32)
+                self._ids = np.empty(_INITIAL_CAPACITY, dtype=np.int64)
+
+            row = self._rows.get(card_id)
+            if row is None:
+                self._reserve_locked(self._size + 1)
+                row = self._size
+                self._size += 1
+                self._rows[card_id] = row
+                self._ids[row] = card_id
+            self._matrix[row] = vec
+            return True
+
+    def upsert_card(self, card: ZettelCard) -> None:
+        """Reflect a card's current state: active embedded cards are indexed, others dropped."""
+        if card.id is None:
+            return
+        with self._lock:
+            self._apply_row_locked(card.id, card.embedding, card.status, card.updated_at)
+
+    def remove(self, card_id: int) -> None:
+        with self._lock:
+            self._remove_locked(card_id)
+
+    def _apply_row_locked(
+        self,
+        card_id: int,
+        embedding: Sequence[float] | None,
+        status: str | None,
+        updated_at: datetime | None,
+    ) -> None:
+        if status == "archived":
+            self._known_ids.discard(card_id)
+            self._remove_locked(card_id)
+        else:
+            self._known_ids.add(card_id)
+            self.upsert(card_id, embedding)
+        self._advance_watermark_locked(updated_at)
+
+    def _remove_locked(self, card_id: int) -> None:
+        row = self._rows.pop(card_id, None)
+        if row is None:
+            return
+        last = self._size - 1
+        if row != last:
+            moved_id = int(self._ids[last])
+            self._matrix[row] = self._matrix[last]
+            self._ids[row] = moved_id
+            self._rows[moved_id] = row
+        self._size = last
+
+    def _reserve_locked(self, needed: int) -> None:
+        capacity = self._matrix.shape[0]
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2, _INITIAL_CAPACITY)
+        matrix = np.empty((new_capacity, self._dim or 0), dtype=np.float32)
+        ids = np.empty(new_capacity, dtype=np.int64)
+        matrix[: self._size] = self._matrix[: self._size]
+        ids[: self._size] = self._ids[: self._size]
+        self._matrix = matrix
+        self._ids = ids
+
+    def _advance_watermark_locked(self, value: datetime | None) -> None:
+        if value is not None and (self._watermark is None or value > self._watermark):
+            self._watermark = value
+
+    # ---------------
+    # Database sync
+    # ---------------
+    def sync(self, session: Session) -> None:
+        """Bring the index up to date with the database.
+
+        The first call streams every non-archived card's embedding into the
+        matrix. Later calls cost one aggregate query when nothing changed and
+        a delta query over ``updated_at >= watermark - _COMMIT_LAG`` otherwise
+        (or while the last write is younger than ``_COMMIT_LAG``); a full reload
+        only happens when the non-archived row count still disagrees after the
+        delta (i.e. rows were hard-deleted).
+        """
+        fingerprint = self._db_fingerprint(session)
+        with self._lock:
+            if (
+                self._loaded
+                and fingerprint == self._fingerprint
+                and not self._within_commit_lag_locked()
+            ):
+                return
+            if not self._loaded or self._watermark is None:
+                self._full_load_locked(session)
+            else:
+                self._apply_delta_locked(session)
+                if fingerprint is not None and len(self._known_ids) != fingerprint[0]:
+                    self._full_load_locked(session)
+            self._fingerprint = fingerprint
+
+    def _within_commit_lag_locked(self) -> bool:
+        """True while rows stamped before the watermark may still be committing."""
+        if self._watermark is None:
+            return False
+        return datetime.now(UTC) - _as_utc(self._watermark) < _COMMIT_LAG
+
+    @staticmethod
+    def _db_fingerprint(session: Session) -> Fingerprint | None:
+        stmt = select(
+            func.count(ZettelCard.id).filter(ZettelCard.status != "archived"),
+            func.max(ZettelCard.updated_at),
+            func.max(ZettelCard.id),
+        )
+        row = session.execute(stmt).first()
+        if row is None:
+            return None
+        count, max_updated, max_id = row[0], row[1], row[2]
+        if not isinstance(count, int):
+            return None
+        return count, max_updated, max_id
+
+    def _full_load_locked(self, session: Session) -> None:
+        self.clear()
+        stmt = (
+            select(ZettelCard.id, ZettelCard.embedding, ZettelCard.updated_at)
+            .where(ZettelCard.status != "archived")
+            .execution_options(yield_per=_LOAD_BATCH_SIZE)
+        )
+        for card_id, embedding, updated_at in session.execute(stmt):
+            self._apply_row_locked(int(card_id), embedding, "active", updated_at)
+        self._loaded = True
+        logger.debug("Loaded %d zettel embeddings into the local vector index", self._size)
+
+    def _apply_delta_locked(self, session: Session) -> None:
+        stmt = select(
+            ZettelCard.id, ZettelCard.embedding, ZettelCard.updated_at, ZettelCard.status
+        ).where(ZettelCard.updated_at >= self._watermark - _COMMIT_LAG)
+        for card_id, embedding, updated_at, status in session.execute(stmt):
+            self._apply_row_locked(int(card_id), embedding, status, updated_at)
+
+    # ---------------
+    # Query
+    # ---------------
+    def search(
+        self,
+        query: Sequence[float],
+        *,
+        limit: int,
+        threshold: float | None = None,
+        exclude_ids: Iterable[int] = (),
+    ) -> list[tuple[int, float]]:
+        """Return up to ``limit`` ``(card_id, cosine)`` pairs, best first."""
+        return self.search_many(
+            [query], limit=limit, threshold=threshold, exclude_ids=[exclude_ids]
+        )[0]
+
+    def search_many(
+        self,
+        queries: Sequence[Sequence[float]],
+        *,
+        limit: int,
+        threshold: float | None = None,
+        exclude_ids: Sequence[Iterable[int]] | None = None,
+    ) -> list[list[tuple[int, float]]]:
+        """Score several queries with a single matrix product.
+
+        ``exclude_ids`` is aligned with ``queries``; each entry lists card ids
+        to drop from that query's results. Queries whose vector is unusable
+        (empty, zero, wrong dimension) get an empty result.
+        """
+        results: list[list[tuple[int, float]]] = [[] for _ in queries]
+        with self._lock:
+            if self._size == 0 or limit <= 0 or not queries:
+                return results
+            valid: list[int] = []
+            vectors: list[np.ndarray] = []
+            for pos, query in enumerate(queries):
+                vec = _unit_vector(query, self._dim)
+                if vec is not None:
+                    valid.append(pos)
+                    vectors.append(vec)
+            if not vectors:
+                return results
+            scores = self._matrix[: self._size] @ np.stack(vectors, axis=1)
+            ids = self._ids[: self._size].copy()
+
+        for col, pos in enumerate(valid):
+            excluded = exclude_ids[pos] if exclude_ids is not None else ()
+            results[pos] = self._top_k(ids, scores[:, col], limit, threshold, excluded)
+        return results
+
+    @staticmethod
+    def _top_k(
+        ids: np.ndarray,
+        scores: np.ndarray,
+        limit: int,
+        threshold: float | None,
+        exclude_ids: Iterable[int],
+    ) -> list[tuple[int, float]]:
+        excluded = {int(i) for i in exclude_ids}
+        if excluded:
+            keep = ~np.isin(ids, np.fromiter(excluded, dtype=np.int64, count=len(excluded)))
+            scores = scores[keep]
+            ids = ids[keep]
+        if threshold is not None:
+            keep = scores >= threshold
+            scores = scores[keep]
+            ids = ids[keep]
+        if scores.size == 0:
+            return []
+
+        k = min(limit, scores.size)
+        if k < scores.size:
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(scores.size)
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(ids[i]), float(scores[i])) for i in top]
+
+
+_indexes: weakref.WeakKeyDictionary[Any, ZettelVectorIndex] = weakref.WeakKeyDictionary()
+_indexes_lock = threading.Lock()
+
+
+def get_zettel_vector_index(session: Session) -> ZettelVectorIndex:
+    """Return the process-wide index for the engine behind ``session``."""
+    bind = session.get_bind()
+    with _indexes_lock:
+        index = _indexes.get(bind)
+        if index is None:
+            index = ZettelVectorIndex()
+            _indexes[bind] = index
+        return index
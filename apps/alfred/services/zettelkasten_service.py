@@ -9,13 +9,10 @@ from __future__ import annotations
 
 import json
 import logging
-import re
-from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
-from math import sqrt
 
-from sqlalchemy import String, cast, func, or_
+from sqlalchemy import func
 from sqlalchemy import text as sa_text
 from sqlmodel import Session, select
 
@@ -33,25 +30,13 @@ from alfred.services.zettel_links import (
     LinkContextPatch,
     ZettelLinkService,
 )
+from alfred.services.zettel_search import ZettelSearchMatch, ZettelSearchService
+from alfred.services.zettel_vector_index import get_zettel_vector_index
 from alfred.services.zettel_wiki_links import ZettelWikiLinkService
 
 log = logging.getLogger(__name__)
 
 
-def _cosine_similarity(a: Iterable[float], b: Iterable[float]) -> float:
-    a_list = list(a)
-    b_list = list(b)
-    if not a_list or not b_list or len(a_list) != len(b_list):
-        return 0.0
-    dot = sum(x * y for x, y in zip(a_list, b_list, strict=False))
-    norm_a = sqrt(sum(x * x for x in a_list))
-    norm_b = sqrt(sum(y * y for y in b_list))
-    denom = norm_a * norm_b
-    if denom == 0:
-        return 0.0
-    return dot / denom
-
-
 def _temporal_proximity_days(a: datetime | None, b: datetime | None) -> float | None:
     if not a or not b:
         return None
@@ -69,163 +54,62 @@ _ALLOWED_SORT_COLUMNS = {
     "confidence": ZettelCard.confidence,
 }
 
-_SEARCH_STOP_TERMS = {
-    "about",
-    "and",
-    "card",
-    "cards",
-    "find",
-    "for",
-    "from",
-    "in",
-    "kb",
-    "knowledge",
-    "label",
-    "labels",
-    "note",
-    "notes",
-    "of",
-    "on",
-    "or",
-    "related",
-    "search",
-    "tag",
-    "tagged",
+_CARD_FIELDS = (
+    "title",
+    "content",
+    "summary",
     "tags",
-    "the",
     "topic",
-    "topics",
-    "with",
-    "zettel",
-    "zettels",
-}
-
-
-@dataclass(frozen=True)
-class ZettelSearchMatch:
-    """Ranked zettel search result with lightweight explainability."""
-
-    card: ZettelCard
-    score: float
-    reasons: list[str]
-
-
-def _dedupe_preserve_order(values: Iterable[str]) -> list[str]:
-    seen: set[str] = set()
-    result: list[str] = []
-    for value in values:
-        cleaned = " ".join(str(value or "").strip().split())
-        if not cleaned:
-            continue
-        key = cleaned.lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        result.append(cleaned)
-    return result
-
-
-def _compact_search_text(value: object) -> str:
-    return re.sub(r"[^a-z0-9]+", "", str(value or "").lower())
-
-
-def _split_camel_case(value: str) -> str:
-    return re.sub(r"(?<=[a-z])(?=[A-Z])", " ", value)
-
-
-def _search_variants(value: str | None) -> list[str]:
-    cleaned = " ".join(str(value or "").strip().split())
-    if not cleaned:
-        return []
-
-    camel_split = _split_camel_case(cleaned)
-    spaced = re.sub(r"[-_]+", " ", camel_split)
-    dashed = re.sub(r"[\s_]+", "-", camel_split)
-    compact = _compact_search_text(cleaned)
-
-    variants = [cleaned, camel_split, spaced, dashed, compact]
-    if compact.endswith("os") and len(compact) > 3:
-        root = compact[:-2]
-        variants.extend([f"{root} os", f"{root}-os"])
-    return _dedupe_preserve_order(variants)
-
-
-def _split_search_terms(value: str | None) -> list[str]:
-    cleaned = " ".join(str(value or "").strip().split())
-    if not cleaned:
-        return []
-
-    terms: list[str] = []
-    terms.extend(_search_variants(cleaned))
-    for raw in re.split(r"[\s,;:/()\[\]{}]+", cleaned):
-        token = raw.strip(".,!?\"'")
-        if not token:
-            continue
-        if token.lower() in _SEARCH_STOP_TERMS:
-            continue
-        if len(_compact_search_text(token)) < 2:
-            continue
-        terms.extend(_search_variants(token))
-    return _dedupe_preserve_order(terms)
+    "source_url",
+    "document_id",
+    "importance",
+    "confidence",
+    "status",
+    "session_id",
+    "bloom_level",
+    "bloom_source",
+)
 
 
-def _split_tag_values(value: object) -> list[str]:
+def _clean_text(value: str | None) -> str | None:
+    """Strip surrounding whitespace; blank values become None."""
     if value is None:
-        return []
-    if isinstance(value, str):
-        return [
-            item.strip().strip(".,!?\"'")
-            for item in re.split(r"[\s,;]+", value)
-            if item.strip().strip(".,!?\"'")
-        ]
-    if isinstance(value, Iterable):
-        return [
-            str(item).strip().strip(".,!?\"'")
-            for item in value
-            if str(item).strip().strip(".,!?\"'")
-        ]
-    return [str(value).strip()]
-
-
-def _extract_query_tag_terms(query: str | None) -> list[str]:
-    text_value = str(query or "").strip()
-    if not text_value:
-        return []
-
-    lowered = text_value.lower()
-    if lowered.startswith(("tags ", "tag ", "tagged ")):
-        return _split_tag_values(text_value.split(maxsplit=1)[1] if " " in text_value else "")
-
-    tagged_chunks: list[str] = []
-    for match in re.finditer(r"\btag(?:s|ged)?\s*:\s*([^\n]+)", text_value, flags=re.IGNORECASE):
-        tagged_chunks.extend(_split_tag_values(match.group(1)))
-    return tagged_chunks
-
-
-def _match_kind(value: object, term: str) -> str | None:
-    text_value = " ".join(str(value or "").strip().split())
-    if not text_value or not term:
         return None
-
-    text_lower = text_value.lower()
-    term_lower = term.lower()
-    text_compact = _compact_search_text(text_value)
-    term_compact = _compact_search_text(term)
-    if not term_compact:
-        return None
-
-    if text_lower == term_lower or text_compact == term_compact:
-        return "exact"
-    if len(term_compact) >= 3 and (term_lower in text_lower or term_compact in text_compact):
-        return "contains"
-    return None
-
-
-def _reason(label: str, value: object, term: str) -> str:
-    shown = str(value or "").strip()
-    if not shown:
-        shown = term
-    return f"{label}:{shown}"
+    return str(value).strip() or None
+
+
+def _new_card(
+    *,
+    title: str,
+    content: str | None = None,
+    summary: str | None = None,
+    tags: list[str] | None = None,
+    topic: str | None = None,
+    source_url: str | None = None,
+    document_id: str | None = None,
+    importance: int = 0,
+    confidence: float = 0.0,
+    status: str = "active",
+    session_id: int | None = None,
+    bloom_level: int = 1,
+    bloom_source: str | None = "backfill",
+) -> ZettelCard:
+    """Build an unsaved card with the normalization shared by single and batch creation."""
+    return ZettelCard(
+        title=str(title).strip(),
+        content=_clean_text(content),
+        summary=_clean_text(summary),
+        tags=tags or [],
+        topic=_clean_text(topic),
+        source_url=_clean_text(source_url),
+        document_id=_clean_text(document_id),
+        importance=clamp_int(int(importance), lo=0, hi=10),
+        confidence=max(0.0, min(1.0, float(confidence))),
+        status=status,
+        session_id=session_id,
+        bloom_level=clamp_int(int(bloom_level), lo=1, hi=6),
+        bloom_source=_clean_text(bloom_source) or "backfill",
+    )
 
 
 @dataclass
@@ -254,20 +138,20 @@ class ZettelkastenService:
         bloom_level: int = 1,
         bloom_source: str = "backfill",
     ) -> ZettelCard:
-        card = ZettelCard(
-            title=title.strip(),
-            content=content.strip() if content else None,
-            summary=summary.strip() if summary else None,
-            tags=tags or [],
-            topic=topic.strip() if topic else None,
-            source_url=source_url.strip() if source_url else None,
-            document_id=document_id.strip() if document_id else None,
-            importance=clamp_int(int(importance), lo=0, hi=10),
-            confidence=max(0.0, min(1.0, float(confidence))),
+        card = _new_card(
+            title=title,
+            content=content,
+            summary=summary,
+            tags=tags,
+            topic=topic,
+            source_url=source_url,
+            document_id=document_id,
+            importance=importance,
+            confidence=confidence,
             status=status,
             session_id=session_id,
-            bloom_level=clamp_int(int(bloom_level), lo=1, hi=6),
-            bloom_source=(bloom_source or "backfill").strip() or "backfill",
+            bloom_level=bloom_level,
+            bloom_source=bloom_source,
         )
         self.session.add(card)
         self.session.commit()
@@ -303,45 +187,38 @@ class ZettelkastenService:
             title (required), content, summary, tags, topic, source_url,
             document_id, importance, confidence, status, session_id,
             bloom_level, bloom_source
+
+        Embeddings for the whole batch are fetched with one
+        ``embed_documents`` call before the insert, and the cards plus their
+        initial review rows are written with a single commit.
         """
-        cards = []
-        for data in cards_data:
-            bloom_level = clamp_int(int(data.get("bloom_level", 1)), lo=1, hi=6)
-            bloom_source_raw = data.get("bloom_source") or "backfill"
-            bloom_source = str(bloom_source_raw).strip() or "backfill"
-            card = ZettelCard(
-                title=str(data["title"]).strip(),
-                content=data.get("content"),
-                summary=data.get("summary"),
-                tags=data.get("tags") or [],
-                topic=data.get("topic"),
-                source_url=data.get("source_url"),
-                document_id=data.get("document_id"),
-                importance=clamp_int(int(data.get("importance", 0)), lo=0, hi=10),
-                confidence=max(0.0, min(1.0, float(data.get("confidence", 0.0)))),
-                status=data.get("status", "active"),
-                session_id=data.get("session_id"),
-                bloom_level=bloom_level,
-                bloom_source=bloom_source,
+        cards = [
+            _new_card(**{key: data[key] for key in _CARD_FIELDS if key in data})
+            for data in cards_data
+        ]
+        if not cards:
+            return []
+
+        # Close the crud-vector-sync-gap for the whole batch at once. A failed
+        # embedding call must not block card creation; ensure_embeddings can
+        # backfill later.
+        try:
+            self._assign_embeddings(cards)
+        except Exception as exc:
+            log.warning(
+                "Batch embedding failed for %d new cards: %s",
+                len(cards),
+                exc,
+                exc_info=True,
             )
-            cards.append(card)
+
         self.session.add_all(cards)
+        self.session.flush()
+        self._add_open_reviews([card.id for card in cards if card.id is not None])
         self.session.commit()
+        self._reload_cards(cards)
         for card in cards:
-            self.session.refresh(card)
-            self._ensure_open_review(card_id=card.id or 0)
-            # Close the crud-vector-sync-gap per-card. Isolating the try
-            # inside the loop means one embedding failure can't block
-            # Qdrant sync for the remaining cards in the batch.
-            try:
-                self.ensure_embedding(card)
-            except Exception as exc:
-                log.warning(
-                    "ensure_embedding failed for card %s: %s",
-                    card.id,
-                    exc,
-                    exc_info=True,
-                )
+            self._sync_vector_index(card)
         return cards
 
     def _apply_card_filters(
@@ -451,123 +328,13 @@ class ZettelkastenService:
         search_mode: str = "broad",
     ) -> list[ZettelSearchMatch]:
         """Search active cards across text and metadata with forgiving variants."""
-        capped_limit = clamp_int(int(limit or 10), lo=1, hi=50)
-        mode = (search_mode or "broad").strip().lower()
-        metadata_only = mode == "metadata"
-
-        query_terms = _split_search_terms(query)
-        topic_terms = _split_search_terms(topic)
-        explicit_tag_terms: list[str] = []
-        for tag in [*_split_tag_values(tags), *_extract_query_tag_terms(query)]:
-            explicit_tag_terms.extend(_split_search_terms(tag))
-        tag_terms = _dedupe_preserve_order(explicit_tag_terms)
-
-        if not query_terms and not topic_terms and not tag_terms:
-            return []
-
-        candidate_limit = min(max(capped_limit * 80, 250), 2000)
-        statement = (
-            select(ZettelCard)
-            .where(ZettelCard.status == "active")
-            .order_by(ZettelCard.updated_at.desc(), ZettelCard.id.desc())
-            .limit(candidate_limit)
+        return ZettelSearchService(self.session).search(
+            query=query,
+            topic=topic,
+            tags=tags,
+            limit=limit,
+            search_mode=search_mode,
         )
-        filter_terms = _dedupe_preserve_order([*query_terms, *topic_terms, *tag_terms])[:40]
-        filters = []
-        for term in filter_terms:
-            term_lower = term.lower()
-            filters.extend(
-                [
-                    func.lower(cast(ZettelCard.title, String)).contains(term_lower),
-                    func.lower(cast(ZettelCard.topic, String)).contains(term_lower),
-                    func.lower(cast(ZettelCard.summary, String)).contains(term_lower),
-                    func.lower(cast(ZettelCard.content, String)).contains(term_lower),
-                    func.lower(cast(ZettelCard.tags, String)).contains(term_lower),
-                ]
-            )
-        if filters:
-            statement = statement.where(or_(*filters))
-        candidates = list(self.session.exec(statement))
-
-        matches: list[ZettelSearchMatch] = []
-        for card in candidates:
-            score, reasons = self._score_search_card(
-                card,
-                query_terms=query_terms,
-                topic_terms=topic_terms,
-                tag_terms=tag_terms,
-                metadata_only=metadata_only,
-            )
-            if score <= 0:
-                continue
-            matches.append(ZettelSearchMatch(card=card, score=score, reasons=reasons[:6]))
-
-        return sorted(
-            matches,
-            key=lambda item: (
-                item.score,
-                item.card.updated_at or datetime.min,
-                item.card.id or 0,
-            ),
-            reverse=True,
-        )[:capped_limit]
-
-    @staticmethod
-    def _score_search_card(
-        card: ZettelCard,
-        *,
-        query_terms: list[str],
-        topic_terms: list[str],
-        tag_terms: list[str],
-        metadata_only: bool,
-    ) -> tuple[float, list[str]]:
-        score = 0.0
-        reasons: list[str] = []
-        seen_reasons: set[str] = set()
-
-        def add_reason(label: str, value: object, term: str) -> None:
-            reason = _reason(label, value, term)
-            if reason in seen_reasons:
-                return
-            seen_reasons.add(reason)
-            reasons.append(reason)
-
-        def score_field(
-            label: str,
-            value: object,
-            terms: list[str],
-            *,
-            exact: float,
-            contains: float,
-        ) -> None:
-            nonlocal score
-            for term in terms:
-                kind = _match_kind(value, term)
-                if not kind:
-                    continue
-                score += exact if kind == "exact" else contains
-                add_reason(label, value, term)
-
-        all_text_terms = _dedupe_preserve_order([*query_terms, *topic_terms, *tag_terms])
-        score_field("title", card.title, all_text_terms, exact=110.0, contains=75.0)
-        score_field("topic", card.topic, [*query_terms, *topic_terms], exact=85.0, contains=60.0)
-
-        for tag in card.tags or []:
-            score_field("tag", tag, [*query_terms, *tag_terms], exact=95.0, contains=70.0)
-
-        if not metadata_only:
-            score_field("summary", card.summary, query_terms, exact=45.0, contains=30.0)
-            score_field("content", card.content, query_terms, exact=25.0, contains=15.0)
-
-        if tag_terms:
-            card_tag_compacts = {_compact_search_text(tag) for tag in card.tags or []}
-            requested_tag_compacts = {_compact_search_text(tag) for tag in tag_terms}
-            requested_tag_compacts.discard("")
-            if requested_tag_compacts and requested_tag_compacts <= card_tag_compacts:
-                score += 50.0
-                add_reason("tags_all", ", ".join(card.tags or []), ",".join(tag_terms))
-
-        return score, reasons
 
     def update_card(self, card: ZettelCard, **fields) -> ZettelCard:
         text_changed = False
@@ -601,6 +368,7 @@ class ZettelkastenService:
         self.session.add(card)
         self.session.commit()
         self.session.refresh(card)
+        self._sync_vector_index(card)
         return card
 
     def archive_card(self, card: ZettelCard, *, remove_links: bool = True) -> ZettelCard:
@@ -614,6 +382,7 @@ class ZettelkastenService:
                 self.session.delete(link)
         self.session.commit()
         self.session.refresh(card)
+        self._sync_vector_index(card)
         return card
 
     # ---------------
@@ -710,6 +479,26 @@ class ZettelkastenService:
         self.session.refresh(review)
         return review
 
+    def _add_open_reviews(self, card_ids: list[int]) -> None:
+        """Stage one open review for each card lacking one. Caller commits."""
+        if not card_ids:
+            return
+        already_open = set(
+            self.session.exec(
+                select(ZettelReview.card_id)
+                .where(ZettelReview.card_id.in_(card_ids))
+                .where(ZettelReview.completed_at.is_(None))
+            )
+        )
+        due_at = _utcnow() + STAGE_TO_DELTA[1]
+        self.session.add_all(
+            [
+                ZettelReview(card_id=card_id, stage=1, iteration=1, due_at=due_at)
+                for card_id in dict.fromkeys(card_ids)
+                if card_id not in already_open
+            ]
+        )
+
     def complete_review(
         self,
         *,
@@ -749,8 +538,8 @@ class ZettelkastenService:
     # ---------------
     # Graph summary
     # ---------------
-    def graph_summary(self) -> dict:
-        return ZettelGraphSummaryService(self.session).graph_summary()
+    def graph_summary(self, since: str | None = None) -> dict:
+        return ZettelGraphSummaryService(self.session).graph_summary(since=since)
 
     def extended_graph_summary(
         self,
@@ -902,8 +691,7 @@ class ZettelkastenService:
     # Embeddings / link suggestions
     # ---------------
     def embed_card(self, card: ZettelCard) -> list[float]:
-        text_parts = [card.title, card.summary or "", card.content or ""]
-        text = " ".join([p.strip() for p in text_parts if p and p.strip()])
+        text = self._embedding_text(card)
         if not text:
             raise ValueError("Cannot embed empty card content")
         from alfred.core.llm_factory import get_embedding_model
@@ -920,8 +708,62 @@ class ZettelkastenService:
         self.session.add(card)
         self.session.commit()
         self.session.refresh(card)
+        self._sync_vector_index(card)
         return card
 
+    @staticmethod
+    def _embedding_text(card: ZettelCard) -> str:
+        text_parts = [card.title, card.summary or "", card.content or ""]
+        return " ".join([p.strip() for p in text_parts if p and p.strip()])
+
+    def _assign_embeddings(self, cards: list[ZettelCard]) -> list[ZettelCard]:
+        """Embed every card that lacks a vector with one ``embed_documents`` call.
+
+        Mutates the cards in place without touching the session and returns
+        the ones that received an embedding.
+        """
+        pending = [card for card in cards if not card.embedding and self._embedding_text(card)]
+        if not pending:
+            return []
+        from alfred.core.llm_factory import get_embedding_model
+
+        model = get_embedding_model()
+        vectors = model.embed_documents([self._embedding_text(card) for card in pending])
+        now = _utcnow()
+        for card, vector in zip(pending, vectors, strict=True):
+            card.embedding = list(vector)
+            card.updated_at = now
+        return pending
+
+    def ensure_embeddings(self, cards: list[ZettelCard]) -> list[ZettelCard]:
+        """Bulk counterpart of ``ensure_embedding``: one embedding call, one commit."""
+        embedded = self._assign_embeddings(cards)
+        if not embedded:
+            return cards
+        self.session.add_all(embedded)
+        self.session.commit()
+        self._reload_cards(embedded)
+        for card in embedded:
+            self._sync_vector_index(card)
+        return cards
+
+    def _reload_cards(self, cards: list[ZettelCard]) -> None:
+        """Refresh expired card instances with one SELECT instead of N refreshes."""
+        ids = [card.id for card in cards if card.id is not None]
+        if ids:
+            self.session.exec(select(ZettelCard).where(ZettelCard.id.in_(ids))).all()
+
+    def _sync_vector_index(self, card: ZettelCard) -> None:
+        """Mirror a card write into the in-process similarity index.
+
+        Index maintenance is best-effort: a failure here only means the next
+        ``sync`` picks the change up from the database instead.
+        """
+        try:
+            get_zettel_vector_index(self.session).upsert_card(card)
+        except Exception as exc:
+            log.debug("Vector index update failed for card %s: %s", card.id, exc)
+
     def _existing_links(self, card_id: int) -> set[tuple[int, int]]:
         links = self.session.exec(
             select(ZettelLink).where(
@@ -1006,7 +848,7 @@ class ZettelkastenService:
                 threshold=threshold,
                 limit=limit,
             )
-        return self._find_similar_via_scan(
+        return self._find_similar_via_index(
             card,
             card_id,
             base_embedding,
@@ -1035,7 +877,7 @@ class ZettelkastenService:
                 score_threshold=threshold,
             )
         except Exception:
-            return self._find_similar_via_scan(
+            return self._find_similar_via_index(
                 card,
                 card.id,
                 base_embedding,
@@ -1068,7 +910,7 @@ class ZettelkastenService:
         scored.sort(key=lambda item: item[1].composite_score, reverse=True)
         return scored[:limit]
 
-    def _find_similar_via_scan(
+    def _find_similar_via_index(
         self,
         card: ZettelCard,
         card_id: int,
@@ -1078,30 +920,171 @@ class ZettelkastenService:
         threshold: float,
         limit: int,
     ) -> list[tuple[ZettelCard, LinkQuality]]:
-        """Original O(n) fallback when Qdrant is unavailable."""
-        candidates = self.session.exec(select(ZettelCard).where(ZettelCard.id != card_id))
-        scored: list[tuple[ZettelCard, LinkQuality]] = []
-        for cand in candidates:
-            if cand.embedding is None:
-                try:
-                    cand = self.ensure_embedding(cand)
-                except Exception:
-                    continue
-            semantic = _cosine_similarity(base_embedding, cand.embedding or [])
-            if semantic < threshold:
-                continue
-            quality = self._quality(card, cand, semantic_score=semantic)
-            if (card.id, cand.id) in existing_links:
-                continue
-            scored.append((cand, quality))
+        """Local fallback when Qdrant is unavailable.
+
+        Scores every indexed card with one matrix-vector product, then hydrates
+        only the top hits. Cards without an embedding are not embedded here;
+        they join the index once ``ensure_embedding`` runs for them.
+        """
+        index = get_zettel_vector_index(self.session)
+        index.sync(self.session)
+        linked_ids = {to_id for from_id, to_id in existing_links if from_id == card_id}
+        hits = index.search(
+            base_embedding,
+            limit=limit * 3,
+            threshold=threshold,
+            exclude_ids={card_id, *linked_ids},
+        )
+        if not hits:
+            return []
+
+        scores_by_id = dict(hits)
+        candidates = self.session.exec(
+            select(ZettelCard).where(ZettelCard.id.in_(list(scores_by_id.keys())))
+        ).all()
 
+        scored: list[tuple[ZettelCard, LinkQuality]] = [
+            (cand, self._quality(card, cand, semantic_score=scores_by_id[cand.id]))
+            for cand in candidates
+            if cand.id in scores_by_id
+        ]
         scored.sort(key=lambda item: item[1].composite_score, reverse=True)
         return scored[:limit]
 
+    def find_similar_cards_bulk(
+        self, card_ids: list[int], *, threshold: float = 0.5, limit: int = 10
+    ) -> dict[int, list[tuple[ZettelCard, LinkQuality]]]:
+        """Batched ``find_similar_cards`` for many source cards.
+
+        Missing embeddings are filled with one ``embed_documents`` call, all
+        queries go to Qdrant as one batch request (or to the local index as one
+        matrix product), and candidates plus existing links are each loaded
+        with a single query. Unknown card ids are omitted from the result.
+        """
+        unique_ids = list(dict.fromkeys(card_ids))
+        if not unique_ids:
+            return {}
+        cards = list(self.session.exec(select(ZettelCard).where(ZettelCard.id.in_(unique_ids))))
+        self.ensure_embeddings(cards)
+        bases = [card for card in cards if card.id is not None and card.embedding]
+        results: dict[int, list[tuple[ZettelCard, LinkQuality]]] = {
+            card.id: [] for card in cards if card.id is not None
+        }
+        if not bases:
+            return results
+
+        linked = self._existing_link_targets([card.id for card in bases])
+        hits = self._bulk_similarity_hits(bases, linked, threshold=threshold, limit=limit * 3)
+
+        candidate_ids = {hit_id for per_card in hits.values() for hit_id in per_card}
+        candidates_by_id: dict[int, ZettelCard] = {}
+        if candidate_ids:
+            candidates_by_id = {
+                cand.id: cand
+                for cand in self.session.exec(
+                    select(ZettelCard).where(ZettelCard.id.in_(list(candidate_ids)))
+                ).all()
+                if cand.id is not None
+            }
+
+        for base in bases:
+            scored = [
+                (candidates_by_id[cand_id], self._quality(base, candidates_by_id[cand_id], score))
+                for cand_id, score in hits.get(base.id, {}).items()
+                if cand_id in candidates_by_id
+            ]
+            scored.sort(key=lambda item: item[1].composite_score, reverse=True)
+            results[base.id] = scored[:limit]
+        return results
+
+    def _existing_link_targets(self, card_ids: list[int]) -> dict[int, set[int]]:
+        """Map each card id to the ids it is already linked with, in either direction."""
+        targets: dict[int, set[int]] = {card_id: set() for card_id in card_ids}
+        links = self.session.exec(
+            select(ZettelLink.from_card_id, ZettelLink.to_card_id).where(
+                ZettelLink.from_card_id.in_(card_ids) | ZettelLink.to_card_id.in_(card_ids)
+            )
+        )
+        for from_id, to_id in links:
+            if from_id in targets:
+                targets[from_id].add(to_id)
+            if to_id in targets:
+                targets[to_id].add(from_id)
+        return targets
+
+    def _bulk_similarity_hits(
+        self,
+        bases: list[ZettelCard],
+        linked: dict[int, set[int]],
+        *,
+        threshold: float,
+        limit: int,
+    ) -> dict[int, dict[int, float]]:
+        exclusions = [{base.id, *linked.get(base.id, set())} for base in bases]
+
+        qdrant = get_qdrant_client()
+        if qdrant is not None:
+            from qdrant_client import models
+
+            from alfred.core.settings import settings
+
+            try:
+                responses = qdrant.query_batch_points(
+                    collection_name=settings.qdrant_zettels_collection,
+                    requests=[
+                        models.QueryRequest(
+                            query=list(base.embedding or []),
+                            limit=limit,
+                            score_threshold=threshold,
+                        )
+                        for base in bases
+                    ],
+                )
+            except Exception as exc:
+                log.debug("Qdrant batch query failed, using local index: %s", exc)
+            else:
+                hits: dict[int, dict[int, float]] = {}
+                for base, excluded, response in zip(bases, exclusions, responses, strict=False):
+                    per_card: dict[int, float] = {}
+                    for point in response.points:
+                        hit_id = int(point.id) if not isinstance(point.id, int) else point.id
+                        if hit_id not in excluded:
+                            per_card[hit_id] = point.score
+                    hits[base.id] = per_card
+                return hits
+
+        index = get_zettel_vector_index(self.session)
+        index.sync(self.session)
+        batched = index.search_many(
+            [base.embedding or [] for base in bases],
+            limit=limit,
+            threshold=threshold,
+            exclude_ids=exclusions,
+        )
+        return {base.id: dict(found) for base, found in zip(bases, batched, strict=True)}
+
     def suggest_links(
         self, card_id: int, *, min_confidence: float = 0.6, limit: int = 10
     ) -> list[LinkSuggestion]:
         results = self.find_similar_cards(card_id, threshold=min_confidence, limit=limit * 2)
+        return self._link_suggestions(results, min_confidence=min_confidence, limit=limit)
+
+    def suggest_links_bulk(
+        self, card_ids: list[int], *, min_confidence: float = 0.6, limit: int = 10
+    ) -> dict[int, list[LinkSuggestion]]:
+        """Batched ``suggest_links``; see ``find_similar_cards_bulk``."""
+        results = self.find_similar_cards_bulk(
+            card_ids, threshold=min_confidence, limit=limit * 2
+        )
+        return {
+            card_id: self._link_suggestions(scored, min_confidence=min_confidence, limit=limit)
+            for card_id, scored in results.items()
+        }
+
+    @staticmethod
+    def _link_suggestions(
+        results: list[tuple[ZettelCard, LinkQuality]], *, min_confidence: float, limit: int
+    ) -> list[LinkSuggestion]:
         suggestions: list[LinkSuggestion] = []
         for cand, quality in results:
             if quality.composite_score < min_confidence:
@@ -1,6 +1,9 @@
 """SnapshotProjector — writes agent_run_snapshots rows.
 
-Cadence: every 100 events and at every terminal event.
+Cadence: every 100 events and at every terminal event. A cadence snapshot
+is deferred to the next non-delta event: the recorder stores deltas coalesced
+per segment, so only a segment boundary is a seq that ReplayEngine can
+fast-forward to without replaying text twice.
 
 Spec: docs/superpowers/specs/2026-05-01-streaming-revamp-design.md sections 5.3 + 6.3
 """
@@ -12,7 +15,7 @@ import logging
 from sqlmodel import Session
 
 from alfred.models.streaming import AgentRunSnapshotRow
-from alfred.streaming.events import AnyRunEvent, MessageDelta, ThinkingDelta
+from alfred.streaming.events import AnyRunEvent, MessageDelta, ThinkingDelta, ToolArgsDelta
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +30,7 @@ class SnapshotProjector:
         self._thinking_text_parts: list[str] = []
         self._last_run_id = None
         self._last_seq = 0
+        self._snapshot_due = False
 
     def on_event(self, event: AnyRunEvent) -> None:
         self._event_count += 1
@@ -37,6 +41,9 @@ class SnapshotProjector:
         elif isinstance(event, ThinkingDelta):
             self._thinking_text_parts.append(event.delta_text)
         if self._event_count % _SNAPSHOT_CADENCE == 0:
+            self._snapshot_due = True
+        if self._snapshot_due and not isinstance(event, MessageDelta | ThinkingDelta | ToolArgsDelta):
+            self._snapshot_due = False
             self._write_snapshot()
 
     def on_run_finished(self, terminal: AnyRunEvent) -> None:
@@ -2,13 +2,21 @@
 
 Responsibilities per emit:
   1. Assign monotonic seq (local counter).
-  2. Append to in-memory buffer.
-  3. Fan out to attached consumers (synchronous).
-  4. Flush buffer on:
-       - Significant event (not message.delta / thinking.delta / tool.args.delta)
-       - Time budget (250ms)
-       - Size budget (32 events)
-       - Terminal event (run.finished / run.errored / run.cancelled)
+  2. Fan out to attached consumers (synchronous, every event).
+  3. Coalesce delta events (message.delta / thinking.delta / tool.args.delta)
+     into one event per segment — a run of deltas for the same message or
+     tool call. The segment closes on any other event, on a new segment key,
+     or when it reaches ``_SEGMENT_MAX_CHARS``.
+  4. Hand closed segments and non-delta events to a write-behind
+     ``_EventWriter``: a bounded queue drained by a background task with
+     multi-row INSERTs on its own connection — awaited on the async engine
+     when one is given, otherwise run in a worker thread.
+
+A coalesced delta keeps the seq of its last constituent, so replay with a
+``target_seq`` never yields text past that seq. The in-memory history used
+for ``attach`` replay holds coalesced events and is capped at
+``_HISTORY_LIMIT``, so memory per run no longer grows with token count.
+run.started is kept outside that cap: a late attach always sees the run open.
 
 DB write failures are logged but do NOT block the wire. Conscious asymmetry.
 
@@ -17,12 +25,17 @@ Spec: docs/superpowers/specs/2026-05-01-streaming-revamp-design.md section 6.1
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
-import time
+from collections import deque
 from datetime import UTC, datetime
 from typing import Any, Self
 from uuid import UUID, uuid4
 
+from sqlalchemy import insert, update
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlmodel import Session
 
 from alfred.models.streaming import AgentRunEventRow, AgentRunRow
@@ -40,8 +53,16 @@ from alfred.streaming.events import (
 logger = logging.getLogger(__name__)
 
 _DELTA_TYPES = frozenset({"message.delta", "thinking.delta", "tool.args.delta"})
-_FLUSH_INTERVAL_SECONDS = 0.25
-_FLUSH_SIZE = 32
+_SEGMENT_MAX_CHARS = 16_384
+_HISTORY_LIMIT = 1024
+_WRITE_QUEUE_SIZE = 256
+_WRITE_BATCH_SIZE = 128
+
+_TERMINAL_STATUS = {
+    "run.finished": "finished",
+    "run.errored": "errored",
+    "run.cancelled": "cancelled",
+}
 
 
 class RunRecorder:
@@ -57,6 +78,7 @@ class RunRecorder:
         thread_id: int | None = None,
         model_id: str | None = None,
         active_lens: str | None = None,
+        async_engine: AsyncEngine | None = None,
     ) -> None:
         self.session = session
         self.run_id = run_id
@@ -66,11 +88,18 @@ class RunRecorder:
         self.model_id = model_id
         self.active_lens = active_lens
         self._seq = 0
-        self._buffer: list[AnyRunEvent] = []
-        self._last_flush_at = time.monotonic()
         self._consumers: list[EventConsumer] = []
         self._closed = False
-        self._all_events: list[AnyRunEvent] = []  # Full history for replay on attach
+        self._writer = _EventWriter(
+            session.get_bind(), run_id=run_id, async_engine=async_engine
+        )
+        # Open delta segment, coalesced into one event when it closes.
+        self._segment: list[AnyRunEvent] = []
+        self._segment_chars = 0
+        # Coalesced history for replay on attach; bounded per run. run.started
+        # is pinned separately so eviction never drops it.
+        self._started: RunStarted | None = None
+        self._history: deque[AnyRunEvent] = deque(maxlen=_HISTORY_LIMIT)
 
     @classmethod
     def start(
@@ -84,6 +113,7 @@ class RunRecorder:
         active_lens: str | None = None,
         input_summary: str | None = None,
         user_id: str | None = None,
+        async_engine: AsyncEngine | None = None,
     ) -> Self:
         run_id = uuid4()
         row = AgentRunRow(
@@ -97,12 +127,10 @@ class RunRecorder:
             model_id=model_id,
             active_lens=active_lens,
         )
-        session.add(row)
-        session.commit()
-
         rec = cls(
             session, run_id=run_id, run_type=run_type, parent=parent,
             thread_id=thread_id, model_id=model_id, active_lens=active_lens,
+            async_engine=async_engine,
         )
         started = RunStarted(
             run_id=run_id, seq=rec._next_seq(), emitted_at=_utcnow(),
@@ -111,8 +139,12 @@ class RunRecorder:
             user_id=user_id, input_summary=input_summary,
             model_id=model_id, active_lens=active_lens,
         )
-        rec._record(started)
-        rec._flush()
+        # The run row and run.started land in one transaction: callers
+        # (and FK'd event rows written later) can rely on both existing.
+        session.add(row)
+        session.add(AgentRunEventRow(id=None, **_event_row(started)))
+        session.commit()
+        rec._started = started
         return rec
 
     async def __aenter__(self) -> Self:
@@ -122,13 +154,13 @@ class RunRecorder:
         if self._closed:
             return False
         if exc is not None:
-            self._emit_terminal(RunErrored(
+            await self._emit_terminal(RunErrored(
                 run_id=self.run_id, seq=self._next_seq(), emitted_at=_utcnow(),
                 error_type=exc_type.__name__ if exc_type else "UnknownError",
                 error_message=str(exc),
             ))
             return False
-        self._emit_terminal(RunFinished(
+        await self._emit_terminal(RunFinished(
             run_id=self.run_id, seq=self._next_seq(), emitted_at=_utcnow(),
         ))
         return False
@@ -136,13 +168,13 @@ class RunRecorder:
     async def aclose(self) -> None:
         if self._closed:
             return
-        self._emit_terminal(RunFinished(
+        await self._emit_terminal(RunFinished(
             run_id=self.run_id, seq=self._next_seq(), emitted_at=_utcnow(),
         ))
 
     def attach(self, consumer: EventConsumer) -> None:
-        # Replay all historical events to the new consumer
-        for event in self._all_events:
+        # Replay history to the new consumer; deltas arrive coalesced per segment.
+        for event in self.recorded_events:
             try:
                 consumer.on_event(event)
             except Exception:
@@ -155,16 +187,27 @@ class RunRecorder:
 
         Routes use this to send recorder-owned lifecycle events (run.started
         and terminal events) through the same wire projector as producer
-        events.
+        events. Deltas are coalesced per segment and carry the seq of the
+        last delta they cover.
         """
-        return tuple(self._all_events)
+        started = (self._started,) if self._started is not None else ()
+        if self._segment:
+            return (*started, *self._history, _coalesce(self._segment))
+        return (*started, *self._history)
+
+    async def flush(self) -> None:
+        """Wait until every event handed to the writer so far is persisted.
+
+        The open delta segment is not included; it is written when it closes.
+        """
+        await self._writer.flush()
 
     async def emit_message_started(self, *, message_id: UUID) -> MessageStarted:
         evt = MessageStarted(
             run_id=self.run_id, seq=self._next_seq(), emitted_at=_utcnow(),
             message_id=message_id,
         )
-        self._record(evt)
+        await self._record(evt)
         return evt
 
     async def emit_delta(self, *, message_id: UUID, delta_text: str) -> MessageDelta:
@@ -172,7 +215,7 @@ class RunRecorder:
             run_id=self.run_id, seq=self._next_seq(), emitted_at=_utcnow(),
             message_id=message_id, delta_text=delta_text,
         )
-        self._record(evt)
+        await self._record(evt)
         return evt
 
     async def emit_tool_started(
@@ -185,7 +228,7 @@ class RunRecorder:
             tool_call_id=tool_call_id, tool_name=tool_name,
             parent_message_id=parent_message_id, args_preview=args_preview or {},
         )
-        self._record(evt)
+        await self._record(evt)
         return evt
 
     async def emit_raw(self, event: AnyRunEvent) -> AnyRunEvent:
@@ -198,7 +241,7 @@ class RunRecorder:
             "seq": self._next_seq(),
             "run_id": self.run_id,
         })
-        self._record(stamped)
+        await self._record(stamped)
         return stamped
 
     def _next_seq(self) -> int:
@@ -206,75 +249,182 @@ class RunRecorder:
         self._seq += 1
         return s
 
-    def _record(self, event: AnyRunEvent) -> None:
-        self._buffer.append(event)
-        self._all_events.append(event)  # Keep full history
+    async def _record(self, event: AnyRunEvent) -> None:
         for c in self._consumers:
             try:
                 c.on_event(event)
             except Exception:
                 logger.exception("consumer.on_event failed; continuing")
-        if self._should_flush(event):
-            self._flush()
-
-    def _should_flush(self, event: AnyRunEvent) -> bool:
-        if event.event_type not in _DELTA_TYPES:
-            return True
-        if len(self._buffer) >= _FLUSH_SIZE:
-            return True
-        if (time.monotonic() - self._last_flush_at) >= _FLUSH_INTERVAL_SECONDS:
-            return True
-        return False
-
-    def _flush(self) -> None:
-        if not self._buffer:
+        key = _segment_key(event)
+        if key is None:
+            await self._close_segment()
+            self._history.append(event)
+            await self._writer.put(event)
             return
-        rows = [
-            AgentRunEventRow(
-                id=None,
-                run_id=e.run_id, seq=e.seq, event_type=e.event_type,
-                payload=e.model_dump(mode="json"),
-                emitted_at=e.emitted_at,
-            )
-            for e in self._buffer
-        ]
-        try:
-            self.session.add_all(rows)
-            self.session.commit()
-        except Exception:
-            logger.exception("event flush failed; dropping %d events", len(rows))
-            self.session.rollback()
-        self._buffer.clear()
-        self._last_flush_at = time.monotonic()
+        if self._segment and _segment_key(self._segment[-1]) != key:
+            await self._close_segment()
+        self._segment.append(event)
+        self._segment_chars += len(_delta_text(event))
+        if self._segment_chars >= _SEGMENT_MAX_CHARS:
+            await self._close_segment()
+
+    async def _close_segment(self) -> None:
+        if not self._segment:
+            return
+        coalesced = _coalesce(self._segment)
+        self._segment = []
+        self._segment_chars = 0
+        self._history.append(coalesced)
+        await self._writer.put(coalesced)
 
-    def _emit_terminal(self, event: AnyRunEvent) -> None:
-        self._buffer.append(event)
-        self._all_events.append(event)
+    async def _emit_terminal(self, event: AnyRunEvent) -> None:
+        self._closed = True
+        await self._close_segment()
+        self._history.append(event)
         for c in self._consumers:
             try:
                 c.on_event(event)
                 c.on_run_finished(event)
             except Exception:
                 logger.exception("consumer terminal fan-out failed")
-        self._flush()
-        run = self.session.get(AgentRunRow, self.run_id)
+        run_values: dict[str, Any] = {
+            "finished_at": _utcnow(),
+            "status": _TERMINAL_STATUS.get(event.event_type, "finished"),
+        }
+        if event.event_type == "run.errored":
+            run_values["error_type"] = getattr(event, "error_type", None)
+            run_values["error_message"] = getattr(event, "error_message", None)
+        if event.event_type == "run.finished":
+            run_values["duration_ms"] = getattr(event, "duration_ms", None)
+            run_values["tokens_in"] = getattr(event, "tokens_in", None)
+            run_values["tokens_out"] = getattr(event, "tokens_out", None)
+        await self._writer.close(event, run_values)
+        # The run row was updated on the writer's connection; make sure a
+        # copy loaded into the caller's session is re-read on next access.
+        run = self.session.identity_map.get(
+            self.session.identity_key(AgentRunRow, self.run_id)
+        )
         if run is not None:
-            run.finished_at = _utcnow()
-            run.status = {
-                "run.finished": "finished",
-                "run.errored": "errored",
-                "run.cancelled": "cancelled",
-            }.get(event.event_type, "finished")
-            if event.event_type == "run.errored":
-                run.error_type = getattr(event, "error_type", None)
-                run.error_message = getattr(event, "error_message", None)
-            if event.event_type == "run.finished":
-                run.duration_ms = getattr(event, "duration_ms", None)
-                run.tokens_in = getattr(event, "tokens_in", None)
-                run.tokens_out = getattr(event, "tokens_out", None)
-            self.session.add(run)
-            self.session.commit()
-        self._closed = True
+            self.session.expire(run)
+
+
+class _EventWriter:
+    """Write-behind persister for one run's events.
+
+    Rows go through a bounded queue drained by a background task. Each drain
+    takes whatever has accumulated (up to ``_WRITE_BATCH_SIZE``) and writes it
+    with one multi-row INSERT on its own connection, so the caller's session
+    and the event loop are never blocked by the DB. With ``async_engine`` the
+    write is awaited on the loop; otherwise it runs on the sync engine in a
+    worker thread. ``put`` only waits when the queue is full, which bounds
+    memory if the DB falls behind.
+    """
+
+    def __init__(
+        self,
+        bind: Engine | Connection,
+        *,
+        run_id: UUID,
+        async_engine: AsyncEngine | None = None,
+    ) -> None:
+        self._engine = bind.engine if isinstance(bind, Connection) else bind
+        self._async_engine = async_engine
+        self._run_id = run_id
+        self._queue: asyncio.Queue[dict[str, Any]] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def put(self, event: AnyRunEvent) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=_WRITE_QUEUE_SIZE)
+            self._task = asyncio.create_task(self._drain(self._queue))
+        await self._queue.put(_event_row(event))
+
+    async def flush(self) -> None:
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self, terminal: AnyRunEvent, run_values: dict[str, Any]) -> None:
+        """Drain pending rows, then write the terminal event and run status together."""
+        await self.flush()
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        await self._persist([_event_row(terminal)], run_values)
+
+    async def _drain(self, queue: asyncio.Queue[dict[str, Any]]) -> None:
+        while True:
+            rows = [await queue.get()]
+            while len(rows) < _WRITE_BATCH_SIZE and not queue.empty():
+                rows.append(queue.get_nowait())
+            try:
+                await self._persist(rows)
+            finally:
+                for _ in rows:
+                    queue.task_done()
+
+    async def _persist(
+        self, rows: list[dict[str, Any]], run_values: dict[str, Any] | None = None
+    ) -> None:
+        if self._async_engine is None:
+            await asyncio.to_thread(self._write, rows, run_values)
+            return
+        try:
+            async with self._async_engine.begin() as conn:
+                if rows:
+                    await conn.execute(insert(AgentRunEventRow), rows)
+                if run_values:
+                    await conn.execute(self._run_update(run_values))
+        except Exception:
+            logger.exception("event flush failed; dropping %d events", len(rows))
+
+    def _write(self, rows: list[dict[str, Any]], run_values: dict[str, Any] | None = None) -> None:
+        try:
+            with self._engine.begin() as conn:
+                if rows:
+                    conn.execute(insert(AgentRunEventRow), rows)
+                if run_values:
+                    conn.execute(self._run_update(run_values))
+        except Exception:
+            logger.exception("event flush failed; dropping %d events", len(rows))
+
+    def _run_update(self, run_values: dict[str, Any]) -> Any:
+        return update(AgentRunRow).where(AgentRunRow.id == self._run_id).values(**run_values)
+
+
+def _segment_key(event: AnyRunEvent) -> tuple[str, str] | None:
+    if event.event_type not in _DELTA_TYPES:
+        return None
+    if event.event_type == "tool.args.delta":
+        return (event.event_type, event.tool_call_id)
+    return (event.event_type, str(event.message_id))
+
+
+def _delta_field(event: AnyRunEvent) -> str:
+    return "delta_json" if event.event_type == "tool.args.delta" else "delta_text"
+
+
+def _delta_text(event: AnyRunEvent) -> str:
+    return getattr(event, _delta_field(event))
+
+
+def _coalesce(segment: list[AnyRunEvent]) -> AnyRunEvent:
+    """Merge a delta segment into its last event, concatenating the deltas."""
+    last = segment[-1]
+    if len(segment) == 1:
+        return last
+    field = _delta_field(last)
+    return last.model_copy(update={field: "".join(_delta_text(e) for e in segment)})
+
+
+def _event_row(event: AnyRunEvent) -> dict[str, Any]:
+    return {
+        "run_id": event.run_id,
+        "seq": event.seq,
+        "event_type": event.event_type,
+        "payload": event.model_dump(mode="json"),
+        "emitted_at": event.emitted_at,
+    }
 
 
 def _utcnow() -> datetime:
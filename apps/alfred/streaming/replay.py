@@ -1,7 +1,15 @@
 """ReplayEngine — load events for a run and yield them in seq order.
 
-Phase 0: bare loader. Phase 5 adds snapshot fast-forward, AG-UI projection,
-and speed-controlled playback.
+Events are streamed with ``yield_per`` so a long run is never materialized in
+full. With ``fast_forward=True`` replay starts from the nearest
+``agent_run_snapshots`` row at or below ``target_seq``: the snapshot is
+yielded as one ``StateSnapshot`` event (carrying ``message_text``,
+``thinking_text`` and ``tokens_so_far``) at the snapshot's seq, followed by
+the events after it.
+
+``replay_frames`` is the re-attach fast path: it maps stored payloads
+straight to AG-UI frames via ``model_construct``, skipping per-event
+validation. Payloads were validated when they were emitted.
 
 Spec: docs/superpowers/specs/2026-05-01-streaming-revamp-design.md section 6.5
 """
@@ -9,36 +17,102 @@ Spec: docs/superpowers/specs/2026-05-01-streaming-revamp-design.md section 6.5
 from __future__ import annotations
 
 from collections.abc import AsyncIterator
+from typing import Any, get_args
 from uuid import UUID
 
 from pydantic import TypeAdapter
 from sqlmodel import Session, select
 
-from alfred.models.streaming import AgentRunEventRow
-from alfred.streaming.events import AnyRunEvent
+from alfred.models.streaming import AgentRunEventRow, AgentRunSnapshotRow
+from alfred.streaming.events import AnyRunEvent, StateSnapshot
+from alfred.streaming.projectors.wire_agui import AGUIProjector
 
 _adapter = TypeAdapter(AnyRunEvent)
+_EVENT_CLASSES = {
+    cls.model_fields["event_type"].default: cls
+    for cls in get_args(get_args(AnyRunEvent)[0])
+}
+_YIELD_PER = 500
 
 
 class ReplayEngine:
     def __init__(self, session: Session) -> None:
         self.session = session
+        self._wire = AGUIProjector()
 
     async def replay(
         self,
         run_id: UUID,
         target_seq: int | None = None,
+        *,
+        fast_forward: bool = False,
     ) -> AsyncIterator[AnyRunEvent]:
+        after_seq = -1
+        if fast_forward:
+            snapshot = self.nearest_snapshot(run_id, target_seq)
+            if snapshot is not None:
+                yield _snapshot_event(snapshot)
+                after_seq = snapshot.up_to_seq
+        for payload in self._payloads(run_id, after_seq, target_seq):
+            yield _adapter.validate_python(payload)
+
+    async def replay_frames(
+        self,
+        run_id: UUID,
+        target_seq: int | None = None,
+        *,
+        fast_forward: bool = True,
+    ) -> AsyncIterator[tuple[int, dict[str, Any]]]:
+        """Yield ``(seq, frame)`` AG-UI wire frames without validating payloads."""
+        after_seq = -1
+        if fast_forward:
+            snapshot = self.nearest_snapshot(run_id, target_seq)
+            if snapshot is not None:
+                for frame in self._wire.frames_for(_snapshot_event(snapshot)):
+                    yield snapshot.up_to_seq, frame
+                after_seq = snapshot.up_to_seq
+        for payload in self._payloads(run_id, after_seq, target_seq):
+            cls = _EVENT_CLASSES.get(payload.get("event_type"))
+            if cls is None:
+                continue
+            for frame in self._wire.frames_for(cls.model_construct(**payload)):
+                yield payload["seq"], frame
+
+    def nearest_snapshot(
+        self, run_id: UUID, target_seq: int | None = None,
+    ) -> AgentRunSnapshotRow | None:
+        """Latest snapshot for ``run_id`` at or below ``target_seq`` (if given)."""
+        stmt = select(AgentRunSnapshotRow).where(AgentRunSnapshotRow.run_id == run_id)
+        if target_seq is not None:
+            stmt = stmt.where(AgentRunSnapshotRow.up_to_seq <= target_seq)
+        stmt = stmt.order_by(AgentRunSnapshotRow.up_to_seq.desc()).limit(1)
+        return self.session.exec(stmt).first()
+
+    def _payloads(self, run_id: UUID, after_seq: int, target_seq: int | None):
         stmt = (
-            select(AgentRunEventRow)
+            select(AgentRunEventRow.payload)
             .where(AgentRunEventRow.run_id == run_id)
+            .where(AgentRunEventRow.seq > after_seq)
             .order_by(AgentRunEventRow.seq)
+            .execution_options(yield_per=_YIELD_PER)
         )
         if target_seq is not None:
             stmt = stmt.where(AgentRunEventRow.seq <= target_seq)
-        rows = self.session.exec(stmt).all()
-        for row in rows:
-            yield _adapter.validate_python(row.payload)
+        yield from self.session.exec(stmt)
+
+
+def _snapshot_event(snapshot: AgentRunSnapshotRow) -> StateSnapshot:
+    return StateSnapshot(
+        run_id=snapshot.run_id,
+        seq=snapshot.up_to_seq,
+        emitted_at=snapshot.created_at,
+        state={
+            **(snapshot.state or {}),
+            "message_text": snapshot.message_text,
+            "thinking_text": snapshot.thinking_text,
+            "tokens_so_far": snapshot.tokens_so_far,
+        },
+    )
 
 
 __all__ = ["ReplayEngine"]
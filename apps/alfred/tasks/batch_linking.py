@@ -3,8 +3,11 @@
 Single-card task: runs suggest_links for one card and auto-creates
 high-confidence links.
 
-Batch coordinator: finds cards with few links and enqueues individual
-link tasks for parallel execution.
+Chunk task: embeds and scores a group of cards with one bulk embedding
+call and one bulk similarity query, then auto-creates links.
+
+Batch coordinator: finds cards with few links and enqueues chunk tasks for
+parallel execution.
 """
 from __future__ import annotations
 
@@ -16,11 +19,40 @@ from sqlmodel import select
 
 from alfred.core.database import SessionLocal
 from alfred.models.zettel import ZettelCard, ZettelLink
+from alfred.schemas.zettel import LinkSuggestion
 from alfred.services.zettelkasten_service import ZettelkastenService
 
 logger = logging.getLogger(__name__)
 
 AUTO_LINK_THRESHOLD = 0.75  # Only auto-create links above this score
+LINK_CHUNK_SIZE = 25  # Cards scored per bulk embedding + similarity pass
+
+
+def _auto_create_links(
+    svc: ZettelkastenService, card_id: int, suggestions: list[LinkSuggestion]
+) -> list[dict]:
+    created_links: list[dict] = []
+    for suggestion in suggestions:
+        if suggestion.scores.composite_score < AUTO_LINK_THRESHOLD:
+            continue
+        try:
+            svc.create_link(
+                from_card_id=card_id,
+                to_card_id=suggestion.to_card_id,
+                type="ai-suggested",
+                context=suggestion.reason,
+                bidirectional=True,
+            )
+            created_links.append({
+                "to_card_id": suggestion.to_card_id,
+                "score": suggestion.scores.composite_score,
+                "reason": suggestion.reason,
+            })
+        except Exception as exc:
+            # Link may already exist (unique constraint)
+            logger.debug("Link creation skipped for %d->%d: %s",
+                         card_id, suggestion.to_card_id, exc)
+    return created_links
 
 
 @shared_task(name="alfred.tasks.batch_linking.link_card")
@@ -41,27 +73,7 @@ def link_card_task(*, card_id: int, min_confidence: float = 0.6, auto_link: bool
             logger.warning("suggest_links failed for card %d: %s", card_id, exc)
             return {"ok": False, "error": str(exc), "card_id": card_id}
 
-        created_links: list[dict] = []
-        if auto_link:
-            for suggestion in suggestions:
-                if suggestion.scores.composite_score >= AUTO_LINK_THRESHOLD:
-                    try:
-                        svc.create_link(
-                            from_card_id=card_id,
-                            to_card_id=suggestion.to_card_id,
-                            type="ai-suggested",
-                            context=suggestion.reason,
-                            bidirectional=True,
-                        )
-                        created_links.append({
-                            "to_card_id": suggestion.to_card_id,
-                            "score": suggestion.scores.composite_score,
-                            "reason": suggestion.reason,
-                        })
-                    except Exception as exc:
-                        # Link may already exist (unique constraint)
-                        logger.debug("Link creation skipped for %d->%d: %s",
-                                     card_id, suggestion.to_card_id, exc)
+        created_links = _auto_create_links(svc, card_id, suggestions) if auto_link else []
 
         return {
             "ok": True,
@@ -74,6 +86,47 @@ def link_card_task(*, card_id: int, min_confidence: float = 0.6, auto_link: bool
         session.close()
 
 
+@shared_task(name="alfred.tasks.batch_linking.link_cards")
+def link_cards_task(
+    *, card_ids: list[int], min_confidence: float = 0.6, auto_link: bool = True
+) -> dict:
+    """Suggest (and optionally auto-create) links for a chunk of cards in bulk."""
+    session = SessionLocal()
+    try:
+        svc = ZettelkastenService(session)
+        try:
+            suggestions_by_card = svc.suggest_links_bulk(
+                card_ids, min_confidence=min_confidence, limit=10
+            )
+        except Exception as exc:
+            logger.warning("suggest_links_bulk failed for cards %s: %s", card_ids, exc)
+            return {"ok": False, "error": str(exc), "card_ids": card_ids}
+
+        results: list[dict] = []
+        for card_id in card_ids:
+            if card_id not in suggestions_by_card:
+                results.append({"ok": False, "error": "Card not found", "card_id": card_id})
+                continue
+            suggestions = suggestions_by_card[card_id]
+            created_links = _auto_create_links(svc, card_id, suggestions) if auto_link else []
+            results.append({
+                "ok": True,
+                "card_id": card_id,
+                "suggestions_found": len(suggestions),
+                "links_created": len(created_links),
+                "created": created_links,
+            })
+
+        return {
+            "ok": True,
+            "card_ids": card_ids,
+            "links_created": sum(r.get("links_created", 0) for r in results),
+            "results": results,
+        }
+    finally:
+        session.close()
+
+
 @shared_task(name="alfred.tasks.batch_linking.batch_link")
 def batch_link_task(
     *,
@@ -90,7 +143,7 @@ def batch_link_task(
         max_existing_links: Only process cards with this many or fewer existing links
         min_confidence: Minimum confidence for suggestions
         auto_link: Auto-create links above AUTO_LINK_THRESHOLD
-        enqueue_only: If True, enqueue individual tasks (parallel). If False, run inline.
+        enqueue_only: If True, enqueue chunk tasks (parallel). If False, run inline.
     """
     session = SessionLocal()
     try:
@@ -123,27 +176,32 @@ def batch_link_task(
         if not card_ids:
             return {"ok": True, "queued": 0, "card_ids": []}
 
+        chunks = [
+            card_ids[i : i + LINK_CHUNK_SIZE] for i in range(0, len(card_ids), LINK_CHUNK_SIZE)
+        ]
         if enqueue_only:
             task_ids: list[str] = []
-            for cid in card_ids:
-                async_result = link_card_task.delay(
-                    card_id=cid,
+            for chunk in chunks:
+                async_result = link_cards_task.delay(
+                    card_ids=chunk,
                     min_confidence=min_confidence,
                     auto_link=auto_link,
                 )
                 task_ids.append(async_result.id)
             return {
                 "ok": True,
-                "queued": len(task_ids),
+                "queued": len(card_ids),
                 "card_ids": card_ids,
                 "task_ids": task_ids,
             }
 
         # Inline mode (for testing)
         results = []
-        for cid in card_ids:
-            result = link_card_task(card_id=cid, min_confidence=min_confidence, auto_link=auto_link)
-            results.append(result)
+        for chunk in chunks:
+            result = link_cards_task(
+                card_ids=chunk, min_confidence=min_confidence, auto_link=auto_link
+            )
+            results.extend(result.get("results", []))
         total_created = sum(r.get("links_created", 0) for r in results)
         return {
             "ok": True,
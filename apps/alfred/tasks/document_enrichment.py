@@ -13,8 +13,9 @@ logger = logging.getLogger(__name__)
 def _auto_link_zettels(card_ids: list[str], session) -> dict:
     """Run suggest_links on each card and auto-create links for high-confidence matches.
 
-    For each newly created zettel, generates an embedding (if missing), finds
-    similar cards via composite scoring, and creates bidirectional links:
+    Missing embeddings for the new zettels are generated with one batched
+    embedding call, similar cards for all of them are found with one bulk
+    similarity query, and bidirectional links are created:
     - confidence >= 0.8: auto-linked as "auto_high" type
     - confidence 0.6-0.8: auto-linked as "auto_suggested" type
 
@@ -27,72 +28,66 @@ def _auto_link_zettels(card_ids: list[str], session) -> dict:
     zk = ZettelkastenService(session=session)
     stats = {"links_created": 0, "cards_processed": 0, "errors": 0}
 
+    parsed_ids: list[int] = []
     for card_id_str in card_ids:
         try:
-            card_id = int(card_id_str)
-            card = zk.get_card(card_id)
-            if not card:
-                logger.warning("Auto-link: card %s not found, skipping", card_id_str)
-                continue
+            parsed_ids.append(int(card_id_str))
+        except (TypeError, ValueError):
+            logger.warning("Auto-link: invalid card id %r, skipping", card_id_str)
+            stats["errors"] += 1
+
+    try:
+        suggestions_by_card = zk.suggest_links_bulk(parsed_ids, min_confidence=0.6, limit=5)
+    except Exception:
+        logger.warning(
+            "Auto-link: bulk link suggestion failed for cards %s",
+            parsed_ids,
+            exc_info=True,
+        )
+        stats["errors"] += len(parsed_ids)
+        return stats
+
+    for card_id in parsed_ids:
+        if card_id not in suggestions_by_card:
+            logger.warning("Auto-link: card %s not found, skipping", card_id)
+            continue
+        stats["cards_processed"] += 1
+
+        for suggestion in suggestions_by_card[card_id]:
+            score = suggestion.scores.composite_score
+            confidence_level = suggestion.scores.confidence
+
+            # Choose link type based on confidence
+            if confidence_level == "high":
+                link_type = "auto_high"
+            else:
+                link_type = "auto_suggested"
 
-            # Ensure the card has an embedding before suggesting links
             try:
-                card = zk.ensure_embedding(card)
+                zk.create_link(
+                    from_card_id=card_id,
+                    to_card_id=suggestion.to_card_id,
+                    type=link_type,
+                    context=suggestion.reason,
+                    bidirectional=True,
+                )
+                stats["links_created"] += 1
+                logger.info(
+                    "Auto-linked card %d -> %d (score=%.3f, confidence=%s, type=%s)",
+                    card_id,
+                    suggestion.to_card_id,
+                    score,
+                    confidence_level,
+                    link_type,
+                )
             except Exception:
                 logger.warning(
-                    "Auto-link: failed to embed card %s, skipping link suggestions",
+                    "Auto-link: failed to create link %d -> %d",
                     card_id,
+                    suggestion.to_card_id,
                     exc_info=True,
                 )
                 stats["errors"] += 1
-                continue
-
-            suggestions = zk.suggest_links(card_id, min_confidence=0.6, limit=5)
-            stats["cards_processed"] += 1
-
-            for suggestion in suggestions:
-                score = suggestion.scores.composite_score
-                confidence_level = suggestion.scores.confidence
-
-                # Choose link type based on confidence
-                if confidence_level == "high":
-                    link_type = "auto_high"
-                else:
-                    link_type = "auto_suggested"
-
-                try:
-                    zk.create_link(
-                        from_card_id=card_id,
-                        to_card_id=suggestion.to_card_id,
-                        type=link_type,
-                        context=suggestion.reason,
-                        bidirectional=True,
-                    )
-                    stats["links_created"] += 1
-                    logger.info(
-                        "Auto-linked card %d -> %d (score=%.3f, confidence=%s, type=%s)",
-                        card_id,
-                        suggestion.to_card_id,
-                        score,
-                        confidence_level,
-                        link_type,
-                    )
-                except Exception:
-                    logger.warning(
-                        "Auto-link: failed to create link %d -> %d",
-                        card_id,
-                        suggestion.to_card_id,
-                        exc_info=True,
-                    )
-                    stats["errors"] += 1
-
-        except Exception:
-            logger.warning(
-                "Auto-link: unexpected error processing card %s",
-                card_id_str,
-                exc_info=True,
-            )
-            stats["errors"] += 1
 
     logger.info(
         "Auto-link complete: %d cards processed, %d links created, %d errors",
@@ -349,19 +344,23 @@ def _create_zettel_from_enrichment(doc_id: str) -> str | None:
                 card_dicts = parse_decomposition_response(raw)
 
                 if card_dicts:
-                    for card_dict in card_dicts:
-                        card_tags = list(set(final_tags + card_dict.get("tags", [])))
-                        card = zk.create_card(
-                            title=card_dict["title"],
-                            content=card_dict["content"],
-                            tags=card_tags,
-                            topic=final_topic,
-                            source_url=source_url,
-                            document_id=doc_id,
-                            importance=5,
-                            confidence=0.7,
-                            status="draft",
-                        )
+                    cards = zk.create_cards_batch(
+                        [
+                            {
+                                "title": card_dict["title"],
+                                "content": card_dict["content"],
+                                "tags": list(set(final_tags + card_dict.get("tags", []))),
+                                "topic": final_topic,
+                                "source_url": source_url,
+                                "document_id": doc_id,
+                                "importance": 5,
+                                "confidence": 0.7,
+                                "status": "draft",
+                            }
+                            for card_dict in card_dicts
+                        ]
+                    )
+                    for card in cards:
                         created_ids.append(str(card.id))
                         logger.info("Created draft zettel %s from document %s", card.id, doc_id)
                 else:
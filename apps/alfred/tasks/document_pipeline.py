@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import time
 
 from celery import shared_task
 
@@ -38,6 +39,74 @@ def _set_pipeline_status(doc_id: str, status: str) -> None:
         )
 
 
+def _set_pipeline_status_many(doc_ids: list[str], status: str) -> None:
+    """Update pipeline_status for a whole batch in one statement."""
+    if not doc_ids:
+        return
+    try:
+        from datetime import UTC, datetime
+
+        from sqlalchemy import update as sa_update
+        from sqlmodel import Session as SMSession
+
+        from alfred.core.database import engine
+        from alfred.models.doc_storage import DocumentRow
+        from alfred.services.doc_storage.utils import parse_uuid as _parse_uuid
+
+        uids = [uid for uid in (_parse_uuid(d) for d in doc_ids) if uid is not None]
+        if not uids:
+            return
+        values: dict = {"pipeline_status": status}
+        if status == "complete":
+            values["processed_at"] = datetime.now(UTC)
+
+        with SMSession(engine) as session:
+            session.exec(
+                sa_update(DocumentRow)
+                .where(DocumentRow.id.in_(uids))
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            session.commit()
+    except Exception:
+        logger.warning(
+            "Failed to set pipeline_status=%s for %d documents",
+            status,
+            len(doc_ids),
+            exc_info=True,
+        )
+
+
+def _claim_pending_documents(limit: int) -> list[str]:
+    """Select up to ``limit`` pending documents and mark them processing."""
+    from sqlalchemy import update as sa_update
+    from sqlmodel import Session as SMSession
+    from sqlmodel import select
+
+    from alfred.core.database import engine
+    from alfred.models.doc_storage import DocumentRow
+
+    with SMSession(engine) as session:
+        stmt = (
+            select(DocumentRow.id)
+            .where(DocumentRow.pipeline_status == "pending")
+            .order_by(DocumentRow.created_at)
+            .limit(limit)
+        )
+        if engine.dialect.name == "postgresql":
+            stmt = stmt.with_for_update(skip_locked=True)
+        uids = list(session.exec(stmt))
+        if uids:
+            session.exec(
+                sa_update(DocumentRow)
+                .where(DocumentRow.id.in_(uids))
+                .values(pipeline_status="processing")
+                .execution_options(synchronize_session=False)
+            )
+        session.commit()
+    return [str(uid) for uid in uids]
+
+
 @shared_task(
     name="alfred.tasks.document_pipeline.run_document_pipeline",
     bind=True,
@@ -54,6 +123,7 @@ def run_document_pipeline(
 ) -> dict:
     """Run the document pipeline graph for a single document."""
     from alfred.core.settings import settings
+    from alfred.pipeline.cache import stage_cache_scope
     from alfred.pipeline.graph import build_pipeline_graph
     from alfred.services.checkpoint_postgres import (
         PostgresCheckpointConfig,
@@ -69,7 +139,9 @@ def run_document_pipeline(
     checkpointer = PostgresCheckpointSaver(
         cfg=PostgresCheckpointConfig(dsn=dsn)
     )
-    graph = build_pipeline_graph(checkpointer=checkpointer)
+    graph = build_pipeline_graph(
+        checkpointer=checkpointer, parallel=settings.pipeline_parallel_stages
+    )
 
     initial_state = {
         "doc_id": doc_id,
@@ -84,12 +156,21 @@ def run_document_pipeline(
     config = {"configurable": {"thread_id": thread_id}}
 
     try:
-        result = graph.invoke(initial_state, config=config)
+        # One stage-cache session for the whole run instead of one per node.
+        started = time.perf_counter()
+        with stage_cache_scope():
+            result = graph.invoke(initial_state, config=config)
+        wall = time.perf_counter() - started
+        timings = result.get("stage_timings", {})
         logger.info(
-            "Pipeline completed for %s: stage=%s, cache_hits=%s",
+            "Pipeline completed for %s: stage=%s, cache_hits=%s, "
+            "wall=%.3fs, stage_sum=%.3fs, timings=%s",
             doc_id,
             result.get("stage"),
             result.get("cache_hits"),
+            wall,
+            sum(timings.values()),
+            {k: round(v, 3) for k, v in timings.items()},
         )
         _set_pipeline_status(doc_id, "complete")
         return {
@@ -97,9 +178,62 @@ def run_document_pipeline(
             "status": "completed",
             "stage": result.get("stage"),
             "cache_hits": result.get("cache_hits", []),
+            "stage_timings": timings,
             "errors": result.get("errors", []),
         }
     except Exception as exc:
         logger.exception("Pipeline failed for %s", doc_id)
         _set_pipeline_status(doc_id, "error")
         raise self.retry(exc=exc) from exc
+
+
+@shared_task(
+    name="alfred.tasks.document_pipeline.run_document_pipeline_batch",
+    bind=True,
+    max_retries=2,
+    default_retry_delay=30,
+)
+def run_document_pipeline_batch(
+    self,
+    *,
+    doc_ids: list[str] | None = None,
+    limit: int | None = None,
+    user_id: str = "",
+    force_replay: bool = False,
+) -> dict:
+    """Run the pipeline over a micro-batch of documents (backfill mode).
+
+    With no ``doc_ids``, claims up to ``limit`` (default
+    ``PIPELINE_BATCH_SIZE``) pending documents.
+    """
+    from alfred.core.settings import settings
+    from alfred.pipeline.batch import run_pipeline_batch
+
+    if doc_ids is None:
+        doc_ids = _claim_pending_documents(limit or settings.pipeline_batch_size)
+    else:
+        _set_pipeline_status_many(doc_ids, "processing")
+    if not doc_ids:
+        return {"status": "empty", "completed": [], "failed": {}}
+
+    try:
+        result = run_pipeline_batch(
+            doc_ids,
+            user_id=user_id,
+            force_replay=force_replay,
+            llm_concurrency=settings.pipeline_batch_llm_concurrency,
+            embed_batch_size=settings.pipeline_batch_embed_size,
+        )
+    except Exception as exc:
+        logger.exception("Pipeline batch failed (%d documents)", len(doc_ids))
+        if self.request.retries >= self.max_retries:
+            _set_pipeline_status_many(doc_ids, "error")
+            raise
+        # Retry this batch, not a fresh claim; the documents stay "processing"
+        # so no other worker picks them up in the meantime.
+        raise self.retry(exc=exc, kwargs={**self.request.kwargs, "doc_ids": doc_ids}) from exc
+
+    # persist() already marked documents rejected at load as errors.
+    _set_pipeline_status_many(result["completed"], "complete")
+    _set_pipeline_status_many(list(result["failed"]), "error")
+    return {"status": "completed", **result}
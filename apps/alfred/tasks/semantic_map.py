@@ -0,0 +1,24 @@
+"""Celery task: refit the stored PCA basis behind the semantic map (Galaxy).
+
+Between refits, new documents are projected onto the stored basis with one
+matrix multiply. A periodic refit lets the basis follow the corpus as it
+grows; it also bumps the map version so cached points are reprojected.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="alfred.tasks.semantic_map.refit_semantic_map_basis")
+def refit_semantic_map_basis(limit: int = 20_000) -> dict:
+    """Refit the semantic-map basis on the latest ``limit`` embedded documents."""
+    from alfred.core.dependencies import get_doc_storage_service
+
+    result = get_doc_storage_service().refit_semantic_map_basis(limit=limit)
+    logger.info("Semantic map basis refit: %s", result)
+    return result
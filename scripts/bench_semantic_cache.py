@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+"""
+Benchmark semantic-cache hit latency: legacy per-candidate lookup vs. the
+batched lookup in ``alfred.core.semantic_cache``.
+
+Redis is simulated in-process with a fixed per-round-trip delay so the
+numbers reflect both CPU work and network round trips. A pipeline or MGET
+counts as a single round trip.
+
+Usage:
+    python scripts/bench_semantic_cache.py --entries 75 --dim 1536 --rtt-us 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "apps"))
+
+from alfred.core.semantic_cache import (
+    RedisSemanticCache,
+    SemanticCacheConfig,
+    _signature,
+)
+
+
+class _SimulatedRedis:
+    """Dict-backed Redis subset that sleeps ``rtt`` seconds per round trip."""
+
+    def __init__(self, rtt: float) -> None:
+        self.rtt = rtt
+        self.kv: dict[str, str] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+
+    def _trip(self) -> None:
+        if self.rtt:
+            time.sleep(self.rtt)
+
+    def get(self, key: str) -> str | None:
+        self._trip()
+        return self.kv.get(key)
+
+    def mget(self, keys: list[str]) -> list[str | None]:
+        self._trip()
+        return [self.kv.get(key) for key in keys]
+
+    def setex(self, key: str, _ttl: int, value: str) -> bool:
+        self.kv[key] = value
+        return True
+
+    def zadd(self, key: str, mapping: dict[str, float]) -> int:
+        self.zsets.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    def _zrevrange(self, key: str, start: int, end: int) -> list[str]:
+        items = sorted(self.zsets.get(key, {}).items(), key=lambda kv: kv[1], reverse=True)
+        return [member for member, _ in items[start : end + 1]]
+
+    def zrevrange(self, key: str, start: int, end: int) -> list[str]:
+        self._trip()
+        return self._zrevrange(key, start, end)
+
+    def zrem(self, key: str, *members: str) -> int:
+        return sum(self.zsets.get(key, {}).pop(m, None) is not None for m in members)
+
+    def pipeline(self, transaction: bool = True) -> _SimulatedPipeline:
+        return _SimulatedPipeline(self)
+
+
+class _SimulatedPipeline:
+    def __init__(self, redis: _SimulatedRedis) -> None:
+        self.redis = redis
+        self.ops: list[tuple[str, int, int]] = []
+
+    def zrevrange(self, key: str, start: int, end: int) -> None:
+        self.ops.append((key, start, end))
+
+    def execute(self, raise_on_error: bool = True) -> list[Any]:
+        self.redis._trip()
+        return [self.redis._zrevrange(*op) for op in self.ops]
+
+
+class _TableEmbedder:
+    def __init__(self, table: dict[str, list[float]]) -> None:
+        self.table = table
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.table[text]
+
+
+def _legacy_signature(vec: list[float], *, bits: int, seed: str) -> str:
+    dim = len(vec)
+    packed: list[int] = []
+    byte = filled = 0
+    for i in range(bits):
+        digest = hashlib.sha256(f"{seed}:{i}:{dim}".encode()).digest()
+        idx = int.from_bytes(digest[:4], "big") % dim
+        byte = (byte << 1) | (1 if float(vec[idx]) >= 0.0 else 0)
+        filled += 1
+        if filled == 8:
+            packed.append(byte)
+            byte = filled = 0
+    if filled:
+        packed.append(byte << (8 - filled))
+    return bytes(packed).hex()
+
+
+def _legacy_get(redis: _SimulatedRedis, config: SemanticCacheConfig, raw_vec: list[float]) -> Any:
+    """Pre-change semantic lookup: sequential GETs, JSON embeddings, Python dot product."""
+    norm = math.sqrt(sum(x * x for x in raw_vec))
+    emb = [x / norm for x in raw_vec]
+    best_value, best_sim = None, float("-inf")
+    for seed in config.bucket_seeds:
+        sig = _legacy_signature(emb, bits=config.bucket_bits, seed=seed)
+        bucket_key = f"legacy:bucket:{sig}"
+        for entry_id in redis.zrevrange(bucket_key, 0, config.max_candidates_per_bucket - 1):
+            raw = redis.get(f"legacy:item:{entry_id}")
+            if not raw:
+                continue
+            candidate = [float(x) for x in json.loads(raw)["embedding"]]
+            sim = sum(x * y for x, y in zip(emb, candidate, strict=False))
+            if sim > best_sim:
+                best_sim, best_value = sim, json.loads(raw)["value"]
+    return best_value if best_sim >= config.similarity_threshold else None
+
+
+def _seed_legacy(redis: _SimulatedRedis, config: SemanticCacheConfig, vectors: np.ndarray) -> None:
+    for i, vec in enumerate(vectors):
+        emb = vec.tolist()
+        redis.setex(f"legacy:item:{i}", 600, json.dumps({"embedding": emb, "value": i}))
+        for seed in config.bucket_seeds:
+            sig = _signature(vec, bits=config.bucket_bits, seed=seed)
+            redis.zadd(f"legacy:bucket:{sig}", {str(i): float(i)})
+
+
+def _time(fn: Any, rounds: int) -> list[float]:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=75, help="Cached entries sharing buckets")
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--rtt-us", type=float, default=200.0, help="Simulated Redis RTT")
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    base = rng.standard_normal(args.dim).astype(np.float32)
+    # Small perturbations of one direction so every entry lands in the same buckets.
+    vectors = base + 0.01 * rng.standard_normal((args.entries, args.dim)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    query = (base / np.linalg.norm(base)).tolist()
+
+    config = SemanticCacheConfig(
+        namespace="bench",
+        similarity_threshold=0.9,
+        bucket_bits=8,
+        max_candidates_per_bucket=max(1, args.entries // 3),
+    )
+    table = {f"entry {i}": vec.tolist() for i, vec in enumerate(vectors)}
+    table["query"] = query
+
+    redis = _SimulatedRedis(rtt=0.0)
+    _seed_legacy(redis, config, vectors)
+    writer = RedisSemanticCache(redis_client=redis, embedder=_TableEmbedder(table), config=config)
+    for i in range(args.entries):
+        writer.set(f"entry {i}", i)
+    redis.rtt = args.rtt_us / 1_000_000
+
+    assert _legacy_get(redis, config, query) is not None
+    legacy = _time(lambda: _legacy_get(redis, config, query), args.rounds)
+
+    def batched_cold() -> None:
+        # A new instance has no local vectors, so this measures the MGET path.
+        cache = RedisSemanticCache(
+            redis_client=redis, embedder=_TableEmbedder(table), config=config
+        )
+        assert cache.get("query") is not None
+
+    warm_cache = RedisSemanticCache(
+        redis_client=redis, embedder=_TableEmbedder(table), config=config
+    )
+    warm_cache.get("query")
+    cold = _time(batched_cold, args.rounds)
+    warm = _time(lambda: warm_cache.get("query"), args.rounds)
+
+    print(f"entries={args.entries} dim={args.dim} rtt={args.rtt_us:.0f}us rounds={args.rounds}")
+    for label, samples in (("legacy", legacy), ("batched", cold), ("batched+local", warm)):
+        print(
+            f"{label:>14}: median {statistics.median(samples):8.3f} ms"
+            f"  p95 {sorted(samples)[int(0.95 * (len(samples) - 1))]:8.3f} ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+"""
+Benchmark the per-call schema overhead of ``LLMService.structured``: building
+the OpenAI ``response_format`` payload from scratch (what every call used to
+do) vs. the process-wide cached payload.
+
+No network is involved; this measures only the CPU work done before the
+request is sent.
+
+Usage:
+    python scripts/bench_structured_schema.py --rounds 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "apps"))
+
+from alfred.services.extraction_service import ClassificationResult, EnrichOut, GraphOut
+from alfred.services.llm_service import _response_format
+
+
+def _time(fn: Callable[[], object], rounds: int) -> list[float]:
+    samples: list[float] = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    uncached = _response_format.__wrapped__
+    print(f"rounds={args.rounds}")
+    for schema in (EnrichOut, GraphOut, ClassificationResult):
+        assert uncached(schema) == _response_format(schema)
+        rebuilt = _time(lambda schema=schema: uncached(schema), args.rounds)
+        cached = _time(lambda schema=schema: _response_format(schema), args.rounds)
+        print(
+            f"{schema.__name__:>22}: rebuild median {statistics.median(rebuilt):8.2f} us"
+            f"  cached median {statistics.median(cached):6.2f} us"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
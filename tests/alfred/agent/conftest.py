@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+import pytest
+
+from alfred.services.agent import context_window
+
+
+@pytest.fixture(autouse=True)
+def _stub_tokenizer(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Count tokens with the chars/4 estimate; tiktoken would fetch its BPE file."""
+    monkeypatch.setattr(context_window, "_load_encoding", lambda _model: None)
+    monkeypatch.setattr(context_window, "_encodings", {})
+    context_window.count_tokens.cache_clear()
@@ -7,11 +7,13 @@ from unittest.mock import MagicMock, patch
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from sqlalchemy import StaticPool
+from sqlalchemy import NullPool
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlmodel import Session, create_engine, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from alfred.api.agent.routes import router as agent_router
-from alfred.api.dependencies import get_db_session
+from alfred.api.dependencies import get_async_db_session, get_db_session
 from alfred.models.thinking import AgentMessageRow, ThinkingSessionRow
 
 # ---------------------------------------------------------------------------
@@ -20,12 +22,17 @@ from alfred.models.thinking import AgentMessageRow, ThinkingSessionRow
 
 
 @pytest.fixture()
-def db_session():
-    """In-memory SQLite session with only the tables we need."""
+def db_path(tmp_path):
+    """SQLite file shared by the sync and async sessions."""
+    return tmp_path / "agent.db"
+
+
+@pytest.fixture()
+def db_session(db_path):
+    """SQLite session with only the tables we need."""
     engine = create_engine(
-        "sqlite://",
+        f"sqlite:///{db_path}",
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
     )
     # Create only the tables for models we use
     ThinkingSessionRow.metadata.create_all(
@@ -40,15 +47,23 @@ def db_session():
 
 
 @pytest.fixture()
-def app_and_client(db_session: Session):
-    """FastAPI app + TestClient wired to the in-memory session."""
+def app_and_client(db_session: Session, db_path):
+    """FastAPI app + TestClient wired to the test database."""
     app = FastAPI()
     app.include_router(agent_router)
+    # NullPool: the TestClient runs the app on its own event loop.
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", poolclass=NullPool)
+    async_factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
 
     def _override_db():
         yield db_session
 
+    async def _override_async_db():
+        async with async_factory() as session:
+            yield session
+
     app.dependency_overrides[get_db_session] = _override_db
+    app.dependency_overrides[get_async_db_session] = _override_async_db
     client = TestClient(app)
     return app, client, db_session
 
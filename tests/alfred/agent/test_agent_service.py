@@ -33,6 +33,11 @@ async def test_stream_turn_executes_same_turn_tool_calls_concurrently(monkeypatc
         return {"name": name, "value": args["value"], "db_id": id(db)}
 
     monkeypatch.setattr("alfred.services.agent.service.execute_tool", fake_execute_tool)
+    # Prompt building would otherwise try Redis for notifications and skew the timing.
+    monkeypatch.setattr(
+        "alfred.services.knowledge_notifications.get_pending_notifications",
+        lambda limit=10: [],
+    )
 
     service = AgentService(SimpleNamespace(), tool_session_factory=session_factory)
     monkeypatch.setattr(service, "_build_api_kwargs", lambda _model, _messages: {})
@@ -0,0 +1,161 @@
+"""Token-bounded conversation context and tool-output compaction."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+from sqlalchemy import StaticPool
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from alfred.models.thinking import AgentMessageRow, ThinkingSessionRow
+from alfred.services.agent.context_window import (
+    ConversationContext,
+    compact_tool_outputs,
+    load_thread_history,
+)
+
+MODEL = "gpt-4o-mini"
+
+
+@pytest.fixture()
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            ThinkingSessionRow.metadata.create_all,
+            tables=[ThinkingSessionRow.__table__, AgentMessageRow.__table__],
+        )
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def _thread_with_messages(session_factory, count: int) -> int:
+    async with session_factory() as db:
+        thread = ThinkingSessionRow(title="Long chat", session_type="agent")
+        db.add(thread)
+        await db.commit()
+        for idx in range(count):
+            role = "user" if idx % 2 == 0 else "assistant"
+            db.add(AgentMessageRow(thread_id=thread.id, role=role, content=f"message {idx} " * 20))
+        await db.commit()
+        return thread.id
+
+
+async def _history(session_factory, thread_id: int) -> list[dict[str, Any]]:
+    async with session_factory() as db:
+        return await load_thread_history(db, thread_id)
+
+
+async def _thread(session_factory, thread_id: int) -> ThinkingSessionRow:
+    async with session_factory() as db:
+        return await db.get(ThinkingSessionRow, thread_id)
+
+
+class _Summarizer:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str | None, int]] = []
+
+    async def __call__(self, summary: str | None, messages: list[dict[str, Any]]) -> str:
+        self.calls.append((summary, len(messages)))
+        return f"summary after {len(self.calls)} folds"
+
+
+async def test_build_folds_aged_out_turns_into_persisted_summary(session_factory) -> None:
+    thread_id = await _thread_with_messages(session_factory, 30)
+    summarize = _Summarizer()
+    context = ConversationContext(
+        model=MODEL,
+        max_history_tokens=100_000,
+        max_messages=10,
+        summarize=summarize,
+        session_factory=session_factory,
+    )
+
+    window = await context.build(thread_id=thread_id, history=await _history(session_factory, thread_id))
+
+    assert window.folded == 24
+    assert window.dropped == 0
+    assert window.messages[0]["role"] == "system"
+    assert "summary after 1 folds" in window.messages[0]["content"]
+    assert len(window.messages) == 1 + 6
+    assert all("id" not in m for m in window.messages)
+
+    thread = await _thread(session_factory, thread_id)
+    assert thread.context_summary == "summary after 1 folds"
+    # Only the unsummarized tail is loaded next turn, so nothing is folded twice.
+    tail = await _history(session_factory, thread_id)
+    assert len(tail) == 6
+    assert tail[0]["id"] == thread.context_summary_through + 1
+
+    window = await context.build(thread_id=thread_id, history=tail)
+    assert window.folded == 0
+    assert summarize.calls == [(None, 24)]
+
+
+async def test_client_history_without_ids_is_trimmed_not_summarized(session_factory) -> None:
+    summarize = _Summarizer()
+    context = ConversationContext(
+        model=MODEL,
+        max_history_tokens=200,
+        max_messages=50,
+        summarize=summarize,
+        session_factory=session_factory,
+    )
+    history = [{"role": "user", "content": "word " * 100} for _ in range(5)]
+
+    window = await context.build(thread_id=None, history=history)
+
+    assert window.history_tokens <= 200
+    assert window.dropped == 5 - len(window.messages)
+    assert window.messages
+    assert summarize.calls == []
+
+
+async def test_failed_summary_keeps_previous_watermark(session_factory) -> None:
+    thread_id = await _thread_with_messages(session_factory, 30)
+
+    async def failing(_summary: str | None, _messages: list[dict[str, Any]]) -> str:
+        raise RuntimeError("model unavailable")
+
+    context = ConversationContext(
+        model=MODEL,
+        max_history_tokens=100_000,
+        max_messages=10,
+        summarize=failing,
+        session_factory=session_factory,
+    )
+    window = await context.build(thread_id=thread_id, history=await _history(session_factory, thread_id))
+
+    assert window.folded == 0
+    assert window.dropped == 24
+    assert (await _thread(session_factory, thread_id)).context_summary_through is None
+
+
+def _tool_round(call_id: str, output: str) -> list[dict[str, Any]]:
+    call = {"id": call_id, "type": "function", "function": {"name": "search_kb", "arguments": "{}"}}
+    return [
+        {"role": "assistant", "content": None, "tool_calls": [call]},
+        {"role": "tool", "tool_call_id": call_id, "content": output},
+    ]
+
+
+def test_compact_tool_outputs_elides_earlier_large_results() -> None:
+    big = json.dumps({"results": [{"title": f"card {i}", "body": "x" * 200} for i in range(50)]})
+    messages = [
+        {"role": "user", "content": "find cards"},
+        *_tool_round("call_1", big),
+        *_tool_round("call_2", big),
+    ]
+
+    assert compact_tool_outputs(messages, model=MODEL, max_tokens=500) == 1
+
+    first = json.loads(messages[2]["content"])
+    assert first["elided"] is True
+    assert first["tool"] == "search_kb"
+    assert first["ref"]
+    # The latest round's result stays intact for the model to read.
+    assert messages[4]["content"] == big
+    assert compact_tool_outputs(messages, model=MODEL, max_tokens=500) == 0
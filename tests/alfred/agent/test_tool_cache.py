@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from sqlalchemy import create_engine
+from sqlmodel import Session, SQLModel
+
+from alfred.models.zettel import ZettelCard
+from alfred.services.agent.harness import AgentEventType, AgentRunContext, AgentRunTrace
+from alfred.services.agent.tool_cache import ToolResultCache
+from alfred.services.agent.tool_runtime import execute_tool_with_harness
+
+
+@pytest.fixture()
+def db() -> Session:
+    engine = create_engine("sqlite:///:memory:")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+class _CountingExecutor:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def __call__(self, tool_name: str, args: dict[str, Any], _db: Session) -> dict[str, Any]:
+        self.calls.append(tool_name)
+        if tool_name == "create_zettel":
+            return {"action": "created", "zettel_id": 1}
+        return {"results": [{"title": args.get("query")}], "count": 1}
+
+
+def _completed(trace: AgentRunTrace) -> list[dict[str, Any]]:
+    return [e.data for e in trace.events if e.type == AgentEventType.TOOL_COMPLETED]
+
+
+async def test_read_tool_results_are_reused_with_counters(db: Session) -> None:
+    cache = ToolResultCache()
+    executor = _CountingExecutor()
+    trace = AgentRunTrace(AgentRunContext(agent_name="test"))
+
+    first = await execute_tool_with_harness(
+        "search_kb", {"query": "rag"}, db, trace=trace, executor=executor, cache=cache
+    )
+    second = await execute_tool_with_harness(
+        "search_kb", {"query": "rag"}, db, trace=trace, executor=executor, cache=cache
+    )
+
+    assert first == second
+    assert executor.calls == ["search_kb"]
+    events = _completed(trace)
+    assert [e["cache"] for e in events] == ["miss", "hit"]
+    assert events[-1]["cache_hits"] == 1
+    assert events[-1]["cache_misses"] == 1
+
+
+async def test_write_tools_bypass_and_invalidate(db: Session) -> None:
+    cache = ToolResultCache()
+    executor = _CountingExecutor()
+    trace = AgentRunTrace(AgentRunContext(agent_name="test"))
+
+    await execute_tool_with_harness("search_kb", {"query": "rag"}, db, executor=executor, cache=cache)
+    await execute_tool_with_harness(
+        "create_zettel", {"title": "t"}, db, trace=trace, executor=executor, cache=cache
+    )
+    await execute_tool_with_harness("search_kb", {"query": "rag"}, db, executor=executor, cache=cache)
+
+    assert executor.calls == ["search_kb", "create_zettel", "search_kb"]
+    assert "cache" not in _completed(trace)[0]
+
+
+async def test_data_version_changes_when_zettels_are_written(db: Session) -> None:
+    cache = ToolResultCache(version_ttl_seconds=0)
+    executor = _CountingExecutor()
+
+    await execute_tool_with_harness("get_zettel", {"zettel_id": 1}, db, executor=executor, cache=cache)
+    db.add(ZettelCard(title="New card", content="body"))
+    db.commit()
+    await execute_tool_with_harness("get_zettel", {"zettel_id": 1}, db, executor=executor, cache=cache)
+
+    assert executor.calls == ["get_zettel", "get_zettel"]
+
+
+async def test_error_results_are_not_cached(db: Session) -> None:
+    cache = ToolResultCache()
+    calls: list[str] = []
+
+    async def failing(tool_name: str, _args: dict[str, Any], _db: Session) -> dict[str, Any]:
+        calls.append(tool_name)
+        return {"error": "backend down"}
+
+    for _ in range(2):
+        await execute_tool_with_harness("web_search_searxng", {"q": "x"}, db, executor=failing, cache=cache)
+
+    assert len(calls) == 2
@@ -43,6 +43,7 @@ def _stub_embeddings(monkeypatch: pytest.MonkeyPatch):
     def _patched_init(self, session):
         original_init(self, session)
         self.ensure_embedding = MagicMock(side_effect=lambda card: card)
+        self._assign_embeddings = MagicMock(return_value=[])
 
     monkeypatch.setattr(zk_mod.ZettelkastenService, "__init__", _patched_init)
 
@@ -206,9 +207,9 @@ def test_bulk_rejects_ended_session(client: TestClient, db_session: Session) ->
 def test_bulk_from_decomposition_cards_appear_as_link_candidates_for_each_other(
     client: TestClient, db_session: Session, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    """Iron-rule regression: every created card must be pushed through
-    ensure_embedding so Qdrant sees it and they can auto-link later (T2)."""
-    synced_card_ids: list[int] = []
+    """Iron-rule regression: every created card must be pushed through the
+    batch embedding step so Qdrant sees it and they can auto-link later (T2)."""
+    synced_cards: list = []
 
     import alfred.services.zettelkasten_service as zk_mod
 
@@ -217,12 +218,11 @@ def test_bulk_from_decomposition_cards_appear_as_link_candidates_for_each_other(
     def _recording_init(self, session):
         original_init(self, session)
 
-        def _record(card):
-            if card.id is not None:
-                synced_card_ids.append(card.id)
-            return card
+        def _record(cards):
+            synced_cards.extend(cards)
+            return []
 
-        self.ensure_embedding = _record
+        self._assign_embeddings = _record
 
     monkeypatch.setattr(zk_mod.ZettelkastenService, "__init__", _recording_init)
 
@@ -234,7 +234,7 @@ def test_bulk_from_decomposition_cards_appear_as_link_candidates_for_each_other(
     body = resp.json()
     card_ids = body["created_card_ids"]
     assert len(card_ids) == 3
-    assert set(synced_card_ids) == set(card_ids)
+    assert {card.id for card in synced_cards} == set(card_ids)
 
 
 def test_bulk_replaces_legacy_bulk_route_contract(client: TestClient) -> None:
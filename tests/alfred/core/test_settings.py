@@ -26,3 +26,13 @@ def test_notes_filesystem_roots_accepts_docker_env_strings(
     settings = Settings(_env_file=None)
 
     assert settings.notes_filesystem_roots == expected
+
+
+def test_qdrant_local_path_resolves_against_the_repo_root(monkeypatch: pytest.MonkeyPatch) -> None:
+    from alfred.core.settings import _PROJECT_ROOT
+
+    monkeypatch.setenv("QDRANT_LOCAL_PATH", "data/qdrant")
+    assert Settings(_env_file=None).qdrant_local_path == str(_PROJECT_ROOT / "data" / "qdrant")
+
+    monkeypatch.setenv("QDRANT_LOCAL_PATH", "")
+    assert Settings(_env_file=None).qdrant_local_path is None
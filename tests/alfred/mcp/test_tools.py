@@ -5,6 +5,7 @@ Uses SQLite in-memory DB, same pattern as test_zettelkasten_service.py.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import tempfile
 from dataclasses import dataclass
@@ -51,6 +52,9 @@ def _make_engine_and_session():
 class _FakeAlfredContext:
     session_factory: Any
     session_id: str = "test-session-id"
+    api: Any = None
+    api_app: Any = None
+    api_base: str = "in-process Alfred API"
 
 
 class _FakeRequestContext:
@@ -67,6 +71,16 @@ class _FakeContext:
         )
 
 
+@pytest.fixture(autouse=True)
+def _isolated_call_log(monkeypatch, tmp_path):
+    """Fresh session-log buffer per test, writing under tmp_path instead of ~/.alfred."""
+    from alfred.mcp import tools
+
+    monkeypatch.setattr(tools, "_call_log", tools._CallLogWriter())
+    monkeypatch.setattr(tools, "_LOG_DIR", tmp_path)
+    monkeypatch.setattr(tools, "_LOG_FILE", tmp_path / "mcp-sessions.jsonl")
+
+
 def _fixture():
     """Create an in-memory session + fake MCP context.
 
@@ -296,3 +310,109 @@ def test_log_call_writes_jsonl():
         assert line["tool"] == "search_knowledge"
         assert line["session_id"] == "test-session"
         assert line["results_count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_log_call_buffers_until_flush():
+    from alfred.mcp.tools import _log_call, flush_call_log
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = Path(tmp) / "mcp-sessions.jsonl"
+
+        with patch("alfred.mcp.tools._LOG_DIR", Path(tmp)), patch(
+            "alfred.mcp.tools._LOG_FILE", log_file
+        ):
+            _log_call("test-session", "get_zettel", zettel_id=1)
+            _log_call("test-session", "get_zettel", zettel_id=2)
+            assert not log_file.exists()
+            await flush_call_log()
+
+        lines = [json.loads(line) for line in log_file.read_text().splitlines()]
+        assert [line["zettel_id"] for line in lines] == [1, 2]
+
+
+def test_log_call_flushes_when_loop_shuts_down(tmp_path):
+    from alfred.mcp.tools import _log_call
+
+    async def _tool_call():
+        _log_call("test-session", "get_zettel", zettel_id=1)
+
+    # asyncio.run cancels the pending flush timer on shutdown.
+    asyncio.run(_tool_call())
+
+    line = json.loads((tmp_path / "mcp-sessions.jsonl").read_text())
+    assert line["zettel_id"] == 1
+
+
+def test_lines_from_a_closed_loop_keep_their_log_file(tmp_path):
+    from alfred.mcp.tools import _log_call
+
+    first, second = tmp_path / "first.jsonl", tmp_path / "second.jsonl"
+
+    async def _tool_call():
+        _log_call("test-session", "get_zettel", zettel_id=1)
+
+    with patch("alfred.mcp.tools._LOG_FILE", first):
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(_tool_call())
+        # Closed without cancelling tasks, so the flush timer never runs.
+        loop.close()
+    with patch("alfred.mcp.tools._LOG_FILE", second):
+        _log_call("test-session", "search_knowledge", results_count=3)
+
+    assert json.loads(first.read_text())["zettel_id"] == 1
+    assert json.loads(second.read_text())["results_count"] == 3
+
+
+# ---------------------------------------------------------------------------
+# alfred_api / openapi spec (in-process transport)
+# ---------------------------------------------------------------------------
+
+
+def _in_process_context():
+    import httpx
+    from fastapi import FastAPI
+
+    api_app = FastAPI(title="Test API", version="1.2.3")
+
+    @api_app.get("/items")
+    def list_items(limit: int = 10) -> list[dict[str, int]]:
+        return [{"id": i} for i in range(limit)]
+
+    client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=api_app, raise_app_exceptions=False),
+        base_url="http://alfred.internal",
+    )
+    alfred_ctx = _FakeAlfredContext(session_factory=None, api=client, api_app=api_app)
+    ctx = _FakeContext(session_factory=None)
+    ctx.request_context.lifespan_context = alfred_ctx
+    return ctx, alfred_ctx, api_app
+
+
+@pytest.mark.asyncio
+async def test_alfred_api_calls_app_in_process():
+    from alfred.mcp.tools import alfred_api
+
+    ctx, alfred_ctx, _ = _in_process_context()
+    async with alfred_ctx.api:
+        result = await alfred_api(method="get", path="/items", query_params={"limit": "2"}, ctx=ctx)
+        missing = await alfred_api(method="GET", path="/missing", ctx=ctx)
+
+    assert result == {"data": [{"id": 0}, {"id": 1}]}
+    assert missing["error"] == "HTTP 404"
+
+
+@pytest.mark.asyncio
+async def test_openapi_spec_is_built_once_per_app_version():
+    from alfred.mcp.tools import _OPENAPI_CACHE, _openapi_json
+
+    _, alfred_ctx, api_app = _in_process_context()
+    _OPENAPI_CACHE.clear()
+    with patch.object(api_app, "openapi", wraps=api_app.openapi) as build:
+        first = await _openapi_json(alfred_ctx)
+        second = await _openapi_json(alfred_ctx)
+
+    assert first is second
+    assert build.call_count == 1
+    assert json.loads(first)["info"]["version"] == "1.2.3"
+    assert "Test API:1.2.3" in _OPENAPI_CACHE
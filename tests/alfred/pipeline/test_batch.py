@@ -0,0 +1,127 @@
+"""Micro-batched pipeline runner with mocked services."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+from unittest.mock import MagicMock, patch
+
+from alfred.pipeline.batch import run_pipeline_batch
+
+
+def _doc(doc_id: str, text: str) -> dict:
+    return {"id": doc_id, "title": doc_id, "cleaned_text": text, "raw_markdown": text}
+
+
+def _chunk(idx: int, text: str) -> MagicMock:
+    return MagicMock(**{"model_dump.return_value": {"idx": idx, "text": text}})
+
+
+def test_batch_embeds_all_chunks_together():
+    """Chunks of every document go through one index_documents call."""
+    docs = {"d1": _doc("d1", "alpha"), "d2": _doc("d2", "beta"), "d3": _doc("d3", "boom")}
+    doc_svc = MagicMock()
+    doc_svc.get_document_details.side_effect = lambda doc_id: docs[doc_id]
+
+    chunk_svc = MagicMock()
+    chunk_svc.chunk.side_effect = lambda text: [_chunk(0, text), _chunk(1, text)]
+
+    extract_svc = MagicMock()
+    extract_svc.extract_all.return_value = {"summary": {"short": "s"}, "tags": []}
+    extract_svc.extract_graph.return_value = {"entities": [], "relations": [], "topics": []}
+
+    def _classify(*, text):
+        if text == "boom":
+            raise RuntimeError("llm down")
+        return {"domain": "Test"}
+
+    extract_svc.classify_taxonomy.side_effect = _classify
+
+    knowledge_svc = MagicMock()
+    knowledge_svc.index_documents.side_effect = lambda docs, batch_size: [d["id"] for d in docs]
+
+    cache = MagicMock()
+    cache.get.return_value = None
+    cache.get_many.return_value = {}
+
+    targets = {
+        "alfred.pipeline.nodes.load_document._get_doc_storage": doc_svc,
+        "alfred.pipeline.nodes.chunk._get_chunking_service": chunk_svc,
+        "alfred.pipeline.nodes.extract._get_extraction_service": extract_svc,
+        "alfred.pipeline.nodes.extract._get_cache": cache,
+        "alfred.pipeline.nodes.classify._get_extraction_service": extract_svc,
+        "alfred.pipeline.nodes.classify._get_cache": cache,
+        "alfred.pipeline.batch._get_cache": cache,
+        "alfred.pipeline.batch._get_knowledge_service": knowledge_svc,
+        "alfred.pipeline.nodes.persist._get_doc_storage": doc_svc,
+    }
+    with contextlib.ExitStack() as stack:
+        for target, mock_obj in targets.items():
+            stack.enter_context(patch(target, return_value=mock_obj))
+        result = run_pipeline_batch(
+            ["d1", "d2", "d3"], llm_concurrency=2, embed_batch_size=512
+        )
+
+    assert sorted(result["completed"]) == ["d1", "d2"]
+    assert set(result["failed"]) == {"d3"}
+    assert result["chunks_indexed"] == 4
+
+    knowledge_svc.index_documents.assert_called_once()
+    indexed = knowledge_svc.index_documents.call_args.args[0]
+    assert [d["id"] for d in indexed] == ["d1:0", "d1:1", "d2:0", "d2:1"]
+    assert knowledge_svc.index_documents.call_args.kwargs["batch_size"] == 512
+    knowledge_svc.delete_stale_chunks.assert_called_once_with(
+        ["d1", "d2"], ["d1:0", "d1:1", "d2:0", "d2:1"]
+    )
+    assert doc_svc.update_document_enrichment.call_count == 2
+
+
+def test_batch_skips_llm_stages_for_cached_documents():
+    """One get_many per stage picks out cached documents before any LLM call."""
+    docs = {"d1": _doc("d1", "alpha"), "d2": _doc("d2", "beta")}
+    doc_svc = MagicMock()
+    doc_svc.get_document_details.side_effect = lambda doc_id: docs[doc_id]
+
+    chunk_svc = MagicMock()
+    chunk_svc.chunk.side_effect = lambda text: [_chunk(0, text)]
+
+    extract_svc = MagicMock()
+    extract_svc.extract_all.return_value = {"summary": {"short": "fresh"}, "tags": []}
+    extract_svc.extract_graph.return_value = {"entities": [], "relations": [], "topics": []}
+    extract_svc.classify_taxonomy.return_value = {"domain": "Fresh"}
+
+    knowledge_svc = MagicMock()
+    knowledge_svc.index_documents.side_effect = lambda docs, batch_size: [d["id"] for d in docs]
+
+    cached_hash = hashlib.sha256(b"alpha").hexdigest()
+    cache = MagicMock()
+    cache.get.return_value = None
+    cache.get_many.side_effect = lambda stage, keys: {
+        key: {"summary": {"short": "cached"}} if stage == "extract" else {"domain": "Cached"}
+        for key in keys
+        if key == cached_hash
+    }
+
+    targets = {
+        "alfred.pipeline.nodes.load_document._get_doc_storage": doc_svc,
+        "alfred.pipeline.nodes.chunk._get_chunking_service": chunk_svc,
+        "alfred.pipeline.nodes.extract._get_extraction_service": extract_svc,
+        "alfred.pipeline.nodes.extract._get_cache": cache,
+        "alfred.pipeline.nodes.classify._get_extraction_service": extract_svc,
+        "alfred.pipeline.nodes.classify._get_cache": cache,
+        "alfred.pipeline.batch._get_cache": cache,
+        "alfred.pipeline.batch._get_knowledge_service": knowledge_svc,
+        "alfred.pipeline.nodes.persist._get_doc_storage": doc_svc,
+    }
+    with contextlib.ExitStack() as stack:
+        for target, mock_obj in targets.items():
+            stack.enter_context(patch(target, return_value=mock_obj))
+        result = run_pipeline_batch(["d1", "d2"], llm_concurrency=2)
+
+    assert sorted(result["completed"]) == ["d1", "d2"]
+    assert [c.args[0] for c in cache.get_many.call_args_list] == ["extract", "classify"]
+    # Only the uncached document reaches the LLM, and nothing is read row by row.
+    extract_svc.extract_all.assert_called_once()
+    assert extract_svc.extract_all.call_args.kwargs["cleaned_text"] == "beta"
+    extract_svc.classify_taxonomy.assert_called_once_with(text="beta")
+    cache.get.assert_not_called()
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import pytest
-from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel import Session, SQLModel, create_engine, select
 
-from alfred.pipeline.cache import PipelineStageCache
+from alfred.pipeline import cache as cache_mod
+from alfred.pipeline.cache import (
+    PipelineStageCache,
+    PipelineStageCacheRow,
+    current_stage_cache,
+    stage_cache_scope,
+)
 
 
 @pytest.fixture()
@@ -41,3 +47,49 @@ def test_cache_different_stages(db_session: Session):
     cache.set("classify", "abc123", {"stage": "classify"})
     assert cache.get("extract", "abc123")["stage"] == "extract"
     assert cache.get("classify", "abc123")["stage"] == "classify"
+
+
+def test_cache_overwrite_keeps_single_row(db_session: Session):
+    cache = PipelineStageCache(session=db_session)
+    cache.set("extract", "abc123", {"v": 1})
+    cache.set("extract", "abc123", {"v": 2})
+    rows = db_session.exec(select(PipelineStageCacheRow)).all()
+    assert len(rows) == 1
+
+
+def test_cache_get_many(db_session: Session):
+    cache = PipelineStageCache(session=db_session)
+    cache.set("extract", "a", {"v": "a"})
+    cache.set("extract", "b", {"v": "b"})
+    cache.set("classify", "c", {"v": "c"})
+
+    found = cache.get_many("extract", ["a", "b", "c", "missing", "a"])
+
+    assert found == {"a": {"v": "a"}, "b": {"v": "b"}}
+    assert cache.get_many("extract", []) == {}
+
+
+def test_stage_cache_scope_shares_one_session(monkeypatch):
+    engine = create_engine("sqlite:///:memory:")
+    SQLModel.metadata.create_all(engine)
+    opened: list[Session] = []
+
+    def session_factory() -> Session:
+        session = Session(engine)
+        opened.append(session)
+        return session
+
+    monkeypatch.setattr("alfred.core.database.SessionLocal", session_factory)
+
+    with pytest.raises(RuntimeError):
+        current_stage_cache()
+
+    with stage_cache_scope() as outer:
+        with stage_cache_scope() as inner:
+            assert inner is outer
+            assert current_stage_cache() is outer
+            inner.set("extract", "abc123", {"v": 1})
+        assert outer.get("extract", "abc123") == {"v": 1}
+
+    assert len(opened) == 1
+    assert cache_mod._scoped_cache.get() is None
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import MagicMock, Mock, call, patch
 
 
 def test_run_document_pipeline_calls_graph():
@@ -41,3 +41,39 @@ def test_run_document_pipeline_calls_graph():
     initial_state = call_args[0][0]
     assert initial_state["doc_id"] == "d1"
     assert initial_state["force_replay"] is False
+
+
+def _run_batch_eagerly(outcomes: list) -> tuple[object, MagicMock, MagicMock, MagicMock]:
+    from alfred.tasks.document_pipeline import run_document_pipeline_batch
+
+    run_batch = MagicMock(side_effect=outcomes)
+    claim = MagicMock(return_value=["d1", "d2"])
+    set_status = MagicMock()
+    with patch("alfred.pipeline.batch.run_pipeline_batch", run_batch), patch(
+        "alfred.tasks.document_pipeline._claim_pending_documents", claim
+    ), patch("alfred.tasks.document_pipeline._set_pipeline_status_many", set_status), patch.object(
+        run_document_pipeline_batch, "default_retry_delay", 0
+    ):
+        result = run_document_pipeline_batch.apply(kwargs={"limit": 2})
+    return result, run_batch, claim, set_status
+
+
+def test_batch_retry_reruns_the_same_documents():
+    ok = {"completed": ["d1", "d2"], "failed": {}, "chunks_indexed": 2}
+    result, run_batch, claim, set_status = _run_batch_eagerly(
+        [RuntimeError("qdrant down"), ok]
+    )
+
+    assert result.get()["status"] == "completed"
+    claim.assert_called_once_with(2)
+    assert [c.args[0] for c in run_batch.call_args_list] == [["d1", "d2"], ["d1", "d2"]]
+    assert call(["d1", "d2"], "error") not in set_status.call_args_list
+
+
+def test_batch_marks_documents_errored_once_retries_are_exhausted():
+    result, run_batch, claim, set_status = _run_batch_eagerly([RuntimeError("qdrant down")] * 3)
+
+    assert result.failed()
+    claim.assert_called_once()
+    assert run_batch.call_count == 3
+    assert set_status.call_args_list.count(call(["d1", "d2"], "error")) == 1
@@ -108,6 +108,38 @@ def test_full_pipeline_runs_all_stages():
     assert "classification" in result
 
 
+def test_parallel_pipeline_joins_at_persist():
+    """Parallel variant fans extract/classify/embed out and persists once."""
+    graph = build_pipeline_graph(checkpointer=MemorySaver(), parallel=True)
+
+    mocks = _mock_all_services()
+    with contextlib.ExitStack() as stack:
+        for target, mock_obj in mocks.items():
+            stack.enter_context(patch(target, return_value=mock_obj))
+
+        result = graph.invoke(
+            {
+                "doc_id": "d1",
+                "user_id": "u1",
+                "errors": [],
+                "cache_hits": [],
+                "force_replay": False,
+                "replay_from": None,
+            },
+            config={"configurable": {"thread_id": "d1-parallel"}},
+        )
+
+    assert result["stage"] == "persist"
+    assert result["embedding_indexed"] is True
+    assert "enrichment" in result
+    assert "classification" in result
+    assert set(result["stage_timings"]) == {
+        "load_document", "chunk", "extract", "classify", "embed", "persist",
+    }
+    doc_svc = mocks["alfred.pipeline.nodes.persist._get_doc_storage"]
+    doc_svc.update_document_enrichment.assert_called_once()
+
+
 def test_pipeline_checkpoint_saves():
     """Pipeline checkpoints after each node."""
     checkpointer = MemorySaver()
@@ -208,6 +208,9 @@ def test_embed_node():
     call_args = mock_svc.index_documents.call_args[0][0]
     assert call_args[0]["id"] == "d1:0"
     assert call_args[0]["text"] == "chunk 0"
+    # Stale chunks are pruned only after the new ones are written.
+    assert [c[0] for c in mock_svc.method_calls] == ["index_documents", "delete_stale_chunks"]
+    mock_svc.delete_stale_chunks.assert_called_once_with(["d1"], ["d1:0", "d1:1"])
 
 
 # -- persist --
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from alfred.pipeline.router import resolve_next_stage
+from alfred.pipeline.router import resolve_next_stage, resolve_parallel_stages
 from alfred.pipeline.state import DocumentPipelineState
 
 
@@ -48,3 +48,17 @@ def test_replay_from_classify():
         "replay_from": "classify",
     }
     assert resolve_next_stage(state) == "classify"
+
+
+def test_parallel_routing_fans_out_from_replay_target():
+    """replay_from=classify runs classify and embed side by side."""
+    state: DocumentPipelineState = {
+        "doc_id": "d1",
+        "cleaned_text": "hello",
+        "content_hash": "abc",
+        "chunks": [{"idx": 0, "text": "hello"}],
+        "replay_from": "classify",
+    }
+    assert resolve_parallel_stages(state) == ["classify", "embed"]
+    state["replay_from"] = None
+    assert resolve_parallel_stages(state) == ["extract", "classify", "embed"]
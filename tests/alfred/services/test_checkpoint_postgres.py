@@ -0,0 +1,176 @@
+"""PostgresCheckpointSaver against a mocked psycopg pool."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any, ClassVar
+
+import pytest
+from langgraph.checkpoint.base import WRITES_IDX_MAP, empty_checkpoint
+
+from alfred.services import checkpoint_postgres
+from alfred.services.checkpoint_postgres import PostgresCheckpointConfig, PostgresCheckpointSaver
+
+DSN = "postgresql://alfred@db/alfred"
+
+
+class _FakeCursor:
+    def __init__(self, conn: _FakeConnection) -> None:
+        self._conn = conn
+
+    def __enter__(self) -> _FakeCursor:
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        return None
+
+    def execute(self, sql: str, params: Any = None) -> None:
+        self._conn.statements.append(("execute", " ".join(sql.split()), params))
+        if self._conn.fail_on and self._conn.fail_on in sql:
+            raise RuntimeError("statement failed")
+
+    def executemany(self, sql: str, rows: list[tuple[Any, ...]]) -> None:
+        self._conn.statements.append(("executemany", " ".join(sql.split()), list(rows)))
+        if self._conn.fail_on and self._conn.fail_on in sql:
+            raise RuntimeError("statement failed")
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.statements: list[tuple[str, str, Any]] = []
+        self.transactions: list[str] = []
+        self.fail_on: str | None = None
+
+    def cursor(self) -> _FakeCursor:
+        return _FakeCursor(self)
+
+    @contextmanager
+    def transaction(self):
+        try:
+            yield
+        except BaseException:
+            self.transactions.append("rollback")
+            raise
+        self.transactions.append("commit")
+
+
+class _FakePool:
+    instances: ClassVar[list[_FakePool]] = []
+
+    def __init__(self, dsn: str, **kwargs: Any) -> None:
+        self.dsn = dsn
+        self.kwargs = kwargs
+        self.conn = _FakeConnection()
+        self.checkouts = 0
+        self.unavailable = False
+        _FakePool.instances.append(self)
+
+    @contextmanager
+    def connection(self):
+        if self.unavailable:
+            raise RuntimeError("pool timeout")
+        self.checkouts += 1
+        yield self.conn
+
+
+@pytest.fixture()
+def pool_cls(monkeypatch: pytest.MonkeyPatch):
+    _FakePool.instances = []
+    monkeypatch.setattr(checkpoint_postgres, "ConnectionPool", _FakePool)
+    checkpoint_postgres._get_pool.cache_clear()
+    yield _FakePool
+    checkpoint_postgres._get_pool.cache_clear()
+
+
+def _saver(**overrides: Any) -> PostgresCheckpointSaver:
+    return PostgresCheckpointSaver(cfg=PostgresCheckpointConfig(dsn=DSN, **overrides))
+
+
+def _config(checkpoint_id: str | None = None) -> dict[str, Any]:
+    configurable = {"thread_id": "thread-1", "checkpoint_ns": ""}
+    if checkpoint_id:
+        configurable["checkpoint_id"] = checkpoint_id
+    return {"configurable": configurable}
+
+
+def _writes(conn: _FakeConnection) -> list[tuple[str, str, Any]]:
+    return [
+        s for s in conn.statements if "alfred_lg_checkpoint_writes" in s[1] and "INSERT" in s[1]
+    ]
+
+
+def test_savers_with_the_same_dsn_share_one_pool(pool_cls) -> None:
+    first, second = _saver(pool_max_size=4), _saver(pool_max_size=4)
+
+    first.delete_thread("thread-1")
+    second.delete_thread("thread-1")
+    first.delete_thread("thread-2")
+
+    assert len(pool_cls.instances) == 1
+    pool = pool_cls.instances[0]
+    assert pool.dsn == DSN
+    assert pool.kwargs["max_size"] == 4
+    assert pool.kwargs["kwargs"] == {"autocommit": True}
+    # One schema check per saver, then one checkout per call.
+    assert pool.checkouts == 5
+
+
+def test_put_writes_inserts_all_writes_in_one_batch(pool_cls) -> None:
+    saver = _saver()
+    saver.put_writes(
+        _config("cp-1"),
+        [("messages", "hello"), ("__error__", "boom"), ("steps", 3)],
+        task_id="task-1",
+    )
+
+    conn = pool_cls.instances[0].conn
+    ((kind, sql, rows),) = _writes(conn)
+    assert kind == "executemany"
+    assert "ON CONFLICT" in sql and "DO NOTHING" in sql
+    assert [(row[4], row[5]) for row in rows] == [
+        (0, "messages"),
+        (WRITES_IDX_MAP["__error__"], "__error__"),
+        (2, "steps"),
+    ]
+    assert {row[:4] for row in rows} == {("thread-1", "", "cp-1", "task-1")}
+
+
+def test_put_writes_without_writes_does_not_touch_the_database(pool_cls) -> None:
+    saver = _saver()
+    saver.put_writes(_config("cp-1"), [], task_id="task-1")
+
+    assert _writes(pool_cls.instances[0].conn) == []
+
+
+def test_put_rolls_back_blobs_when_the_checkpoint_insert_fails(pool_cls) -> None:
+    saver = _saver()
+    saver.delete_thread("warm-up")  # create the pool and schema
+    conn = pool_cls.instances[0].conn
+    conn.fail_on = "INSERT INTO alfred_lg_checkpoints"
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = {"messages": ["hi"]}
+
+    with pytest.raises(RuntimeError, match="statement failed"):
+        saver.put(_config(), checkpoint, {}, {"messages": 1})
+
+    assert conn.transactions == ["rollback"]
+    blob_batches = [s for s in conn.statements if s[0] == "executemany"]
+    assert len(blob_batches) == 1
+    assert blob_batches[0][2][0][2:4] == ("messages", "1")
+
+
+def test_schema_init_is_retried_after_a_failure(pool_cls, caplog) -> None:
+    saver = _saver()
+    pool = checkpoint_postgres._get_pool(DSN, 1, 8)
+    pool.unavailable = True
+
+    with pytest.raises(RuntimeError, match="pool timeout"):
+        saver.delete_thread("thread-1")
+    assert "schema init failed" in caplog.text
+    assert saver._schema_ready is False
+
+    pool.unavailable = False
+    saver.delete_thread("thread-1")
+
+    assert saver._schema_ready is True
+    assert any("CREATE TABLE" in sql for _kind, sql, _params in pool.conn.statements)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 from unittest.mock import MagicMock, patch
 
@@ -98,6 +99,79 @@ class TestDetectClusters:
             assert len(cluster["color"]) == 7  # #RRGGBB
 
 
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+
+    def get(self, key: str) -> str | None:
+        return self.store.get(key)
+
+    def set(self, key: str, value: str, **_kwargs: object) -> None:
+        self.store[key] = value
+
+
+def _blobs(n_per: int, centers: list[list[float]], seed: int = 0) -> tuple[list[int], np.ndarray]:
+    rng = np.random.RandomState(seed)
+    rows = [np.asarray(c) + rng.randn(n_per, len(c)) * 0.05 for c in centers]
+    X = np.vstack(rows).astype(np.float32)
+    return list(range(1, len(X) + 1)), X
+
+
+class TestPersistedClusterModel:
+    @patch("alfred.services.clustering_service.get_redis_client")
+    def test_cluster_ids_stable_across_refreshes(self, mock_get_redis: MagicMock) -> None:
+        mock_get_redis.return_value = _FakeRedis()
+        svc = ClusteringService()
+        ids, X = _blobs(10, [[0.0, 0.0], [5.0, 5.0]])
+
+        first = svc.cluster_matrix(ids, X)
+        second = svc.cluster_matrix(ids, X + 0.01)
+
+        assert {c["id"]: c["card_ids"] for c in first} == {
+            c["id"]: c["card_ids"] for c in second
+        }
+        assert "zettel:graph:cluster_model" in mock_get_redis.return_value.store
+
+    @patch("alfred.services.clustering_service.get_redis_client")
+    def test_new_cards_join_nearest_existing_cluster(self, mock_get_redis: MagicMock) -> None:
+        mock_get_redis.return_value = _FakeRedis()
+        svc = ClusteringService()
+        ids, X = _blobs(10, [[0.0, 0.0], [5.0, 5.0]])
+        first = svc.cluster_matrix(ids, X)
+        near_origin = next(c["id"] for c in first if 1 in c["card_ids"])
+
+        grown = svc.cluster_matrix([*ids, 99], np.vstack([X, [[0.02, -0.01]]]))
+
+        assert 99 in next(c["card_ids"] for c in grown if c["id"] == near_origin)
+
+    @patch("alfred.services.clustering_service.get_redis_client")
+    def test_counts_track_current_membership(self, mock_get_redis: MagicMock) -> None:
+        redis = _FakeRedis()
+        mock_get_redis.return_value = redis
+        svc = ClusteringService()
+        ids, X = _blobs(10, [[0.0, 0.0], [5.0, 5.0]])
+
+        for _ in range(5):
+            svc.cluster_matrix(ids, X)
+
+        model = json.loads(redis.store["zettel:graph:cluster_model"])
+        assert sorted(model["counts"]) == [10.0, 10.0]
+
+    @patch("alfred.services.clustering_service.get_redis_client")
+    def test_refit_on_drift_keeps_matching_ids(self, mock_get_redis: MagicMock) -> None:
+        mock_get_redis.return_value = _FakeRedis()
+        svc = ClusteringService()
+        ids, X = _blobs(10, [[0.0, 0.0], [5.0, 5.0]])
+        first = svc.cluster_matrix(ids, X)
+        origin_id = next(c["id"] for c in first if 1 in c["card_ids"])
+
+        # Split the far blob in two; the origin blob keeps its id.
+        ids2, X2 = _blobs(10, [[0.0, 0.0], [5.0, 5.0], [-5.0, 5.0]], seed=1)
+        refit = svc.cluster_matrix(ids2, X2)
+
+        assert origin_id in {c["id"] for c in refit if 1 in c["card_ids"]}
+
+
 # ---------------------------------------------------------------------------
 # detect_knowledge_gaps
 # ---------------------------------------------------------------------------
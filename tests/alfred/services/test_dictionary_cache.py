@@ -0,0 +1,150 @@
+"""Tiered dictionary cache and offline snapshot."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import Session, SQLModel
+
+from alfred.services.dictionary_cache import DictionaryCache, cache_key
+from alfred.services.dictionary_snapshot import DictionarySnapshot, build_snapshot
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+
+    def get(self, key: str) -> str | None:
+        return self.store.get(key)
+
+    def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.store[key] = value
+
+    def ttl(self, key: str) -> int:
+        return 60 if key in self.store else -2
+
+
+@pytest.fixture()
+def session_factory():
+    engine = create_engine("sqlite:///:memory:")
+    SQLModel.metadata.create_all(engine)
+    return sessionmaker(bind=engine, class_=Session, expire_on_commit=False)
+
+
+def test_cache_key_normalizes_word_and_domains() -> None:
+    assert cache_key("  Ephemeral ") == "ephemeral"
+    assert cache_key("Ephemeral", ["ML", " finance", "ml"]) == "ephemeral|finance,ml"
+    assert cache_key("ephemeral", []) == "ephemeral|"
+
+
+def test_shared_tiers_backfill_faster_tiers(session_factory) -> None:
+    redis = _FakeRedis()
+    writer = DictionaryCache(redis=redis, session_factory=session_factory)
+    writer.set("wiktionary", "ephemeral", {"definitions": []})
+
+    # A fresh process sees the Postgres row once Redis has lost the key.
+    redis.store.clear()
+    reader = DictionaryCache(redis=redis, session_factory=session_factory)
+    assert reader.get("wiktionary", "ephemeral") == {"definitions": []}
+    assert "dictionary:wiktionary:ephemeral" in redis.store
+
+    redis.store.clear()
+    with patch.object(reader, "_db_get", side_effect=AssertionError("LRU miss")):
+        assert reader.get("wiktionary", "ephemeral") == {"definitions": []}
+
+
+def test_expired_rows_are_misses(session_factory) -> None:
+    cache = DictionaryCache(lru_size=0, session_factory=session_factory)
+    with patch.dict("alfred.services.dictionary_cache.SOURCE_TTL_SECONDS", {"ai": -1}):
+        cache.set("ai", "ephemeral|", {"text": "stale"})
+    assert cache.get("ai", "ephemeral|") is None
+
+
+async def test_lookup_reuses_cached_sources() -> None:
+    from alfred.services.dictionary_service import lookup
+
+    response = MagicMock(status_code=200)
+    response.json.return_value = {
+        "en": [{"partOfSpeech": "Adjective", "definitions": [{"definition": "Brief."}]}]
+    }
+    client = MagicMock(is_closed=False)
+    client.get = AsyncMock(return_value=response)
+    llm = MagicMock()
+    llm.chat_async = AsyncMock(return_value="Short-lived.")
+    cache = DictionaryCache()
+
+    with (
+        patch("alfred.services.dictionary_service._http_client", return_value=client),
+        patch(
+            "alfred.services.dictionary_service.retrieve_wikipedia",
+            return_value={"items": [{"content": "Summary."}]},
+        ) as wiki,
+    ):
+        first = await lookup("ephemeral", user_domains=["ml"], llm=llm, cache=cache)
+        second = await lookup("ephemeral", user_domains=["ML"], llm=llm, cache=cache)
+
+    assert first.to_dict() == second.to_dict()
+    assert client.get.await_count == 1
+    assert wiki.call_count == 1
+    assert llm.chat_async.await_count == 1
+
+
+async def test_failed_fetch_is_not_cached() -> None:
+    from alfred.services.dictionary_service import _fetch_wiktionary
+
+    client = MagicMock(is_closed=False)
+    client.get = AsyncMock(side_effect=RuntimeError("offline"))
+    cache = DictionaryCache()
+    with patch("alfred.services.dictionary_service._http_client", return_value=client):
+        assert (await _fetch_wiktionary("ephemeral", cache))["definitions"] == []
+    assert cache.get("wiktionary", "ephemeral") is None
+
+
+def _write_dump(path: Path, records: list[dict]) -> None:
+    with gzip.open(path, "wt", encoding="utf-8") as fh:
+        for record in records:
+            fh.write(json.dumps(record) + "\n")
+
+
+def test_snapshot_groups_parts_of_speech(tmp_path: Path) -> None:
+    dump = tmp_path / "dump.jsonl.gz"
+    _write_dump(
+        dump,
+        [
+            {
+                "word": "Ephemeral",
+                "lang_code": "en",
+                "pos": "adj",
+                "senses": [{"glosses": ["Lasting briefly."], "examples": [{"text": "An ex."}]}],
+                "sounds": [{"ipa": "/ɪˈfɛm(ə)ɹəl/"}],
+                "etymology_text": "From Greek.",
+            },
+            {"word": "ephemera", "lang_code": "fr", "pos": "noun", "senses": [{"glosses": ["x"]}]},
+            {
+                "word": "ephemeral",
+                "lang_code": "en",
+                "pos": "noun",
+                "senses": [{"glosses": ["Something short-lived."]}],
+            },
+        ],
+    )
+    target = tmp_path / "dictionary.sqlite"
+    assert build_snapshot(dump, target) == 1
+
+    snapshot = DictionarySnapshot(target)
+    try:
+        entry = snapshot.get("  EPHEMERAL")
+        assert entry is not None
+        assert [d["part_of_speech"] for d in entry["definitions"]] == ["Adj", "Noun"]
+        assert entry["definitions"][0]["senses"][0]["examples"] == ["An ex."]
+        assert entry["pronunciation_ipa"] == "/ɪˈfɛm(ə)ɹəl/"
+        assert entry["etymology"] == "From Greek."
+        assert snapshot.get("ephemera") is None
+    finally:
+        snapshot.close()
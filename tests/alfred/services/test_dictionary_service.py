@@ -157,7 +157,7 @@ async def test_lookup_stream_yields_lookup_before_ai_tokens():
         "etymology": None,
     }
 
-    async def fake_wikipedia(_word: str) -> str:
+    async def fake_wikipedia(_word: str, _cache=None) -> str:
         return "A short encyclopedia summary."
 
     with (
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Session, SQLModel
+
+from alfred.models.doc_storage import DocumentRow
+from alfred.services.doc_storage import _retrieval_mixin
+from alfred.services.doc_storage_pg import DocStorageService
+
+
+def _make_doc(title: str, text: str, *, created_at: datetime) -> DocumentRow:
+    return DocumentRow(
+        id=uuid.uuid4(),
+        source_url="https://example.com",
+        canonical_url="https://example.com",
+        domain="example.com",
+        title=title,
+        content_type="web",
+        cleaned_text=text,
+        tokens=2,
+        hash=str(uuid.uuid4()),
+        day_bucket=created_at.date(),
+        captured_at=created_at,
+        captured_hour=created_at.hour,
+        processed_at=created_at,
+        created_at=created_at,
+        updated_at=created_at,
+        meta={},
+    )
+
+
+def _seed(session: Session, count: int) -> list[DocumentRow]:
+    base = datetime.utcnow().replace(tzinfo=UTC)
+    docs = [
+        _make_doc(
+            f"Doc {i}",
+            "graph databases" if i % 2 else "hello",
+            created_at=base - timedelta(minutes=i),
+        )
+        for i in range(count)
+    ]
+    session.add_all(docs)
+    session.commit()
+    return docs
+
+
+def _count_queries(engine) -> list[str]:
+    seen: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if "count(" in statement.lower():
+            seen.append(statement)
+
+    return seen
+
+
+def test_explorer_cursor_pages_reuse_cached_total() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    SQLModel.metadata.create_all(engine)
+    counts = _count_queries(engine)
+
+    with Session(engine) as session:
+        _seed(session, 5)
+        svc = DocStorageService(session=session)
+
+        first = svc.list_explorer_documents(limit=2, search="graph")
+        assert first["total_count"] == 2
+        assert first["next_cursor"] is None or len(first["items"]) == 2
+
+        page = svc.list_explorer_documents(limit=2)
+        seen_ids = [item["id"] for item in page["items"]]
+        while page["next_cursor"]:
+            page = svc.list_explorer_documents(limit=2, cursor=page["next_cursor"])
+            seen_ids.extend(item["id"] for item in page["items"])
+            assert page["total_count"] == 5
+
+        assert len(seen_ids) == 5
+        # One count for the search, one for the unfiltered listing.
+        assert len(counts) == 2
+
+
+def test_document_writes_invalidate_cached_totals() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        docs = _seed(session, 3)
+        svc = DocStorageService(session=session)
+
+        assert svc.list_documents(q="Renamed")["total"] == 0
+        svc.update_document_text(str(docs[0].id), title="Renamed doc")
+        assert svc.list_documents(q="Renamed")["total"] == 1
+
+
+def test_search_filter_uses_fulltext_column_when_available(monkeypatch) -> None:
+    engine = create_engine("sqlite:///:memory:")
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        assert _retrieval_mixin._supports_document_fulltext(session) is False
+        fallback = str(_retrieval_mixin._document_search_filter(session, "graph"))
+        assert "cleaned_text" in fallback
+
+        monkeypatch.setattr(_retrieval_mixin, "_supports_document_fulltext", lambda _s: True)
+        clause = _retrieval_mixin._document_search_filter(session, "graph db")
+        sql = str(clause.compile(dialect=postgresql.dialect()))
+        assert "documents.search_vector @@ websearch_to_tsquery" in sql
+        assert "cleaned_text" not in sql
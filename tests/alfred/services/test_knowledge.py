@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import pytest
 from qdrant_client import QdrantClient
 
 from alfred.services.knowledge import KnowledgeService
@@ -36,3 +37,90 @@ def test_knowledge_index_and_search():
     results = svc.search("alpha", limit=2)
     assert isinstance(results, list)
     assert 0 <= len(results) <= 2
+
+
+def test_knowledge_collection_created_lazily_with_inferred_size():
+    client = QdrantClient(":memory:")
+    svc = KnowledgeService(collection_name="lazy_ks", client=client, embedder=_FakeEmbedder(dim=4))
+
+    assert svc.search("anything") == []
+    assert svc.count() == 0
+    assert not client.collection_exists("lazy_ks")
+
+    svc.index_documents([{"id": "d1", "text": "alpha"}])
+    info = client.get_collection("lazy_ks")
+    assert info.config.params.vectors.size == 4
+    assert svc.count() == 1
+
+
+def test_knowledge_delete_by_parent_removes_only_that_documents_chunks():
+    client = QdrantClient(":memory:")
+    svc = KnowledgeService(
+        collection_name="chunks_ks", client=client, embedder=_FakeEmbedder(dim=4), vector_size=4
+    )
+    svc.index_documents(
+        [
+            {"id": "a:0", "text": "one", "meta": {"doc_id": "a"}},
+            {"id": "a:1", "text": "two", "meta": {"doc_id": "a"}},
+            {"id": "b:0", "text": "three", "meta": {"doc_id": "b"}},
+        ]
+    )
+
+    svc.delete_by_parent("a")
+    assert svc.count() == 1
+    assert {hit["doc_id"] for hit in svc.search("x", limit=5)} == {"b:0"}
+
+
+def test_knowledge_delete_stale_chunks_keeps_the_current_ones():
+    client = QdrantClient(":memory:")
+    svc = KnowledgeService(
+        collection_name="stale_ks", client=client, embedder=_FakeEmbedder(dim=4), vector_size=4
+    )
+    svc.index_documents(
+        [
+            {"id": "a:0", "text": "one", "meta": {"doc_id": "a"}},
+            {"id": "a:1", "text": "two", "meta": {"doc_id": "a"}},
+            {"id": "a:2", "text": "three", "meta": {"doc_id": "a"}},
+            {"id": "b:0", "text": "four", "meta": {"doc_id": "b"}},
+        ]
+    )
+
+    # "a" was re-chunked into two chunks.
+    kept = svc.index_documents(
+        [{"id": f"a:{i}", "text": "new", "meta": {"doc_id": "a"}} for i in (0, 1)]
+    )
+    svc.delete_stale_chunks(["a"], kept)
+
+    assert {hit["doc_id"] for hit in svc.search("x", limit=10)} == {"a:0", "a:1", "b:0"}
+
+
+def test_local_qdrant_client_refuses_a_locked_store(monkeypatch, tmp_path):
+    import qdrant_client
+
+    from alfred.core import dependencies
+
+    def _locked(**_kwargs):
+        raise RuntimeError("Storage folder is already accessed by another instance")
+
+    monkeypatch.setattr(dependencies.settings, "qdrant_local_path", str(tmp_path / "qdrant"))
+    monkeypatch.setattr(qdrant_client, "QdrantClient", _locked)
+    dependencies.get_local_qdrant_client.cache_clear()
+    try:
+        with pytest.raises(RuntimeError, match="QDRANT_URL"):
+            dependencies.get_local_qdrant_client()
+    finally:
+        dependencies.get_local_qdrant_client.cache_clear()
+
+
+def test_get_knowledge_service_is_process_wide(monkeypatch):
+    from alfred.core import dependencies
+
+    client = QdrantClient(":memory:")
+    monkeypatch.setattr(dependencies, "get_qdrant_client", lambda: client)
+    dependencies.get_knowledge_service.cache_clear()
+    try:
+        first = dependencies.get_knowledge_service()
+        assert first is dependencies.get_knowledge_service()
+        assert first.client is client
+    finally:
+        dependencies.get_knowledge_service.cache_clear()
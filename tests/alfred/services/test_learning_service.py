@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 import pytest
 from sqlalchemy import create_engine
 from sqlmodel import Session, SQLModel
 
-from alfred.models.learning import LearningReview
+from alfred.models.learning import (
+    LearningEntity,
+    LearningEntityRelation,
+    LearningResourceEntity,
+    LearningReview,
+)
 from alfred.services.learning_service import LearningService
 
 try:  # avoid ImportError when sqlmodel.select is unavailable in minimal envs
@@ -144,3 +150,49 @@ def test_planner_prioritizes_due_reviews(db_session: Session) -> None:
     assert items
     assert items[0]["topic_id"] == topic.id
     assert items[0]["review_id"] is not None
+
+
+def test_extract_resource_concepts_bulk_upserts(db_session: Session) -> None:
+    svc = LearningService(db_session)
+    topic = svc.create_topic(name="Transformers")
+    resource = svc.add_resource(topic=topic, title="Attention", document_id="doc-1")
+    db_session.add(LearningEntity(name="Attention", type=None))
+    db_session.commit()
+
+    graph = {
+        "entities": [
+            {"name": "Attention", "type": "Concept"},
+            {"name": "Softmax", "type": "Function"},
+            {"name": "Softmax", "type": None},
+            {"name": " "},
+        ],
+        "relations": [
+            {"from": "Attention", "to": "Softmax", "type": "USES"},
+            {"from": "Attention", "to": "Unknown"},
+        ],
+    }
+    with (
+        patch("alfred.services.learning_service.DocStorageService") as doc_svc,
+        patch("alfred.services.learning_service.ExtractionService") as extract_svc,
+        patch.object(LearningService, "_maybe_graph", return_value=None),
+    ):
+        doc_svc.return_value.get_document_text.return_value = "text"
+        extract_svc.return_value.extract_graph.return_value = graph
+        svc.extract_resource_concepts(resource=resource)
+        # Re-extraction must not duplicate entities or links.
+        svc.extract_resource_concepts(resource=resource)
+
+    entities = {e.name: e for e in db_session.exec(select(LearningEntity))}
+    assert set(entities) == {"Attention", "Softmax"}
+    assert entities["Attention"].type == "Concept"
+    assert entities["Softmax"].type == "Function"
+
+    links = list(db_session.exec(select(LearningResourceEntity)))
+    assert {link.entity_id for link in links} == {e.id for e in entities.values()}
+    assert len(links) == 2
+
+    relations = list(db_session.exec(select(LearningEntityRelation)))
+    assert {(r.from_entity_id, r.to_entity_id, r.type) for r in relations} == {
+        (entities["Attention"].id, entities["Softmax"].id, "USES")
+    }
+    assert resource.extracted_at is not None
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from alfred.core.settings import LLMProvider
+from alfred.services.extraction_service import ClassificationResult, GraphOut
+from alfred.services.llm_service import LLMService, _response_format
+
+
+def _completion(content: str) -> SimpleNamespace:
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class _Completions:
+    def __init__(self) -> None:
+        self.response_formats: list[object] = []
+
+    def create(self, **kwargs):  # type: ignore[no-untyped-def]
+        self.response_formats.append(kwargs["response_format"])
+        return _completion('{"entities": [], "relations": [], "topics": ["a"]}')
+
+
+class _AsyncCompletions(_Completions):
+    async def create(self, **kwargs):  # type: ignore[no-untyped-def,override]
+        return super().create(**kwargs)
+
+
+def _client(completions: _Completions) -> SimpleNamespace:
+    return SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+
+def test_response_format_is_strict_and_inlined() -> None:
+    payload = _response_format(ClassificationResult)
+
+    assert payload["type"] == "json_schema"
+    assert payload["json_schema"]["name"] == "ClassificationResult"
+    assert payload["json_schema"]["strict"] is True
+    schema = payload["json_schema"]["schema"]
+    assert "$defs" not in schema
+    assert schema["additionalProperties"] is False
+    assert schema["required"] == list(schema["properties"])
+    topic = schema["properties"]["topic"]
+    assert topic["additionalProperties"] is False
+    assert topic["required"] == ["title", "confidence"]
+
+
+@pytest.mark.asyncio
+async def test_sync_and_async_paths_share_cached_response_format(monkeypatch) -> None:
+    sync_completions = _Completions()
+    async_completions = _AsyncCompletions()
+    svc = LLMService(
+        openai_client=_client(sync_completions),  # type: ignore[arg-type]
+        openai_async_client=_client(async_completions),  # type: ignore[arg-type]
+    )
+    monkeypatch.setattr(svc.cfg, "llm_provider", LLMProvider.openai)
+
+    messages = [{"role": "user", "content": "x"}]
+    first = svc.structured(messages, GraphOut)
+    second = svc.structured(messages, GraphOut)
+    third = await svc.structured_async(messages, GraphOut)
+
+    assert first.topics == second.topics == third.topics == ["a"]
+    formats = sync_completions.response_formats + async_completions.response_formats
+    assert len(formats) == 3
+    assert all(fmt is formats[0] for fmt in formats)
+    assert formats[0] is _response_format(GraphOut)
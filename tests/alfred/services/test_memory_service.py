@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import uuid
+from datetime import timedelta
+from typing import ClassVar
+
 from sqlalchemy import create_engine
 from sqlmodel import Session, SQLModel
 
+from alfred.core.utils import utcnow
+from alfred.models.doc_storage import QuickNoteRow
+from alfred.schemas.documents import NoteCreate
 from alfred.schemas.intelligence import MemoryCreateRequest
 from alfred.services.doc_storage_pg import DocStorageService
 from alfred.services.memory_service import MemoryService
@@ -52,3 +59,109 @@ def test_memory_service_context_scoring() -> None:
     assert ctx
     assert any("typescript" in item.text.lower() for item in ctx)
     assert all("score" in (item.metadata or {}) for item in ctx)
+
+
+class _KeywordEmbeddings:
+    """Deterministic embeddings: one axis per concept, synonyms share an axis."""
+
+    _AXES: ClassVar[dict[str, int]] = {
+        "frontend": 0,
+        "react": 0,
+        "ui": 0,
+        "coffee": 1,
+        "espresso": 1,
+        "deploy": 2,
+        "release": 2,
+    }
+
+    def __init__(self) -> None:
+        self.document_calls = 0
+        self.query_calls = 0
+
+    def _vector(self, text: str) -> list[float]:
+        vec = [0.0, 0.0, 0.0, 0.01]
+        for word in text.lower().replace(".", " ").replace(",", " ").split():
+            if word in self._AXES:
+                vec[self._AXES[word]] += 1.0
+        return vec
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.document_calls += len(texts)
+        return [self._vector(t) for t in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        self.query_calls += 1
+        return self._vector(text)
+
+
+def test_memory_columns_and_embedding_are_written_once() -> None:
+    session = _session()
+    embeddings = _KeywordEmbeddings()
+    svc = MemoryService(doc_storage=DocStorageService(session=session), embedding_model=embeddings)
+
+    created = svc.create_memory(MemoryCreateRequest(text="Ship React UI changes.", user_id=7))
+
+    row = session.get(QuickNoteRow, uuid.UUID(created.id))
+    assert row is not None
+    assert (row.kind, row.user_id) == ("memory", 7)
+    assert row.embedding and row.embedding[0] > 0
+    assert embeddings.document_calls == 1
+
+
+def test_context_recall_matches_paraphrases_per_user() -> None:
+    session = _session()
+    embeddings = _KeywordEmbeddings()
+    svc = MemoryService(doc_storage=DocStorageService(session=session), embedding_model=embeddings)
+
+    svc.create_memory(MemoryCreateRequest(text="Build interfaces with React.", user_id=1))
+    svc.create_memory(MemoryCreateRequest(text="Drinks espresso before standup.", user_id=1))
+    svc.create_memory(MemoryCreateRequest(text="Prefers React for dashboards.", user_id=2))
+
+    ctx = svc.get_context_memories(query="frontend work", user_id=1, limit=5)
+
+    # No shared tokens with the query: only the vector path can find it.
+    assert [item.text for item in ctx] == ["Build interfaces with React."]
+    assert ctx[0].metadata["score"] > 0.9
+
+    # New writes are picked up by the existing index slice.
+    svc.create_memory(MemoryCreateRequest(text="Keep the UI minimal.", user_id=1))
+    ctx = svc.get_context_memories(query="frontend work", user_id=1, limit=5)
+    assert {item.text for item in ctx} == {"Build interfaces with React.", "Keep the UI minimal."}
+
+
+def test_context_recall_prefers_recent_memories_at_equal_similarity() -> None:
+    session = _session()
+    svc = MemoryService(
+        doc_storage=DocStorageService(session=session), embedding_model=_KeywordEmbeddings()
+    )
+    old = svc.create_memory(MemoryCreateRequest(text="Release on Fridays.", user_id=3))
+    svc.create_memory(MemoryCreateRequest(text="Release on Tuesdays.", user_id=3))
+    row = session.get(QuickNoteRow, uuid.UUID(old.id))
+    row.created_at = utcnow() - timedelta(days=365)
+    session.add(row)
+    session.commit()
+
+    ctx = svc.get_context_memories(query="deploy", user_id=3, limit=2)
+
+    assert [item.text for item in ctx] == ["Release on Tuesdays.", "Release on Fridays."]
+    assert ctx[0].metadata["score"] > ctx[1].metadata["score"]
+
+
+def test_list_memories_filters_and_pages_in_sql() -> None:
+    session = _session()
+    doc_storage = DocStorageService(session=session)
+    svc = MemoryService(doc_storage=doc_storage)
+    for idx in range(3):
+        svc.create_memory(
+            MemoryCreateRequest(text=f"Task note {idx}", user_id=5, source="task", task_id="t-1")
+        )
+    svc.create_memory(MemoryCreateRequest(text="Manual note", user_id=5, source="manual"))
+    svc.create_memory(MemoryCreateRequest(text="Other user", user_id=6, source="task"))
+    doc_storage.create_note(NoteCreate(text="Plain quick note", metadata={"user_id": 5}))
+
+    listed = svc.list_memories(user_id=5, source="task", task_id="t-1", skip=1, limit=1)
+    assert listed.total == 3
+    assert len(listed.items) == 1
+
+    assert svc.list_memories(user_id=5).total == 4
+    assert svc.list_memories().total == 5
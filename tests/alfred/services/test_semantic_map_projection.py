@@ -0,0 +1,54 @@
+"""Stored PCA basis and compact point cache for the semantic map."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from alfred.services.doc_storage.semantic_map import (
+    decode_basis,
+    decode_points,
+    encode_basis,
+    encode_points,
+    fit_projection_basis,
+    project_vectors_to_3d,
+    project_with_basis,
+    topic_to_color,
+)
+
+
+def test_basis_projection_matches_full_refit_geometry() -> None:
+    rng = np.random.RandomState(0)
+    mat = rng.randn(50, 16).astype(np.float32)
+
+    basis = fit_projection_basis(mat)
+    assert basis is not None
+    coords = np.asarray(project_with_basis(mat, basis))
+    reference = np.asarray(project_vectors_to_3d(mat.tolist()))
+
+    # Same PCA up to per-axis sign.
+    assert np.allclose(np.abs(coords), np.abs(reference), atol=1e-4)
+    assert np.isclose(np.linalg.norm(coords, axis=1).max(), 1.0, atol=1e-5)
+
+
+def test_basis_round_trips_through_text() -> None:
+    mat = np.random.RandomState(1).randn(10, 8).astype(np.float32)
+    basis = fit_projection_basis(mat)
+    restored = decode_basis(encode_basis(basis))
+
+    assert restored.basis_id == basis.basis_id
+    assert project_with_basis(mat[:2], restored) == project_with_basis(mat[:2], basis)
+
+
+def test_points_round_trip_and_derive_colors() -> None:
+    items = [
+        {"id": "a", "pos": [0.1, 0.2, 0.3], "label": "Alpha", "primary_topic": "AI"},
+        {"id": "b", "pos": [-1.0, 0.0, 1.0], "label": "Beta", "primary_topic": None},
+        {"id": "c", "pos": [0.5, 0.5, 0.5], "label": "Gamma", "primary_topic": "AI"},
+    ]
+
+    decoded = decode_points(encode_points(items))
+
+    assert [p["id"] for p in decoded] == ["a", "b", "c"]
+    assert decoded[1]["primary_topic"] is None
+    assert decoded[2]["color"] == topic_to_color("AI")
+    assert np.allclose(decoded[0]["pos"], [0.1, 0.2, 0.3], atol=1e-6)
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import os
+from datetime import timedelta
 
 import pytest
 
@@ -107,3 +108,88 @@ def test_upsert_card_with_archived_status_removes_projection(db_session: Session
     sync.upsert_card(card.id)
     rows = gs._run("MATCH (z:Zettel {card_id: $id}) RETURN count(z) AS n", {"id": card.id})
     assert rows[0]["n"] == 0
+
+
+def test_full_rebuild_prunes_stale_nodes(db_session: Session, gs):
+    gs.upsert_zettel(card_id=9999, title="Stale", topic=None, tags=[], bloom_level=1, cluster_id=None)
+    card = ZettelCard(title="A", status="active", bloom_level=1, bloom_source="backfill")
+    db_session.add(card)
+    db_session.commit()
+
+    result = ZettelGraphSync(session=db_session, graph=gs).full_rebuild()
+
+    assert result["nodes_synced"] == 1
+    assert result["nodes_deleted"] == 1
+    rows = gs._run("MATCH (z:Zettel {card_id: 9999}) RETURN count(z) AS n")
+    assert rows[0]["n"] == 0
+
+
+def test_incremental_sync_projects_changed_cards(db_session: Session, gs):
+    a = ZettelCard(title="A", status="active", bloom_level=1, bloom_source="backfill")
+    db_session.add(a)
+    db_session.commit()
+    db_session.refresh(a)
+    sync = ZettelGraphSync(session=db_session, graph=gs)
+    sync.full_rebuild()
+
+    a.title = "A2"
+    a.updated_at = a.updated_at + timedelta(seconds=1)
+    b = ZettelCard(
+        title="B", status="active", bloom_level=1, bloom_source="backfill",
+        updated_at=a.updated_at,
+    )
+    db_session.add_all([a, b])
+    db_session.commit()
+
+    result = sync.sync_incremental()
+
+    assert result["mode"] == "incremental"
+    assert result["nodes_synced"] == 2
+    rows = gs._run("MATCH (z:Zettel) RETURN z.title AS t ORDER BY t")
+    assert [r["t"] for r in rows] == ["A2", "B"]
+
+
+def test_incremental_sync_picks_up_a_late_commit_behind_the_watermark(db_session: Session, gs):
+    a = ZettelCard(title="A", status="active", bloom_level=1, bloom_source="backfill")
+    b = ZettelCard(title="B", status="active", bloom_level=1, bloom_source="backfill")
+    db_session.add_all([a, b])
+    db_session.commit()
+    db_session.refresh(a)
+    db_session.refresh(b)
+    sync = ZettelGraphSync(session=db_session, graph=gs)
+    sync.full_rebuild()
+
+    # Stamped before the stored watermark, committed after the rebuild.
+    a.title = "A-late"
+    a.updated_at = b.updated_at - timedelta(seconds=5)
+    db_session.add(a)
+    db_session.commit()
+
+    sync.sync_incremental()
+
+    rows = gs._run("MATCH (z:Zettel {card_id: $id}) RETURN z.title AS t", {"id": a.id})
+    assert rows[0]["t"] == "A-late"
+
+
+def test_incremental_sync_matches_full_rebuild_for_stub_cards(db_session: Session, gs):
+    a = ZettelCard(title="A", status="active", bloom_level=1, bloom_source="backfill")
+    db_session.add(a)
+    db_session.commit()
+    db_session.refresh(a)
+    sync = ZettelGraphSync(session=db_session, graph=gs)
+    sync.full_rebuild()
+
+    stub = ZettelCard(
+        title="Stub", status="stub", bloom_level=1, bloom_source="backfill",
+        updated_at=a.updated_at + timedelta(seconds=1),
+    )
+    a.status = "stub"
+    a.updated_at = stub.updated_at
+    db_session.add_all([a, stub])
+    db_session.commit()
+
+    result = sync.sync_incremental()
+
+    assert result["nodes_synced"] == 0
+    rows = gs._run("MATCH (z:Zettel) RETURN count(z) AS n")
+    assert rows[0]["n"] == 0
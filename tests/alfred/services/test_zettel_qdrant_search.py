@@ -64,7 +64,7 @@ def test_find_similar_cards_uses_qdrant_when_available():
 
 
 def test_find_similar_cards_falls_back_without_qdrant():
-    """When Qdrant unavailable, use Python cosine similarity fallback."""
+    """When Qdrant unavailable, use the in-process vector index fallback."""
     from alfred.services.zettelkasten_service import ZettelkastenService
 
     session = MagicMock()
@@ -72,7 +72,6 @@ def test_find_similar_cards_falls_back_without_qdrant():
 
     mock_card = _make_mock_card(1)
     session.get.return_value = mock_card
-    # Two exec calls: _existing_links (returns links) + _find_similar_via_scan (returns candidates)
     session.exec.return_value = iter([])
 
     with patch(
@@ -81,6 +80,8 @@ def test_find_similar_cards_falls_back_without_qdrant():
     ):
         results = svc.find_similar_cards(1, threshold=0.5, limit=5)
 
-    # Called twice: once for _existing_links, once for candidate scan
-    assert session.exec.call_count == 2
+    # Only _existing_links goes through session.exec: the index loads
+    # (id, embedding) columns via session.execute and, with no hits, no
+    # candidate rows are hydrated.
+    assert session.exec.call_count == 1
     assert results == []
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlmodel import Session, SQLModel
+
+from alfred.models.zettel import ZettelCard
+from alfred.services.zettel_search import ZettelSearchService, _match_kind, _tsquery_text
+from alfred.services.zettelkasten_service import ZettelkastenService
+
+
+def _session() -> Session:
+    engine = create_engine("sqlite:///:memory:")
+    SQLModel.metadata.create_all(engine)
+    return Session(engine)
+
+
+def _add(session: Session, **fields) -> ZettelCard:
+    card = ZettelCard(**fields)
+    session.add(card)
+    session.commit()
+    session.refresh(card)
+    return card
+
+
+def test_sqlite_fallback_ranks_title_over_content_and_explains_matches() -> None:
+    session = _session()
+    in_title = _add(session, title="Event Sourcing", tags=["architecture"])
+    in_content = _add(session, title="CQRS", content="Often paired with event sourcing.")
+    _add(session, title="Unrelated", content="nothing here")
+    _add(session, title="Event Sourcing draft", status="archived")
+
+    matches = ZettelkastenService(session).search_cards(query="event sourcing", limit=5)
+
+    assert [m.card.id for m in matches] == [in_title.id, in_content.id]
+    assert "title:Event Sourcing" in matches[0].reasons
+    assert any(reason.startswith("content:") for reason in matches[1].reasons)
+
+
+def test_metadata_mode_ignores_body_only_matches() -> None:
+    session = _session()
+    tagged = _add(session, title="Notes", tags=["kubernetes"])
+    _add(session, title="Other", content="kubernetes operators")
+
+    matches = ZettelSearchService(session).search(query="kubernetes", search_mode="metadata")
+
+    assert [m.card.id for m in matches] == [tagged.id]
+    assert "tag:kubernetes" in matches[0].reasons
+
+
+def test_tag_filter_rewards_cards_carrying_every_requested_tag() -> None:
+    session = _session()
+    both = _add(session, title="A", tags=["rust", "async"])
+    _add(session, title="B", tags=["rust"])
+
+    matches = ZettelSearchService(session).search(tags=["rust", "async"])
+
+    assert matches[0].card.id == both.id
+    assert any(reason.startswith("tags_all:") for reason in matches[0].reasons)
+
+
+def test_match_kind_exact_contains_and_compact_variants() -> None:
+    assert _match_kind("Event Sourcing", "event sourcing") == "exact"
+    assert _match_kind("Event-Sourcing patterns", "eventsourcing") == "contains"
+    assert _match_kind("CQRS", "cq") is None
+    assert _match_kind(None, "x") is None
+
+
+def test_tsquery_text_prefixes_words_and_strips_operators() -> None:
+    assert _tsquery_text(["event sourcing", "cqrs", "a|b!:*"]) == (
+        "(event:* & sourcing:*) | cqrs:* | (a:* & b:*)"
+    )
+    assert _tsquery_text(["!!", ""]) == ""
+
+
+def test_fulltext_statement_uses_search_vector_rank_and_title_trigram() -> None:
+    svc = ZettelSearchService(MagicMock())
+    stmt = svc.fulltext_statement(
+        ["event sourcing"], raw_query="Event Sourcing", metadata_only=False, page_size=30
+    )
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+    assert "zettel_cards.search_vector @@ to_tsquery" in sql
+    assert "ts_rank(zettel_cards.search_vector" in sql
+    assert "lower(zettel_cards.title) %" in sql
+    assert "similarity(lower(zettel_cards.title)" in sql
+    assert "LIMIT" in sql
+
+    metadata_sql = str(
+        svc.fulltext_statement(
+            ["kubernetes"], raw_query=None, metadata_only=True, page_size=30
+        ).compile(dialect=postgresql.dialect())
+    )
+    assert "ts_filter(zettel_cards.search_vector, '{a,b}')" in metadata_sql
+    assert "similarity" not in metadata_sql
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlmodel import Session, SQLModel
+
+from alfred.models.zettel import ZettelCard
+from alfred.services.zettel_vector_index import ZettelVectorIndex, get_zettel_vector_index
+from alfred.services.zettelkasten_service import ZettelkastenService
+
+
+def _engine():
+    engine = create_engine("sqlite:///:memory:")
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+def _add_card(session: Session, title: str, embedding: list[float] | None, **kw) -> ZettelCard:
+    card = ZettelCard(title=title, embedding=embedding, **kw)
+    session.add(card)
+    session.commit()
+    session.refresh(card)
+    return card
+
+
+def test_search_ranks_by_cosine_and_applies_threshold_and_exclusions() -> None:
+    index = ZettelVectorIndex()
+    index.upsert(1, [1.0, 0.0, 0.0])
+    index.upsert(2, [0.9, 0.1, 0.0])
+    index.upsert(3, [0.0, 1.0, 0.0])
+    index.upsert(4, [2.0, 0.0, 0.0])
+
+    hits = index.search([1.0, 0.0, 0.0], limit=10, threshold=0.5)
+    assert [card_id for card_id, _ in hits][:2] in ([1, 4], [4, 1])
+    assert [card_id for card_id, _ in hits][2] == 2
+    assert 3 not in {card_id for card_id, _ in hits}
+    assert hits[0][1] == pytest.approx(1.0)
+
+    hits = index.search([1.0, 0.0, 0.0], limit=1, exclude_ids={1, 4})
+    assert hits == [(2, pytest.approx(0.9 / (0.82**0.5)))]
+
+
+def test_remove_keeps_remaining_rows_addressable() -> None:
+    index = ZettelVectorIndex()
+    for card_id in range(1, 6):
+        vec = [0.0] * 5
+        vec[card_id - 1] = 1.0
+        index.upsert(card_id, vec)
+
+    index.remove(2)
+    assert len(index) == 4
+    # Row 5 was swapped into row 2's slot and must still resolve to id 5.
+    assert index.search([0, 0, 0, 0, 1.0], limit=1) == [(5, pytest.approx(1.0))]
+    assert index.search([0, 1.0, 0, 0, 0], limit=5, threshold=0.5) == []
+
+
+def test_upsert_rejects_zero_and_mismatched_vectors() -> None:
+    index = ZettelVectorIndex()
+    assert index.upsert(1, [1.0, 0.0]) is True
+    assert index.upsert(2, [0.0, 0.0]) is False
+    assert index.upsert(3, [1.0, 0.0, 0.0]) is False
+    assert len(index) == 1
+    assert index.search([1.0, 0.0, 0.0], limit=3) == []
+
+
+def test_sync_loads_active_embedded_cards_and_picks_up_external_writes() -> None:
+    engine = _engine()
+    with Session(engine) as session:
+        a_id = _add_card(session, "A", [1.0, 0.0]).id
+        _add_card(session, "B", None)
+        archived_id = _add_card(session, "C", [1.0, 0.0], status="archived").id
+
+        index = ZettelVectorIndex()
+        index.sync(session)
+        assert len(index) == 1
+
+    # Another worker embeds a card and archives A.
+    with Session(engine) as other:
+        d = _add_card(other, "D", [0.0, 1.0])
+        d_id = d.id
+        row = other.get(ZettelCard, a_id)
+        row.status = "archived"
+        row.updated_at = d.updated_at
+        other.add(row)
+        other.commit()
+
+    with Session(engine) as session:
+        index.sync(session)
+        ids = {card_id for card_id, _ in index.search([1.0, 1.0], limit=10)}
+        assert ids == {d_id}
+        assert archived_id not in ids
+
+
+def test_sync_picks_up_a_late_commit_behind_the_watermark() -> None:
+    engine = _engine()
+    now = datetime.now(UTC)
+    with Session(engine) as session:
+        a_id = _add_card(session, "A", [1.0, 0.0], updated_at=now - timedelta(seconds=10)).id
+        _add_card(session, "B", [1.0, 0.0], updated_at=now)
+
+        index = ZettelVectorIndex()
+        index.sync(session)
+
+    # A slow worker stamped its update before B was written but commits only now,
+    # so neither the card count nor max(updated_at) moves.
+    with Session(engine) as other:
+        row = other.get(ZettelCard, a_id)
+        row.embedding = [0.0, 1.0]
+        row.updated_at = now - timedelta(seconds=5)
+        other.add(row)
+        other.commit()
+
+    with Session(engine) as session:
+        index.sync(session)
+        assert index.search([0.0, 1.0], limit=5, threshold=0.5) == [(a_id, pytest.approx(1.0))]
+
+
+def test_find_similar_cards_uses_local_index_without_qdrant() -> None:
+    engine = _engine()
+    with Session(engine) as session:
+        svc = ZettelkastenService(session)
+        base = _add_card(session, "Base", [1.0, 0.0, 0.0])
+        near = _add_card(session, "Near", [0.95, 0.05, 0.0])
+        linked = _add_card(session, "Linked", [0.99, 0.01, 0.0])
+        _add_card(session, "Far", [0.0, 0.0, 1.0])
+        svc.create_link(from_card_id=base.id or 0, to_card_id=linked.id or 0)
+
+        with patch(
+            "alfred.services.zettelkasten_service.get_qdrant_client",
+            return_value=None,
+        ):
+            results = svc.find_similar_cards(base.id or 0, threshold=0.5, limit=5)
+
+        assert [cand.id for cand, _ in results] == [near.id]
+        assert results[0][1].semantic_score > 0.9
+
+
+def test_service_writes_update_the_shared_index() -> None:
+    engine = _engine()
+    with Session(engine) as session:
+        svc = ZettelkastenService(session)
+        card = _add_card(session, "Indexed", [1.0, 0.0])
+        index = get_zettel_vector_index(session)
+        index.sync(session)
+        assert len(index) == 1
+
+        svc.update_card(card, content="rewritten")
+        assert len(index) == 0
+
+        card.embedding = [0.0, 1.0]
+        svc._sync_vector_index(card)
+        assert index.search([0.0, 1.0], limit=1)[0][0] == card.id
+
+        svc.archive_card(card)
+        assert len(index) == 0
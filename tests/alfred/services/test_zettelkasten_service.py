@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock
 
 import pytest
@@ -130,6 +130,31 @@ def test_extended_graph_summary_basic() -> None:
     assert isinstance(meta["embedding_coverage_pct"], float)
 
 
+def test_graph_summary_delta_since_version() -> None:
+    """Passing a version back returns only rows touched since then."""
+    session = _session()
+    svc = ZettelkastenService(session)
+    a = svc.create_card(title="Alpha")
+    b = svc.create_card(title="Beta")
+    svc.create_link(from_card_id=a.id or 0, to_card_id=b.id or 0, bidirectional=False)
+
+    full = svc.graph_summary()
+    assert {n["id"] for n in full["nodes"]} == {a.id, b.id}
+    assert svc.graph_summary(since=full["version"])["unchanged"] is True
+
+    b.title = "Beta 2"
+    b.updated_at = datetime.now(UTC) + timedelta(minutes=1)
+    session.add(b)
+    session.commit()
+
+    delta = svc.graph_summary(since=full["version"])
+    assert delta["delta"] is True
+    assert [n["title"] for n in delta["nodes"]] == ["Beta 2"]
+    assert delta["node_ids"] == [a.id, b.id]
+    assert delta["degrees"] == [1, 1]
+    assert delta["version"] != full["version"]
+
+
 def test_extended_graph_summary_due_at() -> None:
     """Open reviews populate due_at on nodes."""
     session = _session()
@@ -398,22 +423,120 @@ def test_create_card_syncs_to_qdrant(monkeypatch: pytest.MonkeyPatch) -> None:
     assert called_with.id == card.id
 
 
-def test_create_cards_batch_syncs_all_to_qdrant(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Each card in a batch must be pushed to Qdrant individually."""
+class _FakeEmbeddings:
+    """Counts embedding calls; maps text length to a 2-d vector."""
+
+    def __init__(self) -> None:
+        self.document_calls: list[list[str]] = []
+        self.query_calls: list[str] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.document_calls.append(list(texts))
+        return [[1.0, float(len(text))] for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        self.query_calls.append(text)
+        return [1.0, float(len(text))]
+
+
+def test_create_cards_batch_embeds_in_one_call_and_commits_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A batch makes one embed_documents call and one commit, and every card
+    gets an embedding plus an open review (closes crud-vector-sync-gap)."""
     session = _session()
     svc = ZettelkastenService(session)
 
-    mock_ensure = MagicMock(side_effect=lambda card: card)
-    monkeypatch.setattr(svc, "ensure_embedding", mock_ensure)
+    fake = _FakeEmbeddings()
+    monkeypatch.setattr("alfred.core.llm_factory.get_embedding_model", lambda: fake)
+    commit_spy = MagicMock(wraps=session.commit)
+    monkeypatch.setattr(session, "commit", commit_spy)
 
     cards = svc.create_cards_batch(
-        [{"title": "A"}, {"title": "B"}, {"title": "C"}]
+        [{"title": "A"}, {"title": "B", "content": "body"}, {"title": "C"}]
     )
 
     assert len(cards) == 3
-    assert mock_ensure.call_count == 3
-    synced_ids = {call.args[0].id for call in mock_ensure.call_args_list}
-    assert synced_ids == {c.id for c in cards}
+    assert len(fake.document_calls) == 1
+    assert fake.query_calls == []
+    assert commit_spy.call_count == 1
+    assert all(card.embedding for card in cards)
+    reviews = session.exec(select(ZettelReview)).all()
+    assert sorted(r.card_id for r in reviews) == sorted(c.id for c in cards)
+
+
+def test_create_cards_batch_normalizes_fields_like_create_card(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session = _session()
+    svc = ZettelkastenService(session)
+    monkeypatch.setattr("alfred.core.llm_factory.get_embedding_model", lambda: _FakeEmbeddings())
+    fields = {
+        "title": "  Title ",
+        "content": " body \n",
+        "summary": "   ",
+        "topic": " Topic ",
+        "source_url": " https://example.com ",
+        "document_id": " doc-1 ",
+    }
+
+    (batched,) = svc.create_cards_batch([fields])
+    single = svc.create_card(**fields)
+
+    for card in (batched, single):
+        assert (card.title, card.content, card.summary) == ("Title", "body", None)
+        assert (card.topic, card.source_url, card.document_id) == (
+            "Topic",
+            "https://example.com",
+            "doc-1",
+        )
+
+
+def test_create_cards_batch_survives_embedding_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    session = _session()
+    svc = ZettelkastenService(session)
+
+    class _Down:
+        def embed_documents(self, texts):
+            raise RuntimeError("embeddings offline")
+
+    monkeypatch.setattr("alfred.core.llm_factory.get_embedding_model", lambda: _Down())
+
+    cards = svc.create_cards_batch([{"title": "A"}, {"title": "B"}])
+
+    assert [c.id is not None for c in cards] == [True, True]
+    assert all(c.embedding is None for c in cards)
+
+
+def test_suggest_links_bulk_scores_all_cards_with_one_embedding_call(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session = _session()
+    svc = ZettelkastenService(session)
+    monkeypatch.setattr(
+        "alfred.services.zettelkasten_service.get_qdrant_client", lambda: None
+    )
+
+    existing = ZettelCard(title="Existing", embedding=[1.0, 0.0], topic="ai", tags=["x"])
+    other = ZettelCard(title="Other", embedding=[0.0, 1.0])
+    fresh_a = ZettelCard(title="Fresh A", topic="ai", tags=["x"])
+    fresh_b = ZettelCard(title="Fresh B", topic="ai", tags=["x"])
+    session.add_all([existing, other, fresh_a, fresh_b])
+    session.commit()
+
+    fake = _FakeEmbeddings()
+    fake.embed_documents = MagicMock(return_value=[[1.0, 0.01], [0.01, 1.0]])
+    monkeypatch.setattr("alfred.core.llm_factory.get_embedding_model", lambda: fake)
+
+    suggestions = svc.suggest_links_bulk(
+        [fresh_a.id or 0, fresh_b.id or 0, 999], min_confidence=0.6, limit=5
+    )
+
+    fake.embed_documents.assert_called_once()
+    assert set(suggestions) == {fresh_a.id, fresh_b.id}
+    assert existing.id in {s.to_card_id for s in suggestions[fresh_a.id or 0]}
+    assert fresh_a.id not in {s.to_card_id for s in suggestions[fresh_a.id or 0]}
+    assert other.id in {s.to_card_id for s in suggestions[fresh_b.id or 0]}
 
 
 def test_create_card_accepts_session_id_kwarg(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 
+import httpx
 from fastapi.responses import Response
 from fastapi.testclient import TestClient
 
@@ -68,3 +69,34 @@ def test_firecrawl_route_proxies_to_configured_base(monkeypatch) -> None:
             {"url": "https://example.com", "formats": ["markdown"]},
         )
     ]
+
+
+def test_proxy_streams_through_pooled_client(monkeypatch) -> None:
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, str(request.url), request.read()))
+        # A byte stream, like a real upstream response, so the relay can iterate it.
+        return httpx.Response(
+            200,
+            stream=httpx.ByteStream(b'{"points": []}'),
+            headers={"content-type": "application/json"},
+        )
+
+    base_url = "http://qdrant:6333"
+    monkeypatch.setattr(search_gateway.settings, "search_gateway_qdrant_url", base_url)
+    pooled = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setitem(search_gateway._clients, base_url, pooled)
+
+    client = TestClient(search_gateway.app)
+    first = client.post("/qdrant/collections/cards/points/scroll", json={"limit": 2})
+    second = client.get("/qdrant/collections", params={"x": "1"})
+
+    assert first.status_code == 200
+    assert first.json() == {"points": []}
+    assert second.status_code == 200
+    assert seen == [
+        ("POST", f"{base_url}/collections/cards/points/scroll", b'{"limit":2}'),
+        ("GET", f"{base_url}/collections?x=1", b""),
+    ]
+    assert search_gateway._client(base_url) is pooled
@@ -12,6 +12,11 @@ import pytest
 # This prevents optional LLM modules (e.g. DSPy/OpenAI) from being enabled via a
 # developer's local environment variables during unit tests.
 os.environ.setdefault("APP_ENV", "test")
+# Keep the knowledge store in memory instead of creating embedded Qdrant files.
+os.environ.setdefault("QDRANT_LOCAL_PATH", "")
+# Dictionary lookups and agent tools must not share cached results across tests.
+os.environ.setdefault("DICTIONARY_CACHE_ENABLED", "false")
+os.environ.setdefault("AGENT_TOOL_CACHE_ENABLED", "false")
 
 # Ensure local `apps/` package directory is importable before any installed `alfred` package.
 _REPO_ROOT = Path(__file__).resolve().parents[1]
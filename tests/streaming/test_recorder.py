@@ -1,11 +1,13 @@
-"""Tests for RunRecorder — seq monotonicity, flush policy, fan-out, lifecycle."""
+"""Tests for RunRecorder — seq monotonicity, delta coalescing, fan-out, lifecycle."""
 
 from __future__ import annotations
 
 from uuid import uuid4
 
 import pytest
-from sqlmodel import Session, select
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import Session, SQLModel, select
 
 from alfred.models.streaming import AgentRunEventRow, AgentRunRow
 from alfred.streaming.events import AnyRunEvent
@@ -67,7 +69,54 @@ async def test_recorder_flushes_buffer_to_db(session: Session) -> None:
     assert event_types[0] == "run.started"
     assert event_types[1] == "message.started"
     assert event_types[-1] == "run.finished"
-    assert event_types.count("message.delta") == 10
+    # Deltas are coalesced into one row per message segment.
+    assert event_types.count("message.delta") == 1
+    delta_row = next(r for r in rows if r.event_type == "message.delta")
+    assert delta_row.payload["delta_text"] == "0123456789"
+    assert delta_row.seq == 11
+
+
+@pytest.mark.asyncio
+async def test_recorder_coalesces_per_segment(session: Session) -> None:
+    recorder = RunRecorder.start(session, run_type="chat_turn")
+    consumer = RecordingConsumer()
+    recorder.attach(consumer)
+    first, second = uuid4(), uuid4()
+    async with recorder:
+        await recorder.emit_delta(message_id=first, delta_text="a")
+        await recorder.emit_delta(message_id=first, delta_text="b")
+        await recorder.emit_delta(message_id=second, delta_text="c")
+        await recorder.emit_tool_started(tool_call_id="c3", tool_name="search_kb")
+        await recorder.emit_delta(message_id=second, delta_text="d")
+
+    # Consumers still see every delta live.
+    assert [e.event_type for e in consumer.events].count("message.delta") == 4
+
+    rows = session.exec(
+        select(AgentRunEventRow).where(AgentRunEventRow.run_id == recorder.run_id)
+        .order_by(AgentRunEventRow.seq)
+    ).all()
+    deltas = [r.payload["delta_text"] for r in rows if r.event_type == "message.delta"]
+    assert deltas == ["ab", "c", "d"]
+    assert [r.seq for r in rows] == sorted({r.seq for r in rows})
+    assert [e.seq for e in recorder.recorded_events] == [r.seq for r in rows]
+
+
+@pytest.mark.asyncio
+async def test_replay_keeps_run_started_past_history_limit(
+    session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("alfred.streaming.recorder._HISTORY_LIMIT", 3)
+    recorder = RunRecorder.start(session, run_type="chat_turn")
+    async with recorder:
+        for _ in range(5):
+            await recorder.emit_message_started(message_id=uuid4())
+        consumer = RecordingConsumer()
+        recorder.attach(consumer)
+
+    replayed = [e.event_type for e in consumer.events]
+    assert replayed[0] == "run.started"
+    assert replayed[1:] == ["message.started"] * 3 + ["run.finished"]
 
 
 @pytest.mark.asyncio
@@ -111,10 +160,11 @@ async def test_recorder_terminal_on_error(session: Session) -> None:
 
 @pytest.mark.asyncio
 async def test_significant_event_forces_flush(session: Session) -> None:
-    """Non-delta events must be durable immediately."""
+    """Non-delta events go to the writer immediately, without waiting for the run to end."""
     recorder = RunRecorder.start(session, run_type="chat_turn")
     tool_id = "test-c1"
     await recorder.emit_tool_started(tool_call_id=tool_id, tool_name="search_kb", args_preview={"q": "x"})
+    await recorder.flush()
     rows = session.exec(
         select(AgentRunEventRow).where(AgentRunEventRow.run_id == recorder.run_id)
     ).all()
@@ -133,3 +183,30 @@ async def test_parent_run_id_for_nested(session: Session) -> None:
             await child.emit_tool_started(tool_call_id=tool_id, tool_name="search_kb", args_preview={})
     child_row = session.exec(select(AgentRunRow).where(AgentRunRow.id == child.run_id)).one()
     assert child_row.parent_run_id == parent.run_id
+
+
+@pytest.mark.asyncio
+async def test_recorder_writes_through_async_engine(tmp_path) -> None:
+    """With an async engine the writer awaits its INSERTs on the loop."""
+    path = tmp_path / "runs.db"
+    engine = create_engine(f"sqlite:///{path}")
+    SQLModel.metadata.create_all(engine)
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    try:
+        with Session(engine) as session:
+            recorder = RunRecorder.start(session, run_type="chat_turn", async_engine=async_engine)
+            msg_id = uuid4()
+            async with recorder:
+                await recorder.emit_message_started(message_id=msg_id)
+                await recorder.emit_delta(message_id=msg_id, delta_text="hi")
+            types = session.exec(
+                select(AgentRunEventRow.event_type)
+                .where(AgentRunEventRow.run_id == recorder.run_id)
+                .order_by(AgentRunEventRow.seq)
+            ).all()
+            assert types == ["run.started", "message.started", "message.delta", "run.finished"]
+            run = session.exec(select(AgentRunRow).where(AgentRunRow.id == recorder.run_id)).one()
+            assert run.status == "finished"
+    finally:
+        await async_engine.dispose()
+        engine.dispose()
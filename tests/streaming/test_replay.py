@@ -1,8 +1,4 @@
-"""Tests for ReplayEngine skeleton.
-
-Phase 0: load events for a run and yield them in seq order.
-Phase 5 adds snapshot fast-forward, AG-UI projection, and speed-controlled playback.
-"""
+"""Tests for ReplayEngine — seq-ordered replay, snapshot fast-forward, wire frames."""
 
 from __future__ import annotations
 
@@ -11,6 +7,8 @@ from uuid import uuid4
 import pytest
 from sqlmodel import Session
 
+from alfred.streaming.projectors.snapshot import SnapshotProjector
+from alfred.streaming.projectors.wire_agui import AGUIProjector
 from alfred.streaming.recorder import RunRecorder
 from alfred.streaming.replay import ReplayEngine
 
@@ -48,3 +46,55 @@ async def test_replay_honors_target_seq(session: Session):
     engine = ReplayEngine(session)
     events = [e async for e in engine.replay(recorder.run_id, target_seq=3)]
     assert all(e.seq <= 3 for e in events)
+
+
+async def _record_two_messages(session: Session) -> RunRecorder:
+    recorder = RunRecorder.start(session, run_type="chat_turn")
+    recorder.attach(SnapshotProjector(session=session))
+    first, second = uuid4(), uuid4()
+    async with recorder:
+        await recorder.emit_message_started(message_id=first)
+        for i in range(120):
+            await recorder.emit_delta(message_id=first, delta_text=str(i % 10))
+        await recorder.emit_message_started(message_id=second)
+        await recorder.emit_delta(message_id=second, delta_text="tail")
+    return recorder
+
+
+@pytest.mark.asyncio
+async def test_replay_fast_forwards_from_snapshot(session: Session):
+    recorder = await _record_two_messages(session)
+    engine = ReplayEngine(session)
+
+    # Cadence snapshot is deferred to the second message.started (seq 122).
+    snapshot = engine.nearest_snapshot(recorder.run_id, target_seq=123)
+    assert snapshot is not None
+    assert snapshot.up_to_seq == 122
+
+    events = [e async for e in engine.replay(recorder.run_id, target_seq=123, fast_forward=True)]
+    assert events[0].event_type == "state.snapshot"
+    assert events[0].seq == 122
+    assert events[0].state["message_text"] == "0123456789" * 12
+    assert [(e.event_type, e.seq) for e in events[1:]] == [("message.delta", 123)]
+    assert events[1].delta_text == "tail"
+
+
+@pytest.mark.asyncio
+async def test_replay_frames_match_validated_replay(session: Session):
+    recorder = await _record_two_messages(session)
+    engine = ReplayEngine(session)
+    wire = AGUIProjector()
+
+    expected = [
+        (evt.seq, frame)
+        async for evt in engine.replay(recorder.run_id)
+        for frame in wire.frames_for(evt)
+    ]
+    frames = [f async for f in engine.replay_frames(recorder.run_id, fast_forward=False)]
+    assert frames == expected
+
+    fast = [f async for f in engine.replay_frames(recorder.run_id, target_seq=123)]
+    assert [(seq, frame["type"]) for seq, frame in fast] == [
+        (122, "STATE_SNAPSHOT"), (123, "TEXT_MESSAGE_CONTENT"),
+    ]
+    assert fast[0][1]["snapshot"]["messageText"] == "0123456789" * 12
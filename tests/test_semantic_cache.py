@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+import json
 import time
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
 import pytest
 from cachetools import TTLCache
 
-from alfred.core.semantic_cache import RedisSemanticCache, SemanticCacheConfig
+from alfred.core.semantic_cache import (
+    RedisSemanticCache,
+    SemanticCacheConfig,
+    _projection_indices,
+    _signature,
+    _unpack_vector,
+)
 
 
 @dataclass
@@ -29,11 +37,19 @@ class _FakeRedis:
         self._kv: dict[str, str] = {}
         self._expires_at: dict[str, float] = {}
         self._zsets: dict[str, dict[str, float]] = {}
+        self.calls: dict[str, int] = {}
+
+    def _count(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
 
     def set_now(self, now: float) -> None:
         self._now = now
 
     def get(self, key: str) -> str | None:
+        self._count("get")
+        return self._get(key)
+
+    def _get(self, key: str) -> str | None:
         exp = self._expires_at.get(key)
         if exp is not None and self._now >= exp:
             self._kv.pop(key, None)
@@ -41,6 +57,10 @@ class _FakeRedis:
             return None
         return self._kv.get(key)
 
+    def mget(self, keys: list[str]) -> list[str | None]:
+        self._count("mget")
+        return [self._get(key) for key in keys]
+
     def setex(self, key: str, ttl: int, value: str) -> bool:
         self._kv[key] = value
         self._expires_at[key] = self._now + max(0, int(ttl))
@@ -53,6 +73,7 @@ class _FakeRedis:
         return len(mapping)
 
     def zrevrange(self, key: str, start: int, end: int) -> list[str]:
+        self._count("zrevrange")
         zset = self._zsets.get(key, {})
         items = sorted(zset.items(), key=lambda kv: kv[1], reverse=True)
         if end < 0:
@@ -70,6 +91,27 @@ class _FakeRedis:
                 removed += 1
         return removed
 
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, redis: _FakeRedis) -> None:
+        self._redis = redis
+        self._ops: list[tuple[str, tuple[Any, ...]]] = []
+
+    def zrevrange(self, *args: Any) -> None:
+        self._ops.append(("zrevrange", args))
+
+    def execute(self, raise_on_error: bool = True) -> list[Any]:
+        self._redis._count("pipeline")
+        zsets = self._redis._zsets
+        results = []
+        for _name, (key, start, end) in self._ops:
+            items = sorted(zsets.get(key, {}).items(), key=lambda kv: kv[1], reverse=True)
+            results.append([member for member, _score in items[start : end + 1]])
+        return results
+
 
 def _make_cache(fake_redis: _FakeRedis) -> RedisSemanticCache:
     return RedisSemanticCache(
@@ -127,3 +169,59 @@ def test_semantic_cache_ignores_empty_inputs(value: Any, expected: Any) -> None:
     fake_redis = _FakeRedis(now=time.time())
     cache = _make_cache(fake_redis)
     assert cache.get(value) == expected
+
+
+def test_signature_indices_are_precomputed_once() -> None:
+    _projection_indices.cache_clear()
+    vec = [0.5, -0.2, 0.1, -0.9]
+    first = _signature(vec, bits=16, seed="a")
+    assert _signature(vec, bits=16, seed="a") == first
+    info = _projection_indices.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+
+def test_semantic_cache_stores_packed_float32_embeddings() -> None:
+    fake_redis = _FakeRedis(now=time.time())
+    cache = _make_cache(fake_redis)
+
+    cache.set("billing", "cached")
+    vec_keys = [k for k in fake_redis._kv if k.startswith("semantic-cache:vec:tests:")]
+    assert len(vec_keys) == 1
+    vec = _unpack_vector(fake_redis._kv[vec_keys[0]])
+    assert vec is not None and vec.dtype == np.float32
+    assert vec.tolist() == [0.0, 1.0, 0.0]
+    for key, raw in fake_redis._kv.items():
+        if key.startswith("semantic-cache:item:"):
+            assert "embedding" not in json.loads(raw)
+
+
+def test_semantic_lookup_batches_candidate_reads() -> None:
+    fake_redis = _FakeRedis(now=time.time())
+    writer = _make_cache(fake_redis)
+    writer.set("create note", "A")
+
+    # A fresh cache has no local vectors: buckets come from one pipeline and
+    # the candidate embedding from one MGET.
+    reader = _make_cache(fake_redis)
+    fake_redis.calls.clear()
+    assert reader.get("add a note") == "A"
+    assert fake_redis.calls.get("pipeline") == 1
+    assert fake_redis.calls.get("mget") == 1
+    assert "zrevrange" not in fake_redis.calls
+
+    # Later lookups reuse the locally held vector.
+    fake_redis.calls.clear()
+    assert reader.get_or_set("please add a note", lambda: "B") == "A"
+    assert "mget" not in fake_redis.calls
+
+
+def test_semantic_lookup_skips_expired_entries_with_cached_vectors() -> None:
+    now = 1_700_000_000.0
+    fake_redis = _FakeRedis(now=now)
+    cache = _make_cache(fake_redis)
+
+    cache.set("create note", "A")
+    fake_redis.set_now(now + 15)
+    assert cache.get("add a note") is None
+    assert cache.get_or_set("add a note", lambda: "fresh") == "fresh"
+    assert cache.get("add a note") == "fresh"